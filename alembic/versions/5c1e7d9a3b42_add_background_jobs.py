@@ -0,0 +1,48 @@
+"""add_background_jobs
+
+Revision ID: 5c1e7d9a3b42
+Revises: 2d56b2550005
+Create Date: 2026-10-16 09:12:37.402518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7d9a3b42'
+down_revision: Union[str, Sequence[str], None] = '2d56b2550005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the durable background job store."""
+    op.create_table('background_jobs',
+        sa.Column('id', sa.String(length=255), nullable=False),
+        sa.Column('idempotency_key', sa.String(length=255), nullable=True),
+        sa.Column('func_path', sa.String(length=255), nullable=False),
+        sa.Column('args', sa.Text(), nullable=False),
+        sa.Column('kwargs', sa.Text(), nullable=False),
+        sa.Column('priority', sa.Integer(), nullable=False),
+        sa.Column('executor', sa.String(length=20), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_background_jobs_status', 'background_jobs', ['status'], unique=False)
+    op.create_index('idx_background_jobs_idempotency_key', 'background_jobs', ['idempotency_key'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the durable background job store."""
+    op.drop_index('idx_background_jobs_idempotency_key', table_name='background_jobs')
+    op.drop_index('idx_background_jobs_status', table_name='background_jobs')
+    op.drop_table('background_jobs')
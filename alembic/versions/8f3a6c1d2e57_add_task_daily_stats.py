@@ -0,0 +1,42 @@
+"""add_task_daily_stats
+
+Revision ID: 8f3a6c1d2e57
+Revises: 5c1e7d9a3b42
+Create Date: 2026-10-16 14:03:51.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a6c1d2e57'
+down_revision: Union[str, Sequence[str], None] = '5c1e7d9a3b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the per-day task rollup; fill it with scripts/backfill_task_daily_stats.py."""
+    op.create_table('task_daily_stats',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('category', sa.String(length=100), nullable=True),
+        sa.Column('priority', sa.String(length=20), nullable=True),
+        sa.Column('client_id', sa.Integer(), nullable=True),
+        sa.Column('tasks_created', sa.Integer(), nullable=False),
+        sa.Column('tasks_completed', sa.Integer(), nullable=False),
+        sa.Column('estimated_hours', sa.Float(), nullable=False),
+        sa.Column('actual_hours', sa.Float(), nullable=False),
+        sa.Column('completion_hours', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_task_daily_stats_day_priority', 'task_daily_stats', ['day', 'priority'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the per-day task rollup."""
+    op.drop_index('idx_task_daily_stats_day_priority', table_name='task_daily_stats')
+    op.drop_table('task_daily_stats')
@@ -0,0 +1,43 @@
+"""add_query_plan_indexes
+
+Revision ID: a3c9e5d1f704
+Revises: f2b7d4e9a816
+Create Date: 2026-10-16 23:31:08.915327
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e5d1f704'
+down_revision: Union[str, Sequence[str], None] = 'f2b7d4e9a816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns), as found by scripts/audit_query_plans.py
+INDEXES = [
+    ('idx_tasks_done_due_date', 'tasks', ['done', 'due_date']),
+    ('idx_tasks_client_done', 'tasks', ['client_id', 'done']),
+    ('idx_tasks_parent_id', 'tasks', ['parent_id']),
+    ('idx_reminders_remind_at', 'reminders', ['remind_at']),
+    ('idx_task_comments_task_created', 'task_comments', ['task_id', 'created_at']),
+    ('idx_task_time_entries_task_duration', 'task_time_entries', ['task_id', 'duration_minutes']),
+    ('idx_task_dependencies_task_dependency', 'task_dependencies', ['task_id', 'dependency_id']),
+    ('idx_task_dependencies_dependency', 'task_dependencies', ['dependency_id']),
+    ('idx_task_attachments_task_created', 'task_attachments', ['task_id', 'created_at']),
+]
+
+
+def upgrade() -> None:
+    """Add the composite and covering indexes the query plan audit calls for."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    """Drop the query plan indexes."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
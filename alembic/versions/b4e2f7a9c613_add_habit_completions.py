@@ -0,0 +1,48 @@
+"""add_habit_completions
+
+Revision ID: b4e2f7a9c613
+Revises: 8f3a6c1d2e57
+Create Date: 2026-10-16 20:51:07.402318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e2f7a9c613'
+down_revision: Union[str, Sequence[str], None] = '8f3a6c1d2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the habit completion log, seeded with the days of each current streak."""
+    op.create_table('habit_completions',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('habit_id', sa.Integer(), nullable=False),
+        sa.Column('completed_on', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.ForeignKeyConstraint(['habit_id'], ['habits.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_habit_completions_habit_day', 'habit_completions', ['habit_id', 'completed_on'], unique=True)
+    op.execute("""
+        INSERT INTO habit_completions (habit_id, completed_on)
+        WITH RECURSIVE streak_days(habit_id, completed_on, remaining) AS (
+            SELECT id, last_completed, streak - 1 FROM habits
+            WHERE last_completed IS NOT NULL AND streak > 0
+            UNION ALL
+            SELECT habit_id, date(completed_on, '-1 day'), remaining - 1
+            FROM streak_days WHERE remaining > 0
+        )
+        SELECT habit_id, completed_on FROM streak_days
+    """)
+
+
+def downgrade() -> None:
+    """Drop the habit completion log."""
+    op.drop_index('idx_habit_completions_habit_day', table_name='habit_completions')
+    op.drop_table('habit_completions')
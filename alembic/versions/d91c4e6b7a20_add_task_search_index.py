@@ -0,0 +1,76 @@
+"""add_task_search_index
+
+Revision ID: d91c4e6b7a20
+Revises: b4e2f7a9c613
+Create Date: 2026-10-16 21:38:12.550914
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91c4e6b7a20'
+down_revision: Union[str, Sequence[str], None] = 'b4e2f7a9c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMMENTS = "(SELECT group_concat(comment, ' ') FROM task_comments WHERE task_id = {task_id})"
+INSERT_ROW = (
+    "INSERT INTO tasks_fts(rowid, description, title, category, tags, comments) "
+    "VALUES (new.id, new.description, new.title, new.category, new.tags, "
+    + COMMENTS.format(task_id='new.id') + ");"
+)
+TRIGGERS = {
+    'tasks_fts_insert': f"AFTER INSERT ON tasks BEGIN {INSERT_ROW} END",
+    'tasks_fts_update': (
+        "AFTER UPDATE OF description, title, category, tags ON tasks BEGIN "
+        f"DELETE FROM tasks_fts WHERE rowid = old.id; {INSERT_ROW} END"
+    ),
+    'tasks_fts_delete': "AFTER DELETE ON tasks BEGIN DELETE FROM tasks_fts WHERE rowid = old.id; END",
+    'task_comments_fts_insert': (
+        "AFTER INSERT ON task_comments BEGIN "
+        f"UPDATE tasks_fts SET comments = {COMMENTS.format(task_id='new.task_id')} WHERE rowid = new.task_id; END"
+    ),
+    'task_comments_fts_update': (
+        "AFTER UPDATE ON task_comments BEGIN "
+        f"UPDATE tasks_fts SET comments = {COMMENTS.format(task_id='old.task_id')} WHERE rowid = old.task_id; "
+        f"UPDATE tasks_fts SET comments = {COMMENTS.format(task_id='new.task_id')} WHERE rowid = new.task_id; END"
+    ),
+    'task_comments_fts_delete': (
+        "AFTER DELETE ON task_comments BEGIN "
+        f"UPDATE tasks_fts SET comments = {COMMENTS.format(task_id='old.task_id')} WHERE rowid = old.task_id; END"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Add the FTS5 task search index and its sync triggers; skipped without FTS5."""
+    bind = op.get_bind()
+    try:
+        bind.execute(sa.text(
+            "CREATE VIRTUAL TABLE tasks_fts USING fts5("
+            "description, title, category, tags, comments, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        ))
+    except sa.exc.OperationalError as e:
+        logging.getLogger('alembic.runtime.migration').warning(
+            f'FTS5 unavailable, skipping the task search index: {e}')
+        return
+    bind.execute(sa.text(
+        "INSERT INTO tasks_fts(rowid, description, title, category, tags, comments) "
+        "SELECT id, description, title, category, tags, "
+        + COMMENTS.format(task_id='tasks.id') + " FROM tasks"
+    ))
+    for name, body in TRIGGERS.items():
+        bind.execute(sa.text(f'CREATE TRIGGER {name} {body}'))
+
+
+def downgrade() -> None:
+    """Drop the task search index and its triggers."""
+    for name in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name}')
+    op.execute('DROP TABLE IF EXISTS tasks_fts')
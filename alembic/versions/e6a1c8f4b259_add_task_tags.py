@@ -0,0 +1,97 @@
+"""add_task_tags
+
+Revision ID: e6a1c8f4b259
+Revises: d91c4e6b7a20
+Create Date: 2026-10-16 22:14:36.208417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a1c8f4b259'
+down_revision: Union[str, Sequence[str], None] = 'd91c4e6b7a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_ITEMS = "json_each(CASE WHEN json_valid({tags}) THEN {tags} ELSE '[]' END)"
+JSON_NAMES = "SELECT DISTINCT trim(value) FROM " + JSON_ITEMS + " WHERE trim(value) != ''"
+TAG_NAME = "(SELECT name FROM tags WHERE id = {row}.tag_id)"
+TASK_TAGS_APPEND = (
+    "json_insert(CASE WHEN json_valid(tasks.tags) THEN tasks.tags ELSE '[]' END, '$[#]', "
+    + TAG_NAME + ")"
+)
+TASK_TAGS_WITHOUT = (
+    "(SELECT CASE WHEN count(*) > 0 THEN json_group_array(item.value) END "
+    "FROM json_each(tasks.tags) AS item WHERE trim(item.value) != " + TAG_NAME + " COLLATE NOCASE)"
+)
+IN_JSON = (
+    "EXISTS (SELECT 1 FROM tasks, tags, " + JSON_ITEMS.format(tags='tasks.tags') + " AS item "
+    "WHERE tasks.id = {row}.task_id AND tags.id = {row}.tag_id "
+    "AND trim(item.value) = tags.name COLLATE NOCASE)"
+)
+TRIGGERS = {
+    'tasks_tags_insert': (
+        "AFTER INSERT ON tasks WHEN new.tags IS NOT NULL BEGIN "
+        "INSERT OR IGNORE INTO tags (name) " + JSON_NAMES.format(tags='new.tags') + "; "
+        "INSERT OR IGNORE INTO task_tags (task_id, tag_id) SELECT new.id, id FROM tags "
+        "WHERE name IN (" + JSON_NAMES.format(tags='new.tags') + "); END"
+    ),
+    'tasks_tags_update': (
+        "AFTER UPDATE OF tags ON tasks WHEN new.tags IS NOT old.tags BEGIN "
+        "INSERT OR IGNORE INTO tags (name) " + JSON_NAMES.format(tags='new.tags') + "; "
+        "DELETE FROM task_tags WHERE task_id = new.id AND tag_id NOT IN ("
+        "SELECT id FROM tags WHERE name IN (" + JSON_NAMES.format(tags='new.tags') + ")); "
+        "INSERT OR IGNORE INTO task_tags (task_id, tag_id) SELECT new.id, id FROM tags "
+        "WHERE name IN (" + JSON_NAMES.format(tags='new.tags') + "); END"
+    ),
+    'tasks_tags_delete': "AFTER DELETE ON tasks BEGIN DELETE FROM task_tags WHERE task_id = old.id; END",
+    'task_tags_json_insert': (
+        "AFTER INSERT ON task_tags WHEN NOT " + IN_JSON.format(row='new') + " BEGIN "
+        "UPDATE tasks SET tags = " + TASK_TAGS_APPEND.format(row='new') + " WHERE id = new.task_id; END"
+    ),
+    'task_tags_json_delete': (
+        "AFTER DELETE ON task_tags WHEN " + IN_JSON.format(row='old') + " BEGIN "
+        "UPDATE tasks SET tags = " + TASK_TAGS_WITHOUT.format(row='old') + " WHERE id = old.task_id; END"
+    ),
+}
+
+
+def upgrade() -> None:
+    """Add normalized tag tables, backfilled from the tasks.tags JSON."""
+    op.create_table('tags',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=100, collation='NOCASE'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name')
+    )
+    op.create_table('task_tags',
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('tag_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['tag_id'], ['tags.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('task_id', 'tag_id')
+    )
+    op.create_index('idx_task_tags_tag_task', 'task_tags', ['tag_id', 'task_id'], unique=False)
+    op.execute(
+        "INSERT OR IGNORE INTO tags (name) SELECT DISTINCT trim(item.value) FROM tasks, "
+        + JSON_ITEMS.format(tags='tasks.tags') + " AS item WHERE trim(item.value) != ''"
+    )
+    op.execute(
+        "INSERT OR IGNORE INTO task_tags (task_id, tag_id) SELECT tasks.id, tags.id "
+        "FROM tasks, tags WHERE tags.name IN (" + JSON_NAMES.format(tags='tasks.tags') + ")"
+    )
+    for name, body in TRIGGERS.items():
+        op.execute(f'CREATE TRIGGER {name} {body}')
+
+
+def downgrade() -> None:
+    """Drop the tag tables; tasks.tags still holds every task's tags."""
+    for name in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name}')
+    op.drop_index('idx_task_tags_tag_task', table_name='task_tags')
+    op.drop_table('task_tags')
+    op.drop_table('tags')
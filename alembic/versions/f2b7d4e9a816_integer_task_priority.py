@@ -0,0 +1,81 @@
+"""integer_task_priority
+
+Revision ID: f2b7d4e9a816
+Revises: e6a1c8f4b259
+Create Date: 2026-10-16 22:47:51.630174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7d4e9a816'
+down_revision: Union[str, Sequence[str], None] = 'e6a1c8f4b259'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LEVELS = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4, 'urgent': 5}
+NAMES = {code: name.title() for name, code in LEVELS.items()}
+
+
+def _code(column: str) -> str:
+    """SQL mapping every stored form of a priority to its integer code (2 if unknown)."""
+    cases = ' '.join(
+        f"WHEN '{name}' THEN {code} WHEN '{code}' THEN {code}" for name, code in LEVELS.items()
+    )
+    return f"CASE lower(trim({column})) {cases} ELSE 2 END"
+
+
+def _rebuild_tasks(existing_type, priority_type, add_index: bool) -> None:
+    """
+    Rebuild tasks with a new priority column type.
+
+    The search and tag triggers read tasks, so they are dropped for the
+    rebuild and recreated from their stored SQL afterwards.
+    """
+    bind = op.get_bind()
+    triggers = bind.execute(sa.text(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger'"
+    )).all()
+    for name, _ in triggers:
+        op.execute(f'DROP TRIGGER {name}')
+    with op.batch_alter_table('tasks', recreate='always') as batch_op:
+        batch_op.alter_column('priority', existing_type=existing_type,
+                              type_=priority_type, existing_nullable=False)
+        if add_index:
+            batch_op.create_index('idx_tasks_done_priority_due', ['done', 'priority', 'due_date'], unique=False)
+    for _, sql in triggers:
+        bind.execute(sa.text(sql))
+
+
+def _name(column: str) -> str:
+    """SQL mapping an integer priority code back to its level name ('Medium' if unknown)."""
+    cases = ' '.join(f"WHEN {code} THEN '{name}'" for code, name in NAMES.items())
+    return f"CASE CAST({column} AS INTEGER) {cases} ELSE 'Medium' END"
+
+
+def _retype_daily_stats(existing_type, priority_type) -> None:
+    """Rebuild task_daily_stats with a new priority column type."""
+    with op.batch_alter_table('task_daily_stats', recreate='always') as batch_op:
+        batch_op.alter_column('priority', existing_type=existing_type,
+                              type_=priority_type, existing_nullable=True)
+
+
+def upgrade() -> None:
+    """Store task and rollup priority as its integer level, with a (done, priority, due_date) index."""
+    op.execute(f"UPDATE tasks SET priority = {_code('priority')}")
+    _rebuild_tasks(sa.String(length=20), sa.Integer(), add_index=True)
+    op.execute(f"UPDATE task_daily_stats SET priority = {_code('priority')} WHERE priority IS NOT NULL")
+    _retype_daily_stats(sa.String(length=20), sa.Integer())
+
+
+def downgrade() -> None:
+    """Store task and rollup priority as its level name again."""
+    op.drop_index('idx_tasks_done_priority_due', table_name='tasks')
+    _rebuild_tasks(sa.Integer(), sa.String(length=20), add_index=False)
+    op.execute(f"UPDATE tasks SET priority = {_name('priority')}")
+    _retype_daily_stats(sa.Integer(), sa.String(length=20))
+    op.execute(f"UPDATE task_daily_stats SET priority = {_name('priority')} WHERE priority IS NOT NULL")
@@ -36,6 +36,7 @@ from larrybot.core.dependency_injection import ServiceLocator, DependencyContain
 from larrybot.config.loader import Config
 from larrybot.handlers.bot import TelegramBotHandler
 from larrybot.storage.db import init_db, get_session_stats, optimize_database
+from larrybot.storage.async_db import configure_async_storage
 from larrybot.scheduler import start_scheduler
 from larrybot.plugins.reminder import register_event_handler, subscribe_to_events
 from larrybot.services.health_service import HealthService
@@ -74,6 +75,8 @@ async def async_main():
             await startup_system_monitoring()
             logger.info('⚙️ Loading configuration...')
             config = Config()
+            configure_async_storage(config.ASYNC_STORAGE, max_workers=
+                config.DB_EXECUTOR_WORKERS)
             logger.info('🌍 Initializing timezone service...')
             timezone_service = initialize_timezone_service(config.TIMEZONE if
                 config.TIMEZONE else None)
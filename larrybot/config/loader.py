@@ -19,6 +19,14 @@ class Config:
         self.LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
         self.MAX_REQUESTS_PER_MINUTE: int = int(os.getenv(
             'MAX_REQUESTS_PER_MINUTE', '60'))
+        self.ASYNC_STORAGE: bool = os.getenv('ASYNC_STORAGE', 'false').lower(
+            ) == 'true'
+        self.DB_EXECUTOR_WORKERS: int = int(os.getenv('DB_EXECUTOR_WORKERS',
+            '4'))
+        self.DURABLE_JOBS: bool = os.getenv('DURABLE_JOBS', 'true').lower(
+            ) == 'true'
+        self.JOB_RESULT_TTL_SECONDS: int = int(os.getenv(
+            'JOB_RESULT_TTL_SECONDS', '300'))
         self.NLP_ENABLED: bool = os.getenv('NLP_ENABLED', 'true').lower(
             ) == 'true'
         self.NLP_MODEL: str = os.getenv('NLP_MODEL', 'en_core_web_sm')
@@ -45,6 +53,10 @@ class Config:
         if self.MAX_REQUESTS_PER_MINUTE <= 0:
             errors.append('MAX_REQUESTS_PER_MINUTE must be a positive integer.'
                 )
+        if self.DB_EXECUTOR_WORKERS <= 0:
+            errors.append('DB_EXECUTOR_WORKERS must be a positive integer.')
+        if self.JOB_RESULT_TTL_SECONDS < 0:
+            errors.append('JOB_RESULT_TTL_SECONDS must not be negative.')
         if errors:
             error_message = '\n'.join(errors)
             raise ValueError(
@@ -203,6 +203,22 @@ class PerformanceCollector:
         except Exception:
             return 0
 
+    def _get_outbound_stats(self) ->Dict[str, Any]:
+        """Get outbound Telegram queue depth and send latency."""
+        try:
+            from larrybot.utils.telegram_dispatcher import get_outbound_dispatcher
+            return get_outbound_dispatcher().get_stats()
+        except Exception:
+            return {}
+
+    def _get_nlp_stats(self) ->Dict[str, Any]:
+        """Get load time and memory of the shared spaCy pipeline."""
+        try:
+            from larrybot.nlp.model_registry import get_nlp_registry
+            return get_nlp_registry().get_stats()
+        except Exception:
+            return {}
+
     def get_performance_dashboard(self) ->Dict[str, Any]:
         """Get comprehensive performance dashboard data."""
         with self._lock:
@@ -216,14 +232,17 @@ class PerformanceCollector:
                 (), 'trends': self._get_performance_trends(),
                 'top_operations': self._get_top_operations(),
                 'active_operations': len(self._active_operations),
-                'timestamp': get_utc_now().isoformat()}
+                'outbound': self._get_outbound_stats(), 'nlp': self.
+                _get_nlp_stats(), 'timestamp': get_utc_now().isoformat()}
 
     def _empty_dashboard(self) ->Dict[str, Any]:
         """Return empty dashboard when no metrics available."""
         return {'summary': {'total_operations': 0, 'avg_execution_time': 
             0.0}, 'operations': {}, 'system': {'memory_usage': 0.0,
             'cpu_usage': 0.0}, 'alerts': [], 'trends': {}, 'top_operations':
-            [], 'active_operations': 0, 'timestamp': get_utc_now().isoformat()}
+            [], 'active_operations': 0, 'outbound': self._get_outbound_stats
+            (), 'nlp': self._get_nlp_stats(), 'timestamp': get_utc_now().
+            isoformat()}
 
     def _get_summary_stats(self, metrics: List[PerformanceMetrics]) ->Dict[
         str, Any]:
@@ -0,0 +1,221 @@
+"""
+Event-driven reminder engine for LarryBot2.
+
+Keeps a min-heap of upcoming reminder times and sleeps exactly until the
+earliest one is due, instead of polling the database every minute. The
+reminder repository updates the heap in place when reminders are added,
+rescheduled or deleted, so an idle bot issues no reminder queries at all.
+"""
+import asyncio
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+logger = logging.getLogger(__name__)
+ReminderTime = Tuple[int, datetime]
+RETRY_DELAY = 5.0
+
+
+def due_timestamp(remind_at: datetime) ->float:
+    """
+    Get the epoch time at which a reminder becomes due.
+
+    SQLite stores remind_at without its offset and list_due_reminders()
+    compares it with the current UTC time, so the stored wall-clock value
+    is read as UTC here to fire exactly when the database considers the
+    reminder due.
+    """
+    return remind_at.replace(tzinfo=timezone.utc).timestamp()
+
+
+class ReminderEngine:
+    """
+    Asyncio-native reminder scheduler.
+
+    Features:
+    - Min-heap of (due time, reminder ID) with lazy removal of stale entries
+    - Sleeps until the next due time; schedule()/discard() wake it early
+    - Thread-safe updates from the event loop or database executor threads
+    - Due reminders are processed on an executor thread, never on the loop
+
+    Args:
+        process_due: Processes every due reminder and returns the next
+            upcoming reminder as (id, remind_at), or None
+        load_upcoming: Returns all stored reminders as (id, remind_at)
+        executor: Executor for the two database callables (None = default)
+    """
+
+    def __init__(self, process_due: Callable[[], Optional[ReminderTime]],
+        load_upcoming: Callable[[], Iterable[ReminderTime]], executor=None):
+        self._process_due = process_due
+        self._load_upcoming = load_upcoming
+        self._executor = executor
+        self._heap: List[Tuple[float, int]] = []
+        self._scheduled: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stats = {'fired': 0, 'db_checks': 0, 'total_lag': 0.0,
+            'max_lag': 0.0}
+
+    @property
+    def is_running(self) ->bool:
+        """Check if the engine loop is running."""
+        return self._loop is not None
+
+    def schedule(self, reminder_id: int, remind_at: datetime) ->None:
+        """Add or move a reminder. Safe to call from any thread."""
+        self._push(reminder_id, due_timestamp(remind_at))
+
+    def _push(self, reminder_id: int, due: float) ->None:
+        """Put a reminder on the heap and wake the loop if it is now first."""
+        with self._lock:
+            if self._scheduled.get(reminder_id) == due:
+                return
+            self._scheduled[reminder_id] = due
+            heapq.heappush(self._heap, (due, reminder_id))
+            is_next = self._heap[0] == (due, reminder_id)
+        if is_next:
+            self._notify()
+
+    def discard(self, reminder_id: int) ->None:
+        """Forget a deleted reminder. Safe to call from any thread."""
+        with self._lock:
+            self._scheduled.pop(reminder_id, None)
+
+    def next_due(self) ->Optional[float]:
+        """Get the epoch time of the earliest scheduled reminder."""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def get_stats(self) ->Dict[str, Any]:
+        """Get engine statistics."""
+        with self._lock:
+            fired = self._stats['fired']
+            return {'running': self.is_running, 'scheduled': len(self.
+                _scheduled), 'next_due': self._heap[0][0] if self._heap else
+                None, 'fired': fired, 'db_checks': self._stats['db_checks'], 'avg_lag': self.
+                _stats['total_lag'] / max(1, fired), 'max_lag': self._stats
+                ['max_lag']}
+
+    def _drop_stale(self) ->None:
+        """Pop heap entries that were discarded or moved (lock held)."""
+        while self._heap and self._scheduled.get(self._heap[0][1]
+            ) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now: float) ->List[Tuple[float, int]]:
+        """Remove and return every entry due at now."""
+        due = []
+        with self._lock:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                if self._scheduled.get(entry[1]) == entry[0]:
+                    del self._scheduled[entry[1]]
+                    due.append(entry)
+        return due
+
+    def _notify(self) ->None:
+        """Wake the engine loop, from the loop thread or any other thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            wakeup.set()
+        else:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass
+
+    async def run(self) ->None:
+        """Run the engine until cancelled."""
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        logger.info('Reminder engine started')
+        try:
+            upcoming = await loop.run_in_executor(self._executor, self.
+                _load_upcoming)
+            for reminder_id, remind_at in upcoming:
+                self.schedule(reminder_id, remind_at)
+            while True:
+                self._wakeup.clear()
+                next_due = self.next_due()
+                if next_due is None:
+                    await self._wakeup.wait()
+                    continue
+                delay = next_due - time.time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout
+                            =delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await self._fire(loop)
+        except asyncio.CancelledError:
+            logger.info('Reminder engine cancelled')
+            raise
+        finally:
+            self._loop = None
+            self._wakeup = None
+
+    async def _fire(self, loop: asyncio.AbstractEventLoop) ->None:
+        """Process due reminders and schedule the next one from the database."""
+        now = time.time()
+        due = self._pop_due(now)
+        with self._lock:
+            self._stats['db_checks'] += 1
+            for due_at, _ in due:
+                lag = now - due_at
+                self._stats['fired'] += 1
+                self._stats['total_lag'] += lag
+                self._stats['max_lag'] = max(self._stats['max_lag'], lag)
+        try:
+            upcoming = await loop.run_in_executor(self._executor, self.
+                _process_due)
+        except Exception as e:
+            logger.error(f'Reminder engine failed to process reminders: {e}')
+            retry_at = time.time() + RETRY_DELAY
+            for _, reminder_id in due:
+                self._push(reminder_id, retry_at)
+            return
+        if upcoming is not None:
+            self.schedule(*upcoming)
+
+
+_reminder_engine: Optional[ReminderEngine] = None
+
+
+def set_reminder_engine(engine: Optional[ReminderEngine]) ->None:
+    """Install the engine that reminder changes are reported to."""
+    global _reminder_engine
+    _reminder_engine = engine
+
+
+def get_reminder_engine() ->Optional[ReminderEngine]:
+    """Get the active reminder engine, if any."""
+    return _reminder_engine
+
+
+def notify_reminder_scheduled(reminder_id: int, remind_at: datetime) ->None:
+    """Report a new or moved reminder to the running engine."""
+    engine = _reminder_engine
+    if engine is not None and engine.is_running:
+        engine.schedule(reminder_id, remind_at)
+
+
+def notify_reminder_removed(reminder_id: int) ->None:
+    """Report a deleted reminder to the running engine."""
+    engine = _reminder_engine
+    if engine is not None and engine.is_running:
+        engine.discard(reminder_id)
@@ -127,6 +127,9 @@ class TaskManager:
         background_interval = 5.0 if test_mode else 1800.0
         try:
             await start_background_processing()
+            if not test_mode:
+                await self._resume_durable_jobs()
+                self.create_task(self._warm_up_nlp(), name='nlp_warm_up')
             self.create_task(self._managed_periodic_task(cache_cleanup_task,
                 interval=cache_interval, name='cache_cleanup'), name=
                 'cache_cleanup')
@@ -143,6 +146,36 @@ class TaskManager:
             logger.error(f'❌ Failed to start background services: {e}')
             raise
 
+    async def _resume_durable_jobs(self):
+        """
+        Enable the durable job store and resume jobs left by the last run.
+
+        Runs before init_db(), so the job store creates its own table when
+        needed. Failures are logged; the queue keeps working in memory.
+        """
+        from larrybot.config.loader import Config
+        from larrybot.utils.background_processing import enable_durable_jobs, resume_background_jobs
+        try:
+            config = Config()
+            if not config.DURABLE_JOBS:
+                return
+            enable_durable_jobs(result_ttl=config.JOB_RESULT_TTL_SECONDS)
+            resumed = await resume_background_jobs()
+            logger.info(f'✅ Durable job store ready ({resumed} jobs resumed)')
+        except Exception as e:
+            logger.error(f'❌ Failed to resume background jobs: {e}')
+
+    async def _warm_up_nlp(self):
+        """Load the shared spaCy pipeline off the event loop if NLP is enabled."""
+        from larrybot.config.loader import Config
+        from larrybot.nlp.model_registry import warm_up_nlp
+        try:
+            config = Config()
+            if config.NLP_ENABLED:
+                await warm_up_nlp(config.NLP_MODEL)
+        except Exception as e:
+            logger.error(f'❌ NLP warm-up failed: {e}')
+
     async def _managed_periodic_task(self, task_func, interval: float, name:
         str):
         """
@@ -247,6 +280,11 @@ class TaskManager:
             await stop_background_processing()
         except Exception as e:
             logger.error(f'Error stopping background processing: {e}')
+        try:
+            from larrybot.storage.async_db import shutdown_db_executor
+            shutdown_db_executor()
+        except Exception as e:
+            logger.error(f'Error stopping database executor: {e}')
         shutdown_duration = time.time() - start_time
         logger.info(f'✅ Shutdown completed in {shutdown_duration:.2f}s')
 
@@ -22,12 +22,12 @@ from larrybot.utils.datetime_utils import get_current_datetime
 from larrybot.utils.enhanced_ux_helpers import escape_markdown_v2, UnifiedButtonBuilder, ButtonType
 import random
 from datetime import datetime, timedelta
-from larrybot.services.task_service import TaskService
+from larrybot.services.daily_report_service import DailyReportService
 from larrybot.storage.db import get_optimized_session
-from larrybot.storage.habit_repository import HabitRepository
 from larrybot.utils.datetime_utils import get_current_datetime
 from larrybot.utils.datetime_utils import ensure_timezone_aware
 from larrybot.utils.telegram_safe import safe_edit
+from larrybot.utils.telegram_dispatcher import get_outbound_dispatcher
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +48,8 @@ class TelegramBotHandler:
         request = HTTPXRequest(connection_pool_size=8, connect_timeout=10.0,
             read_timeout=20.0, write_timeout=20.0, pool_timeout=5.0)
         self.application = Application.builder().token(self.config.
-            TELEGRAM_BOT_TOKEN).request(request).build()
+            TELEGRAM_BOT_TOKEN).request(request).rate_limiter(
+            get_outbound_dispatcher()).build()
         self.application.add_error_handler(self._global_error_handler)
         self._register_core_commands()
         self._register_core_handlers()
@@ -57,6 +58,7 @@ class TelegramBotHandler:
         self.sentiment_analyzer = SentimentAnalyzer()
         self.enhanced_narrative_processor = EnhancedNarrativeProcessor()
         self.enhanced_message_processor = EnhancedMessageProcessor()
+        self.daily_reports = DailyReportService(config)
 
     def _is_authorized(self, update: Update) ->bool:
         """Check if the user is authorized to use this single-user bot."""
@@ -2356,10 +2358,8 @@ Ready to boost your productivity? Here's what you can do:"""
             if date_input.lower() in ['clear', 'remove', 'none']:
                 with get_optimized_session() as session:
                     repo = TaskRepository(session)
-                    task = repo.get_task_by_id(task_id)
+                    task = repo.update_due_date(task_id, None)
                     if task:
-                        task.due_date = None
-                        session.commit()
                         
                         # Clear editing context
                         if 'editing_task_id' in context.user_data:
@@ -2391,11 +2391,9 @@ Ready to boost your productivity? Here's what you can do:"""
             # Update the task
             with get_optimized_session() as session:
                 repo = TaskRepository(session)
-                task = repo.get_task_by_id(task_id)
+                # Store the full timezone-aware datetime, not just the date portion
+                task = repo.update_due_date(task_id, parsed_date)
                 if task:
-                    # Store the full timezone-aware datetime, not just the date portion
-                    task.due_date = parsed_date
-                    session.commit()
                     
                     # Clear editing context
                     if 'editing_task_id' in context.user_data:
@@ -2437,10 +2435,8 @@ Ready to boost your productivity? Here's what you can do:"""
             # Update the task
             with get_optimized_session() as session:
                 repo = TaskRepository(session)
-                task = repo.get_task_by_id(task_id)
+                task = repo.update_category(task_id, category_value)
                 if task:
-                    task.category = category_value
-                    session.commit()
                     
                     # Clear editing context
                     if 'editing_task_id' in context.user_data:
@@ -3875,38 +3871,12 @@ Choose what you'd like to learn about:"""
         """Send a comprehensive daily report with tasks, habits, and motivational content."""
         logger.info('Generating daily report')
         try:
-            from larrybot.services.datetime_service import DateTimeService
-            start_of_today = DateTimeService.get_start_of_day()
-            end_of_today = DateTimeService.get_end_of_day()
-            with get_optimized_session() as session:
-                task_repository = TaskRepository(session)
-                task_service = TaskService(task_repository)
-                overdue_result = await task_service.get_tasks_with_filters(
-                    overdue_only=True)
-                due_today_result = await task_service.get_tasks_with_filters(
-                    due_after=start_of_today, due_before=end_of_today, done=False)
-                overdue_tasks = overdue_result['data'] if overdue_result[
-                    'success'] else []
-                due_today_tasks = due_today_result['data'] if due_today_result[
-                    'success'] else []
-                habit_repo = HabitRepository(session)
-                habits = habit_repo.list_habits()
-                habits_due = []
-                today_date = get_current_datetime().date()
-                for habit in habits:
-                    last_completed = habit.last_completed.date(
-                        ) if habit.last_completed else None
-                    if last_completed != today_date:
-                        habits_due.append(habit)
-            from larrybot.services.calendar_service import CalendarService
-            calendar_service = CalendarService(config=self.config)
-            calendar_events = await calendar_service.get_todays_events()
-            events = []
-            for event in calendar_events:
-                formatted_event = (calendar_service.
-                    format_event_for_daily_report(event))
-                events.append((formatted_event['time'], formatted_event[
-                    'name'], formatted_event['duration']))
+            snapshot = await self.daily_reports.get_snapshot()
+            overdue_tasks = snapshot.overdue_tasks
+            due_today_tasks = snapshot.due_today_tasks
+            habits_due = snapshot.habits_due
+            events = snapshot.events
+            today_date = snapshot.day
             quotes = ['Well begun is half done.',
                 'Success is the sum of small efforts repeated day in and day out.'
                 , 'The secret of getting ahead is getting started.',
@@ -3951,9 +3921,9 @@ Choose what you'd like to learn about:"""
             lines.append('🔄 **Habits Due Today:**')
             if habits_due:
                 for h in habits_due:
-                    streak = (f' — 🔥 Streak: {h.streak} days' if h.streak >
-                        1 else '')
-                    lines.append(f'- {h.name}{streak}')
+                    streak = (f" — 🔥 Streak: {h['current_streak']} days" if
+                        h['current_streak'] > 1 else '')
+                    lines.append(f"- {h['name']}{streak}")
             else:
                 lines.append('- _No habits due today!_')
             lines.append('')
@@ -3978,22 +3948,10 @@ Choose what you'd like to learn about:"""
         """Send focused end-of-day reminder with only urgent tasks."""
         logger.info('Generating end-of-day reminder')
         try:
-            from larrybot.services.datetime_service import DateTimeService
-            start_of_today = DateTimeService.get_start_of_day()
-            end_of_today = DateTimeService.get_end_of_day()
-            
-            with get_optimized_session() as session:
-                task_repository = TaskRepository(session)
-                task_service = TaskService(task_repository)
-                
-                # Get overdue tasks
-                overdue_result = await task_service.get_tasks_with_filters(overdue_only=True)
-                overdue_tasks = overdue_result['data'] if overdue_result['success'] else []
-                
-                # Get tasks due today
-                due_today_result = await task_service.get_tasks_with_filters(
-                    due_after=start_of_today, due_before=end_of_today, done=False)
-                due_today_tasks = due_today_result['data'] if due_today_result['success'] else []
+            # Task sections come from the daily report snapshot
+            snapshot = await self.daily_reports.get_snapshot(include_calendar=False)
+            overdue_tasks = snapshot.overdue_tasks
+            due_today_tasks = snapshot.due_today_tasks
             
             # Build focused message
             urgent_count = len(overdue_tasks) + len(due_today_tasks)
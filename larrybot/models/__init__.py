@@ -3,6 +3,7 @@ Base = declarative_base()
 from .task import Task
 from .client import Client
 from .habit import Habit
+from .habit_completion import HabitCompletion
 from .reminder import Reminder
 from .task_comment import TaskComment
 from .task_dependency import TaskDependency
@@ -10,6 +11,11 @@ from .task_time_entry import TaskTimeEntry
 from .task_attachment import TaskAttachment
 from .calendar_token import CalendarToken
 from .metrics import CommandMetric, UserActivityMetric
-__all__ = ['Task', 'Client', 'Habit', 'Reminder', 'TaskComment',
-    'TaskDependency', 'TaskTimeEntry', 'TaskAttachment', 'CalendarToken',
-    'CommandMetric', 'UserActivityMetric']
+from .background_job import BackgroundJobRecord
+from .task_daily_stats import TaskDailyStats
+from .tag import Tag, TaskTag
+from . import task_search_index
+__all__ = ['Task', 'Client', 'Habit', 'HabitCompletion', 'Reminder',
+    'TaskComment', 'TaskDependency', 'TaskTimeEntry', 'TaskAttachment',
+    'CalendarToken', 'CommandMetric', 'UserActivityMetric',
+    'BackgroundJobRecord', 'TaskDailyStats', 'Tag', 'TaskTag']
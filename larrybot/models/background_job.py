@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, func
+from larrybot.models import Base
+
+
+class BackgroundJobRecord(Base):
+    """
+    SQLAlchemy model for a persisted background job.
+    Pending and running jobs are resumed at startup; finished jobs keep their
+    result until expires_at so identical submissions can reuse it.
+    Arguments and results are JSON text (see larrybot.storage.job_store).
+    All datetime fields are stored as UTC and must be timezone-aware in the application layer.
+    """
+    __tablename__ = 'background_jobs'
+    id = Column(String(255), primary_key=True)
+    idempotency_key = Column(String(255), nullable=True)
+    func_path = Column(String(255), nullable=False)
+    args = Column(Text, nullable=False, default='[]')
+    kwargs = Column(Text, nullable=False, default='{}')
+    priority = Column(Integer, nullable=False, default=5)
+    executor = Column(String(20), nullable=False, default='thread')
+    status = Column(String(20), nullable=False, default='pending')
+    result = Column(Text, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=func.now(),
+        nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+    __table_args__ = Index('idx_background_jobs_status', 'status'), Index(
+        'idx_background_jobs_idempotency_key', 'idempotency_key')
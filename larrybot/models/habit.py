@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String, Date, DateTime, func
+from sqlalchemy.orm import relationship
 from larrybot.models import Base
 import datetime
 
@@ -15,3 +16,5 @@ class Habit(Base):
     last_completed = Column(Date, nullable=True)
     created_at = Column(DateTime(timezone=True), default=func.now(),
         nullable=False)
+    completions = relationship('HabitCompletion', back_populates='habit',
+        cascade='all, delete-orphan')
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, Index, func
+from sqlalchemy.orm import relationship
+from larrybot.models import Base
+
+
+class HabitCompletion(Base):
+    """
+    SQLAlchemy model for one day on which a habit was completed.
+    completed_on is the local calendar day; created_at is stored as UTC.
+    HabitRepository appends a row each time a habit is marked done, and
+    streaks and completion rates are derived from these rows.
+    """
+    __tablename__ = 'habit_completions'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    habit_id = Column(Integer, ForeignKey('habits.id'), nullable=False)
+    completed_on = Column(Date, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=func.now(),
+        nullable=False)
+    habit = relationship('Habit', back_populates='completions')
+    __table_args__ = Index('idx_habit_completions_habit_day', 'habit_id',
+        'completed_on', unique=True),
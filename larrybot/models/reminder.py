@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, func
 from larrybot.models import Base
 
 
@@ -13,3 +13,4 @@ class Reminder(Base):
     remind_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), default=func.now(),
         nullable=False)
+    __table_args__ = Index('idx_reminders_remind_at', 'remind_at'),
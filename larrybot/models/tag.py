@@ -0,0 +1,115 @@
+"""
+Normalized task tags.
+
+Each distinct tag name is one row of tags; task_tags links tasks to tags and
+is what tag queries join against. Names compare case-insensitively, as the
+old LIKE matching did, so tasks tagged "work" and "Work" share one tags row.
+tasks.tags keeps a JSON copy of a task's tag names, in the casing that task
+was given, for display and search: triggers resync task_tags whenever a
+task's JSON is inserted or rewritten (TaskRepository.add_tags/remove_tags,
+Task.set_tags_list/add_tag/remove_tag), and add or drop the one name when
+task_tags is changed directly, leaving the task's other names as they are.
+Triggers do not fire recursively in SQLite, and each direction only writes
+when the other side disagrees.
+"""
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, event, text
+from larrybot.models import Base
+
+
+class Tag(Base):
+    """SQLAlchemy model for a tag name, shared by every task carrying it."""
+    __tablename__ = 'tags'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(100, collation='NOCASE'), nullable=False, unique=True)
+
+
+class TaskTag(Base):
+    """SQLAlchemy model linking a task to one of its tags."""
+    __tablename__ = 'task_tags'
+    task_id = Column(Integer, ForeignKey('tasks.id', ondelete='CASCADE'),
+        primary_key=True)
+    tag_id = Column(Integer, ForeignKey('tags.id', ondelete='CASCADE'),
+        primary_key=True)
+    __table_args__ = Index('idx_task_tags_tag_task', 'tag_id', 'task_id'),
+
+
+TAG_NAME = '(SELECT name FROM tags WHERE id = {task}.tag_id)'
+TASK_TAGS_APPEND = """json_insert(CASE WHEN json_valid(tasks.tags) THEN tasks.tags ELSE '[]' END,
+        '$[#]', """ + TAG_NAME + ')'
+TASK_TAGS_WITHOUT = """(SELECT CASE WHEN count(*) > 0 THEN json_group_array(item.value) END
+        FROM json_each(tasks.tags) AS item
+        WHERE trim(item.value) != """ + TAG_NAME + ' COLLATE NOCASE)'
+IN_JSON = """EXISTS (SELECT 1 FROM tasks, tags, json_each(CASE WHEN json_valid(tasks.tags)
+        THEN tasks.tags ELSE '[]' END) AS item
+        WHERE tasks.id = {task}.task_id AND tags.id = {task}.tag_id
+        AND trim(item.value) = tags.name COLLATE NOCASE)"""
+JSON_NAMES = """SELECT DISTINCT trim(value) FROM json_each(CASE WHEN json_valid({tags})
+        THEN {tags} ELSE '[]' END) WHERE trim(value) != ''"""
+BACKFILL = ("""
+INSERT OR IGNORE INTO tags (name)
+SELECT DISTINCT trim(item.value) FROM tasks, json_each(CASE WHEN json_valid(tasks.tags)
+    THEN tasks.tags ELSE '[]' END) AS item WHERE trim(item.value) != ''"""
+    , f"""
+INSERT OR IGNORE INTO task_tags (task_id, tag_id)
+SELECT tasks.id, tags.id FROM tasks, tags
+WHERE tags.name IN ({JSON_NAMES.format(tags='tasks.tags')})""")
+TRIGGERS = {'tasks_tags_insert':
+    f"""
+AFTER INSERT ON tasks WHEN new.tags IS NOT NULL BEGIN
+    INSERT OR IGNORE INTO tags (name) {JSON_NAMES.format(tags='new.tags')};
+    INSERT OR IGNORE INTO task_tags (task_id, tag_id)
+    SELECT new.id, id FROM tags WHERE name IN ({JSON_NAMES.format(tags='new.tags')});
+END"""
+    , 'tasks_tags_update':
+    f"""
+AFTER UPDATE OF tags ON tasks WHEN new.tags IS NOT old.tags BEGIN
+    INSERT OR IGNORE INTO tags (name) {JSON_NAMES.format(tags='new.tags')};
+    DELETE FROM task_tags WHERE task_id = new.id AND tag_id NOT IN (
+        SELECT id FROM tags WHERE name IN ({JSON_NAMES.format(tags='new.tags')}));
+    INSERT OR IGNORE INTO task_tags (task_id, tag_id)
+    SELECT new.id, id FROM tags WHERE name IN ({JSON_NAMES.format(tags='new.tags')});
+END"""
+    , 'tasks_tags_delete':
+    """
+AFTER DELETE ON tasks BEGIN
+    DELETE FROM task_tags WHERE task_id = old.id;
+END"""
+    , 'task_tags_json_insert':
+    f"""
+AFTER INSERT ON task_tags WHEN NOT {IN_JSON.format(task='new')} BEGIN
+    UPDATE tasks SET tags = {TASK_TAGS_APPEND.format(task='new')} WHERE id = new.task_id;
+END"""
+    , 'task_tags_json_delete':
+    f"""
+AFTER DELETE ON task_tags WHEN {IN_JSON.format(task='old')} BEGIN
+    UPDATE tasks SET tags = {TASK_TAGS_WITHOUT.format(task='old')} WHERE id = old.task_id;
+END"""
+    }
+
+
+def create_tag_triggers(connection) ->bool:
+    """
+    Wire up the task_tags triggers unless they already exist.
+
+    task_tags is backfilled from tasks.tags the first time. Returns False
+    when the database is not SQLite or lacks the tag tables.
+    """
+    if connection.dialect.name != 'sqlite':
+        return False
+    tables = set(connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")).scalars())
+    if not {'tasks', 'tags', 'task_tags'} <= tables:
+        return False
+    triggers = set(connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger'")).scalars())
+    if not triggers & TRIGGERS.keys():
+        for statement in BACKFILL:
+            connection.execute(text(statement))
+    for name, body in TRIGGERS.items():
+        connection.execute(text(f'CREATE TRIGGER IF NOT EXISTS {name} {body}'))
+    return True
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _create_tag_triggers(target, connection, **kw) ->None:
+    create_tag_triggers(connection)
@@ -7,7 +7,7 @@ validation, and enterprise-grade data consistency.
 All datetime fields are stored as UTC and must be timezone-aware in the application layer.
 """
 from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Float, ForeignKey, Enum, Index
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.orm import relationship, Mapped, mapped_column, validates
 from sqlalchemy.ext.hybrid import hybrid_property
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
@@ -27,8 +27,8 @@ class Task(Base):
         )
     status: Mapped[TaskStatus] = mapped_column(String(20), default=
         TaskStatus.TODO.value, nullable=False)
-    _priority: Mapped[TaskPriority] = mapped_column('priority', String(20),
-        default=TaskPriority.MEDIUM.value, nullable=False)
+    _priority: Mapped[int] = mapped_column('priority', Integer, default=
+        TaskPriority.MEDIUM.value, nullable=False)
     done: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     due_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=
         True), nullable=True)
@@ -76,7 +76,10 @@ class Task(Base):
         'idx_tasks_priority', 'priority'), Index('idx_tasks_due_date',
         'due_date'), Index('idx_tasks_created_at', 'created_at'), Index(
         'idx_tasks_category', 'category'), Index('idx_tasks_external_id',
-        'external_id')
+        'external_id'), Index('idx_tasks_done_priority_due', 'done',
+        'priority', 'due_date'), Index('idx_tasks_done_due_date', 'done',
+        'due_date'), Index('idx_tasks_client_done', 'client_id', 'done'
+        ), Index('idx_tasks_parent_id', 'parent_id')
 
     def __init__(self, **kwargs):
         """Initialize task with enhanced validation."""
@@ -96,23 +99,7 @@ class Task(Base):
             elif isinstance(status_value, TaskStatus):
                 kwargs['status'] = status_value.value
         if 'priority' in kwargs:
-            priority_value = kwargs.pop('priority')
-            if priority_value is None:
-                kwargs['_priority'] = None
-            elif isinstance(priority_value, str):
-                if priority_value in ['Low', 'Medium', 'High', 'Critical',
-                    'Urgent']:
-                    enum_value = TaskPriority.from_string(priority_value)
-                    kwargs['_priority'] = (enum_value.value if enum_value else
-                        TaskPriority.MEDIUM.value)
-                else:
-                    enum_value = TaskPriority.from_string(priority_value)
-                    kwargs['_priority'] = (enum_value.value if enum_value else
-                        TaskPriority.MEDIUM.value)
-            elif isinstance(priority_value, TaskPriority):
-                kwargs['_priority'] = priority_value.value
-            elif isinstance(priority_value, int):
-                kwargs['_priority'] = priority_value
+            kwargs['_priority'] = kwargs.pop('priority')
         if 'created_at' not in kwargs:
             kwargs['created_at'] = get_utc_now()
         if 'updated_at' not in kwargs:
@@ -150,29 +137,33 @@ class Task(Base):
     @property
     def priority_enum(self) ->Optional[TaskPriority]:
         """Get priority as enum type."""
-        if self._priority is None:
+        return Task.priority_from_value(self._priority)
+
+    @staticmethod
+    def priority_from_value(value) ->Optional[TaskPriority]:
+        """Convert a stored priority column value to the enum type."""
+        if value is None:
             return None
-        if not self._priority:
+        if not value:
             return TaskPriority.MEDIUM
-        if isinstance(self._priority, int):
+        if isinstance(value, int):
             try:
-                return TaskPriority(self._priority)
+                return TaskPriority(value)
             except ValueError:
                 return TaskPriority.MEDIUM
-        elif isinstance(self._priority, str):
+        elif isinstance(value, str):
             try:
-                int_value = int(self._priority)
+                int_value = int(value)
                 return TaskPriority(int_value)
             except (ValueError, TypeError):
-                return TaskPriority.from_string(self._priority
-                    ) or TaskPriority.MEDIUM
+                return TaskPriority.from_string(value) or TaskPriority.MEDIUM
         else:
             return TaskPriority.MEDIUM
 
     @priority_enum.setter
     def priority_enum(self, value: TaskPriority) ->None:
         """Set priority using enum type."""
-        self._priority = value.value
+        self._priority = value
 
     @hybrid_property
     def priority(self) ->Optional[str]:
@@ -191,29 +182,34 @@ class Task(Base):
 
     @priority.setter
     def priority(self, value) ->None:
-        """Set priority from various input types."""
-        if value is None:
-            self._priority = None
-            return
+        """Set priority from an enum, level number or name."""
+        self._priority = value
+
+    @validates('_priority')
+    def _validate_priority(self, key: str, value) ->Optional[int]:
+        return None if value is None else Task.priority_code(value)
+
+    @staticmethod
+    def priority_code(value) ->int:
+        """
+        Normalize a priority to the integer code stored in tasks.priority.
+
+        Accepts a TaskPriority, its level number (also as a string) or its
+        name in any case; raises ValueError for anything else.
+        """
         if isinstance(value, str):
-            if value in ['Low', 'Medium', 'High', 'Critical', 'Urgent']:
-                enum_value = TaskPriority.from_string(value)
-                self._priority = (enum_value.value if enum_value else
-                    TaskPriority.MEDIUM.value)
-            else:
-                enum_value = TaskPriority.from_string(value)
-                self._priority = (enum_value.value if enum_value else
-                    TaskPriority.MEDIUM.value)
-        elif isinstance(value, TaskPriority):
-            self._priority = value.value
-        elif isinstance(value, int):
+            value = value.strip()
+            priority_enum = TaskPriority.from_string(value)
+            if priority_enum is not None:
+                return priority_enum.value
+            if value.isdigit():
+                value = int(value)
+        if isinstance(value, int) and not isinstance(value, bool):
             try:
-                TaskPriority(value)
-                self._priority = value
+                return TaskPriority(value).value
             except ValueError:
-                self._priority = TaskPriority.MEDIUM.value
-        else:
-            self._priority = TaskPriority.MEDIUM.value
+                pass
+        raise ValueError(f'Invalid priority: {value!r}')
 
     def set_done(self, value: bool) ->None:
         """Set completion status and synchronize with status field."""
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from larrybot.models import Base
@@ -25,6 +25,8 @@ class TaskAttachment(Base):
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow,
         onupdate=datetime.utcnow, nullable=False)
     task = relationship('Task', back_populates='attachments')
+    __table_args__ = Index('idx_task_attachments_task_created', 'task_id',
+        'created_at'),
 
     def __repr__(self):
         return (
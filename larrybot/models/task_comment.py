@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from larrybot.models import Base
@@ -17,3 +17,5 @@ class TaskComment(Base):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow,
         nullable=False)
     task = relationship('Task', back_populates='comments')
+    __table_args__ = Index('idx_task_comments_task_created', 'task_id',
+        'created_at'),
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, String, Date, Float, Index
+from larrybot.models import Base
+
+
+class TaskDailyStats(Base):
+    """
+    SQLAlchemy model for the per-day task rollup.
+    One row per local creation day, category, priority and client holds the
+    task counts and hours of the tasks created on that day; it is derived
+    data maintained by TaskRepository (see larrybot.storage.task_rollups).
+    """
+    __tablename__ = 'task_daily_stats'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False)
+    category = Column(String(100), nullable=True)
+    priority = Column(Integer, nullable=True)
+    client_id = Column(Integer, nullable=True)
+    tasks_created = Column(Integer, nullable=False, default=0)
+    tasks_completed = Column(Integer, nullable=False, default=0)
+    estimated_hours = Column(Float, nullable=False, default=0.0)
+    actual_hours = Column(Float, nullable=False, default=0.0)
+    completion_hours = Column(Float, nullable=False, default=0.0)
+    __table_args__ = Index('idx_task_daily_stats_day_priority', 'day',
+        'priority'),
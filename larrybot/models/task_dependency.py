@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from larrybot.models import Base
@@ -19,3 +19,6 @@ class TaskDependency(Base):
         'dependencies')
     dependency = relationship('Task', foreign_keys=[dependency_id],
         back_populates='dependents')
+    __table_args__ = Index('idx_task_dependencies_task_dependency',
+        'task_id', 'dependency_id'), Index(
+        'idx_task_dependencies_dependency', 'dependency_id')
@@ -0,0 +1,103 @@
+"""
+Full-text search index over tasks.
+
+tasks_fts is an SQLite FTS5 table whose rowid is the task id; it holds each
+task's description, title, category, tags and concatenated comments.
+Triggers on tasks and task_comments keep it in sync. The Alembic migration
+creates it for existing databases and Base.metadata.create_all() for new
+ones; SQLite builds without FTS5 skip it, and search falls back to LIKE.
+"""
+import logging
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from larrybot.models import Base
+logger = logging.getLogger(__name__)
+FTS_TABLE = 'tasks_fts'
+FTS_COLUMNS = 'description', 'title', 'category', 'tags', 'comments'
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE tasks_fts USING fts5(
+    description, title, category, tags, comments,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+)"""
+POPULATE = """
+INSERT INTO tasks_fts(rowid, description, title, category, tags, comments)
+SELECT id, description, title, category, tags,
+    (SELECT group_concat(comment, ' ') FROM task_comments WHERE task_id = tasks.id)
+FROM tasks"""
+TRIGGERS = {'tasks_fts_insert':
+    """
+AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, description, title, category, tags, comments)
+    VALUES (new.id, new.description, new.title, new.category, new.tags,
+        (SELECT group_concat(comment, ' ') FROM task_comments WHERE task_id = new.id));
+END"""
+    , 'tasks_fts_update':
+    """
+AFTER UPDATE OF description, title, category, tags ON tasks BEGIN
+    DELETE FROM tasks_fts WHERE rowid = old.id;
+    INSERT INTO tasks_fts(rowid, description, title, category, tags, comments)
+    VALUES (new.id, new.description, new.title, new.category, new.tags,
+        (SELECT group_concat(comment, ' ') FROM task_comments WHERE task_id = new.id));
+END"""
+    , 'tasks_fts_delete':
+    """
+AFTER DELETE ON tasks BEGIN
+    DELETE FROM tasks_fts WHERE rowid = old.id;
+END"""
+    , 'task_comments_fts_insert':
+    """
+AFTER INSERT ON task_comments BEGIN
+    UPDATE tasks_fts SET comments = (SELECT group_concat(comment, ' ')
+        FROM task_comments WHERE task_id = new.task_id) WHERE rowid = new.task_id;
+END"""
+    , 'task_comments_fts_update':
+    """
+AFTER UPDATE ON task_comments BEGIN
+    UPDATE tasks_fts SET comments = (SELECT group_concat(comment, ' ')
+        FROM task_comments WHERE task_id = old.task_id) WHERE rowid = old.task_id;
+    UPDATE tasks_fts SET comments = (SELECT group_concat(comment, ' ')
+        FROM task_comments WHERE task_id = new.task_id) WHERE rowid = new.task_id;
+END"""
+    , 'task_comments_fts_delete':
+    """
+AFTER DELETE ON task_comments BEGIN
+    UPDATE tasks_fts SET comments = (SELECT group_concat(comment, ' ')
+        FROM task_comments WHERE task_id = old.task_id) WHERE rowid = old.task_id;
+END"""
+    }
+
+
+def create_search_index(connection) ->bool:
+    """
+    Create, fill and wire up tasks_fts unless it already exists.
+
+    Returns False when the database is not SQLite, lacks FTS5 or has no
+    tasks tables yet.
+    """
+    if connection.dialect.name != 'sqlite':
+        return False
+    tables = set(connection.execute(text(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")).scalars())
+    if not {'tasks', 'task_comments'} <= tables:
+        return False
+    if FTS_TABLE not in tables:
+        try:
+            connection.execute(text(CREATE_TABLE))
+        except OperationalError as e:
+            logger.warning(f'FTS5 unavailable, task search uses LIKE: {e}')
+            return False
+        connection.execute(text(POPULATE))
+    for name, body in TRIGGERS.items():
+        connection.execute(text(f'CREATE TRIGGER IF NOT EXISTS {name} {body}'))
+    return True
+
+
+@event.listens_for(Base.metadata, 'after_create')
+def _create_search_index(target, connection, **kw) ->None:
+    create_search_index(connection)
+
+
+@event.listens_for(Base.metadata, 'before_drop')
+def _drop_search_index(target, connection, **kw) ->None:
+    if connection.dialect.name == 'sqlite':
+        connection.execute(text(f'DROP TABLE IF EXISTS {FTS_TABLE}'))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from larrybot.models import Base
@@ -19,6 +19,8 @@ class TaskTimeEntry(Base):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow,
         nullable=False)
     task = relationship('Task', back_populates='time_entries')
+    __table_args__ = Index('idx_task_time_entries_task_duration',
+        'task_id', 'duration_minutes'),
 
     @property
     def hours(self) -> float:
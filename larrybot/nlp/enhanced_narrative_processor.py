@@ -5,15 +5,19 @@ This module provides advanced natural language processing capabilities for
 conversational task management, including context-aware responses and smart defaults.
 """
 import re
+import copy
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from enum import Enum
 from larrybot.nlp.intent_recognizer import IntentRecognizer
+from larrybot.nlp.intent_rules import IntentRuleSet
 from larrybot.nlp.entity_extractor import EntityExtractor
 from larrybot.nlp.sentiment_analyzer import SentimentAnalyzer
 logger = logging.getLogger(__name__)
+ANALYSIS_CACHE_SIZE = 256
 
 
 class IntentType(Enum):
@@ -32,6 +36,9 @@ class IntentType(Enum):
     UNKNOWN = 'unknown'
 
 
+DOC_FREE_INTENTS = frozenset({IntentType.LIST_TASKS, IntentType.GET_ANALYTICS})
+
+
 class TaskCreationState(Enum):
     """States for the narrative task creation flow."""
     AWAITING_DESCRIPTION = 'awaiting_description'
@@ -80,6 +87,16 @@ class ProcessedInput:
     response_keyboard: Optional[Any] = None
 
 
+@dataclass
+class MessageAnalysis:
+    """Intent, entity and sentiment analysis of one message."""
+    intent: IntentType
+    confidence: float
+    extracted_text: Optional[str]
+    entities: Dict[str, Any]
+    sentiment: str
+
+
 class SmartDefaults:
     """Smart default values based on user patterns and context."""
 
@@ -189,6 +206,10 @@ class EnhancedNarrativeProcessor:
         self.sentiment_analyzer = SentimentAnalyzer(config)
         self.smart_defaults = SmartDefaults()
         self.conversation_manager = ConversationManager()
+        self._analysis_cache: OrderedDict[str, MessageAnalysis] = OrderedDict(
+            )
+        self._analysis_stats = {'hits': 0, 'misses': 0, 'parses': 0,
+            'fast_path': 0}
         self.intent_patterns = {IntentType.SET_REMINDER: [
             'remind\\s+me\\s+to\\s+(.+)'], IntentType.LIST_TASKS: [
             'show\\s+(?:my\\s+)?tasks', 'list\\s+(?:my\\s+)?tasks',
@@ -214,6 +235,9 @@ class EnhancedNarrativeProcessor:
             'remind\\s+me\\s+to\\s+(.+)', 'i\\s+need\\s+to\\s+(.+)',
             'i\\s+should\\s+(.+)', 'i\\s+want\\s+to\\s+(.+)',
             '(.+)\\s+(?:is\\s+)?(?:a\\s+)?task']}
+        self._intent_rules = IntentRuleSet(((intent_type, pattern) for 
+            intent_type, patterns in self.intent_patterns.items() for
+            pattern in patterns), re.IGNORECASE)
 
     def process_input(self, text: str, user_id: int=None) ->ProcessedInput:
         """
@@ -233,11 +257,11 @@ class EnhancedNarrativeProcessor:
             return self._create_unknown_result('Empty input')
         context = self.conversation_manager.get_context(user_id
             ) if user_id else None
-        intent, confidence, extracted_text = self._recognize_intent_enhanced(
-            text)
-        entities = self.entity_extractor.extract_entities(text)
-        sentiment = self.sentiment_analyzer.analyze_sentiment(text)
-        entities = self._apply_smart_defaults(text, entities, context)
+        analysis = self._analyze(text)
+        intent, confidence = analysis.intent, analysis.confidence
+        sentiment = analysis.sentiment
+        entities = self._apply_smart_defaults(text, copy.deepcopy(analysis.
+            entities), context)
         suggested_command, suggested_parameters = self._generate_suggestions(
             intent, entities, text, context)
         response_message = self._generate_response_message(intent, entities,
@@ -252,29 +276,89 @@ class EnhancedNarrativeProcessor:
             suggested_parameters=suggested_parameters, context=
             result_context, response_message=response_message)
 
-    def _recognize_intent_enhanced(self, text: str) ->Tuple[IntentType,
-        float, Optional[str]]:
+    def _analyze(self, text: str) ->MessageAnalysis:
+        """
+        Run intent, entity and sentiment analysis over a single parse.
+
+        Compiled intent rules run first; list and analytics requests they
+        resolve need no entities and never touch the spaCy model. Other
+        messages are parsed once and the Doc is shared by every stage.
+        Results are kept in an LRU cache keyed by the whitespace-normalized
+        text, so repeated messages skip NLP entirely. Results containing a
+        date are not cached because dates like "tomorrow" are relative to
+        the current time.
+        """
+        key = ' '.join(text.split())
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+            self._analysis_stats['hits'] += 1
+            return cached
+        self._analysis_stats['misses'] += 1
+        fast = self._match_intent_rules(text)
+        if fast is not None and fast[0] in DOC_FREE_INTENTS:
+            self._analysis_stats['fast_path'] += 1
+            intent, confidence, extracted_text = fast
+            entities = {}
+        else:
+            doc = self.entity_extractor.parse(text)
+            if doc is not None:
+                self._analysis_stats['parses'] += 1
+            intent, confidence, extracted_text = (fast or self.
+                _recognize_basic_intent(text, doc))
+            entities = self.entity_extractor.extract_entities(text, doc=doc)
+        sentiment = self.sentiment_analyzer.analyze_sentiment(text)
+        analysis = MessageAnalysis(intent=intent, confidence=confidence,
+            extracted_text=extracted_text, entities=entities, sentiment=
+            sentiment)
+        if 'date' not in entities:
+            self._analysis_cache[key] = analysis
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        return analysis
+
+    def get_analysis_stats(self) ->Dict[str, Any]:
+        """Get analysis cache hits, misses, parses and fast-path count."""
+        stats = dict(self._analysis_stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['entries'] = len(self._analysis_cache)
+        return stats
+
+    def _match_intent_rules(self, text: str) ->Optional[Tuple[IntentType,
+        float, Optional[str]]]:
+        """
+        Resolve the intent from compiled rules alone, without spaCy.
+
+        Tries the narrative patterns, then the recognizer's keywords.
+        Returns None for ambiguous input that needs the parsed Doc.
+        """
+        match = self._intent_rules.search(text.lower())
+        if match is not None:
+            if match.intent in (IntentType.LIST_TASKS, IntentType.
+                SEARCH_TASKS, IntentType.GET_ANALYTICS):
+                confidence = 0.71
+            else:
+                confidence = 0.9 if len(match.text) > 10 else 0.7
+            return match.intent, confidence, match.captured
+        basic_intent = self.intent_recognizer.match_keywords(text)
+        if basic_intent is not None:
+            return IntentType(basic_intent), 0.51, None
+        return None
+
+    def _recognize_intent_enhanced(self, text: str, doc=None) ->Tuple[
+        IntentType, float, Optional[str]]:
         """Enhanced intent recognition using pattern matching."""
-        text_lower = text.lower()
-        for intent_type, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                match = re.search(pattern, text_lower, re.IGNORECASE)
-                if match:
-                    extracted_text = match.group(1) if len(match.groups()
-                        ) > 0 else None
-                    if intent_type in [IntentType.LIST_TASKS, IntentType.
-                        SEARCH_TASKS, IntentType.GET_ANALYTICS]:
-                        confidence = 0.71
-                    else:
-                        confidence = 0.9 if len(match.group(0)) > 10 else 0.7
-                    return intent_type, confidence, extracted_text
-        basic_intent = self.intent_recognizer.recognize_intent(text)
-        intent_mapping = {'create_task': IntentType.CREATE_TASK,
-            'set_reminder': IntentType.SET_REMINDER, 'get_analytics':
-            IntentType.GET_ANALYTICS, 'edit_task': IntentType.EDIT_TASK}
-        intent_type = intent_mapping.get(basic_intent, IntentType.UNKNOWN)
-        confidence = 0.51 if basic_intent != 'unknown' else 0.1
-        return intent_type, confidence, None
+        return self._match_intent_rules(text) or self._recognize_basic_intent(
+            text, doc)
+
+    def _recognize_basic_intent(self, text: str, doc=None) ->Tuple[
+        IntentType, float, Optional[str]]:
+        """Fall back to the spaCy-based recognizer for ambiguous input."""
+        basic_intent = self.intent_recognizer.recognize_intent(text, doc=doc)
+        if basic_intent != 'unknown':
+            return IntentType(basic_intent), 0.51, None
+        return IntentType.UNKNOWN, 0.1, None
 
     def _apply_smart_defaults(self, text: str, entities: Dict[str, Any],
         context: NarrativeContext) ->Dict[str, Any]:
@@ -537,5 +621,5 @@ class EnhancedNarrativeProcessor:
 
 
 __all__ = ['EnhancedNarrativeProcessor', 'IntentType', 'ContextType',
-    'NarrativeContext', 'ProcessedInput', 'SmartDefaults',
+    'NarrativeContext', 'ProcessedInput', 'MessageAnalysis', 'SmartDefaults',
     'ConversationManager']
@@ -1,11 +1,11 @@
-import spacy
-from dateparser import parse as parse_date
 from larrybot.config.loader import Config
+from larrybot.nlp.model_registry import get_shared_model
+from larrybot.services.datetime_service import get_date_resolver
 
 
 class EntityExtractor:
     """
-    Extracts entities (e.g., dates, times, task names) from natural language input using spaCy and dateparser.
+    Extracts entities (e.g., dates, times, task names) from natural language input using spaCy and the shared date resolver.
     """
 
     def __init__(self, config: Config=None):
@@ -14,32 +14,41 @@ class EntityExtractor:
         self.model_name = getattr(config, 'NLP_MODEL', 'en_core_web_sm'
             ) if config else 'en_core_web_sm'
         self._nlp = None
-        if self.enabled:
-            try:
-                self._nlp = spacy.load(self.model_name)
-            except Exception:
-                self._nlp = None
+
+    def _get_nlp(self):
+        """Get the shared spaCy pipeline, disabling NLP if it cannot load."""
+        if self._nlp is None and self.enabled:
+            self._nlp = get_shared_model(self.model_name)
+            if self._nlp is None:
                 self.enabled = False
+        return self._nlp
+
+    def parse(self, text: str):
+        """Parse text with the shared pipeline, or return None if NLP is off."""
+        nlp = self._get_nlp()
+        return nlp(text) if nlp is not None else None
 
-    def extract_entities(self, text: str) ->dict:
+    def extract_entities(self, text: str, doc=None) ->dict:
         """
         Analyze the input text and return a dictionary of extracted entities.
         Extracts: date, time, task_name (if possible).
         'date' is always set to the first found date (dateparser or spaCy NER).
         'all_dates' contains all found dates (optional).
+        Pass the doc returned by parse() to avoid parsing the text again.
         """
-        if not self.enabled or not self._nlp:
+        if doc is None:
+            doc = self.parse(text)
+        if doc is None:
             return {}
-        doc = self._nlp(text)
         entities = {}
         all_dates = []
-        date = parse_date(text, settings={'PREFER_DATES_FROM': 'future'})
+        resolver = get_date_resolver()
+        date = resolver.parse(text)
         if date:
             all_dates.append(date.isoformat())
         for ent in doc.ents:
             if ent.label_ in ['DATE', 'TIME']:
-                parsed = parse_date(ent.text, settings={'PREFER_DATES_FROM':
-                    'future'})
+                parsed = resolver.parse(ent.text)
                 if parsed:
                     all_dates.append(parsed.isoformat())
             if ent.label_ in ['PERSON', 'ORG', 'GPE']:
@@ -1,5 +1,11 @@
-import spacy
+from typing import Optional
 from larrybot.config.loader import Config
+from larrybot.nlp.intent_rules import KeywordRuleSet
+from larrybot.nlp.model_registry import get_shared_model
+KEYWORD_RULES = KeywordRuleSet((('create_task', ('add task', 'create task',
+    'new task', 'todo')), ('set_reminder', ('remind', 'reminder',
+    'remind me')), ('get_analytics', ('analytics', 'stats', 'report')), (
+    'edit_task', ('edit task', 'change task', 'update task'))))
 
 
 class IntentRecognizer:
@@ -13,34 +19,43 @@ class IntentRecognizer:
         self.model_name = getattr(config, 'NLP_MODEL', 'en_core_web_sm'
             ) if config else 'en_core_web_sm'
         self._nlp = None
-        if self.enabled:
-            try:
-                self._nlp = spacy.load(self.model_name)
-            except Exception:
-                self._nlp = None
+
+    def _get_nlp(self):
+        """Get the shared spaCy pipeline, disabling NLP if it cannot load."""
+        if self._nlp is None and self.enabled:
+            self._nlp = get_shared_model(self.model_name)
+            if self._nlp is None:
                 self.enabled = False
+        return self._nlp
+
+    def match_keywords(self, text: str) ->Optional[str]:
+        """
+        Get the intent of text from keyword rules alone, without parsing.
+
+        Returns None when no keyword matches or NLP is disabled.
+        """
+        if self._get_nlp() is None:
+            return None
+        return KEYWORD_RULES.search(text)
 
-    def recognize_intent(self, text: str) ->str:
+    def recognize_intent(self, text: str, doc=None) ->str:
         """
         Analyze the input text and return the detected intent as a string.
         Supported intents: create_task, set_reminder, get_analytics, edit_task, unknown.
+        Pass an already parsed doc to avoid parsing the text again.
         """
-        if not self.enabled or not self._nlp:
+        nlp = self._get_nlp()
+        if nlp is None:
             return 'unknown'
-        doc = self._nlp(text.lower())
-        if any(w in text.lower() for w in ['add task', 'create task',
-            'new task', 'todo']):
-            return 'create_task'
-        if any(w in text.lower() for w in ['remind', 'reminder', 'remind me']):
-            return 'set_reminder'
-        if any(w in text.lower() for w in ['analytics', 'stats', 'report']):
-            return 'get_analytics'
-        if any(w in text.lower() for w in ['edit task', 'change task',
-            'update task']):
-            return 'edit_task'
+        keyword_intent = KEYWORD_RULES.search(text)
+        if keyword_intent is not None:
+            return keyword_intent
+        if doc is None:
+            doc = nlp(text.lower(), disable=['ner'])
         for token in doc:
-            if token.lemma_ == 'add' and 'task' in text:
+            lemma = token.lemma_.lower()
+            if lemma == 'add' and 'task' in text:
                 return 'create_task'
-            if token.lemma_ == 'remind':
+            if lemma == 'remind':
                 return 'set_reminder'
         return 'unknown'
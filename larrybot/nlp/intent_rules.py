@@ -0,0 +1,69 @@
+"""
+Compiled intent rules for LarryBot2.
+
+Intent rules are ordered so that the first rule matching anywhere in the
+text wins. IntentRuleSet compiles regex rules once instead of handing raw
+strings to re.search() on every message, and KeywordRuleSet flattens
+keyword lists into one table scanned over the lowercased text.
+"""
+import re
+from typing import Any, Iterable, List, NamedTuple, Optional, Pattern, Tuple
+
+
+class RuleMatch(NamedTuple):
+    """The rule that matched a message."""
+    intent: Any
+    text: str
+    captured: Optional[str]
+
+
+class IntentRuleSet:
+    """
+    Ordered regex rules compiled once.
+
+    search() gives the same result as trying every rule with re.search()
+    in order, without recompiling or looking up the patterns each time.
+
+    Args:
+        rules: (intent, pattern) pairs in priority order
+        flags: Flags applied to every pattern
+    """
+
+    def __init__(self, rules: Iterable[Tuple[Any, str]], flags: int=0):
+        self._rules: List[Tuple[Any, Pattern]] = [(intent, re.compile(
+            pattern, flags)) for intent, pattern in rules]
+
+    def __len__(self) ->int:
+        return len(self._rules)
+
+    def search(self, text: str) ->Optional[RuleMatch]:
+        """Get the first rule matching text, or None."""
+        for intent, pattern in self._rules:
+            match = pattern.search(text)
+            if match is not None:
+                return RuleMatch(intent, match.group(0), match.group(1) if
+                    pattern.groups else None)
+        return None
+
+
+class KeywordRuleSet:
+    """
+    Ordered keyword rules: the first intent with a keyword in the text wins.
+
+    Args:
+        rules: (intent, keywords) pairs in priority order; keywords are
+            matched as lowercase substrings
+    """
+
+    def __init__(self, rules: Iterable[Tuple[Any, Iterable[str]]]):
+        self._keywords: Tuple[Tuple[str, Any], ...] = tuple((keyword.
+            lower(), intent) for intent, keywords in rules for keyword in
+            keywords)
+
+    def search(self, text: str) ->Optional[Any]:
+        """Get the intent of the first keyword found in text, or None."""
+        text_lower = text.lower()
+        for keyword, intent in self._keywords:
+            if keyword in text_lower:
+                return intent
+        return None
@@ -0,0 +1,137 @@
+"""
+Shared spaCy model registry for LarryBot2.
+
+IntentRecognizer and EntityExtractor used to load their own copy of the
+spaCy model in their constructors. The registry loads each pipeline once,
+on first use, and hands the same Language object to every consumer. The
+dependency parser is excluded because no consumer reads the parse;
+lemmas (intent and task-name matching) and named entities are kept.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+logger = logging.getLogger(__name__)
+DEFAULT_MODEL = 'en_core_web_sm'
+DEFAULT_EXCLUDE = ('parser',)
+
+
+def _rss_bytes() ->Optional[int]:
+    """Get the resident set size of this process, if psutil is available."""
+    try:
+        import psutil
+        return psutil.Process(os.getpid()).memory_info().rss
+    except Exception:
+        return None
+
+
+class NLPModelRegistry:
+    """
+    Process-wide cache of loaded spaCy pipelines.
+
+    Features:
+    - One Language object per (model, excluded components), loaded lazily
+    - Thread-safe: concurrent first calls load the model only once
+    - Failed loads are remembered so callers do not retry on every message
+    - Load time and resident memory reported through get_stats()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[Tuple[str, Tuple[str, ...]], Any] = {}
+        self._failed: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _key(model_name: str, exclude: Iterable[str]) ->Tuple[str, Tuple[
+        str, ...]]:
+        return model_name, tuple(sorted(exclude))
+
+    def get_model(self, model_name: str=DEFAULT_MODEL, exclude: Iterable[
+        str]=DEFAULT_EXCLUDE):
+        """
+        Get the shared pipeline, loading it on first use.
+
+        Returns None if the model cannot be loaded (e.g. not installed).
+        """
+        key = self._key(model_name, exclude)
+        model = self._models.get(key)
+        if model is not None or key in self._failed:
+            return model
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None or key in self._failed:
+                return model
+            return self._load(key)
+
+    def _load(self, key: Tuple[str, Tuple[str, ...]]):
+        """Load a pipeline and record its cost (lock held)."""
+        model_name, exclude = key
+        rss_before = _rss_bytes()
+        started = time.perf_counter()
+        try:
+            import spacy
+            model = spacy.load(model_name, exclude=list(exclude))
+        except Exception as e:
+            self._failed[key] = f'{type(e).__name__}: {e}'
+            logger.warning(f'spaCy model {model_name} unavailable: {e}')
+            return None
+        load_seconds = time.perf_counter() - started
+        rss_after = _rss_bytes()
+        self._models[key] = model
+        self._stats[model_name] = {'load_seconds': load_seconds,
+            'pipeline': list(model.pipe_names), 'excluded': list(exclude),
+            'rss_delta_mb': (rss_after - rss_before) / 1048576 if
+            rss_before is not None and rss_after is not None else None,
+            'rss_mb': rss_after / 1048576 if rss_after is not None else None}
+        logger.info(
+            f"Loaded spaCy model {model_name} in {load_seconds:.2f}s (pipeline: {', '.join(model.pipe_names)})"
+            )
+        return model
+
+    async def warm_up(self, model_name: str=DEFAULT_MODEL, exclude:
+        Iterable[str]=DEFAULT_EXCLUDE) ->bool:
+        """Load a pipeline on an executor thread so the event loop never blocks."""
+        loop = asyncio.get_running_loop()
+        model = await loop.run_in_executor(None, self.get_model, model_name,
+            tuple(exclude))
+        return model is not None
+
+    def get_stats(self) ->Dict[str, Any]:
+        """Get load time, pipeline and memory figures for each loaded model."""
+        with self._lock:
+            return {'loaded': len(self._models), 'models': {name: dict(
+                stats) for name, stats in self._stats.items()}, 'failed': {
+                name: error for (name, _), error in self._failed.items()},
+                'rss_mb': (_rss_bytes() or 0) / 1048576}
+
+    def clear(self) ->None:
+        """Drop every loaded pipeline and forget failed loads."""
+        with self._lock:
+            self._models.clear()
+            self._failed.clear()
+            self._stats.clear()
+
+
+_registry = NLPModelRegistry()
+
+
+def get_nlp_registry() ->NLPModelRegistry:
+    """Get the process-wide NLP model registry."""
+    return _registry
+
+
+def get_shared_model(model_name: str=DEFAULT_MODEL, exclude: Iterable[str]
+    =DEFAULT_EXCLUDE):
+    """Get the shared spaCy pipeline, or None if it cannot be loaded."""
+    return _registry.get_model(model_name, exclude)
+
+
+async def warm_up_nlp(model_name: str=DEFAULT_MODEL) ->bool:
+    """Load the shared pipeline off the event loop before the first message."""
+    loaded = await _registry.warm_up(model_name)
+    if loaded:
+        logger.info(f'✅ NLP model warmed up: {_registry.get_stats()}')
+    return loaded
@@ -1,10 +1,10 @@
-import spacy
 from larrybot.config.loader import Config
 
 
 class SentimentAnalyzer:
     """
-    Analyzes sentiment of user input using spaCy or a simple rule-based approach.
+    Analyzes sentiment of user input using a simple rule-based approach.
+    Needs no spaCy model, so it does not load the shared pipeline.
     """
 
     def __init__(self, config: Config=None):
@@ -12,13 +12,6 @@ class SentimentAnalyzer:
         self.enabled = getattr(config, 'NLP_ENABLED', True) if config else True
         self.model_name = getattr(config, 'NLP_MODEL', 'en_core_web_sm'
             ) if config else 'en_core_web_sm'
-        self._nlp = None
-        if self.enabled:
-            try:
-                self._nlp = spacy.load(self.model_name)
-            except Exception:
-                self._nlp = None
-                self.enabled = False
         self.positive_words = {'good', 'great', 'happy', 'love',
             'excellent', 'awesome', 'fantastic', 'progress'}
         self.negative_words = {'bad', 'sad', 'hate', 'terrible', 'awful',
@@ -126,7 +126,9 @@ async def _productivity_report_handler_internal(update: Update, context:
             format_error_message('Invalid date format',
             'Use YYYY-MM-DD format for dates'), parse_mode='MarkdownV2')
         return
-    result = await task_service.get_productivity_report(start_date, end_date)
+    detailed = len(context.args) > 2 and context.args[2].lower() == 'detailed'
+    result = await task_service.get_productivity_report(start_date,
+        end_date, include_time_analysis=detailed)
     if result['success']:
         report_data = result['data']
         await update.message.reply_text(MessageFormatter.
@@ -170,8 +172,8 @@ async def suggest_priority_handler(update: Update, context: ContextTypes.
 
 
 @command_handler('/productivity_report', 'Productivity report',
-    'Usage: /productivity_report <start_date> <end_date>', 'tasks')
-@require_args(2, 2)
+    'Usage: /productivity_report <start_date> <end_date> [detailed]', 'tasks')
+@require_args(2, 3)
 async def productivity_report_handler(update: Update, context: ContextTypes
     .DEFAULT_TYPE) ->None:
     """Productivity report."""
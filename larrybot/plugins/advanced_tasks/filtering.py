@@ -10,7 +10,9 @@ from larrybot.core.event_bus import EventBus
 from larrybot.utils.decorators import command_handler, require_args
 from larrybot.utils.ux_helpers import MessageFormatter
 from larrybot.core.event_utils import emit_task_event
+from larrybot.storage.task_search import HIGHLIGHT_END, HIGHLIGHT_START
 _event_bus = None
+MAX_SEARCH_SNIPPETS = 10
 
 
 def register(event_bus: EventBus, command_registry: CommandRegistry) ->None:
@@ -160,6 +162,7 @@ async def _search_tasks_handler_internal(update: Update, context:
                 'Status': 'No tasks found'}), parse_mode='MarkdownV2')
         else:
             message = MessageFormatter.format_task_list(tasks, f"Search Results: '{query}'")
+            message += _format_search_snippets(tasks)
             await update.message.reply_text(message, parse_mode='MarkdownV2')
             emit_task_event(_event_bus, 'tasks_searched', {'query': query,
                 'options': search_options, 'count': len(tasks)})
@@ -169,6 +172,20 @@ async def _search_tasks_handler_internal(update: Update, context:
             'Check your search query and try again.'), parse_mode='MarkdownV2')
 
 
+def _format_search_snippets(tasks) ->str:
+    """Render the matching text of ranked search results, matches in bold."""
+    lines = []
+    for task in tasks[:MAX_SEARCH_SNIPPETS]:
+        snippet = task.get('snippet')
+        if isinstance(snippet, str) and HIGHLIGHT_START in snippet:
+            highlighted = MessageFormatter.escape_markdown(snippet).replace(
+                HIGHLIGHT_START, '*').replace(HIGHLIGHT_END, '*')
+            lines.append(f"• \\#{task['id']}: {highlighted}")
+    if not lines:
+        return ''
+    return '\n\n🔎 **Matches**\n' + '\n'.join(lines)
+
+
 @command_handler('/tasks', 'Advanced task filtering',
     'Usage: /tasks [status] [priority] [category]', 'tasks')
 async def advanced_tasks_handler(update: Update, context: ContextTypes.
@@ -6,6 +6,7 @@ all components of the advanced tasks plugin.
 """
 from larrybot.storage.db import get_session
 from larrybot.storage.task_repository import TaskRepository
+from larrybot.storage.async_db import AsyncTaskRepository, is_async_storage_enabled
 from larrybot.services.task_service import TaskService
 
 
@@ -13,9 +14,14 @@ def get_task_service() ->TaskService:
     """
     Get task service instance with proper session management.
     
+    In async storage mode the service awaits repository calls on the
+    database executor instead of holding a session on the event loop.
+
     Returns:
         TaskService: Configured task service instance
     """
+    if is_async_storage_enabled():
+        return TaskService(AsyncTaskRepository())
     session = next(get_session())
     task_repository = TaskRepository(session)
     return TaskService(task_repository)
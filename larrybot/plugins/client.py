@@ -116,7 +116,7 @@ async def allclients_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
     """List all clients with enhanced formatting and per-client action buttons."""
     with next(get_session()) as session:
         repo = ClientRepository(session)
-        clients = repo.list_all_clients()
+        clients = repo.get_client_analytics()
         if not clients:
             await update.message.reply_text(MessageFormatter.
                 format_error_message('No clients found',
@@ -126,36 +126,36 @@ async def allclients_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
         message = f'👥 **All Clients** \\({len(clients)} found\\)\n\n'
         keyboard_buttons = []
         for i, client in enumerate(clients, 1):
-            task_repo = TaskRepository(session)
-            tasks = task_repo.get_tasks_by_client(client.name)
-            completed_tasks = sum(1 for t in tasks if t.done)
-            if len(tasks) == 0:
+            client_id = client['id']
+            total_tasks = client['total']
+            completed_tasks = client['completed']
+            if total_tasks == 0:
                 status_emoji = '⚪'
-            elif completed_tasks == len(tasks):
+            elif completed_tasks == total_tasks:
                 status_emoji = '🟢'
             elif completed_tasks > 0:
                 status_emoji = '🟡'
             else:
                 status_emoji = '🔴'
-            message += f"""{i}\\. {status_emoji} **{MessageFormatter.escape_markdown(client.name)}** \\(ID: {client.id}\\)
+            message += f"""{i}\\. {status_emoji} **{MessageFormatter.escape_markdown(client['name'])}** \\(ID: {client_id}\\)
 """
             message += (
-                f'   📋 Tasks: {len(tasks)} \\({completed_tasks} completed\\)\n'
+                f'   📋 Tasks: {total_tasks} \\({completed_tasks} completed\\)\n'
                 )
-            if client.created_at:
+            if client['created_at']:
                 message += (
-                    f"   📅 Created: {client.created_at.strftime('%Y-%m-%d')}\n"
+                    f"   📅 Created: {client['created_at'].strftime('%Y-%m-%d')}\n"
                     )
             message += '\n'
             keyboard_buttons.append([UnifiedButtonBuilder.create_button(
-                text='👁️ View', callback_data=f'client_view:{client.id}',
+                text='👁️ View', callback_data=f'client_view:{client_id}',
                 button_type=ButtonType.INFO), UnifiedButtonBuilder.
                 create_button(text='✏️ Edit', callback_data=
-                f'client_edit:{client.id}', button_type=ButtonType.INFO),
+                f'client_edit:{client_id}', button_type=ButtonType.INFO),
                 UnifiedButtonBuilder.create_button(text='🗑️ Delete',
-                callback_data=f'client_delete:{client.id}', button_type=ButtonType.DANGER), UnifiedButtonBuilder.create_button(text
+                callback_data=f'client_delete:{client_id}', button_type=ButtonType.DANGER), UnifiedButtonBuilder.create_button(text
                 ='📊 Analytics', callback_data=
-                f'client_analytics:{client.id}', button_type=ButtonType.SECONDARY)])
+                f'client_analytics:{client_id}', button_type=ButtonType.SECONDARY)])
         keyboard_buttons.append([UnifiedButtonBuilder.create_button(text=
             '➕ Add Client', callback_data='client_add', button_type=ButtonType.PRIMARY), UnifiedButtonBuilder.create_button(text=
             '🔄 Refresh', callback_data='client_refresh', button_type=ButtonType.SECONDARY), UnifiedButtonBuilder.create_button(text=
@@ -311,8 +311,7 @@ async def clientanalytics_handler(update: Update, context: ContextTypes.
     """Show comprehensive client analytics with enhanced formatting."""
     with next(get_session()) as session:
         client_repo = ClientRepository(session)
-        task_repo = TaskRepository(session)
-        clients = client_repo.list_all_clients()
+        clients = client_repo.get_client_analytics()
         if not clients:
             await update.message.reply_text(MessageFormatter.
                 format_error_message('No clients to analyze',
@@ -324,15 +323,11 @@ async def clientanalytics_handler(update: Update, context: ContextTypes.
         total_completed = 0
         client_stats = []
         for client in clients:
-            tasks = task_repo.get_tasks_by_client(client.name)
-            completed = sum(1 for t in tasks if t.done)
-            pending = len(tasks) - completed
-            completion_rate = completed / len(tasks) * 100 if tasks else 0
-            total_tasks += len(tasks)
-            total_completed += completed
-            client_stats.append({'name': client.name, 'total': len(tasks),
-                'completed': completed, 'pending': pending, 'rate':
-                completion_rate})
+            total_tasks += client['total']
+            total_completed += client['completed']
+            client_stats.append({'name': client['name'], 'total': client[
+                'total'], 'completed': client['completed'], 'pending':
+                client['pending'], 'rate': client['completion_rate']})
         client_stats.sort(key=lambda x: x['rate'], reverse=True)
         overall_rate = (total_completed / total_tasks * 100 if total_tasks else
             0)
@@ -477,36 +472,32 @@ async def handle_client_analytics_callback(query, context: ContextTypes.DEFAULT_
         client_id = int(query.data.split(':')[1])
         with next(get_session()) as session:
             repo = ClientRepository(session)
-            task_repo = TaskRepository(session)
-            client = repo.get_client_by_id(client_id)
-            if not client:
+            analytics = repo.get_client_analytics(client_id)
+            if not analytics:
                 await query.answer("Client not found")
                 return
             
-            tasks = task_repo.get_tasks_by_client(client.name)
-            completed_tasks = sum(1 for t in tasks if t.done)
-            pending_tasks = len(tasks) - completed_tasks
-            
-            # Calculate analytics
-            completion_rate = round(completed_tasks/len(tasks)*100, 1) if tasks else 0
-            avg_priority = sum(t.priority_score for t in tasks) / len(tasks) if tasks else 0
+            client = analytics[0]
+            completion_rate = round(client['completion_rate'], 1)
             
             message = f"""📊 **Client Analytics**
 
-**Client**: {MessageFormatter.escape_markdown(client.name)}
+**Client**: {MessageFormatter.escape_markdown(client['name'])}
 
 **Task Statistics**:
-• Total Tasks: {len(tasks)}
-• Completed: {completed_tasks}
-• Pending: {pending_tasks}
+• Total Tasks: {client['total']}
+• Completed: {client['completed']}
+• Pending: {client['pending']}
+• Overdue: {client['overdue']}
 • Completion Rate: {completion_rate}%
 
 **Performance Metrics**:
-• Average Priority: {avg_priority:.1f}
-• Active Since: {client.created_at.strftime('%Y-%m-%d') if client.created_at else 'N/A'}"""
+• Average Priority: {client['avg_priority']:.1f}
+• Hours: {client['actual_hours']:.1f} actual / {client['estimated_hours']:.1f} estimated
+• Active Since: {client['created_at'].strftime('%Y-%m-%d') if client['created_at'] else 'N/A'}"""
             
             keyboard = InlineKeyboardMarkup([[
-                UnifiedButtonBuilder.create_button(text='⬅️ Back', callback_data=f'client_view:{client.id}', button_type=ButtonType.INFO)
+                UnifiedButtonBuilder.create_button(text='⬅️ Back', callback_data=f'client_view:{client["id"]}', button_type=ButtonType.INFO)
             ]])
             
             await query.edit_message_text(message, reply_markup=keyboard, parse_mode='MarkdownV2')
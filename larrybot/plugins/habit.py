@@ -90,14 +90,11 @@ async def handle_habit_progress_callback(query, context: ContextTypes.DEFAULT_TY
                 await query.answer("Habit not found")
                 return
             
-            # Calculate progress statistics
-            today = get_current_datetime().date()
-            if habit.last_completed:
-                if hasattr(habit.last_completed, 'date'):
-                    last_completed_date = habit.last_completed.date()
-                else:
-                    last_completed_date = habit.last_completed
-                days_since_last = (today - last_completed_date).days
+            # Streaks and completion rates come from the completion log
+            stats = repo.get_habit_stats(habit.id)[0]
+            streak = stats['current_streak']
+            if stats['last_completed']:
+                days_since_last = (repo.today() - stats['last_completed']).days
                 completion_rate = "Today" if days_since_last == 0 else f"{days_since_last} days ago"
             else:
                 completion_rate = "Never"
@@ -107,14 +104,17 @@ async def handle_habit_progress_callback(query, context: ContextTypes.DEFAULT_TY
 **Habit**: {MessageFormatter.escape_markdown(habit.name)}
 
 **Current Status**:
-• Streak: {habit.streak} days
+• Streak: {streak} days
+• Best Streak: {stats['best_streak']} days
+• Last 7 Days: {stats['last_7_days']}/7
+• Last 30 Days: {stats['last_30_days']}/30
 • Last Completed: {completion_rate}
 • Created: {habit.created_at.strftime('%Y-%m-%d') if habit.created_at else 'N/A'}
 
 **Achievements**:
-• {'🔥 7-day streak' if habit.streak >= 7 else '📈 Building momentum'}
-• {'🏆 30-day streak' if habit.streak >= 30 else '🔥 Keep going!'}
-• {'👑 100-day streak' if habit.streak >= 100 else '🏆 Long way to go!'}"""
+• {'🔥 7-day streak' if streak >= 7 else '📈 Building momentum'}
+• {'🏆 30-day streak' if streak >= 30 else '🔥 Keep going!'}
+• {'👑 100-day streak' if streak >= 100 else '🏆 Long way to go!'}"""
             
             keyboard = InlineKeyboardMarkup([[
                 UnifiedButtonBuilder.create_button(text='⬅️ Back', callback_data='habit_refresh', button_type=ButtonType.INFO)
@@ -165,28 +165,19 @@ async def handle_habit_stats_callback(query, context: ContextTypes.DEFAULT_TYPE)
     """Handle habit stats callback."""
     with next(get_session()) as session:
         repo = HabitRepository(session)
-        habits = repo.list_habits()
+        stats = repo.get_habit_stats()
         
-        if not habits:
+        if not stats:
             await query.answer("No habits found")
             return
         
         # Calculate overall statistics
-        total_habits = len(habits)
-        total_streaks = sum(h.streak for h in habits)
-        avg_streak = total_streaks / total_habits if total_habits > 0 else 0
-        max_streak = max(h.streak for h in habits) if habits else 0
-        
-        today = get_current_datetime().date()
-        completed_today = 0
-        for habit in habits:
-            if habit.last_completed:
-                if hasattr(habit.last_completed, 'date'):
-                    last_completed_date = habit.last_completed.date()
-                else:
-                    last_completed_date = habit.last_completed
-                if (today - last_completed_date).days == 0:
-                    completed_today += 1
+        total_habits = len(stats)
+        avg_streak = sum(h['current_streak'] for h in stats) / total_habits
+        max_streak = max(h['best_streak'] for h in stats)
+        completed_today = sum(1 for h in stats if h['completed_today'])
+        avg_rate_7 = sum(h['rate_7_days'] for h in stats) / total_habits
+        avg_rate_30 = sum(h['rate_30_days'] for h in stats) / total_habits
         
         message = f"""📊 **Habit Statistics**
 
@@ -196,7 +187,9 @@ async def handle_habit_stats_callback(query, context: ContextTypes.DEFAULT_TYPE)
 • Average Streak: {avg_streak:.1f} days
 • Best Streak: {max_streak} days
 
-**Today's Completion Rate**: {round(completed_today/total_habits*100, 1) if total_habits > 0 else 0}%"""
+**Today's Completion Rate**: {round(completed_today/total_habits*100, 1)}%
+**7-Day Completion Rate**: {avg_rate_7:.1f}%
+**30-Day Completion Rate**: {avg_rate_30:.1f}%"""
         
         keyboard = InlineKeyboardMarkup([[
             UnifiedButtonBuilder.create_button(text='⬅️ Back', callback_data='habit_refresh', button_type=ButtonType.INFO)
@@ -410,49 +403,53 @@ async def habit_progress_handler(update: Update, context: ContextTypes.
                 'Check the habit name or use /habit_list to see available habits'
                 ), parse_mode='MarkdownV2')
             return
-        today = get_current_datetime().date()
+        stats = repo.get_habit_stats(habit.id)[0]
+        calendar = repo.get_habit_calendar(habit.id)
+        streak = stats['current_streak']
+        today = repo.today()
         days_since_creation = (today - habit.created_at.date()
             ).days + 1 if habit.created_at else 0
-        completion_rate = (habit.streak / days_since_creation * 100 if 
-            days_since_creation > 0 else 0)
-        progress_length = int(habit.streak / max(days_since_creation, 1) * 30)
+        progress_length = int(stats['rate_30_days'] / 100 * 30)
         progress_bar = '█' * progress_length + '░' * (30 - progress_length)
         next_milestone = None
-        if habit.streak < 7:
+        if streak < 7:
             next_milestone = 7
-        elif habit.streak < 30:
+        elif streak < 30:
             next_milestone = 30
-        elif habit.streak < 100:
+        elif streak < 100:
             next_milestone = 100
         else:
-            next_milestone = habit.streak + 10
-        days_to_milestone = next_milestone - habit.streak
+            next_milestone = streak + 10
+        days_to_milestone = next_milestone - streak
         message = f'📊 **Habit Progress Report**\n\n'
         message += (
             f'**Habit**: {MessageFormatter.escape_markdown(habit.name)}\n')
-        message += f'**Current Streak**: {habit.streak} days\n'
+        message += f'**Current Streak**: {streak} days\n'
+        message += f"**Best Streak**: {stats['best_streak']} days\n"
         message += f'**Days Tracked**: {days_since_creation} days\n'
-        message += f'**Completion Rate**: {completion_rate:.1f}%\n\n'
-        message += f'📈 **Progress Bar**\n'
+        message += (
+            f"**Completion Rate**: {stats['rate_7_days']:.1f}% \\(7 days\\), {stats['rate_30_days']:.1f}% \\(30 days\\)\n\n"
+            )
+        message += f'📈 **Last 30 Days**\n'
         message += f'`{progress_bar}`\n'
-        message += f'`{habit.streak:>3} / {days_since_creation:>3} days`\n\n'
+        message += (
+            f"`{stats['last_30_days']:>3} / {min(30, max(days_since_creation, 1)):>3} days`\n\n"
+            )
+        message += f'🗓️ **Last {len(calendar)} Days**\n'
+        for week in range(0, len(calendar), 7):
+            message += ''.join('🟩' if day['done'] else '⬜' for day in
+                calendar[week:week + 7]) + '\n'
+        message += '\n'
         if next_milestone:
             message += f'🎯 **Next Milestone**\n'
             message += f'• Target: {next_milestone} days\n'
             message += f'• Days needed: {days_to_milestone}\n\n'
-        if habit.last_completed:
-            if hasattr(habit.last_completed, 'date'):
-                last_completed_date = habit.last_completed.date()
-            else:
-                last_completed_date = habit.last_completed
-            days_since_last = (today - last_completed_date).days
+        if stats['last_completed']:
+            days_since_last = (today - stats['last_completed']).days
             message += f'📅 **Recent Activity**\n'
-            if hasattr(habit.last_completed, 'strftime'):
-                last_completed_str = habit.last_completed.strftime(
-                    '%Y-%m-%d %H:%M')
-            else:
-                last_completed_str = str(habit.last_completed)
-            message += f'• Last completed: {last_completed_str}\n'
+            message += (
+                f"• Last completed: {MessageFormatter.escape_markdown(stats['last_completed'].strftime('%Y-%m-%d'))}\n"
+                )
             if days_since_last == 0:
                 message += f'• Status: ✅ Completed today\n'
             elif days_since_last == 1:
@@ -470,45 +467,52 @@ async def habit_stats_handler(update: Update, context: ContextTypes.
     """Show comprehensive habit statistics and insights."""
     with next(get_session()) as session:
         repo = HabitRepository(session)
-        habits = repo.list_habits()
-        if not habits:
+        stats = repo.get_habit_stats()
+        if not stats:
             await update.message.reply_text(MessageFormatter.
                 format_error_message('No habits to analyze',
                 'Add some habits first with /habit_add'), parse_mode=
                 'MarkdownV2')
             return
-        total_habits = len(habits)
-        total_streaks = sum(h.streak for h in habits)
-        active_habits = sum(1 for h in habits if h.streak > 0)
-        habits_by_streak = sorted(habits, key=lambda h: h.streak, reverse=True)
-        best_habit = habits_by_streak[0] if habits_by_streak else None
-        avg_streak = total_streaks / total_habits if total_habits > 0 else 0
+        total_habits = len(stats)
+        total_streaks = sum(h['current_streak'] for h in stats)
+        active_habits = sum(1 for h in stats if h['current_streak'] > 0)
+        habits_by_streak = sorted(stats, key=lambda h: (h['current_streak'
+            ], h['best_streak']), reverse=True)
+        best_habit = max(stats, key=lambda h: h['best_streak'])
+        avg_streak = total_streaks / total_habits
+        avg_rate_30 = sum(h['rate_30_days'] for h in stats) / total_habits
         message = f'📊 **Habit Statistics Report**\n\n'
         message += f'📈 **Overall Statistics**\n'
         message += f'• Total Habits: {total_habits}\n'
         message += f'• Active Habits: {active_habits}\n'
         message += f'• Total Streak Days: {total_streaks}\n'
-        message += f'• Average Streak: {avg_streak:.1f} days\n\n'
+        message += f'• Average Streak: {avg_streak:.1f} days\n'
+        message += f'• 30\\-Day Completion Rate: {avg_rate_30:.1f}%\n\n'
         message += f'🏆 **Top Performers**\n'
         for i, habit in enumerate(habits_by_streak[:3], 1):
-            if habit.streak > 0:
-                if habit.streak >= 30:
+            streak = habit['current_streak']
+            if streak > 0:
+                if streak >= 30:
                     performance = '👑'
-                elif habit.streak >= 7:
+                elif streak >= 7:
                     performance = '🔥'
                 else:
                     performance = '📈'
-                message += f"""{i}\\. {performance} **{MessageFormatter.escape_markdown(habit.name)}**
+                message += f"""{i}\\. {performance} **{MessageFormatter.escape_markdown(habit['name'])}**
 """
-                message += f'   📊 {habit.streak} day streak\n'
-                if habit.last_completed:
+                message += f'   📊 {streak} day streak\n'
+                message += (
+                    f"   📆 {habit['last_7_days']}/7 and {habit['last_30_days']}/30 recent days\n"
+                    )
+                if habit['last_completed']:
                     message += (
-                        f"   📅 Last: {habit.last_completed.strftime('%Y-%m-%d')}\n"
+                        f"   📅 Last: {habit['last_completed'].strftime('%Y-%m-%d')}\n"
                         )
                 message += '\n'
         message += f'💡 **Insights**\n'
-        if best_habit and best_habit.streak >= 7:
-            message += f"""• 🏆 **Best Habit**: {MessageFormatter.escape_markdown(best_habit.name)} \\({best_habit.streak} days\\)
+        if best_habit['best_streak'] >= 7:
+            message += f"""• 🏆 **Best Habit**: {MessageFormatter.escape_markdown(best_habit['name'])} \\({best_habit['best_streak']} day best streak\\)
 """
         if avg_streak < 3:
             message += f"""• 📉 **Low average streak** \\({avg_streak:.1f} days\\) - Consider smaller, more achievable goals
@@ -12,19 +12,36 @@ from datetime import datetime, timedelta
 import asyncio
 import logging
 import threading
-from queue import Queue
+import time
+from collections import deque
 import weakref
 
 
 class ReminderEventHandler:
-    """Handles reminder events by sending messages to the user."""
+    """
+    Handles reminder events by sending messages to the user.
+
+    Reminder events are emitted on scheduler threads. They are handed to
+    the bot's event loop with loop.call_soon_threadsafe() into an
+    asyncio.Queue, so the processor wakes as soon as an event arrives and
+    sleeps otherwise. A burst is drained in batches of up to BATCH_SIZE
+    events per wake-up. Events that arrive before the loop is running wait
+    in a backlog; checking for the loop and appending to the backlog happen
+    under the same lock as the drain in set_event_loop(), so no event can
+    slip in behind the drain.
+    """
+    BATCH_SIZE = 20
 
     def __init__(self, bot_application, user_id: int):
         self.bot_application = bot_application
         self.user_id = user_id
         self._loop = None
-        self._event_queue = Queue()
+        self._event_queue: asyncio.Queue = asyncio.Queue()
+        self._backlog = deque()
+        self._backlog_lock = threading.Lock()
         self._processing_task = None
+        self._stats = {'queued': 0, 'delivered': 0, 'batches': 0,
+            'max_queue_depth': 0, 'total_latency': 0.0, 'max_latency': 0.0}
 
     def set_event_loop(self, loop):
         """Set the event loop for async operations and start event processing."""
@@ -51,38 +68,87 @@ class ReminderEventHandler:
                         logging.getLogger(__name__).debug(
                             'No running event loop - skipping task creation')
                         return
+            with self._backlog_lock:
+                while self._backlog:
+                    self._hand_off(self._backlog.popleft())
 
     async def _process_events(self):
-        """Process events from the thread-safe queue."""
+        """Process events handed over from the scheduler threads."""
         logger = logging.getLogger(__name__)
         logger.info('Reminder event processor started')
         while True:
             try:
-                try:
-                    event = self._event_queue.get_nowait()
-                    await self.handle_reminder_due(event)
-                    self._event_queue.task_done()
-                except Exception as queue_empty:
-                    await asyncio.sleep(1.0)
-                    continue
+                batch = [await self._event_queue.get()]
+                while len(batch) < self.BATCH_SIZE:
+                    try:
+                        batch.append(self._event_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                now = time.perf_counter()
+                self._stats['batches'] += 1
+                for event, queued_at in batch:
+                    latency = now - queued_at
+                    self._stats['total_latency'] += latency
+                    self._stats['max_latency'] = max(self._stats[
+                        'max_latency'], latency)
+                    try:
+                        await self.handle_reminder_due(event)
+                    finally:
+                        self._stats['delivered'] += 1
+                        self._event_queue.task_done()
             except asyncio.CancelledError:
                 logger.info('Reminder event processor cancelled')
                 break
             except Exception as e:
                 logger.error(f'Error in reminder event processor: {e}')
-                await asyncio.sleep(1.0)
 
     def queue_reminder_event(self, event: ReminderDueEvent):
         """
         Thread-safe method to queue a reminder event for processing.
-        This is called from the scheduler thread.
+        This is called from the scheduler thread. Events that arrive
+        before the event loop is set are kept and handed over by
+        set_event_loop().
         """
+        item = event, time.perf_counter()
         try:
-            self._event_queue.put_nowait(event)
+            with self._backlog_lock:
+                loop = self._loop
+                if loop is None or not loop.is_running():
+                    self._backlog.append(item)
+                else:
+                    self._hand_off(item)
         except Exception as e:
             logging.getLogger(__name__).error(
                 f'Failed to queue reminder event: {e}')
 
+    def _hand_off(self, item):
+        """Put an event on the loop's queue from the loop or any thread."""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._enqueue(item)
+        else:
+            self._loop.call_soon_threadsafe(self._enqueue, item)
+
+    def _enqueue(self, item):
+        """Add an event to the queue (runs on the event loop)."""
+        self._event_queue.put_nowait(item)
+        self._stats['queued'] += 1
+        self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'
+            ], self._event_queue.qsize())
+
+    def get_stats(self) ->dict:
+        """Get handoff metrics: queue depth and scheduler-to-loop latency."""
+        handed_off = self._stats['delivered']
+        return {'queue_depth': self._event_queue.qsize(), 'backlog': len(
+            self._backlog), 'max_queue_depth': self._stats[
+            'max_queue_depth'], 'queued': self._stats['queued'],
+            'delivered': handed_off, 'batches': self._stats['batches'],
+            'avg_handoff_latency': self._stats['total_latency'] / max(1,
+            handed_off), 'max_handoff_latency': self._stats['max_latency']}
+
     async def handle_reminder_due(self, event: ReminderDueEvent) ->None:
         """Handle a reminder due event by sending a message to the user."""
         try:
@@ -154,6 +220,13 @@ def set_main_event_loop(loop):
         _reminder_event_handler.set_event_loop(loop)
 
 
+def get_reminder_handoff_stats():
+    """Get handoff metrics of the active reminder event handler, if any."""
+    if _reminder_event_handler:
+        return _reminder_event_handler.get_stats()
+    return None
+
+
 async def cleanup_reminder_handler():
     """Clean up the global reminder event handler."""
     global _reminder_event_handler
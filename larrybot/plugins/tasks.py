@@ -4,20 +4,21 @@ from larrybot.core.command_registry import CommandRegistry
 from larrybot.core.event_bus import EventBus
 from larrybot.storage.db import get_session
 from larrybot.storage.task_repository import TaskRepository
+from larrybot.storage.async_db import AsyncTaskRepository, is_async_storage_enabled
 from larrybot.core.event_utils import emit_task_event
 from larrybot.utils.ux_helpers import MessageFormatter, KeyboardBuilder
 from larrybot.services.task_service import TaskService
 from larrybot.utils.decorators import command_handler, callback_handler
-from typing import Optional
+from typing import Optional, Tuple
 from larrybot.utils.datetime_utils import get_current_datetime
 from larrybot.nlp.enhanced_narrative_processor import TaskCreationState, ContextType
 from larrybot.storage.client_repository import ClientRepository
 from larrybot.services.datetime_service import DateTimeService
-from larrybot.models.enums import TaskPriority
 from datetime import datetime, timedelta, timezone
 import json
 from larrybot.utils.enhanced_ux_helpers import UnifiedButtonBuilder, ActionType, ButtonType
 _task_event_bus = None
+LIST_PAGE_SIZE = 10
 
 
 def register(event_bus: EventBus, command_registry: CommandRegistry) ->None:
@@ -34,6 +35,7 @@ def register(event_bus: EventBus, command_registry: CommandRegistry) ->None:
     
     # Register callback handlers for narrative task flow
     command_registry.register_callback('addtask_step', handle_narrative_task_callback)
+    command_registry.register_callback('tasks_page', handle_tasks_page_callback)
 
 
 @callback_handler('addtask_step', 'Handle narrative task creation callbacks', 'tasks', True, 2)
@@ -75,6 +77,8 @@ async def handle_narrative_task_callback(query, context: ContextTypes.DEFAULT_TY
 
 def _get_task_service() ->TaskService:
     """Get task service instance."""
+    if is_async_storage_enabled():
+        return TaskService(AsyncTaskRepository())
     session = next(get_session())
     task_repository = TaskRepository(session)
     return TaskService(task_repository)
@@ -249,70 +253,87 @@ async def _list_tasks_with_filters(update: Update, status: Optional[str],
 
 async def _list_incomplete_tasks_default(update: Update) ->None:
     """Default task listing behavior (original /list functionality)."""
+    with next(get_session()) as session:
+        page = _build_task_page(TaskRepository(session))
+    if page is None:
+        await update.message.reply_text(MessageFormatter.
+            format_info_message('📋 No Tasks Found', {'Status':
+            'No incomplete tasks', 'Action':
+            'Use /add to create your first task'}), parse_mode='MarkdownV2')
+        return
+    message, keyboard = page
+    await update.message.reply_text(message, reply_markup=keyboard,
+        parse_mode='MarkdownV2')
+
+
+@callback_handler('tasks_page', 'Page through the incomplete task list',
+    'tasks', True, 4)
+async def handle_tasks_page_callback(query, context: ContextTypes.DEFAULT_TYPE
+    ) ->None:
+    """Show the page before or after the cursor task in tasks_page:<dir>:<page>:<id>."""
+    _, direction, page_number, task_id = query.data.split(':')[:4]
+    if not (page_number.isdigit() and task_id.isdigit()):
+        return
+    cursor = {'after_id' if direction == 'next' else 'before_id': int(task_id)}
     with next(get_session()) as session:
         repo = TaskRepository(session)
-        incomplete_tasks = repo.list_incomplete_tasks()
-        # --- Begin sorting patch ---
-        # Define priority order using enum values: Critical=4, High=3, Medium=2, Low=1
-        priority_order = {4: 0, 3: 1, 2: 2, 1: 3}  # Map enum values to sort order
-        def sort_key(task):
-            # Handle due date sorting - None due dates go last
-            if task.due_date is not None and hasattr(task.due_date, 'timestamp'):
-                due_val = task.due_date.timestamp()
-            else:
-                # Use a very large timestamp for tasks without due dates
-                due_val = float('inf')
-            
-            # Get priority as integer from enum, default to Medium (2)
-            priority_enum = task.priority_enum or TaskPriority.MEDIUM
-            priority_val = priority_order.get(priority_enum.value, 2)
-            return (due_val, priority_val)
-        incomplete_tasks = sorted(incomplete_tasks, key=sort_key)
-        # --- End sorting patch ---
-        if not incomplete_tasks:
-            await update.message.reply_text(MessageFormatter.
-                format_info_message('📋 No Tasks Found', {'Status':
-                'No incomplete tasks', 'Action':
-                'Use /add to create your first task'}), parse_mode='MarkdownV2'
-                )
-            return
-        tasks_data = []
-        for task in incomplete_tasks:
-            # Use actual task data instead of static values
-            task_data = {
-                'id': task.id,
-                'description': task.description,
-                'priority': task.priority,  # Use actual priority from database
-                'category': task.category,  # Include category if available
-                'due_date': task.due_date,  # Include due date if available
-                'client': task.client if (task.category and str(task.category).lower() == 'work') else None,
-            }
-            tasks_data.append(task_data)
-        # --- Begin numbered list patch ---
-        # Render the message as a numbered list (prefix each task with its number)
-        message = MessageFormatter.format_task_list(tasks_data, 'Incomplete Tasks', numbered=True)
-        # --- End numbered list patch ---
-        keyboard_buttons = []
-        # --- Begin 4-per-row button patch ---
-        row = []
-        for idx, task in enumerate(incomplete_tasks, 1):
-            button = UnifiedButtonBuilder.create_button(
-                text=str(idx),
-                callback_data=f'task_view:{task.id}',
-                button_type=ButtonType.INFO
-            )
-            row.append(button)
-            if len(row) == 4:
-                keyboard_buttons.append(row)
-                row = []
-        if row:
+        page = _build_task_page(repo, int(page_number), **cursor)
+        if page is None:
+            # The cursor task is gone or the list shrank; start over.
+            page = _build_task_page(repo)
+    if page is None:
+        await query.edit_message_text(MessageFormatter.format_info_message(
+            '📋 No Tasks Found', {'Status': 'No incomplete tasks'}),
+            parse_mode='MarkdownV2')
+        return
+    message, keyboard = page
+    await query.edit_message_text(message, reply_markup=keyboard,
+        parse_mode='MarkdownV2')
+
+
+def _build_task_page(repo: TaskRepository, page: int=1, after_id: Optional[
+    int]=None, before_id: Optional[int]=None) ->Optional[Tuple[str,
+    InlineKeyboardMarkup]]:
+    """
+    Render one LIST_PAGE_SIZE page of incomplete tasks and its keyboard.
+
+    The previous and next buttons carry the first and last task ids of the
+    page as keyset cursors. Returns None when the page is empty.
+    """
+    tasks, has_more = repo.list_incomplete_tasks_page(LIST_PAGE_SIZE,
+        after_id=after_id, before_id=before_id)
+    if not tasks:
+        return None
+    if before_id is not None:
+        page = max(page, 2) if has_more else 1
+    has_next = has_more if before_id is None else True
+    first = (page - 1) * LIST_PAGE_SIZE + 1
+    tasks_data = [{'id': task.id, 'description': task.description,
+        'priority': task.priority, 'category': task.category, 'due_date':
+        task.due_date, 'client': task.client if task.category and str(task
+        .category).lower() == 'work' else None} for task in tasks]
+    message = MessageFormatter.format_task_list(tasks_data,
+        'Incomplete Tasks', numbered=True, start=first, paged=page > 1 or
+        has_next)
+    keyboard_buttons = []
+    row = []
+    for number, task in enumerate(tasks, first):
+        row.append(UnifiedButtonBuilder.create_button(text=str(number),
+            callback_data=f'task_view:{task.id}', button_type=ButtonType.INFO))
+        if len(row) == 4:
             keyboard_buttons.append(row)
-        # --- End 4-per-row button patch ---
-        keyboard_buttons.append([
-            UnifiedButtonBuilder.create_button(text='🏠 Main Menu', callback_data='nav_main', button_type=ButtonType.INFO)
-        ])
-        keyboard = InlineKeyboardMarkup(keyboard_buttons)
-        await update.message.reply_text(message, reply_markup=keyboard, parse_mode='MarkdownV2')
+            row = []
+    if row:
+        keyboard_buttons.append(row)
+    if page > 1 or has_next:
+        pagination = KeyboardBuilder.build_pagination_keyboard(page, None,
+            'tasks_page', show_nav=False, prev_callback=
+            f'tasks_page:prev:{page - 1}:{tasks[0].id}', next_callback=
+            f'tasks_page:next:{page + 1}:{tasks[-1].id}' if has_next else None)
+        keyboard_buttons.extend(pagination.inline_keyboard)
+    keyboard_buttons.append([UnifiedButtonBuilder.create_button(text=
+        '🏠 Main Menu', callback_data='nav_main', button_type=ButtonType.INFO)])
+    return message, InlineKeyboardMarkup(keyboard_buttons)
 
 
 async def done_task_handler(update: Update, context: ContextTypes.DEFAULT_TYPE
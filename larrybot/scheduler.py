@@ -3,13 +3,14 @@ from larrybot.storage.db import get_session
 from larrybot.storage.reminder_repository import ReminderRepository
 from larrybot.storage.task_repository import TaskRepository
 from larrybot.core.events import ReminderDueEvent
-from datetime import datetime
+from datetime import datetime, time as dt_time, timedelta
 from sqlalchemy import text
 import logging
 import time
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from larrybot.utils.datetime_utils import get_current_datetime, get_current_utc_datetime
+from larrybot.core.reminder_engine import ReminderEngine, set_reminder_engine
 scheduler = BackgroundScheduler()
 _event_bus = None
 _main_loop = None  # Store reference to main event loop
@@ -89,17 +90,58 @@ def _process_reminders_batch(session, due_reminders):
             logger.error(f'Failed to cleanup reminders: {e}')
 
 
+def _process_due_reminders():
+    """Process due reminders and return the next upcoming one (engine callback)."""
+    _check_reminders_safe()
+    with next(get_session()) as session:
+        reminder = ReminderRepository(session).get_next_reminder(
+            get_current_datetime())
+        return (reminder.id, reminder.remind_at) if reminder else None
+
+
+def _load_reminder_times():
+    """Load (id, remind_at) for every stored reminder (engine callback)."""
+    with next(get_session()) as session:
+        return [(reminder.id, reminder.remind_at) for reminder in
+            ReminderRepository(session).list_reminders()]
+
+
+reminder_engine = ReminderEngine(_process_due_reminders,
+    _load_reminder_times, executor=_thread_pool)
+
+
 def start_scheduler(event_bus=None):
-    """Start the scheduler with enhanced configuration for reliability."""
+    """
+    Start the scheduler with enhanced configuration for reliability.
+
+    Inside a running event loop reminders are delivered by the
+    event-driven reminder engine, which wakes exactly when the next
+    reminder is due. Without a loop (scripts, sync tests) the one-minute
+    reminder_checker poll is used instead.
+    """
     global _event_bus
     _event_bus = event_bus
     if scheduler.get_job('reminder_checker'):
         scheduler.remove_job('reminder_checker')
-    scheduler.add_job(check_due_reminders, 'interval', minutes=1, id=
-        'reminder_checker', max_instances=1, coalesce=True,
-        misfire_grace_time=15, replace_existing=True)
-    logger.info(
-        'Reminder scheduler started with enhanced reliability configuration')
+    try:
+        asyncio.get_running_loop()
+        has_loop = True
+    except RuntimeError:
+        has_loop = False
+    if has_loop:
+        set_reminder_engine(reminder_engine)
+        if not reminder_engine.is_running:
+            from larrybot.core.task_manager import get_task_manager
+            get_task_manager().create_task(reminder_engine.run(), name=
+                'reminder_engine')
+        logger.info('Event-driven reminder engine started')
+    else:
+        scheduler.add_job(check_due_reminders, 'interval', minutes=1, id=
+            'reminder_checker', max_instances=1, coalesce=True,
+            misfire_grace_time=15, replace_existing=True)
+        logger.info(
+            'Reminder scheduler started with enhanced reliability configuration'
+            )
     try:
         scheduler.start()
     except Exception as e:
@@ -107,8 +149,30 @@ def start_scheduler(event_bus=None):
         raise
 
 
-def schedule_daily_report(bot_handler, chat_id, hour=9, minute=0):
-    """Schedule the daily report to be sent every day at the specified time (default 9am)."""
+def schedule_daily_report(bot_handler, chat_id, hour=9, minute=0,
+    precompute_minutes=5):
+    """
+    Schedule the daily report to be sent every day at the specified time (default 9am).
+
+    precompute_minutes before the send, the report snapshot is built on the
+    background job queue so the send itself only refreshes stale sections.
+    """
+
+    def precompute_report_job():
+        try:
+            from larrybot.utils.background_processing import submit_background_job
+            try:
+                submit_background_job(bot_handler.daily_reports.
+                    build_snapshot, priority=3, idempotency_key=
+                    f'daily_report_snapshot_{chat_id}')
+            except RuntimeError:
+                # Queue not running: build on the main event loop instead
+                if _main_loop is not None and _main_loop.is_running():
+                    asyncio.run_coroutine_threadsafe(bot_handler.
+                        daily_reports.build_snapshot(), _main_loop)
+            logger.info(f'🔄 Daily report snapshot requested for chat_id {chat_id}')
+        except Exception as e:
+            logger.error(f'❌ Error precomputing daily report for chat_id {chat_id}: {e}')
 
     def send_report_job():
         try:
@@ -140,6 +204,13 @@ def schedule_daily_report(bot_handler, chat_id, hour=9, minute=0):
     try:
         scheduler.add_job(send_report_job, 'cron', hour=hour, minute=minute, id
             =job_id, replace_existing=True, misfire_grace_time=300)
+        if precompute_minutes:
+            precompute_at = datetime.combine(datetime.today(), dt_time(hour,
+                minute)) - timedelta(minutes=precompute_minutes)
+            scheduler.add_job(precompute_report_job, 'cron', hour=
+                precompute_at.hour, minute=precompute_at.minute, id=
+                f'{job_id}_snapshot', replace_existing=True,
+                misfire_grace_time=300)
         logger.info(
             f'✅ Scheduled daily report for chat_id {chat_id} at {hour:02d}:{minute:02d}')
         
@@ -0,0 +1,150 @@
+"""
+Daily Report Service for LarryBot2
+
+The daily report has three sections: overdue and due-today tasks, habits
+not yet completed today, and today's calendar events. build_snapshot()
+computes all of them ahead of the scheduled send, on the background job
+queue (see larrybot.scheduler.schedule_daily_report), and keeps the result
+as a ready-to-send snapshot. get_snapshot() serves that snapshot and only
+rebuilds the sections that went stale: the task and habit sections after
+a cached entity was invalidated or once they are SECTION_MAX_AGE old, the
+calendar section - the slow network fetch - once it is CALENDAR_MAX_AGE
+old. /daily and the end-of-day reminder read the same snapshot. Sections
+are read on the database executor (larrybot.storage.async_db), so a
+refresh at send time never runs SQLite on the event loop.
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from larrybot.storage.async_db import AsyncTaskRepository, get_db_executor
+from larrybot.storage.habit_repository import HabitRepository
+from larrybot.services.task_service import TaskService
+from larrybot.utils.caching import cache_generation
+logger = logging.getLogger(__name__)
+SECTION_MAX_AGE = 600.0
+CALENDAR_MAX_AGE = 3600.0
+
+
+@dataclass
+class ReportSection:
+    """One precomputed section of the daily report."""
+    data: Any
+    generation: int
+    built_at: float = field(default_factory=time.time)
+
+    @property
+    def age(self) ->float:
+        """Seconds since the section was built."""
+        return time.time() - self.built_at
+
+
+@dataclass
+class DailyReportSnapshot:
+    """The daily report sections of one local day."""
+    day: date
+    tasks: ReportSection
+    habits: ReportSection
+    calendar: Optional[ReportSection] = None
+
+    @property
+    def overdue_tasks(self) ->List[Dict[str, Any]]:
+        return self.tasks.data['overdue']
+
+    @property
+    def due_today_tasks(self) ->List[Dict[str, Any]]:
+        return self.tasks.data['due_today']
+
+    @property
+    def habits_due(self) ->List[Dict[str, Any]]:
+        return self.habits.data
+
+    @property
+    def events(self) ->List[Tuple[str, str, str]]:
+        """(time, name, duration) of today's calendar events."""
+        return self.calendar.data if self.calendar else []
+
+
+class DailyReportService:
+    """Builds and keeps the daily report snapshot."""
+
+    def __init__(self, config=None):
+        self.config = config
+        self._snapshot: Optional[DailyReportSnapshot] = None
+
+    @property
+    def snapshot(self) ->Optional[DailyReportSnapshot]:
+        """The stored snapshot, as last built or refreshed."""
+        return self._snapshot
+
+    async def build_snapshot(self, include_calendar: bool=True
+        ) ->DailyReportSnapshot:
+        """Compute every section from scratch and store the snapshot."""
+        started = time.time()
+        snapshot = DailyReportSnapshot(day=HabitRepository.today(), tasks=
+            await self._build_tasks(), habits=await self._build_habits())
+        if include_calendar:
+            snapshot.calendar = await self._build_calendar()
+        self._snapshot = snapshot
+        logger.info(
+            f'Daily report snapshot for {snapshot.day} built in {time.time() - started:.2f}s'
+            )
+        return snapshot
+
+    async def get_snapshot(self, include_calendar: bool=True
+        ) ->DailyReportSnapshot:
+        """
+        Get today's snapshot, refreshing only its stale sections.
+
+        Builds a full snapshot when none exists for the current local day.
+        Pass include_calendar=False when the calendar section is not shown.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.day != HabitRepository.today():
+            return await self.build_snapshot(include_calendar)
+        generation = cache_generation()
+        if self._is_stale(snapshot.tasks, generation):
+            snapshot.tasks = await self._build_tasks()
+        if self._is_stale(snapshot.habits, generation):
+            snapshot.habits = await self._build_habits()
+        if include_calendar and (snapshot.calendar is None or snapshot.
+            calendar.age > CALENDAR_MAX_AGE):
+            snapshot.calendar = await self._build_calendar()
+        return snapshot
+
+    @staticmethod
+    def _is_stale(section: ReportSection, generation: int) ->bool:
+        return section.generation != generation or section.age > SECTION_MAX_AGE
+
+    async def _build_tasks(self) ->ReportSection:
+        from larrybot.services.datetime_service import DateTimeService
+        generation = cache_generation()
+        task_service = TaskService(AsyncTaskRepository(get_db_executor()))
+        overdue_result = await task_service.get_tasks_with_filters(
+            overdue_only=True)
+        due_today_result = await task_service.get_tasks_with_filters(
+            due_after=DateTimeService.get_start_of_day(), due_before=
+            DateTimeService.get_end_of_day(), done=False)
+        return ReportSection({'overdue': overdue_result['data'] if
+            overdue_result['success'] else [], 'due_today':
+            due_today_result['data'] if due_today_result['success'] else []
+            }, generation)
+
+    async def _build_habits(self) ->ReportSection:
+        generation = cache_generation()
+        habits_due = await get_db_executor().run_in_session(lambda session:
+            [habit for habit in HabitRepository(session).get_habit_stats() if
+            not habit['completed_today']])
+        return ReportSection(habits_due, generation)
+
+    async def _build_calendar(self) ->ReportSection:
+        from larrybot.services.calendar_service import CalendarService
+        calendar_service = CalendarService(config=self.config)
+        events = []
+        for event in await calendar_service.get_todays_events():
+            formatted_event = calendar_service.format_event_for_daily_report(
+                event)
+            events.append((formatted_event['time'], formatted_event['name'],
+                formatted_event['duration']))
+        return ReportSection(events, cache_generation())
@@ -4,13 +4,220 @@ Centralized DateTime Service for LarryBot2
 This service provides consistent datetime handling across the entire application,
 ensuring proper timezone management, validation, and formatting.
 """
-from typing import Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime, timedelta, date, timezone
+import calendar
 import logging
+import re
+import threading
 from larrybot.utils.basic_datetime import get_utc_now, get_current_datetime
 
 logger = logging.getLogger(__name__)
 
+DATE_CACHE_SIZE = 512
+_FIXED_DAYS = {
+    'today': 0, 'tonight': 0, 'tomorrow': 1, 'tmrw': 1, 'yesterday': -1,
+    'day after tomorrow': 2, 'the day after tomorrow': 2, 'next week': 7,
+}
+_WEEKDAYS = {
+    'monday': 0, 'mon': 0, 'tuesday': 1, 'tue': 1, 'tues': 1,
+    'wednesday': 2, 'wed': 2, 'thursday': 3, 'thu': 3, 'thur': 3,
+    'thurs': 3, 'friday': 4, 'fri': 4, 'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6,
+}
+_WEEKDAY_FORM = re.compile(r'^(?:on\s+|next\s+)?([a-z]+)$')
+_OFFSET_FORM = re.compile(
+    r'^(?:in\s+)?(\d+|a|an|one)\s+(days?|weeks?|months?)(?:\s+from\s+now)?$')
+# Relative and clock times ("in 2 hours", "5pm", "at 17:30") depend on the
+# current time, as a clock time already passed today means tomorrow, so
+# their results are not cached
+_VOLATILE_FORM = re.compile(
+    r'\b(?:now|hours?|hrs?|minutes?|mins?|seconds?|secs?|noon|midnight)\b'
+    r'|\d:\d{2}|\d\s*[ap]\.?m\b')
+
+
+def _add_months(day: date, months: int) -> date:
+    """Add calendar months, clamping to the last day of shorter months."""
+    month_index = day.month - 1 + months
+    year, month = day.year + month_index // 12, month_index % 12 + 1
+    return day.replace(year=year, month=month,
+                       day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+class DateResolver:
+    """
+    Memoized date resolution for user input.
+
+    Features:
+    - Hand-written grammar for the common forms ("today", "tomorrow",
+      weekday names, "next week", "in 3 days", ISO dates) that never
+      reaches dateparser
+    - One reusable dateparser instance pinned to English, so language
+      detection is skipped for everything else
+    - LRU cache keyed by (text, local date, timezone), cleared when the
+      local date changes; inputs naming a relative or clock time skip it
+
+    Dates are resolved the way dateparser does with PREFER_DATES_FROM
+    set to 'future': a bare weekday is its next occurrence after today.
+    """
+
+    def __init__(self, cache_size: int = DATE_CACHE_SIZE):
+        self._cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_day: Optional[Tuple[date, str]] = None
+        self._lock = threading.Lock()
+        self._parser_lock = threading.Lock()
+        self._parser = None
+        self._stats = {'hits': 0, 'misses': 0, 'fast': 0, 'fallback': 0}
+
+    @staticmethod
+    def _local_day() -> Tuple[date, str]:
+        """Get today's local date and the timezone it was computed in."""
+        from larrybot.core.timezone import get_timezone_service
+        tz_service = get_timezone_service()
+        return tz_service.now().date(), tz_service.timezone_name
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return ' '.join(text.lower().split()).rstrip('.!')
+
+    def resolve_date(self, text: str, relative: bool = True) -> Optional[date]:
+        """
+        Resolve ISO dates and the common relative forms to a local date.
+
+        Args:
+            text: User input
+            relative: Also resolve relative forms such as "tomorrow"
+
+        Returns:
+            The local calendar date, or None if the fast grammar does not
+            cover the input
+        """
+        iso_date = self._parse_iso(text)
+        if iso_date is not None or not relative:
+            return iso_date
+        today, tz_name = self._local_day()
+        return self._resolve_cached(self._normalize(text), today, tz_name)
+
+    def parse(self, text: str) -> Optional[datetime]:
+        """
+        Parse a date expression like dateparser.parse() would.
+
+        The fast grammar is tried first and returns local midnight of the
+        resolved date; anything else goes to the pinned dateparser
+        instance. Returns a naive datetime, or None.
+        """
+        iso_date = self._parse_iso(text)
+        if iso_date is not None:
+            return datetime.combine(iso_date, datetime.min.time())
+        normalized = self._normalize(text)
+        if not normalized:
+            return None
+        if _VOLATILE_FORM.search(normalized):
+            return self._parse_fallback(text)
+        today, tz_name = self._local_day()
+        return self._cached(('text', normalized), today, tz_name,
+                            lambda: self._parse_uncached(text, normalized, today))
+
+    def _parse_uncached(self, text: str, normalized: str,
+                        today: date) -> Optional[datetime]:
+        resolved = self._resolve_relative(normalized, today)
+        if resolved is not None:
+            return datetime.combine(resolved, datetime.min.time())
+        return self._parse_fallback(text)
+
+    @staticmethod
+    def _parse_iso(text: str) -> Optional[date]:
+        try:
+            return datetime.strptime(text.strip(), '%Y-%m-%d').date()
+        except ValueError:
+            return None
+
+    def _resolve_cached(self, normalized: str, today: date,
+                        tz_name: str) -> Optional[date]:
+        return self._cached(('date', normalized), today, tz_name,
+                            lambda: self._resolve_relative(normalized, today))
+
+    def _cached(self, key: Tuple[str, str], today: date, tz_name: str,
+                compute) -> Any:
+        """Look key up for today's date, computing and storing it on a miss."""
+        with self._lock:
+            if self._cache_day != (today, tz_name):
+                self._cache.clear()
+                self._cache_day = today, tz_name
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+                return self._cache[key]
+            self._stats['misses'] += 1
+        value = compute()
+        with self._lock:
+            if self._cache_day == (today, tz_name):
+                self._cache[key] = value
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return value
+
+    def _resolve_relative(self, text: str, today: date) -> Optional[date]:
+        """Resolve the relative forms covered by the fast grammar."""
+        result = None
+        if text in _FIXED_DAYS:
+            result = today + timedelta(days=_FIXED_DAYS[text])
+        elif text == 'next month':
+            result = _add_months(today, 1)
+        else:
+            match = _WEEKDAY_FORM.match(text)
+            if match and match.group(1) in _WEEKDAYS:
+                days_ahead = (_WEEKDAYS[match.group(1)] - today.weekday()) % 7
+                result = today + timedelta(days=days_ahead or 7)
+            else:
+                match = _OFFSET_FORM.match(text)
+                if match:
+                    count = int(match.group(1)) if match.group(1).isdigit() else 1
+                    unit = match.group(2)
+                    if unit.startswith('month'):
+                        result = _add_months(today, count)
+                    else:
+                        result = today + timedelta(
+                            days=count * (7 if unit.startswith('week') else 1))
+        if result is not None:
+            with self._lock:
+                self._stats['fast'] += 1
+        return result
+
+    def _parse_fallback(self, text: str) -> Optional[datetime]:
+        """Parse with the shared English-only dateparser instance."""
+        with self._lock:
+            self._stats['fallback'] += 1
+        with self._parser_lock:
+            if self._parser is None:
+                from dateparser.date import DateDataParser
+                self._parser = DateDataParser(
+                    languages=['en'], settings={'PREFER_DATES_FROM': 'future'})
+            return self._parser.get_date_data(text).date_obj
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hits and misses and how inputs were resolved."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+        return stats
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+            self._cache_day = None
+
+
+_date_resolver = DateResolver()
+
+
+def get_date_resolver() -> DateResolver:
+    """Get the process-wide date resolver."""
+    return _date_resolver
+
 
 class DateTimeService:
     """
@@ -26,6 +233,9 @@ class DateTimeService:
         Parse user input to timezone-aware datetime.
         
         Supports both structured (YYYY-MM-DD) and natural language formats.
+        ISO dates and common relative forms ("tomorrow", "Friday",
+        "in 3 days") are resolved in the user's local timezone without
+        calling dateparser; results are memoized for the current day.
         
         Args:
             date_str: Date string (YYYY-MM-DD or natural language like "Monday", "next week")
@@ -41,11 +251,11 @@ class DateTimeService:
             
         date_str = date_str.strip()
         
-        # Try structured parsing first (faster for known formats)
-        try:
-            # Parse the date string
-            local_date = datetime.strptime(date_str, '%Y-%m-%d')
-            local_datetime = local_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+        resolver = get_date_resolver()
+        # Try ISO dates and common relative forms first (no dateparser call)
+        local_date = resolver.resolve_date(date_str, relative=use_nlp)
+        if local_date is not None:
+            local_datetime = datetime.combine(local_date, datetime.max.time())
             
             # Create timezone-aware datetime in user's local timezone, then convert to UTC
             from larrybot.core.timezone import get_timezone_service
@@ -53,16 +263,14 @@ class DateTimeService:
             local_aware = local_datetime.replace(tzinfo=tz_service._timezone)
             utc_aware = local_aware.astimezone(timezone.utc)
             
-            logger.debug(f"Parsed structured date '{date_str}' to {utc_aware} (from local {local_aware})")
+            logger.debug(f"Resolved date '{date_str}' to {utc_aware} (from local {local_aware})")
             return utc_aware
-        except ValueError:
-            logger.debug(f"Structured parsing failed for '{date_str}', attempting NLP parsing")
         
         # Fallback to NLP parsing if enabled
         if use_nlp:
+            logger.debug(f"Fast date grammar did not match '{date_str}', attempting NLP parsing")
             try:
-                from dateparser import parse as parse_date
-                parsed_date = parse_date(date_str, settings={'PREFER_DATES_FROM': 'future'})
+                parsed_date = resolver.parse(date_str)
                 if parsed_date:
                     # Ensure timezone-aware
                     if parsed_date.tzinfo is None:
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, timedelta
 from larrybot.services.base_service import BaseService
 from larrybot.storage.task_repository import TaskRepository
@@ -6,6 +6,9 @@ from larrybot.models.task import Task
 from larrybot.models.task_comment import TaskComment
 from larrybot.storage.client_repository import ClientRepository
 from larrybot.storage.db import get_session
+from larrybot.storage.async_db import AsyncRepository
+from larrybot.storage.task_snapshot import TaskSnapshot
+import inspect
 import json
 import re
 from larrybot.utils.datetime_utils import get_utc_now, ensure_timezone_aware
@@ -21,6 +24,12 @@ class TaskService(BaseService):
         super().__init__()
         self.task_repository = task_repository
 
+    async def _resolve(self, result: Any) ->Any:
+        """Await results from async repositories; pass sync results through."""
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
     async def execute(self, *args, **kwargs) ->Any:
         """Execute the service operation."""
         return await self.create_task_with_metadata(*args, **kwargs)
@@ -39,21 +48,26 @@ class TaskService(BaseService):
                 return self._handle_error(ValueError(
                     'Due date cannot be in the past'))
             if parent_id:
-                parent = self.task_repository.get_task_by_id(parent_id)
+                parent = await self._resolve(self.task_repository.get_task_by_id(parent_id))
                 if not parent:
                     return self._handle_error(ValueError(
                         f'Parent task {parent_id} not found'))
             if client_id:
-                with next(get_session()) as session:
-                    client_repo = ClientRepository(session)
-                    client = client_repo.get_client_by_id(client_id)
-                    if not client:
-                        return self._handle_error(ValueError(
-                            f'Client {client_id} not found'))
-            task = self.task_repository.add_task_with_metadata(description=
+                if isinstance(self.task_repository, AsyncRepository):
+                    client = await self.task_repository.executor.run_in_session(
+                        lambda session: ClientRepository(session).
+                        get_client_by_id(client_id))
+                else:
+                    with next(get_session()) as session:
+                        client_repo = ClientRepository(session)
+                        client = client_repo.get_client_by_id(client_id)
+                if not client:
+                    return self._handle_error(ValueError(
+                        f'Client {client_id} not found'))
+            task = await self._resolve(self.task_repository.add_task_with_metadata(description=
                 description, priority=priority, due_date=due_date, category
                 =category, estimated_hours=estimated_hours, tags=tags,
-                parent_id=parent_id, client_id=client_id)
+                parent_id=parent_id, client_id=client_id))
             return self._create_success_response(self._task_to_dict(task),
                 f'Task created successfully with ID {task.id}')
         except Exception as e:
@@ -67,10 +81,10 @@ class TaskService(BaseService):
         str, Any]:
         """Get tasks with advanced filtering."""
         try:
-            tasks = self.task_repository.get_tasks_with_filters(status=
+            tasks = await self._resolve(self.task_repository.get_tasks_with_filters(status=
                 status, priority=priority, category=category, due_before=
                 due_before, due_after=due_after, overdue_only=overdue_only,
-                client_id=client_id, parent_id=parent_id, done=done)
+                client_id=client_id, parent_id=parent_id, done=done))
             return self._create_success_response([self._task_to_dict(task) for
                 task in tasks], f'Found {len(tasks)} tasks')
         except Exception as e:
@@ -83,7 +97,7 @@ class TaskService(BaseService):
             if priority not in ['Low', 'Medium', 'High', 'Critical']:
                 return self._handle_error(ValueError(
                     f'Invalid priority: {priority}'))
-            task = self.task_repository.update_priority(task_id, priority)
+            task = await self._resolve(self.task_repository.update_priority(task_id, priority))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
@@ -99,7 +113,7 @@ class TaskService(BaseService):
             if not DateTimeService.validate_due_date(due_date):
                 return self._handle_error(ValueError(
                     'Due date cannot be in the past'))
-            task = self.task_repository.update_due_date(task_id, due_date)
+            task = await self._resolve(self.task_repository.update_due_date(task_id, due_date))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
@@ -113,7 +127,7 @@ class TaskService(BaseService):
         str, Any]:
         """Update task category."""
         try:
-            task = self.task_repository.update_category(task_id, category)
+            task = await self._resolve(self.task_repository.update_category(task_id, category))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
@@ -130,7 +144,7 @@ class TaskService(BaseService):
             if status not in valid_statuses:
                 return self._handle_error(ValueError(
                     f'Invalid status: {status}'))
-            task = self.task_repository.update_status(task_id, status)
+            task = await self._resolve(self.task_repository.update_status(task_id, status))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
@@ -142,14 +156,14 @@ class TaskService(BaseService):
     async def start_time_tracking(self, task_id: int) ->Dict[str, Any]:
         """Start time tracking for a task."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
             if task.started_at:
                 return self._handle_error(ValueError(
                     f'Time tracking already started for task {task_id}'))
-            success = self.task_repository.start_time_tracking(task_id)
+            success = await self._resolve(self.task_repository.start_time_tracking(task_id))
             if not success:
                 return self._handle_error(ValueError(
                     f'Failed to start time tracking for task {task_id}'))
@@ -162,14 +176,14 @@ class TaskService(BaseService):
     async def stop_time_tracking(self, task_id: int) ->Dict[str, Any]:
         """Stop time tracking for a task."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
             if not task.started_at:
                 return self._handle_error(ValueError(
                     f'Time tracking not started for task {task_id}'))
-            duration = self.task_repository.stop_time_tracking(task_id)
+            duration = await self._resolve(self.task_repository.stop_time_tracking(task_id))
             if duration is None:
                 return self._handle_error(ValueError(
                     f'Failed to stop time tracking for task {task_id}'))
@@ -184,11 +198,11 @@ class TaskService(BaseService):
         str, Any]:
         """Add a subtask to a parent task."""
         try:
-            parent = self.task_repository.get_task_by_id(parent_id)
+            parent = await self._resolve(self.task_repository.get_task_by_id(parent_id))
             if not parent:
                 return self._handle_error(ValueError(
                     f'Parent task {parent_id} not found'))
-            subtask = self.task_repository.add_subtask(parent_id, description)
+            subtask = await self._resolve(self.task_repository.add_subtask(parent_id, description))
             if not subtask:
                 return self._handle_error(ValueError(
                     f'Failed to create subtask'))
@@ -202,11 +216,11 @@ class TaskService(BaseService):
     async def get_subtasks(self, parent_id: int) ->Dict[str, Any]:
         """Get all subtasks of a parent task."""
         try:
-            parent = self.task_repository.get_task_by_id(parent_id)
+            parent = await self._resolve(self.task_repository.get_task_by_id(parent_id))
             if not parent:
                 return self._handle_error(ValueError(
                     f'Parent task {parent_id} not found'))
-            subtasks = self.task_repository.get_subtasks(parent_id)
+            subtasks = await self._resolve(self.task_repository.get_subtasks(parent_id))
             return self._create_success_response([self._task_to_dict(task) for
                 task in subtasks],
                 f'Found {len(subtasks)} subtasks for task {parent_id}')
@@ -217,8 +231,8 @@ class TaskService(BaseService):
         ) ->Dict[str, Any]:
         """Add a dependency between tasks."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
-            dependency = self.task_repository.get_task_by_id(dependency_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
+            dependency = await self._resolve(self.task_repository.get_task_by_id(dependency_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
@@ -228,8 +242,8 @@ class TaskService(BaseService):
             if task_id == dependency_id:
                 return self._handle_error(ValueError(
                     'Task cannot depend on itself'))
-            success = self.task_repository.add_task_dependency(task_id,
-                dependency_id)
+            success = await self._resolve(self.task_repository.add_task_dependency(task_id,
+                dependency_id))
             if not success:
                 return self._handle_error(ValueError(
                     f'Dependency already exists or failed to create'))
@@ -242,11 +256,11 @@ class TaskService(BaseService):
     async def get_task_dependencies(self, task_id: int) ->Dict[str, Any]:
         """Get all tasks that this task depends on."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
-            dependencies = self.task_repository.get_task_dependencies(task_id)
+            dependencies = await self._resolve(self.task_repository.get_task_dependencies(task_id))
             return self._create_success_response([self._task_to_dict(dep) for
                 dep in dependencies],
                 f'Found {len(dependencies)} dependencies for task {task_id}')
@@ -256,13 +270,13 @@ class TaskService(BaseService):
     async def add_tags(self, task_id: int, tags: List[str]) ->Dict[str, Any]:
         """Add tags to a task."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
             if not tags:
                 return self._handle_error(ValueError('No tags provided'))
-            updated_task = self.task_repository.add_tags(task_id, tags)
+            updated_task = await self._resolve(self.task_repository.add_tags(task_id, tags))
             if not updated_task:
                 return self._handle_error(ValueError(
                     f'Failed to add tags to task {task_id}'))
@@ -274,7 +288,7 @@ class TaskService(BaseService):
     async def get_tasks_by_tag(self, tag: str) ->Dict[str, Any]:
         """Get all tasks with a specific tag."""
         try:
-            tasks = self.task_repository.get_tasks_by_tag(tag)
+            tasks = await self._resolve(self.task_repository.get_tasks_by_tag(tag))
             return self._create_success_response([self._task_to_dict(task) for
                 task in tasks], f"Found {len(tasks)} tasks with tag '{tag}'")
         except Exception as e:
@@ -283,14 +297,14 @@ class TaskService(BaseService):
     async def add_comment(self, task_id: int, comment: str) ->Dict[str, Any]:
         """Add a comment to a task."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
             if not comment.strip():
                 return self._handle_error(ValueError('Comment cannot be empty')
                     )
-            task_comment = self.task_repository.add_comment(task_id, comment)
+            task_comment = await self._resolve(self.task_repository.add_comment(task_id, comment))
             if not task_comment:
                 return self._handle_error(ValueError(
                     f'Failed to add comment to task {task_id}'))
@@ -302,11 +316,11 @@ class TaskService(BaseService):
     async def get_comments(self, task_id: int) ->Dict[str, Any]:
         """Get all comments for a task."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
-            comments = self.task_repository.get_comments(task_id)
+            comments = await self._resolve(self.task_repository.get_comments(task_id))
             return self._create_success_response([self._comment_to_dict(
                 comment) for comment in comments],
                 f'Found {len(comments)} comments for task {task_id}')
@@ -316,14 +330,14 @@ class TaskService(BaseService):
     async def get_task_analytics(self) ->Dict[str, Any]:
         """Get comprehensive task analytics."""
         try:
-            stats = self.task_repository.get_task_statistics()
-            overdue_tasks = self.task_repository.get_overdue_tasks()
-            tasks_due_today = self.task_repository.get_tasks_due_today()
+            stats = await self._resolve(self.task_repository.get_task_statistics())
+            overdue_tasks = await self._resolve(self.task_repository.get_overdue_tasks())
+            tasks_due_today = await self._resolve(self.task_repository.get_tasks_due_today())
             analytics = {**stats, 'overdue_tasks_details': [self.
                 _task_to_dict(task) for task in overdue_tasks],
                 'tasks_due_today': [self._task_to_dict(task) for task in
-                tasks_due_today], 'categories': self.task_repository.
-                get_all_categories()}
+                tasks_due_today], 'categories': await self._resolve(self.task_repository.
+                get_all_categories())}
             return self._create_success_response(analytics,
                 'Task analytics retrieved successfully')
         except Exception as e:
@@ -361,12 +375,12 @@ class TaskService(BaseService):
                 return self._handle_error(ValueError(
                     f'Invalid status: {status}'))
             for task_id in task_ids:
-                task = self.task_repository.get_task_by_id(task_id)
+                task = await self._resolve(self.task_repository.get_task_by_id(task_id))
                 if not task:
                     return self._handle_error(ValueError(
                         f'Task {task_id} not found'))
-            updated_count = self.task_repository.bulk_update_status(task_ids,
-                status)
+            updated_count = await self._resolve(self.task_repository.bulk_update_status(task_ids,
+                status))
             return self._create_success_response({'updated_count':
                 updated_count, 'task_ids': task_ids, 'new_status': status},
                 f"Updated status to '{status}' for {updated_count} tasks")
@@ -383,12 +397,12 @@ class TaskService(BaseService):
                 return self._handle_error(ValueError(
                     f'Invalid priority: {priority}'))
             for task_id in task_ids:
-                task = self.task_repository.get_task_by_id(task_id)
+                task = await self._resolve(self.task_repository.get_task_by_id(task_id))
                 if not task:
                     return self._handle_error(ValueError(
                         f'Task {task_id} not found'))
-            updated_count = self.task_repository.bulk_update_priority(task_ids,
-                priority)
+            updated_count = await self._resolve(self.task_repository.bulk_update_priority(task_ids,
+                priority))
             return self._create_success_response({'updated_count':
                 updated_count, 'task_ids': task_ids, 'new_priority':
                 priority},
@@ -401,12 +415,12 @@ class TaskService(BaseService):
         """Assign multiple tasks to a client."""
         try:
             for task_id in task_ids:
-                task = self.task_repository.get_task_by_id(task_id)
+                task = await self._resolve(self.task_repository.get_task_by_id(task_id))
                 if not task:
                     return self._handle_error(ValueError(
                         f'Task {task_id} not found'))
-            updated_count = self.task_repository.bulk_assign_to_client(task_ids
-                , client_name)
+            updated_count = await self._resolve(self.task_repository.bulk_assign_to_client(task_ids
+                , client_name))
             if updated_count == 0:
                 return self._handle_error(ValueError(
                     f"Client '{client_name}' not found"))
@@ -421,11 +435,11 @@ class TaskService(BaseService):
         """Delete multiple tasks."""
         try:
             for task_id in task_ids:
-                task = self.task_repository.get_task_by_id(task_id)
+                task = await self._resolve(self.task_repository.get_task_by_id(task_id))
                 if not task:
                     return self._handle_error(ValueError(
                         f'Task {task_id} not found'))
-            deleted_count = self.task_repository.bulk_delete_tasks(task_ids)
+            deleted_count = await self._resolve(self.task_repository.bulk_delete_tasks(task_ids))
             return self._create_success_response({'deleted_count':
                 deleted_count, 'task_ids': task_ids},
                 f'Deleted {deleted_count} tasks')
@@ -436,7 +450,7 @@ class TaskService(BaseService):
         int, description: str='') ->Dict[str, Any]:
         """Add manual time entry for a task."""
         try:
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
@@ -445,8 +459,8 @@ class TaskService(BaseService):
                     'Duration must be positive'))
             end_time = get_utc_now()
             start_time = end_time - timedelta(minutes=duration_minutes)
-            success = self.task_repository.add_time_entry(task_id,
-                start_time, end_time, description)
+            success = await self._resolve(self.task_repository.add_time_entry(task_id,
+                start_time, end_time, description))
             if not success:
                 return self._handle_error(ValueError(
                     f'Failed to add time entry for task {task_id}'))
@@ -465,14 +479,14 @@ class TaskService(BaseService):
         try:
             logger.info(f"Getting time summary for task {task_id}")
             
-            task = self.task_repository.get_task_by_id(task_id)
+            task = await self._resolve(self.task_repository.get_task_by_id(task_id))
             if not task:
                 logger.warning(f"Task {task_id} not found for time summary")
                 return self._handle_error(ValueError(
                     f'Task {task_id} not found'))
             
-            time_summary = self.task_repository.get_task_time_summary(task_id)
-            comments = self.task_repository.get_comments(task_id)
+            time_summary = await self._resolve(self.task_repository.get_task_time_summary(task_id))
+            comments = await self._resolve(self.task_repository.get_comments(task_id))
             
             # Validate time summary data
             if not isinstance(time_summary, dict):
@@ -520,14 +534,20 @@ class TaskService(BaseService):
 
     async def search_tasks_by_text(self, search_text: str, case_sensitive:
         bool=False) ->Dict[str, Any]:
-        """Search tasks by text in description, comments, and tags."""
+        """
+        Search tasks by text in description, title, category, tags and comments.
+
+        Results are ranked by relevance; each carries the matching text as
+        'snippet' when the full-text index served the search.
+        """
         try:
             if not search_text.strip():
                 return self._handle_error(ValueError(
                     'Search text cannot be empty'))
-            tasks = self.task_repository.search_tasks_by_text(search_text,
-                case_sensitive)
-            return self._create_success_response([self._task_to_dict(task) for
+            tasks = await self._resolve(self.task_repository.search_tasks_by_text(search_text,
+                case_sensitive))
+            return self._create_success_response([dict(self._task_to_dict(
+                task), snippet=getattr(task, 'search_snippet', None)) for
                 task in tasks],
                 f"Found {len(tasks)} tasks matching '{search_text}'")
         except Exception as e:
@@ -554,7 +574,7 @@ class TaskService(BaseService):
             if sort_order not in ['asc', 'desc']:
                 return self._handle_error(ValueError(
                     f'Invalid sort order: {sort_order}'))
-            tasks = self.task_repository.get_tasks_with_advanced_filters(status
+            tasks = await self._resolve(self.task_repository.get_tasks_with_advanced_filters(status
                 =status, priority=priority, category=category, due_before=
                 due_before, due_after=due_after, overdue_only=overdue_only,
                 client_id=client_id, parent_id=parent_id, done=done, tags=
@@ -562,7 +582,7 @@ class TaskService(BaseService):
                 has_time_entries, estimated_hours_min=estimated_hours_min,
                 estimated_hours_max=estimated_hours_max, created_after=
                 created_after, created_before=created_before, sort_by=
-                sort_by, sort_order=sort_order, limit=limit)
+                sort_by, sort_order=sort_order, limit=limit))
             return self._create_success_response([self._task_to_dict(task) for
                 task in tasks],
                 f'Found {len(tasks)} tasks with advanced filters')
@@ -576,8 +596,8 @@ class TaskService(BaseService):
         try:
             if not tags:
                 return self._handle_error(ValueError('No tags provided'))
-            tasks = self.task_repository.get_tasks_by_multiple_tags(tags,
-                match_all)
+            tasks = await self._resolve(self.task_repository.get_tasks_by_multiple_tags(tags,
+                match_all))
             match_type = 'all' if match_all else 'any'
             return self._create_success_response([self._task_to_dict(task) for
                 task in tasks],
@@ -593,8 +613,8 @@ class TaskService(BaseService):
             if start_date >= end_date:
                 return self._handle_error(ValueError(
                     'Start date must be before end date'))
-            tasks = self.task_repository.get_tasks_by_time_range(start_date,
-                end_date, include_completed)
+            tasks = await self._resolve(self.task_repository.get_tasks_by_time_range(start_date,
+                end_date, include_completed))
             completed_text = ('including completed' if include_completed else
                 'excluding completed')
             return self._create_success_response([self._task_to_dict(task) for
@@ -614,8 +634,8 @@ class TaskService(BaseService):
                 return self._handle_error(ValueError(
                     f"Invalid priority. Must be one of: {', '.join(valid_priorities)}"
                     ))
-            tasks = self.task_repository.get_tasks_by_priority_range(
-                min_priority, max_priority)
+            tasks = await self._resolve(self.task_repository.get_tasks_by_priority_range(
+                min_priority, max_priority))
             return self._create_success_response([self._task_to_dict(task) for
                 task in tasks],
                 f'Found {len(tasks)} tasks in priority range {min_priority} to {max_priority}'
@@ -630,15 +650,20 @@ class TaskService(BaseService):
             if days <= 0 or days > 365:
                 return self._handle_error(ValueError(
                     'Days must be between 1 and 365'))
-            analytics = self.task_repository.get_advanced_task_analytics(days)
+            analytics = await self._resolve(self.task_repository.get_advanced_task_analytics(days))
             return self._create_success_response(analytics,
                 f'Advanced analytics for the last {days} days')
         except Exception as e:
             return self._handle_error(e, 'Error retrieving advanced analytics')
 
     async def get_productivity_report(self, start_date: datetime, end_date:
-        datetime) ->Dict[str, Any]:
-        """Get detailed productivity report for a specific time period."""
+        datetime, include_time_analysis: bool=False) ->Dict[str, Any]:
+        """
+        Get detailed productivity report for a specific time period.
+
+        include_time_analysis adds completion-time, estimate and on-time
+        statistics, which read every task in the range.
+        """
         try:
             if start_date >= end_date:
                 return self._handle_error(ValueError(
@@ -646,8 +671,8 @@ class TaskService(BaseService):
             if (end_date - start_date).days > 365:
                 return self._handle_error(ValueError(
                     'Date range cannot exceed 365 days'))
-            report = self.task_repository.get_productivity_report(start_date,
-                end_date)
+            report = await self._resolve(self.task_repository.get_productivity_report(start_date,
+                end_date, include_time_analysis))
             return self._create_success_response(report,
                 f"Productivity report from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
                 )
@@ -655,8 +680,8 @@ class TaskService(BaseService):
             return self._handle_error(e, 'Error generating productivity report'
                 )
 
-    def _task_to_dict(self, task: Task) ->Dict[str, Any]:
-        """Convert task model to dictionary."""
+    def _task_to_dict(self, task: Union[Task, TaskSnapshot]) ->Dict[str, Any]:
+        """Convert a task model or cached task snapshot to dictionary."""
         return {'id': task.id, 'description': task.description, 'done':
             task.done, 'priority': task.priority_enum.name.title(),
             'due_date': task.due_date.isoformat() if task.due_date else
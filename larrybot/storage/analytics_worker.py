@@ -0,0 +1,91 @@
+"""
+Process-pool analytics jobs for LarryBot2.
+
+These functions run in the background queue's process lane
+(submit_background_job(..., executor='process')). They take only picklable
+inputs - a database path and plain parameters - open their own read-only
+SQLite connection in the worker process and return plain dicts, so the
+Python-heavy loops over every task never hold the bot process's GIL.
+Because they take plain arguments, the durable job store can also persist
+and resume them (see larrybot.storage.job_store).
+"""
+import logging
+import os
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+logger = logging.getLogger(__name__)
+_engines: Dict[str, Engine] = {}
+
+
+def get_database_path(session: Session) ->Optional[str]:
+    """
+    Get the file path of the SQLite database behind a session.
+
+    Returns None for in-memory databases, which a worker process cannot
+    open.
+    """
+    database = session.get_bind().url.database
+    if not database or database == ':memory:' or database.startswith('file:'
+        ):
+        return None
+    return os.path.abspath(database)
+
+
+def _get_readonly_engine(db_path: str) ->Engine:
+    """Create (once per process) a read-only engine for db_path."""
+    engine = _engines.get(db_path)
+    if engine is None:
+        engine = create_engine(f'sqlite:///file:{db_path}?mode=ro&uri=true',
+            poolclass=NullPool, connect_args={'timeout': 20})
+
+        @event.listens_for(engine, 'connect')
+        def set_readonly_pragma(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute('PRAGMA query_only=ON')
+                cursor.execute('PRAGMA busy_timeout=20000')
+            finally:
+                cursor.close()
+        _engines[db_path] = engine
+    return engine
+
+
+@contextmanager
+def open_readonly_session(db_path: str) ->Iterator[Session]:
+    """Open a read-only session on db_path inside the worker process."""
+    session = sessionmaker(bind=_get_readonly_engine(db_path))()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def compute_task_statistics(db_path: str) ->Dict[str, Any]:
+    """Compute task statistics on a read-only connection."""
+    from larrybot.storage.task_repository import TaskRepository
+    with open_readonly_session(db_path) as session:
+        return TaskRepository(session)._compute_task_statistics()
+
+
+def compute_advanced_analytics(db_path: str, days: int=30, use_rollups:
+    Optional[bool]=None) ->Dict[str, Any]:
+    """Compute advanced task analytics in a worker process."""
+    from larrybot.storage.task_repository import TaskRepository
+    with open_readonly_session(db_path) as session:
+        return TaskRepository(session)._compute_advanced_analytics(days,
+            use_rollups)
+
+
+def compute_productivity_report(db_path: str, start_date: datetime,
+    end_date: datetime, use_rollups: Optional[bool]=None,
+    include_time_analysis: bool=False) ->Dict[str, Any]:
+    """Compute a productivity report in a worker process."""
+    from larrybot.storage.task_repository import TaskRepository
+    with open_readonly_session(db_path) as session:
+        return TaskRepository(session)._compute_productivity_report(start_date,
+            end_date, use_rollups, include_time_analysis)
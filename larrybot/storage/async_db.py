@@ -0,0 +1,210 @@
+"""
+Async storage layer for LarryBot2.
+
+Runs repository calls on a dedicated database executor so Telegram handlers
+can await them instead of blocking the event loop on SQLite I/O or
+busy_timeout waits. Each awaited call opens its own short-lived session on a
+database thread, invokes the synchronous repository method and returns the
+result to the caller's loop.
+
+Async storage mode (ASYNC_STORAGE, off by default) currently covers the
+task handlers only: plugins/tasks.py and the advanced task plugin build
+their TaskService on AsyncTaskRepository. Client, habit and reminder
+handlers still use the synchronous repositories.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+from sqlalchemy.orm import Session
+from larrybot.storage.db import get_optimized_session
+from larrybot.storage.task_repository import TaskRepository
+logger = logging.getLogger(__name__)
+T = TypeVar('T')
+SessionFactory = Callable[[], AbstractContextManager]
+
+
+class DatabaseExecutor:
+    """
+    Dedicated thread pool for database work.
+
+    Features:
+    - Keeps SQLite I/O and lock waits off the event loop
+    - Several DB threads so one heavy query cannot starve short lookups
+    - Queue-wait and run-time statistics for monitoring
+    """
+
+    def __init__(self, max_workers: int=4, session_factory: Optional[
+        SessionFactory]=None):
+        self._max_workers = max_workers
+        self._session_factory = session_factory or get_optimized_session
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {'submitted': 0, 'completed': 0, 'failed': 0,
+            'in_flight': 0, 'total_wait': 0.0, 'total_run': 0.0, 'max_run':
+            0.0}
+
+    def _get_executor(self) ->ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.
+                    _max_workers, thread_name_prefix='db')
+                logger.info(
+                    f'DatabaseExecutor started ({self._max_workers} workers)')
+            return self._executor
+
+    def _timed_call(self, submitted_at: float, func: Callable[..., T], args:
+        tuple, kwargs: dict) ->T:
+        """Run func on a DB thread while recording wait and run times."""
+        started_at = time.perf_counter()
+        with self._lock:
+            self._stats['total_wait'] += started_at - submitted_at
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            with self._lock:
+                self._stats['in_flight'] -= 1
+                self._stats['failed'] += 1
+            raise
+        run_time = time.perf_counter() - started_at
+        with self._lock:
+            self._stats['in_flight'] -= 1
+            self._stats['completed'] += 1
+            self._stats['total_run'] += run_time
+            self._stats['max_run'] = max(self._stats['max_run'], run_time)
+        return result
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) ->T:
+        """Run a blocking callable on a DB thread and await its result."""
+        executor = self._get_executor()
+        with self._lock:
+            self._stats['submitted'] += 1
+            self._stats['in_flight'] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self._timed_call, time.
+            perf_counter(), func, args, kwargs)
+
+    async def run_in_session(self, func: Callable[[Session], T]) ->T:
+        """
+        Open a session on a DB thread and call func(session).
+
+        Committing is left to the session factory; the default
+        get_optimized_session commits on success and rolls back on error.
+        """
+
+        def call() ->T:
+            with self._session_factory() as session:
+                return func(session)
+        return await self.run(call)
+
+    def get_stats(self) ->Dict[str, Any]:
+        """Get executor statistics."""
+        with self._lock:
+            completed = max(1, self._stats['completed'])
+            finished = max(1, self._stats['completed'] + self._stats['failed'])
+            return {'workers': self._max_workers, 'submitted': self._stats[
+                'submitted'], 'completed': self._stats['completed'],
+                'failed': self._stats['failed'], 'in_flight': self._stats[
+                'in_flight'], 'avg_wait': f"{self._stats['total_wait'] / finished:.4f}s",
+                'avg_run': f"{self._stats['total_run'] / completed:.4f}s",
+                'max_run': f"{self._stats['max_run']:.4f}s"}
+
+    def shutdown(self, wait: bool=True) ->None:
+        """Stop the DB threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+            logger.info('DatabaseExecutor stopped')
+
+
+class AsyncRepository:
+    """
+    Awaitable facade over a synchronous repository class.
+
+    Every public repository method is exposed as a coroutine that runs in a
+    fresh session on the database executor:
+
+        repo = AsyncTaskRepository()
+        task = await repo.get_task_by_id(42)
+
+    Returned ORM objects are detached (sessions use expire_on_commit=False),
+    so column attributes stay readable after the call completes.
+    """
+    repository_class: Type = None
+
+    def __init__(self, executor: Optional[DatabaseExecutor]=None):
+        self._executor = executor or get_db_executor()
+
+    @property
+    def executor(self) ->DatabaseExecutor:
+        """The executor this facade runs on."""
+        return self._executor
+
+    def __getattr__(self, name: str) ->Callable[..., Any]:
+        if name.startswith('_') or not callable(getattr(self.
+            repository_class, name, None)):
+            raise AttributeError(
+                f"'{type(self).__name__}' has no repository method '{name}'")
+
+        async def method(*args, **kwargs):
+            return await self._executor.run_in_session(lambda session:
+                getattr(self.repository_class(session), name)(*args, **kwargs))
+        method.__name__ = name
+        return method
+
+
+class AsyncTaskRepository(AsyncRepository):
+    """Awaitable variant of TaskRepository."""
+    repository_class = TaskRepository
+
+
+_db_executor: Optional[DatabaseExecutor] = None
+_async_storage_enabled = False
+
+
+def get_db_executor() ->DatabaseExecutor:
+    """Get the global database executor."""
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = DatabaseExecutor()
+    return _db_executor
+
+
+def configure_async_storage(enabled: bool, max_workers: Optional[int]=None
+    ) ->None:
+    """Enable or disable async storage mode for handlers and services."""
+    global _async_storage_enabled, _db_executor
+    _async_storage_enabled = enabled
+    if max_workers is not None:
+        if _db_executor is not None:
+            _db_executor.shutdown(wait=False)
+        _db_executor = DatabaseExecutor(max_workers=max_workers)
+    logger.info(f"Async storage mode {'enabled' if enabled else 'disabled'}")
+
+
+def is_async_storage_enabled() ->bool:
+    """Check whether handlers should use the async repositories."""
+    return _async_storage_enabled
+
+
+async def run_in_db_session(func: Callable[[Session], T]) ->T:
+    """Run func(session) on the global database executor."""
+    return await get_db_executor().run_in_session(func)
+
+
+def get_db_executor_stats() ->Dict[str, Any]:
+    """Get database executor statistics."""
+    return get_db_executor().get_stats()
+
+
+def shutdown_db_executor() ->None:
+    """Shut down the global database executor (for shutdown)."""
+    global _db_executor
+    if _db_executor is not None:
+        _db_executor.shutdown()
+        _db_executor = None
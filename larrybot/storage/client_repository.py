@@ -1,8 +1,11 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import func
+from sqlalchemy import and_, case, func
 from larrybot.models.client import Client
 from larrybot.models.task import Task
+from larrybot.storage.task_columns import priority_code
+from larrybot.utils.caching import cached
+from larrybot.utils.cache_automation import auto_invalidate_cache, OperationType
 
 
 class ClientRepository:
@@ -11,6 +14,7 @@ class ClientRepository:
     def __init__(self, session: Session):
         self.session = session
 
+    @auto_invalidate_cache(OperationType.CLIENT_CREATE)
     def add_client(self, name: str) ->Client:
         """Add a new client."""
         client = Client(name=name)
@@ -19,9 +23,8 @@ class ClientRepository:
         return client
 
     def list_clients(self) ->List[Client]:
-        """List all clients with optimized task count loading."""
-        return self.session.query(Client).options(selectinload(Client.tasks)
-            ).order_by(Client.name.asc()).all()
+        """List all clients; use get_client_analytics() for task counts."""
+        return self.session.query(Client).order_by(Client.name.asc()).all()
 
     def list_all_clients(self) ->List[Client]:
         """Legacy method name - delegates to list_clients for backward compatibility."""
@@ -37,6 +40,7 @@ class ClientRepository:
         return self.session.query(Client).options(selectinload(Client.tasks)
             ).filter_by(id=client_id).first()
 
+    @auto_invalidate_cache(OperationType.CLIENT_DELETE)
     def delete_client(self, name: str) ->bool:
         """Delete a client and handle task reassignment."""
         client = self.session.query(Client).filter_by(name=name).first()
@@ -48,6 +52,7 @@ class ClientRepository:
             return True
         return False
 
+    @auto_invalidate_cache(OperationType.CLIENT_DELETE)
     def remove_client(self, name: str) ->Optional[Client]:
         """Legacy method name - wrapper around delete_client for backward compatibility."""
         client = self.session.query(Client).filter_by(name=name).first()
@@ -71,6 +76,44 @@ class ClientRepository:
             created_at, 'task_count': row.task_count, 'active_task_count':
             row.active_task_count} for row in result]
 
+    @cached(ttl=300.0, tags=['client', 'task'])
+    def get_client_analytics(self, client_id: Optional[int]=None) ->List[dict
+        ]:
+        """
+        Get per-client task analytics with one GROUP BY aggregate.
+
+        Each entry has the client's id, name and created_at, its total,
+        completed, pending and overdue task counts, estimated and actual
+        hours, average priority level and completion rate. Pass client_id
+        to get a single client.
+        """
+        from larrybot.services.datetime_service import DateTimeService
+        pending = Task.done == False
+        query = self.session.query(Client.id, Client.name, Client.
+            created_at, func.count(Task.id).label('total'), func.sum(case((
+            Task.done == True, 1), else_=0)).label('completed'), func.sum(
+            case((and_(pending, Task.due_date < DateTimeService.
+            get_start_of_day()), 1), else_=0)).label('overdue'), func.sum(
+            func.coalesce(Task.estimated_hours, 0)).label('estimated_hours'
+            ), func.sum(func.coalesce(Task.actual_hours, 0)).label(
+            'actual_hours'), func.avg(priority_code()).label('avg_priority')
+            ).outerjoin(Task, Client.id == Task.client_id)
+        if client_id is not None:
+            query = query.filter(Client.id == client_id)
+        rows = query.group_by(Client.id, Client.name, Client.created_at
+            ).order_by(Client.name.asc()).all()
+        analytics = []
+        for row in rows:
+            completed = row.completed or 0
+            analytics.append({'id': row.id, 'name': row.name, 'created_at':
+                row.created_at, 'total': row.total, 'completed': completed,
+                'pending': row.total - completed, 'overdue': row.overdue or
+                0, 'estimated_hours': row.estimated_hours or 0,
+                'actual_hours': row.actual_hours or 0, 'avg_priority': row.
+                avg_priority or 0, 'completion_rate': completed / row.total *
+                100 if row.total else 0})
+        return analytics
+
     def get_clients_by_ids(self, client_ids: List[int]) ->List[Client]:
         """Batch load clients by IDs with optimized relationships."""
         if not client_ids:
@@ -1,17 +1,34 @@
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 from larrybot.models.habit import Habit
-from typing import List, Optional
+from larrybot.models.habit_completion import HabitCompletion
+from larrybot.storage.task_rollups import local_day
+from larrybot.utils.caching import cached
+from larrybot.utils.cache_automation import auto_invalidate_cache, OperationType
+from larrybot.utils.datetime_utils import get_current_datetime
+from typing import Any, Dict, List, Optional
 import datetime
+RATE_WINDOWS = 7, 30
 
 
 class HabitRepository:
     """
     Repository for CRUD and streak logic on Habit model.
+
+    Marking a habit done appends a habit_completions row for the local day;
+    streaks, best streaks, completion rates and calendars are computed from
+    those rows in SQL and cached until the day changes or a habit does.
     """
 
     def __init__(self, session: Session):
         self.session = session
 
+    @staticmethod
+    def today() ->datetime.date:
+        """Get the current local calendar day."""
+        return local_day(get_current_datetime())
+
+    @auto_invalidate_cache(OperationType.HABIT_CREATE)
     def add_habit(self, name: str) ->Habit:
         habit = Habit(name=name, streak=0, last_completed=None)
         self.session.add(habit)
@@ -28,37 +45,37 @@ class HabitRepository:
     def list_habits(self) ->List[Habit]:
         return self.session.query(Habit).all()
 
+    def _complete(self, habit: Habit) ->Habit:
+        """Advance the streak and record today's completion."""
+        today = self.today()
+        if habit.last_completed == today:
+            return habit
+        if habit.last_completed == today - datetime.timedelta(days=1):
+            habit.streak += 1
+        else:
+            habit.streak = 1
+        habit.last_completed = today
+        self.session.add(HabitCompletion(habit_id=habit.id, completed_on=
+            today))
+        self.session.commit()
+        return habit
+
+    @auto_invalidate_cache(OperationType.HABIT_UPDATE)
     def mark_habit_done(self, name: str) ->Optional[Habit]:
         habit = self.get_habit_by_name(name)
-        today = datetime.date.today()
         if habit:
-            if habit.last_completed == today:
-                return habit
-            if habit.last_completed == today - datetime.timedelta(days=1):
-                habit.streak += 1
-            else:
-                habit.streak = 1
-            habit.last_completed = today
-            self.session.commit()
-            return habit
+            return self._complete(habit)
         return None
 
+    @auto_invalidate_cache(OperationType.HABIT_UPDATE)
     def mark_habit_done_by_id(self, habit_id: int) ->Optional[Habit]:
         """Mark habit as done by ID."""
         habit = self.get_habit_by_id(habit_id)
-        today = datetime.date.today()
         if habit:
-            if habit.last_completed == today:
-                return habit
-            if habit.last_completed == today - datetime.timedelta(days=1):
-                habit.streak += 1
-            else:
-                habit.streak = 1
-            habit.last_completed = today
-            self.session.commit()
-            return habit
+            return self._complete(habit)
         return None
 
+    @auto_invalidate_cache(OperationType.HABIT_DELETE)
     def delete_habit(self, name: str) ->Optional[Habit]:
         habit = self.get_habit_by_name(name)
         if habit:
@@ -67,6 +84,7 @@ class HabitRepository:
             return habit
         return None
 
+    @auto_invalidate_cache(OperationType.HABIT_DELETE)
     def delete_habit_by_id(self, habit_id: int) ->Optional[Habit]:
         """Delete habit by ID."""
         habit = self.get_habit_by_id(habit_id)
@@ -75,3 +93,78 @@ class HabitRepository:
             self.session.commit()
             return habit
         return None
+
+    def get_habit_stats(self, habit_id: Optional[int]=None) ->List[Dict[str,
+        Any]]:
+        """
+        Get streak and completion statistics per habit.
+
+        Each entry has the habit's id, name and created_at, its current and
+        best streak, last completion day, whether it was completed today,
+        total completions, and the completion counts and rates (percent of
+        the days the habit existed) over the last 7 and 30 days. Pass
+        habit_id to get a single habit. Results are cached per local day.
+        """
+        return self._habit_stats(self.today(), habit_id)
+
+    def get_habit_calendar(self, habit_id: int, days: int=28) ->List[Dict[
+        str, Any]]:
+        """Get the last `days` local days, oldest first, each with a done flag."""
+        return self._habit_calendar(self.today(), habit_id, days)
+
+    @cached(ttl=3600.0, tags=['habit'])
+    def _habit_stats(self, today: datetime.date, habit_id: Optional[int]
+        ) ->List[Dict[str, Any]]:
+        completed_on = HabitCompletion.completed_on
+        run = func.julianday(completed_on) - func.row_number().over(
+            partition_by=HabitCompletion.habit_id, order_by=completed_on)
+        runs = select(HabitCompletion.habit_id, completed_on, run.label('run')
+            ).subquery()
+        streaks = select(runs.c.habit_id, func.count().label('length'),
+            func.max(runs.c.completed_on).label('last_day')).group_by(runs.
+            c.habit_id, runs.c.run).subquery()
+        alive = streaks.c.last_day >= today - datetime.timedelta(days=1)
+        history = select(streaks.c.habit_id, func.max(streaks.c.length).
+            label('best'), func.max(case((alive, streaks.c.length), else_=0
+            )).label('current'), func.max(streaks.c.last_day).label(
+            'last_day'), func.sum(streaks.c.length).label('total')).group_by(
+            streaks.c.habit_id).subquery()
+        windows = select(HabitCompletion.habit_id, *[func.sum(case((
+            completed_on > today - datetime.timedelta(days=window), 1),
+            else_=0)).label(f'last_{window}') for window in RATE_WINDOWS]
+            ).where(completed_on > today - datetime.timedelta(days=max(
+            RATE_WINDOWS))).group_by(HabitCompletion.habit_id).subquery()
+        query = self.session.query(Habit.id, Habit.name, Habit.created_at,
+            history.c.best, history.c.current, history.c.last_day, history.
+            c.total, *[getattr(windows.c, f'last_{window}') for window in
+            RATE_WINDOWS]).outerjoin(history, history.c.habit_id == Habit.id
+            ).outerjoin(windows, windows.c.habit_id == Habit.id)
+        if habit_id is not None:
+            query = query.filter(Habit.id == habit_id)
+        stats = []
+        for row in query.order_by(Habit.name.asc()).all():
+            age = (today - local_day(row.created_at)).days + 1 if (row.
+                created_at) else max(RATE_WINDOWS)
+            entry = {'id': row.id, 'name': row.name, 'created_at': row.
+                created_at, 'current_streak': row.current or 0,
+                'best_streak': row.best or 0, 'last_completed': row.
+                last_day, 'completed_today': row.last_day == today,
+                'total_completions': row.total or 0}
+            for window in RATE_WINDOWS:
+                count = getattr(row, f'last_{window}') or 0
+                entry[f'last_{window}_days'] = count
+                entry[f'rate_{window}_days'] = round(min(count / max(1, min
+                    (window, age)), 1) * 100, 1)
+            stats.append(entry)
+        return stats
+
+    @cached(ttl=3600.0, tags=['habit'])
+    def _habit_calendar(self, today: datetime.date, habit_id: int, days: int
+        ) ->List[Dict[str, Any]]:
+        first = today - datetime.timedelta(days=days - 1)
+        done = {day for day, in self.session.query(HabitCompletion.
+            completed_on).filter(HabitCompletion.habit_id == habit_id,
+            HabitCompletion.completed_on >= first, HabitCompletion.
+            completed_on <= today)}
+        return [{'day': day, 'done': day in done} for day in (first +
+            datetime.timedelta(days=offset) for offset in range(days))]
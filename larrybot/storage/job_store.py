@@ -0,0 +1,222 @@
+"""
+Durable background job store for LarryBot2.
+
+Persists background jobs to the background_jobs table so pending work
+survives a restart and finished results can be reused by identical
+submissions until they expire. Only jobs whose function is importable at
+module level (recorded as "module:name") and whose arguments are JSON
+serializable are persisted; everything else stays in memory only.
+"""
+import importlib
+import json
+import logging
+import sys
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from larrybot.models import Base
+from larrybot.models.background_job import BackgroundJobRecord
+from larrybot.storage.db import get_optimized_session
+from larrybot.utils.background_processing import BackgroundJob, JobStatus
+logger = logging.getLogger(__name__)
+FINISHED_STATUSES = (JobStatus.COMPLETED.value, JobStatus.FAILED.value,
+    JobStatus.CANCELLED.value)
+
+
+def _json_default(value: Any) ->Any:
+    """Tag datetimes and dates so they round-trip through JSON."""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _json_object_hook(value: Dict[str, Any]) ->Any:
+    """Restore values tagged by _json_default."""
+    if len(value) == 1:
+        if '__datetime__' in value:
+            return datetime.fromisoformat(value['__datetime__'])
+        if '__date__' in value:
+            return date.fromisoformat(value['__date__'])
+    return value
+
+
+def encode_value(value: Any) ->str:
+    """Encode job arguments or results as JSON text."""
+    return json.dumps(value, default=_json_default, separators=(',', ':'))
+
+
+def decode_value(text: Optional[str]) ->Any:
+    """Decode JSON text written by encode_value."""
+    if text is None:
+        return None
+    return json.loads(text, object_hook=_json_object_hook)
+
+
+def callable_path(func: Callable) ->Optional[str]:
+    """
+    Get the "module:name" path of a module-level function.
+
+    Returns None for bound methods, lambdas, nested functions and anything
+    else that cannot be imported again after a restart.
+    """
+    module_name = getattr(func, '__module__', None)
+    name = getattr(func, '__qualname__', None)
+    if not module_name or not name or module_name == '__main__':
+        return None
+    if '.' in name or '<' in name:
+        return None
+    module = sys.modules.get(module_name)
+    if module is None or getattr(module, name, None) is not func:
+        return None
+    return f'{module_name}:{name}'
+
+
+def resolve_callable(path: str) ->Callable:
+    """Import the function recorded by callable_path."""
+    module_name, name = path.split(':', 1)
+    return getattr(importlib.import_module(module_name), name)
+
+
+def _to_datetime(timestamp: Optional[float]) ->Optional[datetime]:
+    """Convert an epoch timestamp to an aware UTC datetime."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def _to_timestamp(value: Optional[datetime]) ->Optional[float]:
+    """Convert a stored datetime (naive values are UTC) to a timestamp."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class JobStore:
+    """
+    SQLite-backed persistence for BackgroundJobQueue.
+
+    Every method opens its own short-lived session, so the queue can call
+    them from its store thread without touching the event loop.
+    """
+
+    def __init__(self, session_factory: Callable=get_optimized_session):
+        self._session_factory = session_factory
+
+    def ensure_table(self) ->None:
+        """Create the background_jobs table if it does not exist yet."""
+        with self._session_factory() as session:
+            Base.metadata.create_all(bind=session.get_bind(), tables=[
+                BackgroundJobRecord.__table__])
+
+    def encode(self, job: BackgroundJob) ->Optional[Dict[str, Any]]:
+        """
+        Build the row for a job, or None if the job cannot be persisted.
+
+        Called on the submitting thread so the queue knows up front
+        whether the job is durable.
+        """
+        func_path = callable_path(job.func)
+        if func_path is None:
+            return None
+        try:
+            args = encode_value(list(job.args))
+            kwargs = encode_value(job.kwargs)
+        except (TypeError, ValueError):
+            return None
+        return {'id': job.id, 'idempotency_key': job.idempotency_key,
+            'func_path': func_path, 'args': args, 'kwargs': kwargs,
+            'priority': job.priority, 'executor': job.executor, 'status':
+            job.status.value, 'created_at': _to_datetime(job.created_at)}
+
+    def add(self, row: Dict[str, Any]) ->None:
+        """Insert (or replace) a job row built by encode()."""
+        with self._session_factory() as session:
+            session.merge(BackgroundJobRecord(**row))
+            session.commit()
+
+    def mark_running(self, job_id: str, started_at: float) ->None:
+        """Record that a job started."""
+        self._update(job_id, status=JobStatus.RUNNING.value, started_at=
+            _to_datetime(started_at))
+
+    def mark_finished(self, job_id: str, status: str, completed_at: float,
+        expires_at: Optional[float], result: Any=None, error: Optional[str]
+        =None) ->None:
+        """Record a job's outcome and when its result expires."""
+        try:
+            encoded = None if result is None else encode_value(result)
+        except (TypeError, ValueError):
+            logger.debug(f'Result of job {job_id} is not JSON serializable')
+            encoded = None
+        self._update(job_id, status=status, completed_at=_to_datetime(
+            completed_at), expires_at=_to_datetime(expires_at), result=
+            encoded, error=error)
+
+    def _update(self, job_id: str, **values) ->None:
+        """Update one job row."""
+        with self._session_factory() as session:
+            session.query(BackgroundJobRecord).filter(BackgroundJobRecord.
+                id == job_id).update(values, synchronize_session=False)
+            session.commit()
+
+    def load_jobs(self, now: float) ->List[BackgroundJob]:
+        """
+        Load jobs to restore after a restart.
+
+        Pending jobs and jobs that were running when the process stopped
+        come back as pending; completed jobs come back with their result
+        while it has not expired. Jobs whose function can no longer be
+        imported are marked failed.
+        """
+        jobs = []
+        with self._session_factory() as session:
+            records = session.query(BackgroundJobRecord).filter(
+                BackgroundJobRecord.status.in_([JobStatus.PENDING.value,
+                JobStatus.RUNNING.value, JobStatus.COMPLETED.value])).order_by(
+                BackgroundJobRecord.created_at).all()
+            for record in records:
+                expires_at = _to_timestamp(record.expires_at)
+                completed = record.status == JobStatus.COMPLETED.value
+                if completed and (expires_at is None or expires_at <= now):
+                    continue
+                try:
+                    func = resolve_callable(record.func_path)
+                    args = tuple(decode_value(record.args))
+                    kwargs = decode_value(record.kwargs)
+                except Exception as e:
+                    logger.warning(
+                        f'Cannot restore background job {record.id}: {e}')
+                    if not completed:
+                        record.status = JobStatus.FAILED.value
+                        record.error = f'{type(e).__name__}: {e}'
+                    continue
+                job = BackgroundJob(id=record.id, func=func, args=args,
+                    kwargs=kwargs, priority=record.priority, executor=record
+                    .executor, created_at=_to_timestamp(record.created_at),
+                    idempotency_key=record.idempotency_key, persisted=True)
+                if completed:
+                    job.status = JobStatus.COMPLETED
+                    job.started_at = _to_timestamp(record.started_at)
+                    job.completed_at = _to_timestamp(record.completed_at)
+                    job.expires_at = expires_at
+                    job.result = decode_value(record.result)
+                    job.progress = 100.0
+                else:
+                    record.status = JobStatus.PENDING.value
+                    record.started_at = None
+                jobs.append(job)
+            session.commit()
+        return jobs
+
+    def purge_expired(self, now: float) ->int:
+        """Delete finished jobs whose result has expired."""
+        with self._session_factory() as session:
+            deleted = session.query(BackgroundJobRecord).filter(
+                BackgroundJobRecord.status.in_(FINISHED_STATUSES),
+                BackgroundJobRecord.expires_at < _to_datetime(now)).delete(
+                synchronize_session=False)
+            session.commit()
+        return deleted
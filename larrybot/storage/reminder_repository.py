@@ -1,14 +1,35 @@
 from sqlalchemy.orm import Session
 from larrybot.models.reminder import Reminder
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import event, text
+from larrybot.core.reminder_engine import notify_reminder_scheduled, notify_reminder_removed
+REMOVED_REMINDERS_KEY = 'removed_reminder_ids'
+
+
+def _report_removed_reminders(session: Session) ->None:
+    """Report reminders deleted in a committed transaction to the engine."""
+    removed = session.info.get(REMOVED_REMINDERS_KEY)
+    if removed:
+        reminder_ids = sorted(removed)
+        removed.clear()
+        for reminder_id in reminder_ids:
+            notify_reminder_removed(reminder_id)
+
+
+def _forget_removed_reminders(session: Session) ->None:
+    """Drop pending removals when their transaction rolls back."""
+    removed = session.info.get(REMOVED_REMINDERS_KEY)
+    if removed:
+        removed.clear()
 
 
 class ReminderRepository:
     """
     Repository for CRUD operations on Reminder model.
     Optimized for performance and minimal database blocking.
+    Changes are reported to the reminder engine so it never has to poll;
+    deletions are reported only once the caller's transaction commits.
     """
 
     def __init__(self, session: Session):
@@ -18,6 +39,7 @@ class ReminderRepository:
         reminder = Reminder(task_id=task_id, remind_at=remind_at)
         self.session.add(reminder)
         self.session.commit()
+        notify_reminder_scheduled(reminder.id, remind_at)
         return reminder
 
     def list_reminders(self) ->List[Reminder]:
@@ -32,6 +54,7 @@ class ReminderRepository:
         reminder = self.get_reminder_by_id(reminder_id)
         if reminder:
             self.session.delete(reminder)
+            self._notify_removed_on_commit([reminder_id])
             return reminder
         return None
 
@@ -52,8 +75,25 @@ class ReminderRepository:
             return 0
         deleted_count = self.session.query(Reminder).filter(Reminder.id.in_
             (reminder_ids)).delete(synchronize_session=False)
+        self._notify_removed_on_commit(reminder_ids)
         return deleted_count
 
+    def _notify_removed_on_commit(self, reminder_ids: Iterable[int]) ->None:
+        """
+        Report deleted reminders to the engine after the session commits.
+
+        A rollback forgets them, so reminders still in the database stay
+        scheduled.
+        """
+        removed = self.session.info.get(REMOVED_REMINDERS_KEY)
+        if removed is None:
+            removed = self.session.info[REMOVED_REMINDERS_KEY] = set()
+            event.listen(self.session, 'after_commit',
+                _report_removed_reminders)
+            event.listen(self.session, 'after_rollback',
+                _forget_removed_reminders)
+        removed.update(reminder_ids)
+
     def get_next_reminder(self, now: datetime) ->Optional[Reminder]:
         """Get the next upcoming reminder after the given time."""
         return self.session.query(Reminder).filter(Reminder.remind_at > now
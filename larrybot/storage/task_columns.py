@@ -0,0 +1,185 @@
+"""
+Columnar task analytics for LarryBot2.
+
+load_task_columns() reads only the columns analytics need - timestamps as
+hours, hours, a priority code and the done flag - with one SELECT and holds
+them column by column. time_analysis() derives completion times, estimate
+accuracy, percentiles and per-priority totals from those columns with
+vectorized NumPy operations, or with plain Python when NumPy is not
+installed; both paths give the same figures.
+"""
+import logging
+import math
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+from larrybot.models.enums import TaskPriority
+from larrybot.models.task import Task
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+logger = logging.getLogger(__name__)
+PERCENTILES = 50, 90
+ACCURACY_TOLERANCE = 0.2
+
+
+class TaskColumns(NamedTuple):
+    """Task columns in row order; timestamps are hours since the epoch."""
+    created: Sequence[Optional[float]]
+    completed: Sequence[Optional[float]]
+    due: Sequence[Optional[float]]
+    estimated_hours: Sequence[Optional[float]]
+    actual_hours: Sequence[Optional[float]]
+    priority: Sequence[int]
+    done: Sequence[bool]
+
+    def __len__(self) ->int:
+        return len(self.created)
+
+
+def _hours(column: Any) ->Any:
+    """Hours since the Unix epoch of a stored timestamp."""
+    return (func.julianday(column) - 2440587.5) * 24
+
+
+def priority_code() ->Any:
+    """SQL expression for the priority level of a task (0 if unset)."""
+    return func.coalesce(Task._priority, 0)
+
+
+def load_task_columns(session: Session, *criteria: Any) ->TaskColumns:
+    """Load the analytics columns of the tasks matching criteria in one SELECT."""
+    completed_at = case((Task.done == True, func.coalesce(Task.
+        completed_at, Task.updated_at)))
+    rows = session.execute(select(_hours(Task.created_at), _hours(
+        completed_at), _hours(Task.due_date), Task.estimated_hours, Task.
+        actual_hours, priority_code(), Task.done).where(*criteria)).all()
+    if not rows:
+        return TaskColumns((), (), (), (), (), (), ())
+    return TaskColumns(*zip(*rows))
+
+
+def _priority_label(code: int) ->str:
+    return TaskPriority(code).name.title() if code else 'Unknown'
+
+
+def _percentile(ordered: List[float], percent: float) ->float:
+    """Linear-interpolation percentile of sorted values (NumPy's default)."""
+    position = (len(ordered) - 1) * percent / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position -
+        lower)
+
+
+def _summary(values: Sequence[float], total: float) ->Dict[str, float]:
+    """Mean and percentiles of values whose sum is total."""
+    if not len(values):
+        return {'mean': 0, **{f'p{p}': 0 for p in PERCENTILES}}
+    summary = {'mean': round(total / len(values), 2)}
+    if NUMPY_AVAILABLE and not isinstance(values, list):
+        points = np.percentile(values, PERCENTILES)
+    else:
+        ordered = sorted(values)
+        points = [_percentile(ordered, p) for p in PERCENTILES]
+    for percent, point in zip(PERCENTILES, points):
+        summary[f'p{percent}'] = round(float(point), 2)
+    return summary
+
+
+def _result(tasks: int, completed: int, completion: Dict[str, float],
+    ratios: Dict[str, float], estimated_tasks: int, within: int, due_tasks:
+    int, on_time: int, by_priority: Dict[str, Dict[str, float]]) ->Dict[str,
+    Any]:
+    return {'tasks': tasks, 'completed': completed, 'completion_hours':
+        completion, 'estimate_accuracy': {'tasks': estimated_tasks,
+        'actual_to_estimate': ratios, 'within_20_percent': round(within /
+        max(1, estimated_tasks) * 100, 1)}, 'on_time_rate': round(on_time /
+        max(1, due_tasks) * 100, 1), 'by_priority': by_priority}
+
+
+def _time_analysis_numpy(columns: TaskColumns) ->Dict[str, Any]:
+    created = np.array(columns.created, dtype=float)
+    completed_at = np.array(columns.completed, dtype=float)
+    due = np.array(columns.due, dtype=float)
+    estimated = np.array(columns.estimated_hours, dtype=float)
+    actual = np.array(columns.actual_hours, dtype=float)
+    priority = np.array(columns.priority, dtype=np.int64)
+    done = np.array(columns.done, dtype=bool)
+    finished = done & ~np.isnan(completed_at)
+    completion = np.maximum(completed_at[finished] - created[finished], 0)
+    estimated_mask = (estimated > 0) & (actual > 0)
+    ratios = actual[estimated_mask] / estimated[estimated_mask]
+    within = int(np.count_nonzero(np.abs(ratios - 1) <= ACCURACY_TOLERANCE))
+    due_mask = finished & ~np.isnan(due)
+    on_time = int(np.count_nonzero(completed_at[due_mask] <= due[due_mask]))
+    levels = len(TaskPriority) + 1
+    counts = np.bincount(priority, minlength=levels)
+    done_counts = np.bincount(priority, weights=done, minlength=levels)
+    estimated_sums = np.bincount(priority, weights=np.nan_to_num(estimated
+        ), minlength=levels)
+    actual_sums = np.bincount(priority, weights=np.nan_to_num(actual),
+        minlength=levels)
+    by_priority = {_priority_label(code): {'tasks': int(counts[code]),
+        'completed': int(done_counts[code]), 'estimated_hours': round(float
+        (estimated_sums[code]), 1), 'actual_hours': round(float(actual_sums
+        [code]), 1)} for code in np.flatnonzero(counts)}
+    return _result(len(columns), int(np.count_nonzero(done)), _summary(
+        completion, float(completion.sum())), _summary(ratios, float(ratios
+        .sum())), len(ratios), within, int(np.count_nonzero(due_mask)),
+        on_time, by_priority)
+
+
+def _time_analysis_python(columns: TaskColumns) ->Dict[str, Any]:
+    completion: List[float] = []
+    ratios: List[float] = []
+    due_tasks = on_time = 0
+    by_priority: Dict[int, List[float]] = {}
+    for created, completed_at, due, estimated, actual, priority, done in zip(
+        *columns):
+        if done and completed_at is not None:
+            completion.append(max(completed_at - created, 0))
+            if due is not None:
+                due_tasks += 1
+                on_time += completed_at <= due
+        if estimated and actual and estimated > 0 and actual > 0:
+            ratios.append(actual / estimated)
+        totals = by_priority.setdefault(priority, [0, 0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += 1 if done else 0
+        totals[2] += estimated or 0
+        totals[3] += actual or 0
+    within = sum(1 for ratio in ratios if abs(ratio - 1) <=
+        ACCURACY_TOLERANCE)
+    return _result(len(columns), sum(1 for done in columns.done if done),
+        _summary(completion, math.fsum(completion)), _summary(ratios, math.
+        fsum(ratios)), len(ratios), within, due_tasks, on_time, {
+        _priority_label(code): {'tasks': totals[0], 'completed': totals[1],
+        'estimated_hours': round(totals[2], 1), 'actual_hours': round(
+        totals[3], 1)} for code, totals in sorted(by_priority.items())})
+
+
+def time_analysis(columns: TaskColumns, use_numpy: Optional[bool]=None
+    ) ->Dict[str, Any]:
+    """
+    Analyze task columns.
+
+    Returns task and completion counts, completion time in hours (mean,
+    median, 90th percentile), the actual-to-estimate ratio of tasks with
+    both hours set and the share within 20% of the estimate, the share of
+    completed tasks with a due date finished on time, and per-priority
+    task counts and hours.
+
+    Args:
+        columns: Columns from load_task_columns()
+        use_numpy: Force or skip the NumPy path; defaults to NumPy when
+            it is installed
+    """
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy and len(columns):
+        return _time_analysis_numpy(columns)
+    return _time_analysis_python(columns)
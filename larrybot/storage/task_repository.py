@@ -1,12 +1,19 @@
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 from larrybot.models.task import Task
 from larrybot.models.task_dependency import TaskDependency
 from larrybot.models.task_time_entry import TaskTimeEntry
 from larrybot.models.task_comment import TaskComment
-from typing import List, Optional, Dict, Any
+from larrybot.models.tag import Tag, TaskTag
+from larrybot.storage.task_snapshot import TaskSnapshot, snapshot_query, to_snapshots
+from larrybot.storage.task_columns import load_task_columns, time_analysis
+from larrybot.storage.task_rollups import maintains_daily_stats, rollups_in_sync, summarize_by_priority
+from larrybot.storage.task_search import search_task_ids
+from larrybot.storage.analytics_worker import get_database_path, compute_task_statistics, compute_advanced_analytics, compute_productivity_report
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import json
-from sqlalchemy import or_, and_, func, text, desc, asc
+import math
+from sqlalchemy import or_, and_, func, text, desc, asc, case, select, intersect, false
 from larrybot.utils.caching import cached, cache_invalidate, cache_clear
 from larrybot.utils.cache_automation import auto_invalidate_cache, OperationType, invalidate_caches_for
 from larrybot.utils.background_processing import background_task, submit_background_job
@@ -27,28 +34,75 @@ class TaskRepository:
         self.session = session
 
     @auto_invalidate_cache(OperationType.TASK_CREATE)
+    @maintains_daily_stats
     def add_task(self, description: str) ->Task:
         task = Task(description=description, done=False)
         self.session.add(task)
         self.session.commit()
         return task
 
-    @cached(ttl=60.0)
-    def list_incomplete_tasks(self) ->List[Task]:
-        """List all incomplete tasks with optimized client loading."""
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter_by(done=False).order_by(Task.created_at.desc()).all()
+    @cached(ttl=60.0, tags=['task', 'client'])
+    def list_incomplete_tasks(self) ->List[TaskSnapshot]:
+        """
+        List all incomplete tasks as read-only snapshots.
 
-    @cached(ttl=300.0)
-    def get_task_by_id(self, task_id: int) ->Optional[Task]:
-        """Get task by ID with optimized relationship loading."""
-        return self.session.query(Task).options(joinedload(Task.client),
-            selectinload(Task.comments), selectinload(Task.time_entries),
-            selectinload(Task.dependencies), selectinload(Task.dependents),
-            selectinload(Task.children), selectinload(Task.attachments)
-            ).filter_by(id=task_id).first()
+        Tasks come in /list order: by due date with undated tasks last,
+        then highest priority first, then oldest first.
+        """
+        return to_snapshots(snapshot_query(self.session).filter(Task.done ==
+            False).order_by(Task.due_date.is_(None), Task.due_date.asc(),
+            Task._priority.desc(), Task.id.asc()))
+
+    def list_incomplete_tasks_page(self, limit: int, after_id: Optional[
+        int]=None, before_id: Optional[int]=None) ->Tuple[List[
+        TaskSnapshot], bool]:
+        """
+        Get one page of incomplete tasks in /list order using keyset paging.
+
+        The page starts right after task after_id, or ends right before
+        task before_id; with neither it is the first page. The cursor task
+        is looked up inside the query, so each page reads at most limit + 1
+        rows. Returns the tasks and whether more follow in that direction.
+        """
+        query = snapshot_query(self.session).filter(Task.done == False)
+        anchor_id = after_id if after_id is not None else before_id
+        backwards = after_id is None and before_id is not None
+        if anchor_id is not None:
+            anchor = aliased(Task)
+            due = select(anchor.due_date).where(anchor.id == anchor_id
+                ).scalar_subquery()
+            priority = select(anchor._priority).where(anchor.id == anchor_id
+                ).scalar_subquery()
+            if backwards:
+                query = query.filter(or_(Task.due_date < due, and_(Task.
+                    due_date.isnot(None), due.is_(None)), and_(Task.
+                    due_date.is_(due), or_(Task._priority > priority, and_(
+                    Task._priority == priority, Task.id < anchor_id)))))
+            else:
+                query = query.filter(or_(Task.due_date > due, and_(Task.
+                    due_date.is_(None), due.isnot(None)), and_(Task.
+                    due_date.is_(due), or_(Task._priority < priority, and_(
+                    Task._priority == priority, Task.id > anchor_id)))))
+        order = [Task.due_date.is_(None), Task.due_date.asc(), Task.
+            _priority.desc(), Task.id.asc()]
+        if backwards:
+            order = [Task.due_date.is_(None).desc(), Task.due_date.desc(),
+                Task._priority.asc(), Task.id.desc()]
+        tasks = to_snapshots(query.order_by(*order).limit(limit + 1))
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+        if backwards:
+            tasks.reverse()
+        return tasks, has_more
+
+    @cached(ttl=300.0, tags=['task', 'client'])
+    def get_task_by_id(self, task_id: int) ->Optional[TaskSnapshot]:
+        """Get a read-only snapshot of a task by ID."""
+        row = snapshot_query(self.session).filter(Task.id == task_id).first()
+        return TaskSnapshot.from_row(row) if row else None
 
     @auto_invalidate_cache(OperationType.TASK_STATUS_CHANGE)
+    @maintains_daily_stats
     def mark_task_done(self, task_id: int) ->Optional[Task]:
         task = self.session.query(Task).filter_by(id=task_id).first()
         if task and not task.done:
@@ -59,6 +113,7 @@ class TaskRepository:
         return None
 
     @auto_invalidate_cache(OperationType.TASK_UPDATE)
+    @maintains_daily_stats
     def edit_task(self, task_id: int, new_description: str) ->Optional[Task]:
         task = self.session.query(Task).filter_by(id=task_id).first()
         if task:
@@ -68,6 +123,7 @@ class TaskRepository:
         return None
 
     @auto_invalidate_cache(OperationType.TASK_DELETE)
+    @maintains_daily_stats
     def remove_task(self, task_id: int) ->Optional[Task]:
         task = self.session.query(Task).filter_by(id=task_id).first()
         if task:
@@ -77,6 +133,7 @@ class TaskRepository:
         return None
 
     @auto_invalidate_cache(OperationType.TASK_CLIENT_CHANGE)
+    @maintains_daily_stats
     def assign_task_to_client(self, task_id: int, client_name: str) ->Optional[
         Task]:
         from larrybot.models.client import Client
@@ -93,6 +150,7 @@ class TaskRepository:
         return task
 
     @auto_invalidate_cache(OperationType.TASK_CLIENT_CHANGE)
+    @maintains_daily_stats
     def unassign_task(self, task_id: int) ->Optional[Task]:
         task = self.session.query(Task).filter_by(id=task_id).first()
         if not task:
@@ -101,15 +159,15 @@ class TaskRepository:
         self.session.commit()
         return task
 
-    @cached(ttl=180.0)
-    def get_tasks_by_client(self, client_name: str) ->List[Task]:
-        """Get tasks by client with optimized join and caching."""
+    @cached(ttl=180.0, tags=['task', 'client'])
+    def get_tasks_by_client(self, client_name: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of a client's tasks."""
         from larrybot.models.client import Client
-        return self.session.query(Task).join(Client, Task.client_id ==
-            Client.id).options(joinedload(Task.client)).filter(Client.name ==
-            client_name).order_by(Task.created_at.desc()).all()
+        return to_snapshots(snapshot_query(self.session).filter(Client.name ==
+            client_name).order_by(Task.created_at.desc()))
 
     @auto_invalidate_cache(OperationType.TASK_CREATE)
+    @maintains_daily_stats
     def add_task_with_metadata(self, description: str, priority: str=
         'Medium', due_date: Optional[datetime]=None, category: Optional[str
         ]=None, estimated_hours: Optional[float]=None, tags: Optional[List[
@@ -124,21 +182,14 @@ class TaskRepository:
         self.session.commit()
         return task
 
-    @cached(ttl=300.0)
-    def get_tasks_by_priority(self, priority: str) ->List[Task]:
-        """Get all tasks with a specific priority with optimized loading."""
-        from larrybot.models.enums import TaskPriority
-        priority_enum = TaskPriority.from_string(priority)
-        if priority_enum:
-            possible_values = [priority_enum.name, priority_enum.name.title
-                (), priority_enum.value]
-        else:
-            possible_values = [priority]
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task._priority.in_(possible_values)).order_by(Task.
-            created_at.desc()).all()
+    @cached(ttl=300.0, tags=['task'])
+    def get_tasks_by_priority(self, priority: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all tasks with a specific priority."""
+        return to_snapshots(snapshot_query(self.session).filter(self.
+            _priority_filter(priority)).order_by(Task.created_at.desc()))
 
     @auto_invalidate_cache(OperationType.TASK_PRIORITY_CHANGE)
+    @maintains_daily_stats
     def update_priority(self, task_id: int, priority: str) ->Optional[Task]:
         """Update task priority."""
         task = self.session.query(Task).filter_by(id=task_id).first()
@@ -148,32 +199,33 @@ class TaskRepository:
             return task
         return None
 
-    @cached(ttl=180.0)
-    def get_overdue_tasks(self) ->List[Task]:
-        """Get all overdue tasks with optimized client loading."""
+    @cached(ttl=180.0, tags=['task'])
+    def get_overdue_tasks(self) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all overdue tasks."""
         # Use date-based comparison: overdue only if due date is before today
         from larrybot.services.datetime_service import DateTimeService
         start_of_today = DateTimeService.get_start_of_day()
         
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task.due_date < start_of_today, Task.done == False).order_by(Task
-            .due_date.asc()).all()
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            due_date < start_of_today, Task.done == False).order_by(Task.
+            due_date.asc()))
 
-    @cached(ttl=300.0)
+    @cached(ttl=300.0, tags=['task'])
     def get_tasks_due_between(self, start_date: datetime, end_date: datetime
-        ) ->List[Task]:
-        """Get tasks due between two dates with optimized loading."""
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task.due_date >= start_date, Task.due_date <= end_date
-            ).order_by(Task.due_date.asc()).all()
+        ) ->List[TaskSnapshot]:
+        """Get read-only snapshots of tasks due between two dates."""
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            due_date >= start_date, Task.due_date <= end_date).order_by(
+            Task.due_date.asc()))
 
-    def get_tasks_due_today(self) ->List[Task]:
+    def get_tasks_due_today(self) ->List[TaskSnapshot]:
         """Get tasks due today."""
         start_of_day = DateTimeService.get_start_of_day()
         end_of_day = DateTimeService.get_end_of_day()
         return self.get_tasks_due_between(start_of_day, end_of_day)
 
     @auto_invalidate_cache(OperationType.TASK_DUE_DATE_CHANGE)
+    @maintains_daily_stats
     def update_due_date(self, task_id: int, due_date: datetime) ->Optional[Task
         ]:
         """Update task due date."""
@@ -184,14 +236,13 @@ class TaskRepository:
             return task
         return None
 
-    @cached(ttl=300.0)
-    def get_tasks_by_category(self, category: str) ->List[Task]:
-        """Get all tasks in a specific category with optimized loading."""
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter_by(category=category).order_by(Task.created_at.desc()
-            ).all()
+    @cached(ttl=300.0, tags=['task'])
+    def get_tasks_by_category(self, category: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all tasks in a specific category."""
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            category == category).order_by(Task.created_at.desc()))
 
-    @cached(ttl=600.0)
+    @cached(ttl=600.0, tags=['task'])
     def get_all_categories(self) ->List[str]:
         """Get all unique categories - cached with longer TTL."""
         categories = self.session.query(Task.category).filter(Task.category
@@ -199,6 +250,7 @@ class TaskRepository:
         return [cat[0] for cat in categories if cat[0]]
 
     @auto_invalidate_cache(OperationType.TASK_CATEGORY_CHANGE)
+    @maintains_daily_stats
     def update_category(self, task_id: int, category: str) ->Optional[Task]:
         """Update task category."""
         task = self.session.query(Task).filter_by(id=task_id).first()
@@ -208,20 +260,20 @@ class TaskRepository:
             return task
         return None
 
-    @cached(ttl=300.0)
-    def get_tasks_by_status(self, status: str) ->List[Task]:
-        """Get all tasks with a specific status with optimized loading."""
+    @cached(ttl=300.0, tags=['task'])
+    def get_tasks_by_status(self, status: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all tasks with a specific status."""
         from larrybot.models.enums import TaskStatus
         status_enum = TaskStatus.from_string(status)
         if status_enum:
             possible_values = [status_enum.value, status]
         else:
             possible_values = [status]
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task.status.in_(possible_values)).order_by(Task.
-            created_at.desc()).all()
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            status.in_(possible_values)).order_by(Task.created_at.desc()))
 
     @auto_invalidate_cache(OperationType.TASK_STATUS_CHANGE)
+    @maintains_daily_stats
     def update_status(self, task_id: int, status: str) ->Optional[Task]:
         """Update task status."""
         task = self.session.query(Task).filter_by(id=task_id).first()
@@ -233,6 +285,8 @@ class TaskRepository:
             return task
         return None
 
+    @auto_invalidate_cache(OperationType.TASK_UPDATE)
+    @maintains_daily_stats
     def start_time_tracking(self, task_id: int) ->bool:
         """Start time tracking for a task."""
         task = self.session.query(Task).filter_by(id=task_id).first()
@@ -242,6 +296,8 @@ class TaskRepository:
             return True
         return False
 
+    @auto_invalidate_cache(OperationType.TASK_UPDATE)
+    @maintains_daily_stats
     def stop_time_tracking(self, task_id: int) ->Optional[float]:
         """Stop time tracking and return duration in hours. Also create a TaskTimeEntry record for the session."""
         import logging
@@ -283,6 +339,8 @@ class TaskRepository:
             return duration
         return None
 
+    @auto_invalidate_cache(OperationType.TASK_UPDATE)
+    @maintains_daily_stats
     def add_time_entry(self, task_id: int, started_at: datetime, ended_at:
         datetime, description: str='') ->bool:
         """Add a time entry for a task."""
@@ -316,19 +374,13 @@ class TaskRepository:
             return {}
         total_actual = float(task.actual_hours or 0)
         total_estimated = float(task.estimated_hours or 0)
-        time_entries = self.session.query(TaskTimeEntry).filter_by(task_id=
-            task_id).all()
-        
-        # Safely calculate total from entries, handling None values
-        total_from_entries = 0.0
-        for entry in time_entries:
-            if entry.duration_minutes is not None:
-                total_from_entries += entry.duration_minutes
-        total_from_entries = total_from_entries / 60.0
-        
+        entry_count, entry_minutes = self.session.query(func.count(
+            TaskTimeEntry.id), func.coalesce(func.sum(TaskTimeEntry.
+            duration_minutes), 0)).filter(TaskTimeEntry.task_id == task_id
+            ).one()
         return {'estimated_hours': total_estimated, 'actual_hours':
-            total_actual, 'time_entries_hours': total_from_entries,
-            'time_entries_count': len(time_entries)}
+            total_actual, 'time_entries_hours': entry_minutes / 60.0,
+            'time_entries_count': entry_count}
 
     def add_task_dependency(self, task_id: int, dependency_id: int) ->bool:
         """Add a dependency between tasks."""
@@ -381,34 +433,67 @@ class TaskRepository:
             ).all()
 
     @auto_invalidate_cache(OperationType.TASK_UPDATE)
+    @maintains_daily_stats
     def add_tags(self, task_id: int, tags: List[str]) ->Optional[Task]:
-        """Add tags to a task."""
+        """
+        Add tags to a task.
+
+        Names the task already has in another casing are skipped; the
+        tasks.tags triggers link the new names in task_tags.
+        """
         task = self.session.query(Task).filter_by(id=task_id).first()
         if task:
-            current_tags = json.loads(task.tags) if task.tags else []
-            current_tags.extend(tags)
-            task.tags = json.dumps(list(set(current_tags)))
-            self.session.commit()
+            current = task.get_tags_list()
+            known = {tag.lower() for tag in current}
+            for name in (tag.strip() for tag in tags if tag):
+                if name and name.lower() not in known:
+                    current.append(name)
+                    known.add(name.lower())
+            if len(current) != len(task.get_tags_list()):
+                task.tags = json.dumps(sorted(current, key=str.lower))
+                self.session.commit()
+                self.session.refresh(task)
             return task
         return None
 
     @auto_invalidate_cache(OperationType.TASK_UPDATE)
+    @maintains_daily_stats
     def remove_tags(self, task_id: int, tags: List[str]) ->Optional[Task]:
-        """Remove tags from a task."""
+        """Remove tags from a task, matching names case-insensitively."""
         task = self.session.query(Task).filter_by(id=task_id).first()
         if task and task.tags:
-            current_tags = json.loads(task.tags)
-            current_tags = [tag for tag in current_tags if tag not in tags]
-            task.tags = json.dumps(current_tags) if current_tags else None
-            self.session.commit()
+            removed = {tag.strip().lower() for tag in tags if tag and tag.
+                strip()}
+            current = task.get_tags_list()
+            remaining = [tag for tag in current if tag.strip().lower() not in
+                removed]
+            if len(remaining) != len(current):
+                task.tags = json.dumps(remaining) if remaining else None
+                self.session.commit()
+                self.session.refresh(task)
             return task
         return None
 
+    @staticmethod
+    def _tagged_task_ids(tags: List[str], match_all: bool=False):
+        """
+        Select the ids of tasks carrying any (or all) of the tags.
+
+        Any-tag queries probe idx_task_tags_tag_task once per tag; all-tag
+        queries INTERSECT one such probe per tag.
+        """
+        names = list(dict.fromkeys(tag.strip() for tag in tags if tag.strip()))
+        if match_all and len(names) > 1:
+            return intersect(*(select(TaskTag.task_id).join(Tag, Tag.id ==
+                TaskTag.tag_id).where(Tag.name == name) for name in names))
+        return select(TaskTag.task_id).join(Tag, Tag.id == TaskTag.tag_id
+            ).where(Tag.name.in_(names))
+
     def get_tasks_by_tag(self, tag: str) ->List[Task]:
         """Get tasks by tag with optimized loading."""
         return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task.tags.like(f'%"{tag}"%')).order_by(Task.created_at
-            .desc()).all()
+            ).filter(Task.id.in_(self._tagged_task_ids([tag]))).order_by(
+            Task.created_at.desc()).all()
 
     def get_tasks_with_filters(self, status: Optional[str]=None, priority:
         Optional[str]=None, category: Optional[str]=None, due_before:
@@ -427,14 +512,7 @@ class TaskRepository:
             else:
                 filters.append(Task.status == status)
         if priority:
-            from larrybot.models.enums import TaskPriority
-            priority_enum = TaskPriority.from_string(priority)
-            if priority_enum:
-                possible_values = [priority_enum.name, priority_enum.name.
-                    title(), priority_enum.value]
-                filters.append(Task._priority.in_(possible_values))
-            else:
-                filters.append(Task._priority == priority)
+            filters.append(self._priority_filter(priority))
         if category:
             filters.append(Task.category == category)
         # PATCH: Ensure datetime filters are timezone-aware
@@ -463,10 +541,31 @@ class TaskRepository:
         return query.order_by(Task.created_at.desc()).all()
 
     def search_tasks_by_text(self, search_text: str, case_sensitive: bool=False
-        ) ->List[Task]:
-        """Search tasks by text with optimized full-text search."""
+        , limit: Optional[int]=None) ->List[Task]:
+        """
+        Search tasks by text.
+
+        Uses the tasks_fts index: tasks matching every word (as a prefix) in
+        their description, title, category, tags or comments, most relevant
+        first, each with the matching text in search_snippet. Case-sensitive
+        searches and databases without the index fall back to substring
+        matching on description, category and status, newest first.
+        """
         if not search_text.strip():
             return []
+        if not case_sensitive:
+            matches = search_task_ids(self.session, search_text, limit)
+            if matches is not None:
+                tasks = {task.id: task for task in self.session.query(Task).
+                    options(joinedload(Task.client)).filter(Task.id.in_(
+                    list(matches)))}
+                ranked = []
+                for task_id, snippet in matches.items():
+                    task = tasks.get(task_id)
+                    if task is not None:
+                        task.search_snippet = snippet
+                        ranked.append(task)
+                return ranked
         if case_sensitive:
             search_filter = or_(Task.description.contains(search_text),
                 Task.category.contains(search_text), Task.status.contains(
@@ -476,8 +575,11 @@ class TaskRepository:
             search_filter = or_(func.lower(Task.description).contains(
                 search_lower), func.lower(Task.category).contains(
                 search_lower), func.lower(Task.status).contains(search_lower))
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(search_filter).order_by(Task.created_at.desc()).all()
+        query = self.session.query(Task).options(joinedload(Task.client)
+            ).filter(search_filter).order_by(Task.created_at.desc())
+        if limit:
+            query = query.limit(limit)
+        return query.all()
 
     def get_tasks_with_advanced_filters(self, status: Optional[str]=None,
         priority: Optional[str]=None, category: Optional[str]=None,
@@ -502,14 +604,7 @@ class TaskRepository:
             else:
                 filters.append(Task.status == status)
         if priority:
-            from larrybot.models.enums import TaskPriority
-            priority_enum = TaskPriority.from_string(priority)
-            if priority_enum:
-                possible_values = [priority_enum.name, priority_enum.name.
-                    title(), priority_enum.value]
-                filters.append(Task._priority.in_(possible_values))
-            else:
-                filters.append(Task._priority == priority)
+            filters.append(self._priority_filter(priority))
         if category:
             filters.append(Task.category == category)
         if due_before:
@@ -538,10 +633,7 @@ class TaskRepository:
         if created_before:
             filters.append(Task.created_at <= created_before)
         if tags:
-            tag_filters = []
-            for tag in tags:
-                tag_filters.append(Task.tags.like(f'%"{tag}"%'))
-            filters.append(or_(*tag_filters))
+            filters.append(Task.id.in_(self._tagged_task_ids(tags)))
         if has_comments is not None:
             comment_subquery = self.session.query(TaskComment.task_id
                 ).distinct()
@@ -572,14 +664,9 @@ class TaskRepository:
         """Get tasks by multiple tags with optimized query."""
         if not tags:
             return []
-        if match_all:
-            filters = [Task.tags.like(f'%"{tag}"%') for tag in tags]
-            query_filter = and_(*filters)
-        else:
-            filters = [Task.tags.like(f'%"{tag}"%') for tag in tags]
-            query_filter = or_(*filters)
         return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(query_filter).order_by(Task.created_at.desc()).all()
+            ).filter(Task.id.in_(self._tagged_task_ids(tags, match_all))
+            ).order_by(Task.created_at.desc()).all()
 
     def get_tasks_by_time_range(self, start_date: datetime, end_date:
         datetime, include_completed: bool=True) ->List[Task]:
@@ -598,16 +685,20 @@ class TaskRepository:
         min_enum = TaskPriority.from_string(min_priority) or TaskPriority.LOW
         max_enum = TaskPriority.from_string(max_priority
             ) or TaskPriority.URGENT
-        valid_priorities = []
-        for priority_enum in TaskPriority:
-            if min_enum.value <= priority_enum.value <= max_enum.value:
-                valid_priorities.extend([priority_enum.name, priority_enum.
-                    name.title(), priority_enum.value])
         return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task._priority.in_(valid_priorities)).order_by(Task.
-            created_at.desc()).all()
+            ).filter(Task._priority.between(min_enum.value, max_enum.value)
+            ).order_by(Task.created_at.desc()).all()
+
+    @staticmethod
+    def _priority_filter(priority: str):
+        """Match one priority level by its integer code; unknown names match nothing."""
+        try:
+            return Task._priority == Task.priority_code(priority)
+        except ValueError:
+            return false()
 
     @auto_invalidate_cache(OperationType.BULK_OPERATION)
+    @maintains_daily_stats
     def bulk_update_status(self, task_ids: List[int], status: str) ->int:
         """Bulk update task status - optimized for performance."""
         if not task_ids:
@@ -622,16 +713,19 @@ class TaskRepository:
         return updated_count
 
     @auto_invalidate_cache(OperationType.BULK_OPERATION)
+    @maintains_daily_stats
     def bulk_update_priority(self, task_ids: List[int], priority: str) ->int:
         """Bulk update task priority - optimized for performance."""
         if not task_ids:
             return 0
         updated_count = self.session.query(Task).filter(Task.id.in_(task_ids)
-            ).update({'_priority': priority}, synchronize_session=False)
+            ).update({'_priority': Task.priority_code(priority)},
+            synchronize_session=False)
         self.session.commit()
         return updated_count
 
     @auto_invalidate_cache(OperationType.BULK_OPERATION)
+    @maintains_daily_stats
     def bulk_update_category(self, task_ids: List[int], category: str) ->int:
         """Bulk update task category - optimized for performance."""
         if not task_ids:
@@ -642,6 +736,7 @@ class TaskRepository:
         return updated_count
 
     @auto_invalidate_cache(OperationType.BULK_OPERATION)
+    @maintains_daily_stats
     def bulk_assign_to_client(self, task_ids: List[int], client_name: str
         ) ->int:
         """Bulk assign tasks to client - optimized for performance."""
@@ -657,6 +752,7 @@ class TaskRepository:
         return updated_count
 
     @auto_invalidate_cache(OperationType.BULK_OPERATION)
+    @maintains_daily_stats
     def bulk_delete_tasks(self, task_ids: List[int]) ->int:
         """Bulk delete tasks - optimized for performance."""
         if not task_ids:
@@ -698,7 +794,7 @@ class TaskRepository:
         return self.session.query(TaskComment).filter_by(task_id=task_id
             ).order_by(TaskComment.created_at.asc()).all()
 
-    @cached(ttl=900.0)
+    @cached(ttl=900.0, tags=['task'], stale_while_revalidate=300.0)
     def get_task_statistics(self) ->Dict[str, Any]:
         """Get comprehensive task statistics with caching."""
         return self._compute_task_statistics()
@@ -711,27 +807,8 @@ class TaskRepository:
         pending_tasks = total_tasks - completed_tasks
         priority_stats_raw = self.session.query(Task._priority, func.count(
             Task.id)).group_by(Task._priority).all()
-        priority_distribution = {}
-        for priority_raw, count in priority_stats_raw:
-            try:
-                from larrybot.models.enums import TaskPriority
-                if isinstance(priority_raw, int):
-                    priority_enum = TaskPriority(priority_raw)
-                    priority_key = priority_enum.name.title()
-                elif isinstance(priority_raw, str):
-                    try:
-                        int_value = int(priority_raw)
-                        priority_enum = TaskPriority(int_value)
-                        priority_key = priority_enum.name.title()
-                    except (ValueError, TypeError):
-                        priority_enum = TaskPriority.from_string(priority_raw)
-                        priority_key = priority_enum.name.title(
-                            ) if priority_enum else str(priority_raw)
-                else:
-                    priority_key = str(priority_raw)
-                priority_distribution[priority_key] = count
-            except Exception:
-                priority_distribution[str(priority_raw)] = count
+        priority_distribution = {self._priority_label(code): count for
+            code, count in priority_stats_raw}
         status_stats = self.session.query(Task.status, func.count(Task.id)
             ).group_by(Task.status).all()
         now = get_utc_now()
@@ -745,71 +822,65 @@ class TaskRepository:
             priority_distribution, 'status_distribution': dict(status_stats)}
 
     def get_task_statistics_async(self) ->str:
-        """Get task statistics via background processing."""
-        job_id = submit_background_job(self._compute_task_statistics,
-            priority=3, job_id=f'task_stats_{int(get_utc_now().timestamp())}')
-        return job_id
+        """
+        Get task statistics via background processing.
 
-    @cached(ttl=1800.0)
+        Repeated requests share one job (and its result for the queue's
+        result TTL) through the 'task_statistics' idempotency key.
+        """
+        db_path = get_database_path(self.session)
+        if db_path is None:
+            return submit_background_job(self._compute_task_statistics,
+                priority=3, idempotency_key='task_statistics')
+        return submit_background_job(compute_task_statistics, db_path,
+            priority=3, idempotency_key='task_statistics')
+
+    @cached(ttl=1800.0, tags=['task'], stale_while_revalidate=600.0)
     def get_advanced_task_analytics(self, days: int=30) ->Dict[str, Any]:
         """Get advanced analytics with caching."""
         return self._compute_advanced_analytics(days)
 
-    def _compute_advanced_analytics(self, days: int=30) ->Dict[str, Any]:
-        """Compute advanced analytics (called from cache or background)."""
+    def _compute_advanced_analytics(self, days: int=30, use_rollups:
+        Optional[bool]=None) ->Dict[str, Any]:
+        """
+        Compute advanced analytics (called from cache or background).
+
+        Totals and the priority breakdown come from task_daily_stats when
+        it is in sync with the tasks table (use_rollups, which defaults to
+        rollups_in_sync), and from aggregates over the tasks table
+        otherwise; the created and completed per-day histograms are grouped
+        by date() over the window.
+        """
         logger.debug(f'Computing advanced analytics for {days} days')
         end_date = get_utc_now()
         start_date = end_date - timedelta(days=days)
-        tasks_created = self.session.query(Task).filter(Task.created_at >=
-            start_date, Task.created_at <= end_date).count()
-        tasks_completed = self.session.query(Task).filter(Task.done == True,
-            Task.created_at >= start_date, Task.created_at <= end_date).count()
-        total_tasks = self.session.query(Task).count()
-        completed_tasks_total = self.session.query(Task).filter_by(done=True
-            ).count()
-        priority_analysis = {}
-        all_tasks = self.session.query(Task).all()
-        priority_groups = {}
-        for task in all_tasks:
-            try:
-                priority_key = task.priority_enum.name.title()
-                if priority_key not in priority_groups:
-                    priority_groups[priority_key] = []
-                priority_groups[priority_key].append(task)
-            except Exception:
-                priority_key = str(task.priority
-                    ) if task.priority else 'Unknown'
-                if priority_key not in priority_groups:
-                    priority_groups[priority_key] = []
-                priority_groups[priority_key].append(task)
-        for priority_key, tasks in priority_groups.items():
-            priority_analysis[priority_key] = {'total': len(tasks),
-                'completed': sum(1 for task in tasks if task.done)}
-        completed_tasks = self.session.query(Task).filter(Task.done == True,
-            Task.created_at >= start_date).all()
-        if completed_tasks:
-            completion_times = []
-            for task in completed_tasks:
-                if task.updated_at and task.created_at:
-                    duration = (task.updated_at - task.created_at
-                        ).total_seconds() / 3600
-                    completion_times.append(duration)
-            avg_completion_time = sum(completion_times) / len(completion_times
-                ) if completion_times else 0
+        if use_rollups is None:
+            use_rollups = rollups_in_sync(self.session)
+        if use_rollups:
+            totals, priority_analysis = self._analytics_totals_from_rollups(
+                start_date, end_date)
         else:
-            avg_completion_time = 0
+            totals, priority_analysis = self._analytics_totals_from_tasks(
+                start_date, end_date)
+        (total_tasks, completed_tasks_total, tasks_created, tasks_completed,
+            avg_completion_time) = totals
+        first_day = start_date.replace(hour=0, minute=0, second=0,
+            microsecond=0)
+        window_end = first_day + timedelta(days=days)
+        created_day = func.date(Task.created_at)
+        created_by_day = dict(self.session.query(created_day, func.count(
+            Task.id)).filter(Task.created_at >= first_day, Task.created_at <
+            window_end).group_by(created_day).all())
+        completed_day = func.date(Task.updated_at)
+        completed_by_day = dict(self.session.query(completed_day, func.
+            count(Task.id)).filter(Task.done == True, Task.updated_at >=
+            first_day, Task.updated_at < window_end).group_by(completed_day
+            ).all())
         daily_stats = {}
         for i in range(days):
-            day = start_date + timedelta(days=i)
-            day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1)
-            created_count = self.session.query(Task).filter(Task.created_at >=
-                day_start, Task.created_at < day_end).count()
-            completed_count = self.session.query(Task).filter(Task.done == 
-                True, Task.updated_at >= day_start, Task.updated_at < day_end
-                ).count()
-            daily_stats[day.strftime('%Y-%m-%d')] = {'created':
-                created_count, 'completed': completed_count}
+            day = (first_day + timedelta(days=i)).strftime('%Y-%m-%d')
+            daily_stats[day] = {'created': created_by_day.get(day, 0),
+                'completed': completed_by_day.get(day, 0)}
         return {'overall_stats': {'total_tasks': total_tasks,
             'completed_tasks': completed_tasks_total, 'completion_rate':
             round(completed_tasks_total / max(1, total_tasks) * 100, 1)},
@@ -820,61 +891,152 @@ class TaskRepository:
             tasks_completed / max(1, tasks_created) * 100, 1),
             'daily_breakdown': daily_stats}
 
+    def _analytics_totals_from_tasks(self, start_date: datetime, end_date:
+        datetime) ->tuple:
+        """Get analytics totals and the priority breakdown from the tasks table."""
+        in_window = and_(Task.created_at >= start_date, Task.created_at <=
+            end_date)
+        completion_hours = (func.julianday(Task.updated_at) - func.
+            julianday(Task.created_at)) * 24
+        totals = self.session.query(func.count(Task.id), func.sum(case((
+            Task.done == True, 1), else_=0)), func.sum(case((in_window, 1),
+            else_=0)), func.sum(case((and_(Task.done == True, in_window), 1
+            ), else_=0)), func.avg(case((and_(Task.done == True, Task.
+            created_at >= start_date), completion_hours)))).one()
+        priority_analysis = {}
+        for raw_priority, total, completed in self.session.query(Task.
+            _priority, func.count(Task.id), func.sum(case((Task.done == 
+            True, 1), else_=0))).group_by(Task._priority):
+            stats = priority_analysis.setdefault(self._priority_label(
+                raw_priority), {'total': 0, 'completed': 0})
+            stats['total'] += total
+            stats['completed'] += completed or 0
+        return tuple(value or 0 for value in totals), priority_analysis
+
+    def _analytics_totals_from_rollups(self, start_date: datetime,
+        end_date: datetime) ->tuple:
+        """Get analytics totals and the priority breakdown from task_daily_stats."""
+        priority_analysis = {}
+        total_tasks = completed_tasks = 0
+        for raw_priority, stats in summarize_by_priority(self.session).items():
+            entry = priority_analysis.setdefault(self._priority_label(
+                raw_priority), {'total': 0, 'completed': 0})
+            entry['total'] += stats['tasks_created']
+            entry['completed'] += stats['tasks_completed']
+            total_tasks += stats['tasks_created']
+            completed_tasks += stats['tasks_completed']
+        window = summarize_by_priority(self.session, start_date, end_date
+            ).values()
+        tasks_created = sum(stats['tasks_created'] for stats in window)
+        tasks_completed = sum(stats['tasks_completed'] for stats in window)
+        completion_hours = sum(stats['completion_hours'] for stats in window)
+        avg_completion_time = (completion_hours / tasks_completed if
+            tasks_completed else 0)
+        return (total_tasks, completed_tasks, tasks_created,
+            tasks_completed, avg_completion_time), priority_analysis
+
+    @staticmethod
+    def _priority_label(raw_priority: Any) ->str:
+        """Get the display name of a stored priority value."""
+        priority_enum = Task.priority_from_value(raw_priority)
+        return priority_enum.name.title() if priority_enum else 'Unknown'
+
     def get_advanced_task_analytics_async(self, days: int=30) ->str:
         """Get advanced analytics via background processing."""
-        job_id = submit_background_job(self._compute_advanced_analytics,
-            days, priority=4, job_id=
-            f'advanced_analytics_{days}d_{int(get_utc_now().timestamp())}')
-        return job_id
-
-    @cached(ttl=1800.0)
-    def get_productivity_report(self, start_date: datetime, end_date: datetime
-        ) ->Dict[str, Any]:
+        key = f'advanced_analytics_{days}d'
+        db_path = get_database_path(self.session)
+        if db_path is None:
+            return submit_background_job(self._compute_advanced_analytics,
+                days, priority=4, idempotency_key=key)
+        return submit_background_job(compute_advanced_analytics, db_path,
+            days, rollups_in_sync(self.session), priority=4,
+            idempotency_key=key, executor='process')
+
+    @cached(ttl=1800.0, tags=['task'])
+    def get_productivity_report(self, start_date: datetime, end_date:
+        datetime, include_time_analysis: bool=False) ->Dict[str, Any]:
         """Get productivity report with caching."""
-        return self._compute_productivity_report(start_date, end_date)
+        return self._compute_productivity_report(start_date, end_date, None,
+            include_time_analysis)
 
     def _compute_productivity_report(self, start_date: datetime, end_date:
-        datetime) ->Dict[str, Any]:
-        """Compute productivity report (called from cache or background)."""
+        datetime, use_rollups: Optional[bool]=None, include_time_analysis:
+        bool=False) ->Dict[str, Any]:
+        """
+        Compute productivity report (called from cache or background).
+
+        Sums task_daily_stats for the whole days in the range when it is in
+        sync with the tasks table (use_rollups, which defaults to
+        rollups_in_sync), and the task columns in the range otherwise. The
+        columnar time analysis reads every task in the range, so it is only
+        added as 'time_analysis' when include_time_analysis is set.
+        """
         logger.debug(
             f'Computing productivity report from {start_date} to {end_date}')
-        tasks_in_range = self.session.query(Task).filter(Task.created_at >=
-            start_date, Task.created_at <= end_date).all()
-        total_tasks = len(tasks_in_range)
-        completed_tasks = sum(1 for task in tasks_in_range if task.done)
-        total_estimated_hours = sum(task.estimated_hours or 0 for task in
-            tasks_in_range)
-        total_actual_hours = sum(task.actual_hours or 0 for task in
-            tasks_in_range)
-        priority_breakdown = {}
-        for task in tasks_in_range:
-            priority = task.priority or 'Unknown'
-            if priority not in priority_breakdown:
-                priority_breakdown[priority] = {'total': 0, 'completed': 0}
-            priority_breakdown[priority]['total'] += 1
-            if task.done:
-                priority_breakdown[priority]['completed'] += 1
+        if use_rollups is None:
+            use_rollups = rollups_in_sync(self.session)
+        columns = analysis = None
+        if include_time_analysis or not use_rollups:
+            columns = load_task_columns(self.session, Task.created_at >=
+                start_date, Task.created_at <= end_date)
+            analysis = time_analysis(columns)
+        if use_rollups:
+            total_tasks = completed_tasks = 0
+            total_estimated_hours = total_actual_hours = 0
+            priority_breakdown = {}
+            for raw_priority, stats in summarize_by_priority(self.session,
+                start_date, end_date).items():
+                entry = priority_breakdown.setdefault(self._priority_label(
+                    raw_priority), {'total': 0, 'completed': 0})
+                entry['total'] += stats['tasks_created']
+                entry['completed'] += stats['tasks_completed']
+                total_tasks += stats['tasks_created']
+                completed_tasks += stats['tasks_completed']
+                total_estimated_hours += stats['estimated_hours']
+                total_actual_hours += stats['actual_hours']
+        else:
+            total_tasks = analysis['tasks']
+            completed_tasks = analysis['completed']
+            total_estimated_hours = math.fsum(hours for hours in columns.
+                estimated_hours if hours)
+            total_actual_hours = math.fsum(hours for hours in columns.
+                actual_hours if hours)
+            priority_breakdown = {priority: {'total': stats['tasks'],
+                'completed': stats['completed']} for priority, stats in
+                analysis['by_priority'].items()}
         completion_rate = completed_tasks / max(1, total_tasks) * 100
         time_efficiency = total_estimated_hours / max(1, total_actual_hours
             ) * 100 if total_actual_hours > 0 else 0
-        return {'summary': {'tasks_created': total_tasks, 'tasks_completed':
-            completed_tasks, 'completion_rate': round(completion_rate, 1)},
-            'period_start': start_date.isoformat(), 'period_end': end_date.
+        report = {'summary': {'tasks_created': total_tasks,
+            'tasks_completed': completed_tasks, 'completion_rate': round(
+            completion_rate, 1)}, 'period_start': start_date.isoformat(), 'period_end': end_date.
             isoformat(), 'total_tasks': total_tasks, 'completed_tasks':
             completed_tasks, 'completion_rate': round(completion_rate, 1),
             'estimated_hours': round(total_estimated_hours, 1),
             'actual_hours': round(total_actual_hours, 1), 'time_efficiency':
-            round(time_efficiency, 1), 'priority_breakdown': priority_breakdown
-            }
+            round(time_efficiency, 1), 'priority_breakdown':
+            priority_breakdown}
+        if include_time_analysis:
+            report['time_analysis'] = analysis
+        return report
 
     def get_productivity_report_async(self, start_date: datetime, end_date:
-        datetime) ->str:
+        datetime, include_time_analysis: bool=False) ->str:
         """Get productivity report via background processing."""
-        job_id = submit_background_job(self._compute_productivity_report,
-            start_date, end_date, priority=4, job_id=
+        key = (
             f"productivity_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}"
             )
-        return job_id
+        if include_time_analysis:
+            key += '_time'
+        db_path = get_database_path(self.session)
+        if db_path is None:
+            return submit_background_job(self._compute_productivity_report,
+                start_date, end_date, None, include_time_analysis,
+                priority=4, idempotency_key=key)
+        return submit_background_job(compute_productivity_report, db_path,
+            start_date, end_date, rollups_in_sync(self.session),
+            include_time_analysis, priority=4, idempotency_key=key,
+            executor='process')
 
     def get_tasks_by_ids(self, task_ids: List[int]) ->List[Task]:
         """Batch load tasks by IDs with optimized relationships."""
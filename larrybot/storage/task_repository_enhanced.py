@@ -6,7 +6,7 @@ eliminates manual cache invalidation throughout the codebase.
 """
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session
 from sqlalchemy import or_
 import json
 import logging
@@ -15,6 +15,7 @@ from larrybot.models.task_comment import TaskComment
 from larrybot.models.task_time_entry import TaskTimeEntry
 from larrybot.models.task_dependency import TaskDependency
 from larrybot.models.enums import TaskStatus
+from larrybot.storage.task_snapshot import TaskSnapshot, snapshot_query, to_snapshots
 from larrybot.utils.caching import cached
 from larrybot.utils.cache_automation import auto_invalidate_cache, OperationType, invalidate_caches_for
 from larrybot.utils.datetime_utils import get_current_utc_datetime, get_today_date, get_start_of_day, get_end_of_day
@@ -51,20 +52,17 @@ class EnhancedTaskRepository:
         logger.info(f'Task created: {task.id} - {description}')
         return task
 
-    @cached(ttl=60.0)
-    def list_incomplete_tasks(self) ->List[Task]:
-        """List all incomplete tasks with optimized client loading."""
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter_by(done=False).order_by(Task.created_at.desc()).all()
+    @cached(ttl=60.0, tags=['task', 'client'])
+    def list_incomplete_tasks(self) ->List[TaskSnapshot]:
+        """List all incomplete tasks as read-only snapshots."""
+        return to_snapshots(snapshot_query(self.session).filter(Task.done ==
+            False).order_by(Task.created_at.desc()))
 
-    @cached(ttl=300.0)
-    def get_task_by_id(self, task_id: int) ->Optional[Task]:
-        """Get task by ID with optimized relationship loading."""
-        return self.session.query(Task).options(joinedload(Task.client),
-            selectinload(Task.comments), selectinload(Task.time_entries),
-            selectinload(Task.dependencies), selectinload(Task.dependents),
-            selectinload(Task.children), selectinload(Task.attachments)
-            ).filter_by(id=task_id).first()
+    @cached(ttl=300.0, tags=['task', 'client'])
+    def get_task_by_id(self, task_id: int) ->Optional[TaskSnapshot]:
+        """Get a read-only snapshot of a task by ID."""
+        row = snapshot_query(self.session).filter(Task.id == task_id).first()
+        return TaskSnapshot.from_row(row) if row else None
 
     @auto_invalidate_cache(OperationType.TASK_STATUS_CHANGE)
     def mark_task_done(self, task_id: int) ->Optional[Task]:
@@ -263,44 +261,37 @@ class EnhancedTaskRepository:
             logger.error(f'Error in bulk_delete_tasks: {e}')
             raise
 
-    @cached(ttl=180.0)
-    def get_tasks_by_client(self, client_name: str) ->List[Task]:
-        """Get tasks by client with optimized join and caching."""
+    @cached(ttl=180.0, tags=['task', 'client'])
+    def get_tasks_by_client(self, client_name: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of a client's tasks."""
         from larrybot.models.client import Client
-        return self.session.query(Task).join(Client, Task.client_id ==
-            Client.id).options(joinedload(Task.client)).filter(Client.name ==
-            client_name).order_by(Task.created_at.desc()).all()
+        return to_snapshots(snapshot_query(self.session).filter(Client.name ==
+            client_name).order_by(Task.created_at.desc()))
 
-    @cached(ttl=300.0)
-    def get_tasks_by_priority(self, priority: str) ->List[Task]:
-        """Get all tasks with a specific priority with optimized loading."""
-        from larrybot.models.enums import TaskPriority
-        priority_enum = TaskPriority.from_string(priority)
-        if priority_enum:
-            possible_values = [priority_enum.name, priority_enum.name.title
-                (), priority_enum.value]
-        else:
-            possible_values = [priority]
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task._priority.in_(possible_values)).order_by(Task.
-            created_at.desc()).all()
+    @cached(ttl=300.0, tags=['task'])
+    def get_tasks_by_priority(self, priority: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all tasks with a specific priority."""
+        try:
+            code = Task.priority_code(priority)
+        except ValueError:
+            return []
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            _priority == code).order_by(Task.created_at.desc()))
 
-    @cached(ttl=180.0)
-    def get_overdue_tasks(self) ->List[Task]:
-        """Get all overdue tasks with optimized client loading."""
+    @cached(ttl=180.0, tags=['task'])
+    def get_overdue_tasks(self) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all overdue tasks."""
         now = get_current_utc_datetime()
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter(Task.due_date < now, Task.done == False).order_by(Task
-            .due_date.asc()).all()
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            due_date < now, Task.done == False).order_by(Task.due_date.asc()))
 
-    @cached(ttl=300.0)
-    def get_tasks_by_category(self, category: str) ->List[Task]:
-        """Get all tasks in a specific category with optimized loading."""
-        return self.session.query(Task).options(joinedload(Task.client)
-            ).filter_by(category=category).order_by(Task.created_at.desc()
-            ).all()
+    @cached(ttl=300.0, tags=['task'])
+    def get_tasks_by_category(self, category: str) ->List[TaskSnapshot]:
+        """Get read-only snapshots of all tasks in a specific category."""
+        return to_snapshots(snapshot_query(self.session).filter(Task.
+            category == category).order_by(Task.created_at.desc()))
 
-    @cached(ttl=600.0)
+    @cached(ttl=600.0, tags=['task'])
     def get_all_categories(self) ->List[str]:
         """Get all unique categories - cached with longer TTL."""
         categories = self.session.query(Task.category).filter(Task.category
@@ -0,0 +1,242 @@
+"""
+Daily task rollups for LarryBot2.
+
+task_daily_stats holds one row per local creation day, category, priority
+and client with the number of tasks created and completed and their
+estimated, actual and completion hours. TaskRepository mutations refresh
+the days they touch (see maintains_daily_stats), so analytics over a date
+range add up whole days from the rollup and read only the partial days at
+the edges of the range from the tasks table. Whether the rollup can be
+trusted is kept per engine (see rollups_in_sync) rather than re-checked
+against the tasks table on every read.
+
+Days follow the configured local timezone; run
+scripts/backfill_task_daily_stats.py after changing it, and once after
+upgrading a database that already has tasks.
+"""
+import inspect
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+from sqlalchemy import and_, case, func, insert, or_, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from larrybot.models.task import Task
+from larrybot.models.task_daily_stats import TaskDailyStats
+logger = logging.getLogger(__name__)
+ROLLUP_FIELDS = ('tasks_created', 'tasks_completed', 'estimated_hours',
+    'actual_hours', 'completion_hours')
+_sync_state: 'WeakKeyDictionary[Engine, bool]' = WeakKeyDictionary()
+
+
+def _timezone_service():
+    from larrybot.core.timezone import get_timezone_service
+    return get_timezone_service()
+
+
+def _as_utc(moment: datetime) ->datetime:
+    """Treat naive datetimes as UTC, like the stored timestamps."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def local_day(moment: datetime) ->date:
+    """Get the local calendar day of a UTC timestamp."""
+    return _timezone_service().to_local(_as_utc(moment)).date()
+
+
+def day_bounds(day: date) ->Tuple[datetime, datetime]:
+    """Get the UTC start of a local day and of the day after it."""
+    tz_service = _timezone_service()
+    return tz_service.to_utc(datetime.combine(day, time.min)
+        ), tz_service.to_utc(datetime.combine(day + timedelta(days=1),
+        time.min))
+
+
+def _task_aggregates() ->Tuple[Any, ...]:
+    """Aggregate columns over tasks, in ROLLUP_FIELDS order."""
+    completion_hours = (func.julianday(Task.updated_at) - func.julianday(
+        Task.created_at)) * 24
+    return func.count(Task.id), func.sum(case((Task.done == True, 1),
+        else_=0)), func.sum(func.coalesce(Task.estimated_hours, 0)), func.sum(
+        func.coalesce(Task.actual_hours, 0)), func.sum(case((Task.done ==
+        True, completion_hours), else_=0))
+
+
+def _rollup_aggregates() ->Tuple[Any, ...]:
+    """Aggregate columns over task_daily_stats, in ROLLUP_FIELDS order."""
+    return tuple(func.sum(getattr(TaskDailyStats, field)) for field in
+        ROLLUP_FIELDS)
+
+
+def _add_row(totals: Dict[Optional[int], Dict[str, float]], priority:
+    Optional[int], values: Iterable[Any]) ->None:
+    stats = totals.setdefault(priority, dict.fromkeys(ROLLUP_FIELDS, 0))
+    for field, value in zip(ROLLUP_FIELDS, values):
+        stats[field] += value or 0
+
+
+def task_days(session: Session, task_ids: Iterable[int]) ->Set[date]:
+    """Get the local creation days of tasks and of their subtasks."""
+    task_ids = list(task_ids)
+    if not task_ids:
+        return set()
+    rows = session.query(Task.created_at).filter(or_(Task.id.in_(task_ids),
+        Task.parent_id.in_(task_ids))).all()
+    return {local_day(created_at) for created_at, in rows if created_at}
+
+
+def refresh_daily_stats(session: Session, days: Iterable[date]) ->int:
+    """
+    Rebuild the rollup rows of the given local days from the tasks table.
+
+    Leaves committing to the caller. Returns the number of rows written.
+    """
+    written = 0
+    for day in sorted(set(days)):
+        start, end = day_bounds(day)
+        session.query(TaskDailyStats).filter(TaskDailyStats.day == day
+            ).delete(synchronize_session=False)
+        rows = session.query(Task.category, Task._priority, Task.client_id,
+            *_task_aggregates()).filter(Task.created_at >= start, Task.
+            created_at < end).group_by(Task.category, Task._priority, Task.
+            client_id).all()
+        if rows:
+            session.execute(insert(TaskDailyStats), [{'day': day,
+                'category': category, 'priority': priority, 'client_id':
+                client_id, **dict(zip(ROLLUP_FIELDS, values))} for category,
+                priority, client_id, *values in rows])
+        written += len(rows)
+    return written
+
+
+def backfill_daily_stats(session: Session) ->int:
+    """Rebuild task_daily_stats from every task and commit. Returns the day count."""
+    days = {local_day(created_at) for created_at, in session.query(Task.
+        created_at).yield_per(1000) if created_at}
+    session.query(TaskDailyStats).delete(synchronize_session=False)
+    refresh_daily_stats(session, days)
+    session.commit()
+    mark_rollups_in_sync(session, True)
+    logger.info(f'Backfilled task_daily_stats for {len(days)} days')
+    return len(days)
+
+
+def rollups_match_tasks(session: Session) ->bool:
+    """
+    Check in one statement that the rollup totals match the tasks table.
+
+    This reads every task and every rollup row; analytics go through
+    rollups_in_sync instead.
+    """
+    done = select(func.count(Task.id)).where(Task.done == True)
+    row = session.query(select(func.count(Task.id)).scalar_subquery(),
+        done.scalar_subquery(), select(func.coalesce(func.sum(
+        TaskDailyStats.tasks_created), 0)).scalar_subquery(), select(func.
+        coalesce(func.sum(TaskDailyStats.tasks_completed), 0)).
+        scalar_subquery()).one()
+    return row[0] == row[2] and row[1] == row[3]
+
+
+def mark_rollups_in_sync(session: Session, in_sync: bool) ->None:
+    """Record whether task_daily_stats matches the tasks table of a session's engine."""
+    _sync_state[session.get_bind().engine] = in_sync
+
+
+def rollups_in_sync(session: Session) ->bool:
+    """
+    Tell whether analytics can read task_daily_stats.
+
+    The answer is kept per engine: backfill_daily_stats sets it and a
+    failed refresh in maintains_daily_stats clears it, so only the first
+    call in a process compares the two tables (rollups_match_tasks).
+    False until the backfill has run; tasks changed outside TaskRepository
+    are not noticed until the next backfill.
+    """
+    engine = session.get_bind().engine
+    in_sync = _sync_state.get(engine)
+    if in_sync is None:
+        in_sync = _sync_state[engine] = rollups_match_tasks(session)
+    return in_sync
+
+
+def summarize_by_priority(session: Session, start: Optional[datetime]=None,
+    end: Optional[datetime]=None) ->Dict[Optional[int], Dict[str, float]]:
+    """
+    Sum the rollup fields per priority code for tasks created in [start, end].
+
+    Whole local days come from task_daily_stats and the partial days at
+    either edge from one aggregate over the tasks table. Without a range
+    every rollup row is summed.
+    """
+    totals: Dict[Optional[int], Dict[str, float]] = {}
+    if start is None or end is None:
+        for priority, *values in session.query(TaskDailyStats.priority, *
+            _rollup_aggregates()).group_by(TaskDailyStats.priority):
+            _add_row(totals, priority, values)
+        return totals
+    start, end = _as_utc(start), _as_utc(end)
+    first_day = local_day(start)
+    if day_bounds(first_day)[0] < start:
+        first_day += timedelta(days=1)
+    last_day = local_day(end)
+    if day_bounds(last_day)[1] > end:
+        last_day -= timedelta(days=1)
+    if first_day > last_day:
+        edges = and_(Task.created_at >= start, Task.created_at <= end)
+    else:
+        for priority, *values in session.query(TaskDailyStats.priority, *
+            _rollup_aggregates()).filter(TaskDailyStats.day >= first_day,
+            TaskDailyStats.day <= last_day).group_by(TaskDailyStats.priority):
+            _add_row(totals, priority, values)
+        edges = or_(and_(Task.created_at >= start, Task.created_at <
+            day_bounds(first_day)[0]), and_(Task.created_at >= day_bounds(
+            last_day)[1], Task.created_at <= end))
+    for priority, *values in session.query(Task._priority, *
+        _task_aggregates()).filter(edges).group_by(Task._priority):
+        _add_row(totals, priority, values)
+    return totals
+
+
+def maintains_daily_stats(func: Callable) ->Callable:
+    """
+    Keep task_daily_stats in step with a TaskRepository mutation.
+
+    The creation days of the tasks named by the method's task_id or
+    task_ids argument (and of their subtasks) are read before the call, so
+    deleted tasks are covered; a Task returned by the call adds its own
+    day. A failed refresh is logged, leaves the mutation committed and
+    marks the rollup out of sync until the next backfill.
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        arguments = signature.bind_partial(self, *args, **kwargs).arguments
+        task_ids = arguments.get('task_ids') or []
+        if arguments.get('task_id') is not None:
+            task_ids = [arguments['task_id']]
+        try:
+            days = task_days(self.session, task_ids)
+        except Exception as e:
+            logger.debug(f'Could not read task days for {func.__name__}: {e}')
+            mark_rollups_in_sync(self.session, False)
+            days = set()
+        result = func(self, *args, **kwargs)
+        try:
+            if isinstance(result, Task):
+                days.add(local_day(result.created_at))
+            if days:
+                refresh_daily_stats(self.session, days)
+                self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            mark_rollups_in_sync(self.session, False)
+            logger.warning(
+                f'Could not refresh task_daily_stats after {func.__name__}: {e}'
+                )
+        return result
+    return wrapper
@@ -0,0 +1,65 @@
+"""
+Ranked task search for LarryBot2.
+
+search_task_ids() matches free text against the tasks_fts index (see
+larrybot.models.task_search_index). Every word of the query must match,
+each as a prefix, and results come back in bm25 order - description and
+title matches weigh more than category, tags and comments - with a snippet
+of the best matching column. Matched words in snippets are wrapped in
+HIGHLIGHT_START and HIGHLIGHT_END for the caller to render.
+"""
+import logging
+import re
+from typing import Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from larrybot.models.task_search_index import FTS_TABLE
+logger = logging.getLogger(__name__)
+BM25_WEIGHTS = 10.0, 8.0, 3.0, 3.0, 1.0
+HIGHLIGHT_START = '\x02'
+HIGHLIGHT_END = '\x03'
+SNIPPET_TOKENS = 12
+_WORD = re.compile('\\w+')
+
+
+def fts_query(search_text: str) ->Optional[str]:
+    """Build an FTS5 query requiring every word as a prefix; None if no words."""
+    words = _WORD.findall(search_text)
+    if not words:
+        return None
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+def search_index_available(session: Session) ->bool:
+    """Check whether the database has the tasks_fts index."""
+    if session.get_bind().dialect.name != 'sqlite':
+        return False
+    return session.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+        ), {'name': FTS_TABLE}).first() is not None
+
+
+def search_task_ids(session: Session, search_text: str, limit: Optional[int
+    ]=None) ->Optional[Dict[int, str]]:
+    """
+    Get matching task ids, best first, each with its snippet.
+
+    Returns None when the index is unavailable or the text has no words,
+    so the caller can fall back to a LIKE search.
+    """
+    query = fts_query(search_text)
+    if query is None or not search_index_available(session):
+        return None
+    weights = ', '.join(str(weight) for weight in BM25_WEIGHTS)
+    statement = text(
+        f'SELECT rowid, snippet({FTS_TABLE}, -1, :start, :end, :ellipsis, :tokens) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :query ORDER BY bm25({FTS_TABLE}, {weights})'
+         + (' LIMIT :limit' if limit else ''))
+    try:
+        rows = session.execute(statement, {'start': HIGHLIGHT_START, 'end':
+            HIGHLIGHT_END, 'ellipsis': '…', 'tokens': SNIPPET_TOKENS,
+            'query': query, 'limit': limit}).all()
+    except OperationalError as e:
+        logger.warning(f'Full-text task search failed, using LIKE: {e}')
+        return None
+    return {task_id: snippet for task_id, snippet in rows}
@@ -0,0 +1,115 @@
+"""
+Read-only task projections for LarryBot2.
+
+Cached repository reads return TaskSnapshot tuples built straight from
+column rows instead of ORM instances. Snapshots carry no session, identity
+map or lazy relationships, so they stay valid after the session closes and
+can be shared safely between cache hits.
+
+TaskSnapshot mirrors the read-only API of Task (priority, status_enum,
+is_overdue, get_tags_list, to_dict, ...) so formatters and services accept
+either type.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query, Session
+from larrybot.models.client import Client
+from larrybot.models.task import Task
+from larrybot.models.task_time_entry import TaskTimeEntry
+
+
+class ClientRef(NamedTuple):
+    """Minimal client reference embedded in a task snapshot."""
+    id: int
+    name: str
+
+
+class TaskSnapshot(NamedTuple):
+    """Immutable, session-free view of a task row."""
+    id: int
+    description: str
+    description_rich: Optional[str]
+    status: str
+    priority_value: Any
+    done: bool
+    due_date: Optional[datetime]
+    category: Optional[str]
+    estimated_hours: Optional[float]
+    actual_hours: Optional[float]
+    progress: int
+    parent_id: Optional[int]
+    tags: Optional[str]
+    client_id: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    title: Optional[str]
+    sla_hours: Optional[int]
+    sla_deadline: Optional[datetime]
+    task_metadata: Optional[str]
+    external_id: Optional[str]
+    source: Optional[str]
+    time_spent_hours: float
+    client: Optional[ClientRef]
+
+    @classmethod
+    def from_row(cls, row) ->'TaskSnapshot':
+        """Build a snapshot from a row produced by snapshot_query()."""
+        *values, time_spent_minutes, client_name = row
+        client = ClientRef(values[13], client_name
+            ) if client_name is not None else None
+        return cls(*values, (time_spent_minutes or 0) / 60.0, client)
+
+    @property
+    def _priority(self) ->Any:
+        """Raw priority column value, as used by the Task helpers."""
+        return self.priority_value
+
+    @property
+    def priority(self) ->Optional[str]:
+        """Get priority as human-readable string."""
+        if self.priority_value is None:
+            return None
+        return self.priority_enum.name.title()
+
+    @property
+    def client_name(self) ->Optional[str]:
+        """Name of the assigned client, if any."""
+        return self.client.name if self.client else None
+    status_enum = property(Task.status_enum.fget)
+    priority_enum = property(Task.priority_enum.fget)
+    is_overdue = property(Task.is_overdue.fget)
+    days_until_due = property(Task.days_until_due.fget)
+    completion_percentage = property(Task.completion_percentage.fget)
+    sla_hours_remaining = property(Task.sla_hours_remaining.fget)
+    is_sla_violated = property(Task.is_sla_violated.fget)
+    is_done = Task.is_done
+    get_tags_list = Task.get_tags_list
+    calculate_priority_score = Task.calculate_priority_score
+
+    def to_dict(self) ->Dict[str, Any]:
+        """Convert snapshot to the same dictionary shape as Task.to_dict()."""
+        return Task.to_dict(self)
+
+
+SNAPSHOT_COLUMNS = (Task.id, Task.description, Task.description_rich, Task
+    .status, Task._priority, Task.done, Task.due_date, Task.category, Task.
+    estimated_hours, Task.actual_hours, Task.progress, Task.parent_id, Task
+    .tags, Task.client_id, Task.created_at, Task.updated_at, Task.
+    started_at, Task.completed_at, Task.title, Task.sla_hours, Task.
+    sla_deadline, Task.task_metadata, Task.external_id, Task.source)
+
+
+def snapshot_query(session: Session) ->Query:
+    """Column query yielding rows for TaskSnapshot.from_row()."""
+    time_spent = select(func.sum(TaskTimeEntry.duration_minutes)).where(
+        TaskTimeEntry.task_id == Task.id).correlate(Task).scalar_subquery()
+    return session.query(*SNAPSHOT_COLUMNS, time_spent, Client.name
+        ).select_from(Task).outerjoin(Client, Task.client_id == Client.id)
+
+
+def to_snapshots(query: Query) ->List[TaskSnapshot]:
+    """Run a snapshot query and convert every row."""
+    return [TaskSnapshot.from_row(row) for row in query.all()]
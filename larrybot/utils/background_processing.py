@@ -8,12 +8,16 @@ import asyncio
 import time
 import logging
 import json
-from typing import Any, Dict, Optional, Callable, List, Union
+from typing import Any, Deque, Dict, Optional, Callable, List, Tuple, Union
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from concurrent.futures import ThreadPoolExecutor, Future
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
 from functools import wraps
+import functools
+import itertools
+import multiprocessing
 import threading
 import traceback
 logger = logging.getLogger(__name__)
@@ -35,6 +39,8 @@ class BackgroundJob:
     func: Callable
     args: tuple
     kwargs: dict
+    priority: int = 5
+    executor: str = 'thread'
     created_at: float = field(default_factory=time.time)
     started_at: Optional[float] = None
     completed_at: Optional[float] = None
@@ -42,6 +48,10 @@ class BackgroundJob:
     result: Any = None
     error: Optional[str] = None
     progress: float = 0.0
+    idempotency_key: Optional[str] = None
+    result_ttl: Optional[float] = None
+    expires_at: Optional[float] = None
+    persisted: bool = False
 
     @property
     def duration(self) ->Optional[float]:
@@ -50,6 +60,13 @@ class BackgroundJob:
             return self.completed_at - self.started_at
         return None
 
+    @property
+    def wait_time(self) ->Optional[float]:
+        """Get time spent queued before execution started."""
+        if self.started_at:
+            return self.started_at - self.created_at
+        return None
+
     @property
     def is_complete(self) ->bool:
         """Check if job is complete (success or failure)."""
@@ -57,6 +74,10 @@ class BackgroundJob:
             JobStatus.CANCELLED]
 
 
+DEFAULT_CONCURRENCY_LIMITS = {7: 2, 8: 1, 9: 1, 10: 1}
+EXECUTOR_LANES = 'thread', 'process'
+
+
 class BackgroundJobQueue:
     """
     High-performance background job queue with priority handling, result caching,
@@ -64,79 +85,254 @@ class BackgroundJobQueue:
     
     Features:
     - Async and sync job execution
-    - Priority queue for urgent tasks
-    - Result caching with TTL
-    - Progress tracking for long operations
-    - Error handling and retry logic
-    - Thread pool for CPU-intensive tasks
+    - Priority scheduling (1=highest) with FIFO order inside a priority
+    - Aging: every aging_interval seconds a job waits raises its effective
+      priority by one level, so low-priority work cannot starve
+    - Per-priority concurrency caps, keeping workers free for urgent jobs
+    - Queue-wait and run-time statistics per priority
+    - Thread pool for I/O-bound jobs
+    - Process pool lane for CPU-heavy jobs that would otherwise hold the
+      GIL; such jobs must be picklable module-level functions taking
+      picklable arguments (e.g. a database path) and returning plain data
+    - Idempotency keys: a submission whose key matches a pending, running
+      or unexpired completed job returns that job's ID instead of queueing
+      duplicate work
+    - Optional durable store (larrybot.storage.job_store.JobStore): jobs
+      are written on a dedicated store thread and resumed after a restart
     """
 
-    def __init__(self, max_workers: int=4, max_queue_size: int=1000):
+    def __init__(self, max_workers: int=4, max_queue_size: int=1000,
+        aging_interval: float=30.0, concurrency_limits: Optional[Dict[int,
+        int]]=None, process_workers: int=2, result_ttl: float=300.0,
+        job_store=None):
         self._jobs: Dict[str, BackgroundJob] = {}
-        self._queue = None
+        self._keys: Dict[str, str] = {}
+        self._result_ttl = result_ttl
+        self._job_store = job_store
+        self._store_executor = ThreadPoolExecutor(max_workers=1,
+            thread_name_prefix='bg_job_store')
+        self._pending: Dict[Tuple[int, str], Deque[Tuple[int, str]]] = {}
+        self._pending_count = 0
+        self._running_by_priority: Dict[int, int] = {}
+        self._lane_capacity = {'thread': max_workers, 'process':
+            process_workers}
+        self._running_by_lane = dict.fromkeys(EXECUTOR_LANES, 0)
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_workers = process_workers
+        self._sequence = itertools.count()
         self._max_queue_size = max_queue_size
+        self._aging_interval = aging_interval
+        self._concurrency_limits = dict(DEFAULT_CONCURRENCY_LIMITS if 
+            concurrency_limits is None else concurrency_limits)
         self._executor = ThreadPoolExecutor(max_workers=max_workers,
             thread_name_prefix='bg_job')
         self._running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
         self._worker_tasks: List[asyncio.Task] = []
         self._lock = threading.RLock()
         self._max_workers = max_workers
         self._stats = {'total_jobs': 0, 'completed_jobs': 0, 'failed_jobs':
-            0, 'cancelled_jobs': 0}
+            0, 'cancelled_jobs': 0, 'coalesced_jobs': 0, 'resumed_jobs': 0}
+        self._priority_stats: Dict[int, Dict[str, float]] = {}
         logger.info(
             f'BackgroundJobQueue initialized: max_workers={max_workers}, max_queue_size={max_queue_size}'
             )
 
+    def set_job_store(self, job_store, result_ttl: Optional[float]=None
+        ) ->None:
+        """Persist durable jobs to job_store from now on."""
+        self._job_store = job_store
+        if result_ttl is not None:
+            self._result_ttl = result_ttl
+
     def submit_job(self, func: Callable, *args, job_id: Optional[str]=None,
-        priority: int=5, **kwargs) ->str:
+        priority: int=5, executor: str='thread', idempotency_key: Optional[
+        str]=None, result_ttl: Optional[float]=None, **kwargs) ->str:
         """
         Submit a job to the background queue.
         
+        Safe to call from the event loop or from worker threads.
+
         Args:
             func: Function to execute
             *args: Function arguments
             job_id: Optional custom job ID
             priority: Job priority (1=highest, 10=lowest)
+            executor: Execution lane, 'thread' or 'process'
+            idempotency_key: Optional key; while a job with the same key is
+                pending, running or holds an unexpired result, its ID is
+                returned instead of submitting a new job
+            result_ttl: Seconds a completed result satisfies identical
+                submissions (defaults to the queue's result_ttl)
             **kwargs: Function keyword arguments
             
         Returns:
             Job ID for tracking
         """
+        if executor not in EXECUTOR_LANES:
+            raise ValueError(f'Unknown executor lane: {executor}')
+        if executor == 'process' and asyncio.iscoroutinefunction(func):
+            raise ValueError('Coroutine functions cannot run in the process lane'
+                )
         if job_id is None:
-            job_id = f'job_{int(time.time() * 1000000)}'
-        job = BackgroundJob(id=job_id, func=func, args=args, kwargs=kwargs)
+            job_id = f'job_{time.time_ns()}'
+        job = BackgroundJob(id=job_id, func=func, args=args, kwargs=kwargs,
+            priority=priority, executor=executor, idempotency_key=
+            idempotency_key, result_ttl=result_ttl)
+        store = self._job_store
+        row = store.encode(job) if store is not None else None
         with self._lock:
-            self._jobs[job_id] = job
-            self._stats['total_jobs'] += 1
-        if self._queue is not None:
-            try:
-                self._queue.put_nowait((priority, job_id))
-                logger.debug(f'Job {job_id} submitted with priority {priority}'
-                    )
-            except asyncio.QueueFull:
+            if not self._running:
+                logger.warning(f'Queue not initialized, dropping job {job_id}')
+                raise RuntimeError('Background job queue not started')
+            if idempotency_key is not None:
+                existing = self._find_reusable(idempotency_key, time.time())
+                if existing is not None:
+                    self._stats['coalesced_jobs'] += 1
+                    logger.debug(
+                        f'Job {job_id} coalesced into {existing.id} ({idempotency_key})'
+                        )
+                    return existing.id
+            if self._pending_count >= self._max_queue_size:
                 logger.warning(f'Job queue full, dropping job {job_id}')
-                with self._lock:
-                    del self._jobs[job_id]
-                    self._stats['total_jobs'] -= 1
                 raise RuntimeError('Background job queue is full')
-        else:
-            logger.warning(f'Queue not initialized, dropping job {job_id}')
-            with self._lock:
-                del self._jobs[job_id]
-                self._stats['total_jobs'] -= 1
-            raise RuntimeError('Background job queue not started')
+            if row is not None:
+                job.persisted = True
+                self._persist(store.add, row)
+            self._enqueue(job)
+            self._stats['total_jobs'] += 1
+            self._priority_stat(priority)['submitted'] += 1
+        logger.debug(f'Job {job_id} submitted with priority {priority}')
+        self._notify()
         return job_id
 
+    def _enqueue(self, job: BackgroundJob) ->None:
+        """Register a pending job and queue it (lock must be held)."""
+        self._jobs[job.id] = job
+        if job.idempotency_key is not None:
+            self._keys[job.idempotency_key] = job.id
+        self._pending.setdefault((job.priority, job.executor), deque()).append(
+            (next(self._sequence), job.id))
+        self._pending_count += 1
+
+    def _find_reusable(self, key: str, now: float) ->Optional[BackgroundJob]:
+        """
+        Find the job an idempotent submission can reuse (lock must be held).
+
+        Pending and running jobs are always reused; completed jobs only
+        until their result expires. Failed and cancelled jobs are retried.
+        """
+        job = self._jobs.get(self._keys.get(key))
+        if job is None:
+            return None
+        if job.status in (JobStatus.PENDING, JobStatus.RUNNING):
+            return job
+        if job.status == JobStatus.COMPLETED and (job.expires_at is None or
+            job.expires_at > now):
+            return job
+        return None
+
+    def _persist(self, method: Callable, *args) ->None:
+        """
+        Run a job store write on the store thread.
+
+        A single thread keeps writes in submission order and off the event
+        loop; failures are logged and never affect the in-memory job.
+        """
+        try:
+            future = self._store_executor.submit(method, *args)
+        except RuntimeError:
+            return
+        future.add_done_callback(_log_store_error)
+
+    def _priority_stat(self, priority: int) ->Dict[str, float]:
+        """Get the statistics bucket for a priority (lock must be held)."""
+        stats = self._priority_stats.get(priority)
+        if stats is None:
+            stats = self._priority_stats[priority] = {'submitted': 0,
+                'completed': 0, 'failed': 0, 'cancelled': 0, 'total_wait': 
+                0.0, 'max_wait': 0.0, 'total_run': 0.0, 'max_run': 0.0}
+        return stats
+
+    def _notify(self) ->None:
+        """Wake idle workers, from the loop thread or any other thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            wakeup.set()
+        else:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass
+
+    def _take_next(self) ->Optional[BackgroundJob]:
+        """
+        Pop the next runnable job and mark it running.
+
+        Each priority keeps a FIFO per execution lane, so only the head of
+        every FIFO is a candidate. The candidate with the lowest aged
+        priority wins; ties go to the job submitted first. Priorities at
+        their concurrency cap and lanes without a free slot are skipped.
+        """
+        now = time.time()
+        with self._lock:
+            best = None
+            for (priority, lane), pending in self._pending.items():
+                if not pending:
+                    continue
+                if self._running_by_lane[lane] >= self._lane_capacity[lane]:
+                    continue
+                limit = self._concurrency_limits.get(priority)
+                if limit is not None and self._running_by_priority.get(
+                    priority, 0) >= limit:
+                    continue
+                sequence, job_id = pending[0]
+                waited = now - self._jobs[job_id].created_at
+                effective = priority
+                if self._aging_interval > 0:
+                    effective -= int(waited // self._aging_interval)
+                candidate = effective, sequence, priority, lane
+                if best is None or candidate < best:
+                    best = candidate
+            if best is None:
+                return None
+            _, _, priority, lane = best
+            _, job_id = self._pending[priority, lane].popleft()
+            self._pending_count -= 1
+            job = self._jobs[job_id]
+            job.status = JobStatus.RUNNING
+            job.started_at = now
+            self._running_by_priority[priority
+                ] = self._running_by_priority.get(priority, 0) + 1
+            self._running_by_lane[lane] += 1
+            if job.persisted:
+                self._persist(self._job_store.mark_running, job.id, now)
+            stats = self._priority_stat(priority)
+            stats['total_wait'] += job.wait_time
+            stats['max_wait'] = max(stats['max_wait'], job.wait_time)
+            return job
+
     def get_job_status(self, job_id: str) ->Optional[Dict[str, Any]]:
         """Get job status and result."""
         with self._lock:
             job = self._jobs.get(job_id)
             if not job:
                 return None
-            return {'id': job.id, 'status': job.status.value, 'progress':
-                job.progress, 'result': job.result, 'error': job.error,
-                'created_at': job.created_at, 'started_at': job.started_at,
-                'completed_at': job.completed_at, 'duration': job.duration}
+            return {'id': job.id, 'status': job.status.value, 'priority':
+                job.priority, 'executor': job.executor, 'progress': job.
+                progress, 'result': job.
+                result, 'error': job.error, 'created_at': job.created_at,
+                'started_at': job.started_at, 'completed_at': job.
+                completed_at, 'duration': job.duration, 'wait_time': job.
+                wait_time, 'idempotency_key': job.idempotency_key,
+                'expires_at': job.expires_at, 'durable': job.persisted}
 
     def get_job_result(self, job_id: str) ->Any:
         """Get job result if completed, otherwise return None."""
@@ -151,33 +347,68 @@ class BackgroundJobQueue:
         with self._lock:
             job = self._jobs.get(job_id)
             if job and job.status == JobStatus.PENDING:
+                pending = self._pending.get((job.priority, job.executor), ())
+                for item in pending:
+                    if item[1] == job_id:
+                        pending.remove(item)
+                        self._pending_count -= 1
+                        break
                 job.status = JobStatus.CANCELLED
+                job.completed_at = time.time()
                 self._stats['cancelled_jobs'] += 1
+                self._priority_stat(job.priority)['cancelled'] += 1
+                self._record_outcome(job)
                 return True
             return False
 
     def get_queue_stats(self) ->Dict[str, Any]:
-        """Get queue statistics."""
+        """
+        Get queue statistics.
+
+        'priorities' breaks queue depth, wait time and run time down per
+        priority, to show whether urgent jobs wait behind bulk work.
+        """
         with self._lock:
             pending_jobs = sum(1 for job in self._jobs.values() if job.
                 status == JobStatus.PENDING)
             running_jobs = sum(1 for job in self._jobs.values() if job.
                 status == JobStatus.RUNNING)
-            queue_size = self._queue.qsize() if self._queue else 0
+            priorities = {}
+            for priority in sorted(self._priority_stats):
+                stats = self._priority_stats[priority]
+                started = stats['completed'] + stats['failed'
+                    ] + self._running_by_priority.get(priority, 0)
+                finished = max(1, stats['completed'] + stats['failed'])
+                priorities[priority] = {'queued': sum(len(self._pending.
+                    get((priority, lane), ())) for lane in EXECUTOR_LANES),
+                    'running': self._running_by_priority.
+                    get(priority, 0), 'limit': self._concurrency_limits.get
+                    (priority), 'submitted': stats['submitted'],
+                    'completed': stats['completed'], 'failed': stats[
+                    'failed'], 'cancelled': stats['cancelled'], 'avg_wait':
+                    stats['total_wait'] / max(1, started), 'max_wait':
+                    stats['max_wait'], 'avg_run': stats['total_run'] /
+                    finished, 'max_run': stats['max_run']}
             return {'total_jobs': self._stats['total_jobs'],
                 'completed_jobs': self._stats['completed_jobs'],
                 'failed_jobs': self._stats['failed_jobs'], 'cancelled_jobs':
-                self._stats['cancelled_jobs'], 'pending_jobs': pending_jobs,
-                'running_jobs': running_jobs, 'queue_size': queue_size,
-                'worker_count': self._max_workers}
+                self._stats['cancelled_jobs'], 'coalesced_jobs': self.
+                _stats['coalesced_jobs'], 'resumed_jobs': self._stats[
+                'resumed_jobs'], 'durable': self._job_store is not None,
+                'pending_jobs': pending_jobs,
+                'running_jobs': running_jobs, 'queue_size': self.
+                _pending_count, 'worker_count': self._max_workers,
+                'process_workers': self._process_workers, 'running_by_lane':
+                dict(self._running_by_lane), 'priorities': priorities}
 
     async def start(self):
         """Start the background job processing."""
         if self._running:
             return
-        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self._running = True
-        for i in range(self._max_workers):
+        for i in range(self._max_workers + self._process_workers):
             task = asyncio.create_task(self._worker_loop(f'worker_{i}'))
             self._worker_tasks.append(task)
         logger.info(
@@ -188,34 +419,97 @@ class BackgroundJobQueue:
         """Stop the background job processing."""
         if not self._running:
             return
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout=5.0)
+            logger.debug('All background jobs completed')
+        except asyncio.TimeoutError:
+            logger.warning('Timeout waiting for background jobs to complete')
         self._running = False
-        if self._queue:
-            try:
-                await asyncio.wait_for(self._queue.join(), timeout=5.0)
-                logger.debug('All background jobs completed')
-            except asyncio.TimeoutError:
-                logger.warning(
-                    'Timeout waiting for background jobs to complete')
         for task in self._worker_tasks:
             task.cancel()
         await asyncio.gather(*self._worker_tasks, return_exceptions=True)
         self._worker_tasks.clear()
         self._executor.shutdown(wait=True)
-        self._queue = None
+        self._store_executor.shutdown(wait=True)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=True)
+            self._process_executor = None
+        self._loop = None
+        self._wakeup = None
         logger.info('Background job queue stopped')
 
+    async def resume_jobs(self) ->int:
+        """
+        Restore jobs from the job store after a restart.
+
+        Pending and interrupted jobs are queued again under their original
+        IDs; unexpired completed results become available to get_job_status()
+        and to idempotent submissions. If the store cannot be read it is
+        detached and the queue falls back to memory only.
+
+        Returns:
+            Number of jobs queued again
+        """
+        store = self._job_store
+        if store is None:
+            return 0
+        if not self._running:
+            raise RuntimeError('Background job queue not started')
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._store_executor, store.ensure_table
+                )
+            jobs = await loop.run_in_executor(self._store_executor, store.
+                load_jobs, time.time())
+        except Exception:
+            self._job_store = None
+            logger.warning('Job store unavailable, keeping jobs in memory only'
+                )
+            raise
+        resumed = 0
+        with self._lock:
+            for job in jobs:
+                if job.id in self._jobs:
+                    continue
+                if job.status == JobStatus.COMPLETED:
+                    self._jobs[job.id] = job
+                    if job.idempotency_key is not None:
+                        self._keys[job.idempotency_key] = job.id
+                    continue
+                self._enqueue(job)
+                self._stats['total_jobs'] += 1
+                self._stats['resumed_jobs'] += 1
+                self._priority_stat(job.priority)['submitted'] += 1
+                resumed += 1
+        if resumed:
+            logger.info(f'Resumed {resumed} background jobs')
+            self._notify()
+        return resumed
+
+    async def _wait_idle(self):
+        """Wait until no job is pending or running."""
+        while True:
+            with self._lock:
+                if not self._pending_count and not any(self.
+                    _running_by_priority.values()):
+                    return
+            await asyncio.sleep(0.05)
+
     async def _worker_loop(self, worker_name: str):
         """Main worker loop for processing jobs."""
         logger.debug(f'Worker {worker_name} started')
         while self._running:
             try:
-                try:
-                    priority, job_id = await asyncio.wait_for(self._queue.
-                        get(), timeout=1.0)
-                except asyncio.TimeoutError:
+                self._wakeup.clear()
+                job = self._take_next()
+                if job is None:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout
+                            =1.0)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
-                await self._process_job(job_id, worker_name)
-                self._queue.task_done()
+                await self._process_job(job, worker_name)
             except asyncio.CancelledError:
                 logger.debug(f'Worker {worker_name} cancelled')
                 break
@@ -224,50 +518,95 @@ class BackgroundJobQueue:
                 await asyncio.sleep(1.0)
         logger.debug(f'Worker {worker_name} stopped')
 
-    async def _process_job(self, job_id: str, worker_name: str):
-        """Process a single job."""
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job or job.status != JobStatus.PENDING:
-                return
-            job.status = JobStatus.RUNNING
-            job.started_at = time.time()
-        logger.debug(f'Worker {worker_name} processing job {job_id}')
+    async def _process_job(self, job: BackgroundJob, worker_name: str):
+        """Process a single job that _take_next() marked as running."""
+        logger.debug(f'Worker {worker_name} processing job {job.id}')
         try:
             if asyncio.iscoroutinefunction(job.func):
                 result = await job.func(*job.args, **job.kwargs)
             else:
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(self._executor, job.
-                    func, *job.args, **job.kwargs)
+                executor = (self._get_process_executor() if job.executor ==
+                    'process' else self._executor)
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(executor, functools.
+                    partial(job.func, *job.args, **job.kwargs))
             with self._lock:
                 job.result = result
                 job.status = JobStatus.COMPLETED
                 job.completed_at = time.time()
                 job.progress = 100.0
                 self._stats['completed_jobs'] += 1
+                self._finish(job, 'completed')
+                self._record_outcome(job)
             logger.debug(
-                f'Job {job_id} completed successfully in {job.duration:.2f}s')
+                f'Job {job.id} completed successfully in {job.duration:.2f}s')
         except Exception as e:
             error_msg = f'{type(e).__name__}: {str(e)}'
-            logger.error(f'Job {job_id} failed: {error_msg}')
+            logger.error(f'Job {job.id} failed: {error_msg}')
             with self._lock:
                 job.error = error_msg
                 job.status = JobStatus.FAILED
                 job.completed_at = time.time()
                 self._stats['failed_jobs'] += 1
+                self._finish(job, 'failed')
+                self._record_outcome(job)
+        finally:
+            self._notify()
+
+    def _get_process_executor(self) ->ProcessPoolExecutor:
+        """Create the process pool on first use."""
+        with self._lock:
+            if self._process_executor is None:
+                self._process_executor = ProcessPoolExecutor(max_workers=
+                    self._process_workers, mp_context=multiprocessing.
+                    get_context('spawn'))
+                logger.info(
+                    f'Process lane started ({self._process_workers} workers)')
+            return self._process_executor
+
+    def _finish(self, job: BackgroundJob, outcome: str) ->None:
+        """Release the job's concurrency slot and record timing (lock held)."""
+        self._running_by_priority[job.priority] -= 1
+        self._running_by_lane[job.executor] -= 1
+        stats = self._priority_stat(job.priority)
+        stats[outcome] += 1
+        stats['total_run'] += job.duration or 0.0
+        stats['max_run'] = max(stats['max_run'], job.duration or 0.0)
+
+    def _record_outcome(self, job: BackgroundJob) ->None:
+        """
+        Set when a finished job's result expires and persist the outcome
+        (lock must be held).
+        """
+        ttl = self._result_ttl if job.result_ttl is None else job.result_ttl
+        job.expires_at = job.completed_at + ttl
+        if job.persisted:
+            self._persist(self._job_store.mark_finished, job.id, job.status
+                .value, job.completed_at, job.expires_at, job.result, job.error)
 
     def cleanup_old_jobs(self, max_age_hours: int=24):
         """Remove old completed jobs to prevent memory growth."""
-        cutoff_time = time.time() - max_age_hours * 3600
+        now = time.time()
+        cutoff_time = now - max_age_hours * 3600
         with self._lock:
             old_job_ids = [job_id for job_id, job in self._jobs.items() if 
                 job.is_complete and job.completed_at and job.completed_at <
                 cutoff_time]
             for job_id in old_job_ids:
-                del self._jobs[job_id]
+                job = self._jobs.pop(job_id)
+                if self._keys.get(job.idempotency_key) == job_id:
+                    del self._keys[job.idempotency_key]
             if old_job_ids:
                 logger.info(f'Cleaned up {len(old_job_ids)} old jobs')
+            if self._job_store is not None:
+                self._persist(self._job_store.purge_expired, now)
+
+
+def _log_store_error(future: Future) ->None:
+    """Log a failed job store write."""
+    error = future.exception()
+    if error is not None:
+        logger.error(f'Background job store write failed: {error}')
 
 
 _global_queue = BackgroundJobQueue(max_workers=4)
@@ -304,10 +643,18 @@ def background_task(priority: int=5, job_id: Optional[str]=None):
 
 
 def submit_background_job(func: Callable, *args, priority: int=5, job_id:
-    Optional[str]=None, **kwargs) ->str:
-    """Submit a job to the global background queue."""
+    Optional[str]=None, executor: str='thread', idempotency_key: Optional[
+    str]=None, result_ttl: Optional[float]=None, **kwargs) ->str:
+    """
+    Submit a job to the global background queue.
+
+    Use executor='process' for CPU-heavy, picklable jobs (see
+    larrybot.storage.analytics_worker). Pass an idempotency_key to reuse
+    an identical pending, running or recently completed job.
+    """
     return _global_queue.submit_job(func, *args, priority=priority, job_id=
-        job_id, **kwargs)
+        job_id, executor=executor, idempotency_key=idempotency_key,
+        result_ttl=result_ttl, **kwargs)
 
 
 def get_background_job_status(job_id: str) ->Optional[Dict[str, Any]]:
@@ -335,6 +682,26 @@ async def start_background_processing():
     await _global_queue.start()
 
 
+def enable_durable_jobs(job_store=None, result_ttl: Optional[float]=None
+    ) ->None:
+    """
+    Persist global queue jobs to the database.
+
+    Args:
+        job_store: Store to use (defaults to a JobStore on the main database)
+        result_ttl: Seconds completed results stay reusable
+    """
+    if job_store is None:
+        from larrybot.storage.job_store import JobStore
+        job_store = JobStore()
+    _global_queue.set_job_store(job_store, result_ttl=result_ttl)
+
+
+async def resume_background_jobs() ->int:
+    """Resume persisted jobs on the global queue; returns how many."""
+    return await _global_queue.resume_jobs()
+
+
 async def stop_background_processing():
     """Stop the global background job queue."""
     await _global_queue.stop()
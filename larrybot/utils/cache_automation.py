@@ -9,7 +9,7 @@ import inspect
 from typing import Dict, List, Set, Callable, Any, Optional
 from functools import wraps
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +42,7 @@ class CacheInvalidationRule:
     cache_patterns: List[str]
     conditional_patterns: Optional[Dict[str, List[str]]] = None
     description: str = ''
+    cache_tags: List[str] = field(default_factory=list)
 
 
 class AutomatedCacheManager:
@@ -64,52 +65,69 @@ class AutomatedCacheManager:
             'Invalidate task lists and statistics when creating tasks'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_UPDATE, cache_patterns=['get_task_by_id',
-            'list_incomplete_tasks'], description=
+            'list_incomplete_tasks', 'get_tasks_by_client',
+            'get_client_analytics'], description=
             'Invalidate task details when updating tasks'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_DELETE, cache_patterns=['list_incomplete_tasks',
             'task_statistics', 'analytics', 'get_task_by_id',
             'get_tasks_by_priority', 'get_tasks_by_category',
-            'get_tasks_by_status', 'get_tasks_by_client'], description=
+            'get_tasks_by_status', 'get_tasks_by_client'], cache_tags=[
+            'task'], description=
             'Comprehensive cache invalidation for task deletion'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_STATUS_CHANGE, cache_patterns=['get_task_by_id',
             'get_tasks_by_status', 'list_incomplete_tasks',
-            'task_statistics', 'analytics'], description=
+            'get_tasks_by_client', 'task_statistics', 'analytics'],
+            description=
             'Invalidate status-related caches when task status changes'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_PRIORITY_CHANGE, cache_patterns=['get_task_by_id',
-            'get_tasks_by_priority'], description=
+            'get_tasks_by_priority', 'list_incomplete_tasks',
+            'get_tasks_by_client', 'get_client_analytics'], description=
             'Invalidate priority-related caches when task priority changes'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_CATEGORY_CHANGE, cache_patterns=['get_task_by_id',
-            'get_tasks_by_category', 'get_all_categories'], description=
+            'get_tasks_by_category', 'get_all_categories',
+            'list_incomplete_tasks', 'get_tasks_by_client'], description=
             'Invalidate category-related caches when task category changes'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_CLIENT_CHANGE, cache_patterns=['get_task_by_id',
-            'get_tasks_by_client'], description=
+            'get_tasks_by_client', 'list_incomplete_tasks',
+            'get_client_analytics'], description=
             'Invalidate client-related caches when task assignment changes'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             TASK_DUE_DATE_CHANGE, cache_patterns=['get_task_by_id',
-            'get_overdue_tasks', 'get_tasks_due_between', 'get_tasks_with_filters'], description=
+            'get_overdue_tasks', 'get_tasks_due_between', 'get_tasks_with_filters',
+            'list_incomplete_tasks', 'get_tasks_by_client',
+            'get_client_analytics'], description=
             'Invalidate date-related caches when task due date changes'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             BULK_OPERATION, cache_patterns=['get_tasks_by_status',
             'get_tasks_by_priority', 'get_tasks_by_category',
             'get_tasks_by_client', 'list_incomplete_tasks',
-            'task_statistics', 'analytics'], description=
-            'Comprehensive cache invalidation for bulk operations'))
+            'task_statistics', 'analytics'], cache_tags=['task'],
+            description='Comprehensive cache invalidation for bulk operations')
+            )
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
-            CLIENT_CREATE, cache_patterns=['get_all_clients'], description=
+            CLIENT_CREATE, cache_patterns=['get_all_clients',
+            'get_client_analytics'], description=
             'Invalidate client lists when creating clients'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             CLIENT_UPDATE, cache_patterns=['get_all_clients',
-            'get_client_by_name'], description=
+            'get_client_by_name'], cache_tags=['client'], description=
             'Invalidate client data when updating clients'))
         self.add_rule(CacheInvalidationRule(operation_type=OperationType.
             CLIENT_DELETE, cache_patterns=['get_all_clients',
-            'get_client_by_name', 'get_tasks_by_client'], description=
+            'get_client_by_name', 'get_tasks_by_client'], cache_tags=[
+            'client'], description=
             'Invalidate client and related task data when deleting clients'))
+        for operation_type in (OperationType.HABIT_CREATE, OperationType.
+            HABIT_UPDATE, OperationType.HABIT_DELETE):
+            self.add_rule(CacheInvalidationRule(operation_type=
+                operation_type, cache_patterns=['habit_stats',
+                'habit_calendar'], cache_tags=['habit'], description=
+                'Invalidate habit streaks and calendars when habits change'))
 
     def add_rule(self, rule: CacheInvalidationRule):
         """Add a cache invalidation rule."""
@@ -135,8 +153,14 @@ class AutomatedCacheManager:
             logger.warning(
                 f'No cache invalidation rule found for {operation_type.value}')
             return 0
-        from larrybot.utils.caching import cache_invalidate
+        from larrybot.utils.caching import cache_invalidate, cache_invalidate_tag
         invalidated_count = 0
+        for tag in rule.cache_tags:
+            count = cache_invalidate_tag(tag)
+            invalidated_count += count
+            if count > 0:
+                logger.debug(
+                    f"Invalidated {count} cache entries tagged '{tag}'")
         for pattern in rule.cache_patterns:
             count = cache_invalidate(pattern)
             invalidated_count += count
@@ -9,10 +9,13 @@ import asyncio
 import hashlib
 import json
 import logging
-from typing import Any, Dict, Optional, Callable, TypeVar, Generic, List
+from typing import Any, Dict, Optional, Callable, TypeVar, Generic, List, Set, Tuple, Iterable
+from collections import OrderedDict
 from functools import wraps
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+import inspect
+import threading
 from threading import RLock
 logger = logging.getLogger(__name__)
 T = TypeVar('T')
@@ -26,14 +29,24 @@ class CacheEntry(Generic[T]):
     access_count: int = 0
     last_accessed: float = field(default_factory=time.time)
     ttl_seconds: float = 300.0
+    func_name: Optional[str] = None
+    tags: Tuple[str, ...] = ()
+    stale_after: Optional[float] = None
 
     def is_expired(self) ->bool:
         """Check if the cache entry has expired."""
         return time.time() - self.created_at > self.ttl_seconds
 
     def is_stale(self, stale_threshold: float=0.8) ->bool:
-        """Check if entry is stale (approaching expiration)."""
+        """
+        Check if entry is stale.
+
+        Entries stored with stale_after (stale-while-revalidate) turn stale
+        once that age is reached; others when approaching expiration.
+        """
         age = time.time() - self.created_at
+        if self.stale_after is not None:
+            return age > self.stale_after
         return age > self.ttl_seconds * stale_threshold
 
     def access(self) ->T:
@@ -43,26 +56,52 @@ class CacheEntry(Generic[T]):
         return self.value
 
 
+class _Flight:
+    """A computation in progress that concurrent callers can wait on."""
+    __slots__ = 'done', 'result', 'error'
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+    def wait(self) ->Any:
+        """Block until the leader finishes and return its outcome."""
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
 class QueryCache:
     """
     High-performance query result cache with TTL, LRU eviction, and analytics.
     
     Features:
     - TTL-based expiration
-    - LRU eviction when memory limits reached
+    - O(1) LRU bookkeeping backed by an OrderedDict
+    - Secondary indexes from function name and entity tags to keys, so
+      invalidation only touches the entries it affects
+    - Single-flight bookkeeping so concurrent misses share one computation
+    - Stale-while-revalidate refresh tracking
     - Access statistics for optimization
-    - Automatic cache warming for frequently accessed data
     - Thread-safe operations
     """
 
     def __init__(self, max_entries: int=500, default_ttl: float=300.0):
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: List[str] = []
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._func_index: Dict[str, Set[str]] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
         self._max_entries = max_entries
         self._default_ttl = default_ttl
         self._lock = RLock()
-        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0
-            }
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[str] = set()
+        self._generation = 0
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0,
+            'expirations': 0, 'invalidations': 0, 'coalesced': 0,
+            'stale_hits': 0, 'refreshes': 0, 'refresh_failures': 0}
         logger.info(
             f'QueryCache initialized: max_entries={max_entries}, default_ttl={default_ttl}s'
             )
@@ -74,78 +113,204 @@ class QueryCache:
         key_str = json.dumps(key_data, sort_keys=True, default=str)
         return hashlib.md5(key_str.encode()).hexdigest()
 
+    def _index(self, key: str, entry: CacheEntry) ->None:
+        """Add a key to the function and tag indexes."""
+        if entry.func_name:
+            self._func_index.setdefault(entry.func_name, set()).add(key)
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+    def _unindex(self, key: str, entry: CacheEntry) ->None:
+        """Remove a key from the function and tag indexes."""
+        if entry.func_name:
+            keys = self._func_index.get(entry.func_name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._func_index[entry.func_name]
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _remove(self, key: str) ->Optional[CacheEntry]:
+        """Remove a key from the cache and its indexes (lock must be held)."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry)
+        return entry
+
     def get(self, key: str) ->Optional[Any]:
         """Get a value from cache, handling expiration and LRU."""
+        entry = self.get_entry(key)
+        return entry.access() if entry is not None else None
+
+    def get_entry(self, key: str) ->Optional[CacheEntry]:
+        """Get the live entry for a key, counting hits and misses."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self._stats['misses'] += 1
                 return None
-            entry = self._cache[key]
             if entry.is_expired():
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
+                self._remove(key)
                 self._stats['expirations'] += 1
                 self._stats['misses'] += 1
                 return None
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+            self._cache.move_to_end(key)
             self._stats['hits'] += 1
-            return entry.access()
-
-    def set(self, key: str, value: Any, ttl: Optional[float]=None) ->None:
-        """Set a value in cache with optional TTL override."""
+            return entry
+
+    def set(self, key: str, value: Any, ttl: Optional[float]=None,
+        func_name: Optional[str]=None, tags: Optional[Iterable[str]]=None,
+        stale_after: Optional[float]=None) ->None:
+        """
+        Set a value in cache with optional TTL override.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (defaults to the cache default)
+            func_name: Name of the function that produced the value, used by
+                invalidate_pattern()
+            tags: Entity tags (e.g. 'task', 'client') used by invalidate_tag()
+            stale_after: Age in seconds after which the entry is served stale
+                while a refresh runs (ttl then bounds the stale window)
+        """
         with self._lock:
             ttl = ttl or self._default_ttl
-            entry = CacheEntry(value=value, ttl_seconds=ttl)
-            if len(self._cache
-                ) >= self._max_entries and key not in self._cache:
+            entry = CacheEntry(value=value, ttl_seconds=ttl, func_name=
+                func_name, tags=tuple(tags or ()), stale_after=stale_after)
+            if self._remove(key) is None and len(self._cache
+                ) >= self._max_entries:
                 self._evict_lru()
             self._cache[key] = entry
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+            self._index(key, entry)
 
     def _evict_lru(self) ->None:
         """Evict least recently used entries."""
-        if not self._access_order:
-            return
         evict_count = max(1, len(self._cache) // 10)
-        for _ in range(evict_count):
-            if self._access_order:
-                lru_key = self._access_order.pop(0)
-                if lru_key in self._cache:
-                    del self._cache[lru_key]
-                    self._stats['evictions'] += 1
+        for _ in range(min(evict_count, len(self._cache))):
+            lru_key, entry = self._cache.popitem(last=False)
+            self._unindex(lru_key, entry)
+            self._stats['evictions'] += 1
 
     def invalidate(self, key: str) ->bool:
         """Invalidate a specific cache entry."""
         with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
+            self._generation += 1
+            if self._remove(key) is not None:
+                self._stats['invalidations'] += 1
                 return True
             return False
 
+    def _invalidate_keys(self, keys: Iterable[str]) ->int:
+        """Invalidate a set of keys (lock must be held)."""
+        self._generation += 1
+        count = 0
+        for key in list(keys):
+            if self._remove(key) is not None:
+                count += 1
+        self._stats['invalidations'] += count
+        return count
+
     def invalidate_pattern(self, pattern: str) ->int:
-        """Invalidate all cache entries matching a pattern."""
+        """
+        Invalidate all cache entries matching a pattern.
+        
+        A pattern matches every entry whose producing function name contains
+        it (so 'task_statistics' matches get_task_statistics) and every
+        entry tagged with exactly that tag. Only the function index is
+        scanned, never the full key space.
+        """
+        with self._lock:
+            keys: Set[str] = set()
+            for func_name, func_keys in self._func_index.items():
+                if pattern in func_name:
+                    keys.update(func_keys)
+            keys.update(self._tag_index.get(pattern, ()))
+            return self._invalidate_keys(keys)
+
+    def invalidate_tag(self, tag: str) ->int:
+        """Invalidate all cache entries carrying an entity tag."""
         with self._lock:
-            keys_to_remove = [k for k in self._cache.keys() if pattern in k]
-            for key in keys_to_remove:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-            return len(keys_to_remove)
+            return self._invalidate_keys(self._tag_index.get(tag, ()))
 
     def clear(self) ->None:
         """Clear all cache entries."""
         with self._lock:
+            self._generation += 1
             self._cache.clear()
-            self._access_order.clear()
+            self._func_index.clear()
+            self._tag_index.clear()
             logger.info('Cache cleared')
 
+    @property
+    def generation(self) ->int:
+        """Counter bumped by every invalidation, used to drop racing writes."""
+        return self._generation
+
+    def begin_flight(self, key: str) ->Tuple[_Flight, bool]:
+        """
+        Join or start the in-flight computation for a key.
+
+        Returns the flight and True when the caller is the leader and must
+        compute the value and call finish_flight().
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._stats['coalesced'] += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            return flight, True
+
+    def finish_flight(self, key: str, flight: _Flight, result: Any=None,
+        error: Optional[BaseException]=None) ->None:
+        """Publish the leader's outcome and release waiting callers."""
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.result = result
+        flight.error = error
+        flight.done.set()
+
+    def begin_async_flight(self, key: str) ->Tuple[asyncio.Future, bool]:
+        """Async counterpart of begin_flight() bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            future = self._async_flights.get(key)
+            if (future is not None and not future.done() and future.
+                get_loop() is loop):
+                self._stats['coalesced'] += 1
+                return future, False
+            future = self._async_flights[key] = loop.create_future()
+            future.add_done_callback(_consume_future_exception)
+            return future, True
+
+    def finish_async_flight(self, key: str, future: asyncio.Future) ->None:
+        """Forget a finished async flight."""
+        with self._lock:
+            if self._async_flights.get(key) is future:
+                del self._async_flights[key]
+
+    def begin_refresh(self, key: str) ->bool:
+        """Claim the background refresh for a stale key (one at a time)."""
+        with self._lock:
+            self._stats['stale_hits'] += 1
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str, success: bool) ->None:
+        """Release a refresh claim and record its outcome."""
+        with self._lock:
+            self._refreshing.discard(key)
+            self._stats['refreshes' if success else 'refresh_failures'] += 1
+
     def get_stats(self) ->Dict[str, Any]:
         """Get cache statistics for monitoring."""
         with self._lock:
@@ -156,7 +321,14 @@ class QueryCache:
                 _max_entries, 'hit_rate': f'{hit_rate:.1f}%', 'hits': self.
                 _stats['hits'], 'misses': self._stats['misses'],
                 'evictions': self._stats['evictions'], 'expirations': self.
-                _stats['expirations'], 'memory_usage':
+                _stats['expirations'], 'invalidations': self._stats[
+                'invalidations'], 'coalesced': self._stats['coalesced'],
+                'stale_hits': self._stats['stale_hits'], 'refreshes': self.
+                _stats['refreshes'], 'refresh_failures': self._stats[
+                'refresh_failures'], 'in_flight': len(self._flights) + len(
+                self._async_flights), 'indexed_functions': len(self.
+                _func_index), 'indexed_tags': len(self._tag_index),
+                'memory_usage':
                 f'{len(self._cache) / self._max_entries * 100:.1f}%'}
 
     def cleanup_expired(self) ->int:
@@ -165,9 +337,7 @@ class QueryCache:
             expired_keys = [key for key, entry in self._cache.items() if
                 entry.is_expired()]
             for key in expired_keys:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
+                self._remove(key)
                 self._stats['expirations'] += 1
             return len(expired_keys)
 
@@ -175,40 +345,180 @@ class QueryCache:
 _global_cache = QueryCache(max_entries=1000, default_ttl=300.0)
 
 
-def cached(ttl: float=300.0, invalidate_on: Optional[List[str]]=None):
+def _consume_future_exception(future: asyncio.Future) ->None:
+    """Mark a flight's exception as retrieved even if nobody awaited it."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _refresh_call(func: Callable, is_method: bool, args: tuple, kwargs: dict
+    ) ->Any:
+    """
+    Call func for a background refresh.
+
+    Repository methods are rebound to a fresh session, because the caller's
+    session is closed (or in use by another thread) by the time the refresh
+    job runs.
+    """
+    if is_method and args and hasattr(args[0], 'session'):
+        from larrybot.storage.db import get_optimized_session
+        with get_optimized_session() as session:
+            return func(type(args[0])(session), *args[1:], **kwargs)
+    return func(*args, **kwargs)
+
+
+def cached(ttl: float=300.0, invalidate_on: Optional[List[str]]=None,
+    tags: Optional[List[str]]=None, stale_while_revalidate: float=0.0):
     """
     Decorator for caching function results with TTL.
+
+    Concurrent misses for the same key are coalesced: one caller computes
+    the value while the others wait for its result. Both plain and async
+    functions are supported. For methods the instance is left out of the
+    key, so every repository instance shares the same entries; cached
+    methods must therefore return session-free values (snapshots, dicts,
+    scalars), never live ORM instances.
     
     Args:
         ttl: Time to live in seconds
         invalidate_on: List of cache key patterns to invalidate when this function is called
+        tags: Entity tags attached to every cached result, for cache_invalidate_tag()
+        stale_while_revalidate: Seconds past ttl during which the stale value
+            is served while a refresh runs on the background job queue
     
     Example:
-        @cached(ttl=120.0, invalidate_on=['task_list'])
+        @cached(ttl=120.0, invalidate_on=['task_list'], tags=['task'])
         def get_task_count():
             return expensive_query()
     """
 
     def decorator(func: Callable) ->Callable:
-
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_key = _global_cache._generate_key(func.__name__, args, kwargs
-                )
-            cached_result = _global_cache.get(cache_key)
-            if cached_result is not None:
-                logger.debug(f'Cache hit for {func.__name__}')
-                return cached_result
-            logger.debug(f'Cache miss for {func.__name__}, executing...')
-            result = func(*args, **kwargs)
-            _global_cache.set(cache_key, result, ttl)
+        func_name = func.__name__
+        is_method = next(iter(inspect.signature(func).parameters), None
+            ) == 'self'
+        is_async = asyncio.iscoroutinefunction(func)
+        stale_after = ttl if stale_while_revalidate > 0 else None
+        entry_ttl = ttl + stale_while_revalidate
+
+        def make_key(args: tuple, kwargs: dict) ->str:
+            key_args = args[1:] if is_method else args
+            return _global_cache._generate_key(func.__qualname__, key_args,
+                kwargs)
+
+        def store(cache: QueryCache, key: str, result: Any, generation: int
+            ) ->None:
+            if result is not None and cache.generation == generation:
+                cache.set(key, result, entry_ttl, func_name=func_name, tags
+                    =tags, stale_after=stale_after)
             if invalidate_on:
                 for pattern in invalidate_on:
-                    invalidated = _global_cache.invalidate_pattern(pattern)
+                    invalidated = cache.invalidate_pattern(pattern)
                     if invalidated > 0:
                         logger.debug(
                             f"Invalidated {invalidated} cache entries matching '{pattern}'"
                             )
+
+        def lookup(cache: QueryCache, key: str, args: tuple, kwargs: dict
+            ) ->Optional[CacheEntry]:
+            entry = cache.get_entry(key)
+            if entry is None or entry.value is None:
+                return None
+            logger.debug(f'Cache hit for {func_name}')
+            if stale_after is not None and entry.is_stale():
+                schedule_refresh(cache, key, args, kwargs)
+            return entry
+
+        def schedule_refresh(cache: QueryCache, key: str, args: tuple,
+            kwargs: dict) ->None:
+            if not cache.begin_refresh(key):
+                return
+            generation = cache.generation
+            if is_async:
+
+                async def refresh():
+                    try:
+                        result = await func(*args, **kwargs)
+                    except Exception:
+                        cache.end_refresh(key, False)
+                        raise
+                    store(cache, key, result, generation)
+                    cache.end_refresh(key, True)
+                    return result
+            else:
+
+                def refresh():
+                    try:
+                        result = _refresh_call(func, is_method, args, kwargs)
+                    except Exception:
+                        cache.end_refresh(key, False)
+                        raise
+                    store(cache, key, result, generation)
+                    cache.end_refresh(key, True)
+                    return result
+            try:
+                from larrybot.utils.background_processing import submit_background_job
+                submit_background_job(refresh, priority=7, job_id=
+                    f'cache_refresh_{func_name}_{key[:8]}_{time.time_ns()}')
+                logger.debug(f'Scheduled background refresh for {func_name}')
+            except RuntimeError as e:
+                cache.end_refresh(key, False)
+                logger.debug(f'Could not refresh {func_name} in background: {e}'
+                    )
+
+        if is_async:
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache = _global_cache
+                key = make_key(args, kwargs)
+                while True:
+                    entry = lookup(cache, key, args, kwargs)
+                    if entry is not None:
+                        return entry.access()
+                    future, leader = cache.begin_async_flight(key)
+                    if leader:
+                        break
+                    try:
+                        return await asyncio.shield(future)
+                    except asyncio.CancelledError:
+                        if not future.cancelled():
+                            raise
+                logger.debug(f'Cache miss for {func_name}, executing...')
+                generation = cache.generation
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    future.set_exception(e)
+                    raise
+                finally:
+                    cache.finish_async_flight(key, future)
+                store(cache, key, result, generation)
+                future.set_result(result)
+                return result
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _global_cache
+            key = make_key(args, kwargs)
+            entry = lookup(cache, key, args, kwargs)
+            if entry is not None:
+                return entry.access()
+            flight, leader = cache.begin_flight(key)
+            if not leader:
+                return flight.wait()
+            logger.debug(f'Cache miss for {func_name}, executing...')
+            generation = cache.generation
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                cache.finish_flight(key, flight, error=e)
+                raise
+            store(cache, key, result, generation)
+            cache.finish_flight(key, flight, result=result)
             return result
         return wrapper
     return decorator
@@ -219,6 +529,11 @@ def cache_invalidate(pattern: str) ->int:
     return _global_cache.invalidate_pattern(pattern)
 
 
+def cache_invalidate_tag(tag: str) ->int:
+    """Invalidate cache entries carrying an entity tag."""
+    return _global_cache.invalidate_tag(tag)
+
+
 def cache_stats() ->Dict[str, Any]:
     """Get global cache statistics."""
     return _global_cache.get_stats()
@@ -229,6 +544,11 @@ def cache_clear() ->None:
     _global_cache.clear()
 
 
+def cache_generation() ->int:
+    """Get the global cache generation; it changes whenever data is invalidated."""
+    return _global_cache.generation
+
+
 async def cache_cleanup_task():
     """
     Background task for cache maintenance.
@@ -0,0 +1,197 @@
+"""
+Outbound Telegram dispatcher for LarryBot2.
+
+Every Bot API request made through the application's bot (reply_text,
+edit_message_text, send_message, ...) passes through OutboundDispatcher,
+which python-telegram-bot calls as its rate limiter. It spaces requests
+with a global and a per-chat token bucket, collapses consecutive edits of
+the same message so only the latest text is sent, and retries requests
+rejected with RetryAfter once the flood wait has passed.
+"""
+import asyncio
+import logging
+import time
+import warnings
+from datetime import timedelta
+from typing import Any, Callable, Coroutine, Dict, Optional, Tuple
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+from telegram.warnings import PTBDeprecationWarning
+logger = logging.getLogger(__name__)
+COALESCED_ENDPOINTS = frozenset({'editMessageText', 'editMessageReplyMarkup'})
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations.
+
+    Tokens may go negative: each reservation beyond the available tokens
+    queues behind the earlier ones, so waiting callers are served in
+    arrival order at the configured rate.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, now: float) ->float:
+        """Take one token and return how long to wait before using it."""
+        self._tokens = min(self.capacity, self._tokens + (now - self.
+            _updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+
+def _retry_seconds(error: RetryAfter) ->float:
+    """Get the flood wait of a RetryAfter error in seconds."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', PTBDeprecationWarning)
+        retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class OutboundDispatcher(BaseRateLimiter):
+    """
+    Central rate limiter for all outbound Telegram requests.
+
+    Features:
+    - Global token bucket (Telegram allows about 30 messages per second)
+    - Per-chat token bucket (about one message per second, short bursts)
+    - Edit coalescing: while an edit of a message waits for a token, a
+      newer edit of the same message replaces it; the superseded call
+      returns True without reaching Telegram
+    - RetryAfter handling: all requests pause for the flood wait and the
+      rejected request is retried up to max_retries times
+    - Queue depth, wait time and send latency metrics
+
+    Args:
+        global_rate: Requests per second across all chats
+        global_burst: Requests allowed at once across all chats
+        chat_rate: Requests per second to one chat
+        chat_burst: Requests allowed at once to one chat
+        max_retries: RetryAfter retries before the error is raised
+    """
+
+    def __init__(self, global_rate: float=30.0, global_burst: float=30.0,
+        chat_rate: float=1.0, chat_burst: float=5.0, max_retries: int=3):
+        self._global_bucket = TokenBucket(global_rate, global_burst)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._chat_buckets: Dict[Any, TokenBucket] = {}
+        self._max_retries = max_retries
+        self._paused_until = 0.0
+        self._latest_edit: Dict[Tuple, int] = {}
+        self._edit_sequence = 0
+        self._waiting = 0
+        self._stats = {'sent': 0, 'failed': 0, 'coalesced': 0, 'retries': 0,
+            'flood_wait': 0.0, 'max_queue_depth': 0, 'total_wait': 0.0,
+            'max_wait': 0.0, 'total_latency': 0.0, 'max_latency': 0.0}
+
+    async def initialize(self) ->None:
+        """Nothing to set up; buckets are created on demand."""
+
+    async def shutdown(self) ->None:
+        """Forget per-chat state."""
+        self._chat_buckets.clear()
+        self._latest_edit.clear()
+
+    def _reserve(self, chat_id: Any) ->float:
+        """Reserve global and per-chat tokens; return the delay to honour."""
+        now = time.monotonic()
+        delay = self._global_bucket.reserve(now)
+        if chat_id is not None:
+            bucket = self._chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = self._chat_buckets[chat_id] = TokenBucket(self.
+                    _chat_rate, self._chat_burst)
+            delay = max(delay, bucket.reserve(now))
+        return max(delay, self._paused_until - now)
+
+    async def process_request(self, callback: Callable[...,
+        Coroutine[Any, Any, Any]], args: Any, kwargs: Dict[str, Any],
+        endpoint: str, data: Dict[str, Any], rate_limit_args: Optional[Any]
+        ) ->Any:
+        """Throttle, coalesce and retry one Bot API request."""
+        started = time.monotonic()
+        chat_id = data.get('chat_id')
+        edit_key = None
+        if endpoint in COALESCED_ENDPOINTS:
+            edit_key = endpoint, chat_id, data.get('message_id'), data.get(
+                'inline_message_id')
+            self._edit_sequence += 1
+            sequence = self._latest_edit[edit_key] = self._edit_sequence
+        self._waiting += 1
+        self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'],
+            self._waiting)
+        try:
+            retries = 0
+            while True:
+                delay = self._reserve(chat_id)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                if edit_key is not None and self._latest_edit.get(edit_key
+                    ) != sequence:
+                    self._stats['coalesced'] += 1
+                    return True
+                waited = time.monotonic() - started
+                try:
+                    result = await callback(*args, **kwargs)
+                except RetryAfter as e:
+                    if retries >= self._max_retries:
+                        self._stats['failed'] += 1
+                        raise
+                    retries += 1
+                    wait = _retry_seconds(e)
+                    self._paused_until = max(self._paused_until, time.
+                        monotonic() + wait)
+                    self._stats['retries'] += 1
+                    self._stats['flood_wait'] += wait
+                    logger.warning(
+                        f'Telegram flood limit on {endpoint}, retrying in {wait:.1f}s'
+                        )
+                    continue
+                break
+            latency = time.monotonic() - started
+            self._stats['sent'] += 1
+            self._stats['total_wait'] += waited
+            self._stats['max_wait'] = max(self._stats['max_wait'], waited)
+            self._stats['total_latency'] += latency
+            self._stats['max_latency'] = max(self._stats['max_latency'],
+                latency)
+            return result
+        finally:
+            self._waiting -= 1
+            if edit_key is not None and self._latest_edit.get(edit_key
+                ) == sequence:
+                del self._latest_edit[edit_key]
+
+    def get_stats(self) ->Dict[str, Any]:
+        """Get queue depth, coalescing, retry and latency metrics."""
+        sent = max(1, self._stats['sent'])
+        return {'queue_depth': self._waiting, 'max_queue_depth': self.
+            _stats['max_queue_depth'], 'sent': self._stats['sent'],
+            'failed': self._stats['failed'], 'coalesced': self._stats[
+            'coalesced'], 'retries': self._stats['retries'],
+            'flood_wait_seconds': self._stats['flood_wait'], 'avg_wait':
+            self._stats['total_wait'] / sent, 'max_wait': self._stats[
+            'max_wait'], 'avg_latency': self._stats['total_latency'] / sent,
+            'max_latency': self._stats['max_latency'], 'chats': len(self.
+            _chat_buckets)}
+
+
+_dispatcher: Optional[OutboundDispatcher] = None
+
+
+def get_outbound_dispatcher() ->OutboundDispatcher:
+    """Get the process-wide outbound dispatcher."""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = OutboundDispatcher()
+    return _dispatcher
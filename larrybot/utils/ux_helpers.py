@@ -232,16 +232,21 @@ class KeyboardBuilder:
         return InlineKeyboardMarkup(buttons)
 
     @staticmethod
-    def build_pagination_keyboard(current_page: int, total_pages: int,
-        base_callback: str, show_nav: bool=True) ->InlineKeyboardMarkup:
+    def build_pagination_keyboard(current_page: int, total_pages: Optional[
+        int], base_callback: str, show_nav: bool=True, prev_callback:
+        Optional[str]=None, next_callback: Optional[str]=None
+        ) ->InlineKeyboardMarkup:
         """
         Build pagination keyboard.
         
         Args:
             current_page: Current page number (1-based)
-            total_pages: Total number of pages
+            total_pages: Total number of pages, or None when unknown
             base_callback: Base callback data for pagination
             show_nav: Whether to show navigation buttons
+            prev_callback: Callback data for the previous page, e.g. a cursor
+            next_callback: Callback data for the next page; with an unknown
+                total_pages the next button is shown only when this is given
             
         Returns:
             InlineKeyboardMarkup with pagination buttons
@@ -250,15 +255,16 @@ class KeyboardBuilder:
         pagination_buttons = []
         if current_page > 1:
             pagination_buttons.append(UnifiedButtonBuilder.create_button(
-                text='⬅️', callback_data=
+                text='⬅️', callback_data=prev_callback or
                 f'{base_callback}:page:{current_page - 1}', button_type=
                 ButtonType.INFO))
         pagination_buttons.append(UnifiedButtonBuilder.create_button(text=
-            f'{current_page}/{total_pages}', callback_data='no_action',
-            button_type=ButtonType.INFO))
-        if current_page < total_pages:
+            f'{current_page}/{total_pages}' if total_pages else str(
+            current_page), callback_data='no_action', button_type=
+            ButtonType.INFO))
+        if (current_page < total_pages if total_pages else next_callback):
             pagination_buttons.append(UnifiedButtonBuilder.create_button(
-                text='➡️', callback_data=
+                text='➡️', callback_data=next_callback or
                 f'{base_callback}:page:{current_page + 1}', button_type=
                 ButtonType.INFO))
         if pagination_buttons:
@@ -678,14 +684,19 @@ class MessageFormatter:
             return f"{calendar.month_name[dt.month]} {dt.day}"
 
     @staticmethod
-    def format_task_list(tasks: list, title: str='Tasks', numbered: bool=False) ->str:
+    def format_task_list(tasks: list, title: str='Tasks', numbered: bool=False, start: int=1,
+        paged: bool=False) ->str:
         """
         Format a list of tasks with rich formatting for Telegram MarkdownV2.
+        Accepts Task models, cached TaskSnapshot tuples or task dictionaries.
         - Natural language due date
         - Only priority emoji (no text label)
         - Show client for Work tasks
         - Updated summary with emoji breakdown
         - Clear dividers between tasks
+        Numbering begins at start, so later pages of a list continue it.
+        When paged, the summary names the page's range ("Tasks 11–20")
+        instead of presenting the page as the whole list.
         """
         if not tasks:
             return f'📋 **{MessageFormatter.escape_markdown(title)}**\n\nNo tasks found.'
@@ -697,10 +708,11 @@ class MessageFormatter:
             emoji = priority_map.get(priority, '⚪')
             if emoji in priority_counts:
                 priority_counts[emoji] += 1
-        summary = f"📝 {len(tasks)} Incomplete Tasks: " + " | ".join(f"{k} {v}" for k, v in priority_counts.items() if v > 0)
+        heading = f"Tasks {start}–{start + len(tasks) - 1}" if paged else f"{len(tasks)} Incomplete Tasks"
+        summary = f"📝 {heading}: " + " | ".join(f"{k} {v}" for k, v in priority_counts.items() if v > 0)
         message = f'{MessageFormatter.escape_markdown(summary)}\n\n'
         divider = '────────────'
-        for i, task in enumerate(tasks, 1):
+        for i, task in enumerate(tasks, start):
             if hasattr(task, 'priority'):
                 task_id = task.id
                 description = task.description
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Audit the query plans of LarryBot2's SQL.
+
+Runs the test suite (or the test paths given) with a listener on every
+SQLAlchemy engine. Each distinct SELECT, UPDATE or DELETE issued from
+larrybot code is run once through EXPLAIN QUERY PLAN on the connection
+that issued it, while its tables still exist. The report lists the
+statements that fully scan a table or sort in a temporary B-tree, grouped
+by table, with the larrybot function that issued them.
+
+Usage:
+    python scripts/audit_query_plans.py [pytest args...] [--json report.json]
+"""
+import sys
+import os
+import json
+import re
+import traceback
+from collections import defaultdict
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from larrybot.models import Base
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'larrybot')
+AUDITED_VERBS = ('SELECT', 'UPDATE', 'DELETE', 'WITH')
+TEMP_BTREE = 'USE TEMP B-TREE'
+IN_LIST = re.compile(r'\(\?(?:, \?)+\)')
+
+
+def statement_origin():
+    """Get 'module:function' of the innermost larrybot frame, or None."""
+    package_dir = os.path.realpath(PACKAGE_DIR)
+    for frame in reversed(traceback.extract_stack()):
+        path = os.path.realpath(frame.filename)
+        if path.startswith(package_dir):
+            module = os.path.relpath(path, os.path.dirname(package_dir))
+            return f'{module}:{frame.name}'
+    return None
+
+
+def statement_shape(statement):
+    """Collapse IN lists so statements differing only in list length audit once."""
+    return IN_LIST.sub('(?)', statement)
+
+
+def plan_problems(plan_details, tables):
+    """Get the full table scans and temp B-tree sorts of a query plan."""
+    problems = []
+    for detail in plan_details:
+        words = detail.split()
+        if words[:1] == ['SCAN'] and len(words) > 1 and words[1] in tables and 'USING' not in words:
+            problems.append((words[1], detail))
+        elif detail.startswith(TEMP_BTREE):
+            problems.append((None, detail))
+    return problems
+
+
+class QueryPlanAuditor:
+    """Pytest plugin collecting the EXPLAIN QUERY PLAN of each distinct statement."""
+
+    def __init__(self):
+        self.tables = set(Base.metadata.tables)
+        self.plans = {}
+        self.origins = defaultdict(set)
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if conn.dialect.name != 'sqlite' or executemany:
+            return
+        if not statement.lstrip().upper().startswith(AUDITED_VERBS):
+            return
+        origin = statement_origin()
+        if origin is None:
+            return
+        shape = statement_shape(statement)
+        self.origins[shape].add(origin)
+        if shape in self.plans:
+            return
+        explain = conn.connection.driver_connection.cursor()
+        try:
+            explain.execute(f'EXPLAIN QUERY PLAN {statement}', parameters or ())
+            self.plans[shape] = [row[3] for row in explain.fetchall()]
+        except Exception:
+            pass
+        finally:
+            explain.close()
+
+    def pytest_sessionstart(self, session):
+        event.listen(Engine, 'before_cursor_execute', self.before_cursor_execute)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        event.remove(Engine, 'before_cursor_execute', self.before_cursor_execute)
+
+    def findings(self):
+        """Get {table: [(statement shape, plan problems, origins)]} for every flagged statement."""
+        by_table = defaultdict(list)
+        for statement, plan in self.plans.items():
+            problems = plan_problems(plan, self.tables)
+            if not problems:
+                continue
+            tables = {table for table, _ in problems if table} or {'(sort only)'}
+            for table in sorted(tables):
+                by_table[table].append((statement, [detail for _, detail in problems],
+                    sorted(self.origins[statement])))
+        return dict(sorted(by_table.items()))
+
+
+def print_report(auditor):
+    """Print the flagged statements grouped by table."""
+    findings = auditor.findings()
+    flagged = {statement for entries in findings.values() for statement, _, _ in entries}
+    print()
+    print("🔎 Query Plan Audit")
+    print("=" * 50)
+    print(f"📊 Explained {len(auditor.plans)} distinct statements, {len(flagged)} flagged")
+    for table, entries in findings.items():
+        print()
+        print(f"📋 {table}: {len(entries)} statements")
+        for statement, problems, origins in entries:
+            print(f"   • {', '.join(origins)}")
+            for problem in problems:
+                print(f"     {problem}")
+            print(f"     {' '.join(statement.split())[:160]}")
+
+
+def main(argv):
+    """Run the tests under the auditor and report the scans."""
+    json_path = None
+    if '--json' in argv:
+        index = argv.index('--json')
+        json_path = argv[index + 1]
+        argv = argv[:index] + argv[index + 2:]
+    auditor = QueryPlanAuditor()
+    exit_code = pytest.main(['-q', '-p', 'no:cacheprovider', '-o', 'addopts=', *(argv or ['tests'])],
+        plugins=[auditor])
+    print_report(auditor)
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump({table: [{'statement': statement, 'plan': problems, 'origins': origins}
+                for statement, problems, origins in entries]
+                for table, entries in auditor.findings().items()}, f, indent=2)
+        print(f"\n💾 Report written to {json_path}")
+    return 0 if exit_code in (0, 1) else exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
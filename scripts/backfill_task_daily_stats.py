@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Backfill the task_daily_stats rollup for LarryBot2.
+
+Rebuilds every day of the rollup from the tasks table. Run it once after
+the add_task_daily_stats migration on a database that already has tasks,
+and again after changing TIMEZONE, since rollup days are local days.
+A running bot keeps its own record of whether the rollup is in sync, so
+restart it afterwards.
+"""
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from larrybot.core.timezone import initialize_timezone_service
+from larrybot.storage.db import get_optimized_session
+from larrybot.storage.task_rollups import backfill_daily_stats, rollups_match_tasks
+
+
+def backfill():
+    """Rebuild task_daily_stats and check it against the tasks table."""
+    print("📊 Task Daily Stats Backfill")
+    print("=" * 50)
+    tz_service = initialize_timezone_service(os.getenv('TIMEZONE') or None)
+    print(f"🌍 Timezone: {tz_service.timezone_name}")
+    start = time.perf_counter()
+    with get_optimized_session() as session:
+        days = backfill_daily_stats(session)
+        in_sync = rollups_match_tasks(session)
+    elapsed = time.perf_counter() - start
+    print(f"✅ Rebuilt {days} days in {elapsed:.2f}s")
+    if in_sync:
+        print("✅ Rollup totals match the tasks table")
+    else:
+        print("❌ Rollup totals do not match the tasks table")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(backfill())
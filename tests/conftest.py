@@ -21,6 +21,15 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    """Start every test with an empty global query cache."""
+    from larrybot.utils.caching import cache_clear
+    cache_clear()
+    yield
+    cache_clear()
+
+
 @pytest.fixture
 def test_db_engine():
     """Create a test database engine."""
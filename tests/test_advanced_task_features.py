@@ -7,6 +7,7 @@ from larrybot.models.task_comment import TaskComment
 from larrybot.models.task_dependency import TaskDependency
 from larrybot.models.task_time_entry import TaskTimeEntry
 from larrybot.models.client import Client
+from larrybot.models.enums import TaskPriority
 import json
 
 class TestAdvancedTaskFeatures:
@@ -36,4 +37,29 @@ class TestAdvancedTaskFeatures:
         assert task.estimated_hours == 2.5
         assert task.tags == '["test", "metadata"]'
         assert task.status == "Todo"
-        assert not task.done 
\ No newline at end of file
+        assert not task.done 
+
+    def test_priority_stored_as_integer_code(self, test_session):
+        """Test that every priority form is normalized and junk is rejected."""
+        assert Task(description="a", priority="high")._priority == 3
+        assert Task(description="b", priority="4")._priority == 4
+        task = Task(description="c")
+        task.priority = TaskPriority.URGENT
+        assert task._priority == 5 and task.priority == "Urgent"
+        with pytest.raises(ValueError):
+            Task(description="d", priority="Someday")
+        with pytest.raises(ValueError):
+            task.priority = 9
+
+    def test_priority_range_and_list_order(self, test_session):
+        """Test priority range queries and the default /list ordering."""
+        repo = TaskRepository(test_session)
+        due = datetime.utcnow() + timedelta(days=1)
+        low = repo.add_task_with_metadata("Low", priority="Low", due_date=due)
+        high = repo.add_task_with_metadata("High", priority="High", due_date=due)
+        undated = repo.add_task_with_metadata("Undated", priority="Critical")
+
+        in_range = repo.get_tasks_by_priority_range("Medium", "Critical")
+        assert {t.id for t in in_range} == {high.id, undated.id}
+        assert repo.get_tasks_by_priority("Someday") == []
+        assert [t.id for t in repo.list_incomplete_tasks()] == [high.id, low.id, undated.id]
@@ -57,6 +57,7 @@ class TestConfig:
                 config = Config()
                 assert config.TELEGRAM_BOT_TOKEN == ''
                 assert config.ALLOWED_TELEGRAM_USER_ID == 0
+                assert config.ASYNC_STORAGE is False
         '''
         result = run_subprocess_test(test_code)
         assert result.returncode == 0, result.stdout + result.stderr
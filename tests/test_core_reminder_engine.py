@@ -0,0 +1,150 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+import pytest_asyncio
+from larrybot.core.reminder_engine import ReminderEngine, due_timestamp, set_reminder_engine
+
+
+def utc_in(seconds):
+    """Naive UTC wall-clock time, as SQLite returns remind_at."""
+    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).replace(
+        tzinfo=None)
+
+
+class FakeReminders:
+    """In-memory stand-in for the reminder table."""
+
+    def __init__(self, *reminders):
+        self.reminders = dict(reminders)
+        self.fired = []
+        self.checks = 0
+
+    def process_due(self):
+        self.checks += 1
+        now = time.time()
+        for reminder_id, remind_at in list(self.reminders.items()):
+            if due_timestamp(remind_at) <= now:
+                self.fired.append((reminder_id, now - due_timestamp(remind_at)))
+                del self.reminders[reminder_id]
+        upcoming = sorted(self.reminders.items(), key=lambda item: item[1])
+        return upcoming[0] if upcoming else None
+
+    def load(self):
+        return list(self.reminders.items())
+
+
+@pytest_asyncio.fixture
+async def run_engine():
+    """Start engines on the running loop and cancel them afterwards."""
+    tasks = []
+
+    def start(engine):
+        tasks.append(asyncio.create_task(engine.run()))
+        return engine
+    yield start
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class TestReminderEngine:
+    """Test cases for the event-driven reminder engine."""
+
+    @pytest.mark.asyncio
+    async def test_fires_at_due_time(self, run_engine):
+        """Reminders fire when due, including ones loaded at startup."""
+        store = FakeReminders((1, utc_in(-60)), (2, utc_in(0.2)))
+        engine = run_engine(ReminderEngine(store.process_due, store.load))
+        await asyncio.sleep(0.4)
+        assert [reminder_id for reminder_id, _ in store.fired] == [1, 2]
+        assert store.fired[1][1] < 0.1
+        assert engine.get_stats()['max_lag'] >= 60
+
+    @pytest.mark.asyncio
+    async def test_no_database_checks_while_idle(self, run_engine):
+        """Nothing touches the database until a reminder is due."""
+        store = FakeReminders((1, utc_in(3600)))
+        engine = run_engine(ReminderEngine(store.process_due, store.load))
+        await asyncio.sleep(0.2)
+        assert store.checks == 0
+        assert engine.get_stats()['scheduled'] == 1
+
+    @pytest.mark.asyncio
+    async def test_updates_in_place(self, run_engine):
+        """Added, moved and deleted reminders update the pending timer."""
+        store = FakeReminders((1, utc_in(3600)))
+        engine = run_engine(ReminderEngine(store.process_due, store.load))
+        await asyncio.sleep(0.05)
+        store.reminders[1] = utc_in(0.1)
+        engine.schedule(1, store.reminders[1])
+        store.reminders[2] = utc_in(0.1)
+        thread = threading.Thread(target=engine.schedule, args=(2, store.
+            reminders[2]))
+        thread.start()
+        thread.join()
+        engine.discard(2)
+        del store.reminders[2]
+        await asyncio.sleep(0.3)
+        assert [reminder_id for reminder_id, _ in store.fired] == [1]
+        assert store.checks == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_processing_is_retried(self, run_engine, monkeypatch):
+        """Reminders stay scheduled when processing fails."""
+        monkeypatch.setattr('larrybot.core.reminder_engine.RETRY_DELAY', 0.1)
+        store = FakeReminders((1, utc_in(0)))
+        attempts = []
+
+        def flaky_process_due():
+            attempts.append(time.time())
+            if len(attempts) == 1:
+                raise RuntimeError('database is locked')
+            return store.process_due()
+        run_engine(ReminderEngine(flaky_process_due, store.load))
+        await asyncio.sleep(0.3)
+        assert len(attempts) == 2
+        assert [reminder_id for reminder_id, _ in store.fired] == [1]
+
+    @pytest.mark.asyncio
+    async def test_repository_changes_reach_engine(self, run_engine,
+        test_session, db_task_factory):
+        """ReminderRepository reports added and deleted reminders."""
+        from larrybot.storage.reminder_repository import ReminderRepository
+        engine = run_engine(ReminderEngine(lambda : None, lambda : []))
+        set_reminder_engine(engine)
+        try:
+            await asyncio.sleep(0.05)
+            repo = ReminderRepository(test_session)
+            task = db_task_factory()
+            remind_at = utc_in(3600)
+            reminder = repo.add_reminder(task.id, remind_at)
+            assert engine.next_due() == due_timestamp(remind_at)
+            repo.delete_reminder(reminder.id)
+            assert engine.next_due() == due_timestamp(remind_at)
+            test_session.commit()
+            assert engine.next_due() is None
+        finally:
+            set_reminder_engine(None)
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_delete_stays_scheduled(self, run_engine,
+        test_session, db_task_factory):
+        """A deletion that is rolled back leaves the reminder scheduled."""
+        from larrybot.storage.reminder_repository import ReminderRepository
+        engine = run_engine(ReminderEngine(lambda : None, lambda : []))
+        set_reminder_engine(engine)
+        try:
+            await asyncio.sleep(0.05)
+            repo = ReminderRepository(test_session)
+            task = db_task_factory()
+            remind_at = utc_in(3600)
+            reminder = repo.add_reminder(task.id, remind_at)
+            repo.delete_multiple_reminders([reminder.id])
+            test_session.rollback()
+            test_session.commit()
+            assert engine.next_due() == due_timestamp(remind_at)
+            assert repo.get_reminder_by_id(reminder.id) is not None
+        finally:
+            set_reminder_engine(None)
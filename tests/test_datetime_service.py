@@ -7,7 +7,9 @@ consistent timezone-aware datetime operations across the application.
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
-from larrybot.services.datetime_service import DateTimeService
+from larrybot.services.datetime_service import DateTimeService, DateResolver, get_date_resolver
+
+FALLBACK = 'larrybot.services.datetime_service.DateResolver._parse_fallback'
 
 
 class TestDateTimeService:
@@ -60,14 +62,14 @@ class TestDateTimeService:
         result = DateTimeService.parse_user_date("Monday", use_nlp=False)
         assert result is None
 
-    @patch('dateparser.parse')
+    @patch(FALLBACK)
     def test_parse_user_date_nlp_success(self, mock_parse_date):
         """Test successful NLP date parsing."""
         # Mock dateparser to return a specific date
         mock_date = datetime(2025, 7, 15, 14, 30, 0)
         mock_parse_date.return_value = mock_date
         
-        result = DateTimeService.parse_user_date("next Monday")
+        result = DateTimeService.parse_user_date("mid next July")
         
         assert result is not None
         assert result.tzinfo is not None
@@ -77,14 +79,14 @@ class TestDateTimeService:
         assert result.second == 59
         mock_parse_date.assert_called_once()
 
-    @patch('dateparser.parse')
+    @patch(FALLBACK)
     def test_parse_user_date_nlp_timezone_aware(self, mock_parse_date):
         """Test NLP parsing with timezone-aware datetime."""
         # Mock dateparser to return a timezone-aware datetime
         mock_date = datetime(2025, 7, 15, 14, 30, 0, tzinfo=timezone.utc)
         mock_parse_date.return_value = mock_date
         
-        result = DateTimeService.parse_user_date("tomorrow")
+        result = DateTimeService.parse_user_date("the 15th of July")
         
         assert result is not None
         assert result.tzinfo is not None
@@ -93,7 +95,7 @@ class TestDateTimeService:
         assert result.minute == 59
         assert result.second == 59
 
-    @patch('dateparser.parse')
+    @patch(FALLBACK)
     def test_parse_user_date_nlp_failure(self, mock_parse_date):
         """Test NLP parsing failure."""
         mock_parse_date.return_value = None
@@ -101,7 +103,7 @@ class TestDateTimeService:
         result = DateTimeService.parse_user_date("invalid natural language")
         assert result is None
 
-    @patch('dateparser.parse')
+    @patch(FALLBACK)
     def test_parse_user_date_nlp_exception(self, mock_parse_date):
         """Test NLP parsing with exception."""
         mock_parse_date.side_effect = Exception("NLP parsing error")
@@ -416,4 +418,66 @@ class TestDateTimeService:
     def test_edge_case_invalid_leap_year(self):
         """Test date parsing for invalid leap year date."""
         result = DateTimeService.parse_user_date("2023-02-29")
-        assert result is None 
\ No newline at end of file
+        assert result is None 
+
+
+class TestDateResolver:
+    """Test cases for the memoized date resolver."""
+
+    @patch(FALLBACK)
+    def test_common_forms_skip_dateparser(self, mock_fallback):
+        """Relative days, weekdays and offsets use the fast grammar."""
+        resolver = DateResolver()
+        today = datetime(2026, 10, 16).date()  # a Friday
+        with patch.object(DateResolver, '_local_day', return_value=(today,
+                                                                    'UTC')):
+            assert resolver.resolve_date('Tomorrow') == datetime(2026, 10, 17).date()
+            assert resolver.resolve_date('friday') == datetime(2026, 10, 23).date()
+            assert resolver.resolve_date('next Mon') == datetime(2026, 10, 19).date()
+            assert resolver.resolve_date('in 3 days') == datetime(2026, 10, 19).date()
+            assert resolver.resolve_date('2 weeks') == datetime(2026, 10, 30).date()
+            assert resolver.resolve_date('next month') == datetime(2026, 11, 16).date()
+            assert resolver.parse('today') == datetime(2026, 10, 16)
+        mock_fallback.assert_not_called()
+        assert resolver.get_stats()['fast'] == 7
+
+    @patch(FALLBACK, return_value=datetime(2026, 12, 25))
+    def test_fallback_cached_until_day_changes(self, mock_fallback):
+        """Fallback results are reused for the rest of the local day."""
+        resolver = DateResolver()
+        days = [(datetime(2026, 10, 16).date(), 'UTC')] * 2 + [
+            (datetime(2026, 10, 17).date(), 'UTC')]
+        with patch.object(DateResolver, '_local_day', side_effect=days):
+            for _ in range(3):
+                assert resolver.parse('Christmas day') == datetime(2026, 12, 25)
+        assert mock_fallback.call_count == 2
+        assert resolver.get_stats()['hits'] == 1
+
+    @patch(FALLBACK, return_value=datetime(2026, 10, 16, 18, 0))
+    def test_relative_times_not_cached(self, mock_fallback):
+        """Inputs relative to the current time are parsed every time."""
+        resolver = DateResolver()
+        resolver.parse('in 2 hours')
+        resolver.parse('in 2 hours')
+        assert mock_fallback.call_count == 2
+
+    @patch(FALLBACK, return_value=datetime(2026, 10, 16, 17, 0))
+    def test_clock_times_not_cached(self, mock_fallback):
+        """Clock times roll over to tomorrow once passed, so are never cached."""
+        resolver = DateResolver()
+        for text in ('5pm', '5 p.m.', 'at 17:30', 'friday noon'):
+            resolver.parse(text)
+            resolver.parse(text)
+        assert mock_fallback.call_count == 8
+        assert resolver.get_stats()['hits'] == 0
+
+    def test_add_months_clamps_to_month_end(self):
+        """Month offsets clamp to the last day of shorter months."""
+        resolver = DateResolver()
+        with patch.object(DateResolver, '_local_day', return_value=(
+                datetime(2027, 1, 31).date(), 'UTC')):
+            assert resolver.resolve_date('in 1 month') == datetime(2027, 2, 28).date()
+
+    def test_shared_resolver(self):
+        """DateTimeService uses the process-wide resolver."""
+        assert get_date_resolver() is get_date_resolver()
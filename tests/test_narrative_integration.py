@@ -33,7 +33,7 @@ class TestNarrativeIntegration:
         # Mock the Application builder to avoid event loop issues
         with patch('telegram.ext.Application.builder') as mock_builder:
             mock_app = Mock()
-            mock_builder.return_value.token.return_value.request.return_value.build.return_value = mock_app
+            mock_builder.return_value.token.return_value.request.return_value.rate_limiter.return_value.build.return_value = mock_app
             self.handler = TelegramBotHandler(self.config, self.registry)
         
         # Mock user
@@ -0,0 +1,78 @@
+import threading
+from unittest.mock import MagicMock, patch
+import pytest
+from larrybot.nlp.entity_extractor import EntityExtractor
+from larrybot.nlp.intent_recognizer import IntentRecognizer
+from larrybot.nlp.model_registry import NLPModelRegistry, get_nlp_registry
+
+
+def fake_pipeline():
+    """Build a stand-in for a spaCy Language object."""
+    nlp = MagicMock()
+    nlp.pipe_names = ['tok2vec', 'tagger', 'attribute_ruler', 'lemmatizer',
+        'ner']
+    return nlp
+
+
+@pytest.fixture
+def shared_registry():
+    """Give each test an empty process-wide registry."""
+    registry = get_nlp_registry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+class TestNLPModelRegistry:
+    """Test cases for the shared spaCy model registry."""
+
+    def test_model_loaded_once_without_parser(self):
+        """Concurrent first calls share a single load that excludes the parser."""
+        registry = NLPModelRegistry()
+        with patch('spacy.load', return_value=fake_pipeline()) as load:
+            threads = [threading.Thread(target=registry.get_model) for _ in
+                range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            model = registry.get_model()
+        load.assert_called_once_with('en_core_web_sm', exclude=['parser'])
+        stats = registry.get_stats()
+        assert stats['loaded'] == 1
+        assert stats['models']['en_core_web_sm']['pipeline'] == model.pipe_names
+        assert stats['models']['en_core_web_sm']['load_seconds'] >= 0
+
+    def test_failed_load_is_not_retried(self):
+        """A missing model is reported once and then returns None."""
+        registry = NLPModelRegistry()
+        with patch('spacy.load', side_effect=OSError('not installed')) as load:
+            assert registry.get_model('missing_model') is None
+            assert registry.get_model('missing_model') is None
+        assert load.call_count == 1
+        assert 'not installed' in registry.get_stats()['failed']['missing_model']
+
+    @pytest.mark.asyncio
+    async def test_warm_up_runs_in_executor(self):
+        """The warm-up hook loads the model off the event loop thread."""
+        registry = NLPModelRegistry()
+        loader_threads = []
+
+        def load(*args, **kwargs):
+            loader_threads.append(threading.current_thread())
+            return fake_pipeline()
+        with patch('spacy.load', side_effect=load):
+            assert await registry.warm_up() is True
+        assert loader_threads[0] is not threading.current_thread()
+
+    def test_consumers_share_one_pipeline(self, shared_registry):
+        """Intent and entity consumers use the same lazily loaded pipeline."""
+        with patch('spacy.load', return_value=fake_pipeline()) as load:
+            recognizer = IntentRecognizer()
+            extractor = EntityExtractor()
+            assert load.call_count == 0
+            recognizer.recognize_intent('add milk to the list')
+            extractor.extract_entities('Add task Buy milk')
+        assert load.call_count == 1
+        assert recognizer._nlp is extractor._nlp
+        recognizer._nlp.assert_any_call('add milk to the list', disable=['ner'])
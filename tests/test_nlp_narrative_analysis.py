@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+import pytest
+from larrybot.nlp import enhanced_narrative_processor
+from larrybot.nlp.enhanced_narrative_processor import EnhancedNarrativeProcessor, IntentType
+from larrybot.nlp.intent_rules import IntentRuleSet, KeywordRuleSet
+from larrybot.nlp.model_registry import get_nlp_registry
+
+
+@pytest.fixture
+def fake_nlp():
+    """Serve a stand-in spaCy pipeline from an empty shared registry."""
+    registry = get_nlp_registry()
+    registry.clear()
+    nlp = MagicMock()
+    nlp.pipe_names = ['tagger', 'lemmatizer', 'ner']
+    with patch('spacy.load', return_value=nlp):
+        yield nlp
+    registry.clear()
+
+
+class TestSinglePassAnalysis:
+    """Test cases for single-pass NLP analysis and its cache."""
+
+    def test_message_parsed_once(self, fake_nlp):
+        """Intent, entity and sentiment stages share one parse."""
+        processor = EnhancedNarrativeProcessor()
+        result = processor.process_input('Please sort out the garage')
+        assert fake_nlp.call_count == 1
+        assert result.intent == IntentType.UNKNOWN
+
+    def test_repeated_message_skips_nlp(self, fake_nlp):
+        """Repeated inputs are answered from the analysis cache."""
+        processor = EnhancedNarrativeProcessor()
+        first = processor.process_input('Please sort out the garage')
+        second = processor.process_input('  Please sort out   the garage ')
+        assert fake_nlp.call_count == 1
+        assert first.intent == second.intent == IntentType.UNKNOWN
+        stats = processor.get_analysis_stats()
+        assert stats['hits'] == 1 and stats['misses'] == 1
+
+    def test_dated_results_not_cached(self, fake_nlp):
+        """Relative dates are recomputed on every message."""
+        processor = EnhancedNarrativeProcessor()
+        processor.process_input('tomorrow')
+        processor.process_input('tomorrow')
+        assert fake_nlp.call_count == 2
+
+    def test_cache_evicts_least_recently_used(self, fake_nlp, monkeypatch):
+        """The cache keeps at most ANALYSIS_CACHE_SIZE entries."""
+        monkeypatch.setattr(enhanced_narrative_processor,
+            'ANALYSIS_CACHE_SIZE', 2)
+        processor = EnhancedNarrativeProcessor()
+        for text in ('list tasks', 'my tasks', 'list tasks', 'show tasks'):
+            processor.process_input(text)
+        assert list(processor._analysis_cache) == ['list tasks', 'show tasks']
+
+
+class TestIntentFastPath:
+    """Test cases for the compiled intent rules."""
+
+    def test_rules_keep_priority_order(self):
+        """The first matching rule wins even if a later one matches earlier."""
+        rules = IntentRuleSet([('search', 'search\\s+(.+)'), ('list',
+            'my\\s+tasks')])
+        match = rules.search('my tasks: search for invoices')
+        assert match == ('search', 'search for invoices', 'for invoices')
+        assert rules.search('my tasks').captured is None
+        assert rules.search('hello') is None
+
+    def test_keyword_rules_match_substrings(self):
+        """Keywords match case-insensitively in priority order."""
+        rules = KeywordRuleSet([('create', ['add task']), ('remind', [
+            'remind'])])
+        assert rules.search('Please ADD TASK and remind me') == 'create'
+        assert rules.search('Reminder for later') == 'remind'
+        assert rules.search('nothing here') is None
+
+    def test_list_requests_skip_the_model(self, fake_nlp):
+        """Intents resolved by rules that need no entities are not parsed."""
+        processor = EnhancedNarrativeProcessor()
+        result = processor.process_input('show my tasks')
+        assert result.intent == IntentType.LIST_TASKS
+        assert result.suggested_command == '/list'
+        assert fake_nlp.call_count == 0
+        assert processor.get_analysis_stats()['fast_path'] == 1
@@ -130,6 +130,82 @@ def test_reminder_event_handler_set_event_loop():
     assert handler._loop == mock_loop
 
 
+@pytest.mark.asyncio
+async def test_reminder_event_handler_cross_thread_handoff():
+    """Events from scheduler threads are delivered promptly and in batches."""
+    import asyncio
+    import threading
+    mock_bot_app = MagicMock()
+    mock_bot_app.bot.send_message = AsyncMock()
+    handler = ReminderEventHandler(mock_bot_app, 12345)
+    early = ReminderDueEvent(reminder_id=0, task_id=1, task_description=
+        'Early', remind_at=datetime(2024, 1, 1, 10, 30))
+    handler.queue_reminder_event(early)
+    assert handler.get_stats()['backlog'] == 1
+    handler.set_event_loop(asyncio.get_running_loop())
+    try:
+        events = [ReminderDueEvent(reminder_id=i, task_id=1,
+            task_description=f'Task {i}', remind_at=datetime(2024, 1, 1, 10,
+            30)) for i in range(1, 31)]
+        thread = threading.Thread(target=lambda: [handler.
+            queue_reminder_event(event) for event in events])
+        thread.start()
+        thread.join()
+        for _ in range(100):
+            if handler.get_stats()['delivered'] == 31:
+                break
+            await asyncio.sleep(0.01)
+        stats = handler.get_stats()
+    finally:
+        await handler.cleanup()
+    assert stats['delivered'] == 31
+    assert stats['backlog'] == 0
+    assert stats['queue_depth'] == 0
+    assert stats['batches'] < 31
+    assert stats['max_handoff_latency'] < 0.5
+    sent = [sent_call.kwargs['text'] for sent_call in mock_bot_app.bot.
+        send_message.call_args_list]
+    assert 'Early' in sent[0] and 'Task 30' in sent[-1]
+
+
+@pytest.mark.asyncio
+async def test_reminder_event_handler_backlog_race():
+    """An event backlogged while the loop is being set is still delivered."""
+    import asyncio
+    import threading
+    import time
+    from collections import deque
+    mock_bot_app = MagicMock()
+    mock_bot_app.bot.send_message = AsyncMock()
+    handler = ReminderEventHandler(mock_bot_app, 12345)
+    appending = threading.Event()
+
+    class SlowBacklog(deque):
+        def append(self, item):
+            appending.set()
+            time.sleep(0.1)
+            super().append(item)
+    handler._backlog = SlowBacklog()
+    event = ReminderDueEvent(reminder_id=1, task_id=1, task_description=
+        'Racing', remind_at=datetime(2024, 1, 1, 10, 30))
+    thread = threading.Thread(target=handler.queue_reminder_event, args=(
+        event,))
+    thread.start()
+    appending.wait()
+    handler.set_event_loop(asyncio.get_running_loop())
+    thread.join()
+    try:
+        for _ in range(100):
+            if handler.get_stats()['delivered'] == 1:
+                break
+            await asyncio.sleep(0.01)
+        stats = handler.get_stats()
+    finally:
+        await handler.cleanup()
+    assert stats['delivered'] == 1
+    assert stats['backlog'] == 0
+
+
 @pytest.mark.asyncio
 async def test_add_reminder_handler_no_args(test_session, mock_update, mock_context):
     """Test add_reminder handler when no arguments are provided."""
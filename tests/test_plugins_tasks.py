@@ -467,4 +467,41 @@ async def test_remove_task_handler_emits_event(test_session, mock_update, mock_c
         mock_update.message.reply_text.assert_called_once()
         call_args = mock_update.message.reply_text.call_args
         assert "Confirm Task Deletion" in call_args[0][0]
-        assert call_args[1]['parse_mode'] == 'MarkdownV2' 
\ No newline at end of file
+        assert call_args[1]['parse_mode'] == 'MarkdownV2' 
+
+@pytest.mark.asyncio
+async def test_list_tasks_handler_paginates(test_session, mock_update, mock_context, db_task_factory):
+    """Test that /list shows one page with a cursor for the next one."""
+    from larrybot.plugins.tasks import LIST_PAGE_SIZE
+    ids = [db_task_factory(description=f"Paged task {n}").id for n in range(LIST_PAGE_SIZE + 2)]
+
+    with patch("larrybot.plugins.tasks.get_session", return_value=iter([test_session])):
+        await list_tasks_handler(mock_update, mock_context)
+
+    call_args = mock_update.message.reply_text.call_args
+    assert f"Paged task {LIST_PAGE_SIZE - 1}" in call_args[0][0]
+    assert f"Paged task {LIST_PAGE_SIZE}" not in call_args[0][0]
+    assert f"Tasks 1–{LIST_PAGE_SIZE}:" in call_args[0][0]
+    assert "Incomplete Tasks:" not in call_args[0][0]
+    callbacks = [button.callback_data for row in call_args[1]['reply_markup'].inline_keyboard for button in row]
+    assert f"tasks_page:next:2:{ids[LIST_PAGE_SIZE - 1]}" in callbacks
+
+
+@pytest.mark.asyncio
+async def test_tasks_page_callback_shows_next_page(test_session, mock_context, db_task_factory):
+    """Test that a page callback edits the message to the page after its cursor."""
+    from larrybot.plugins.tasks import LIST_PAGE_SIZE, handle_tasks_page_callback
+    ids = [db_task_factory(description=f"Paged task {n}").id for n in range(LIST_PAGE_SIZE + 2)]
+    query = MagicMock()
+    query.data = f"tasks_page:next:2:{ids[LIST_PAGE_SIZE - 1]}"
+    query.edit_message_text = AsyncMock()
+
+    with patch("larrybot.plugins.tasks.get_session", return_value=iter([test_session])):
+        await handle_tasks_page_callback(query, mock_context)
+
+    message = query.edit_message_text.call_args[0][0]
+    assert f"Paged task {LIST_PAGE_SIZE + 1}" in message
+    assert "Paged task 0" not in message
+    assert f"Tasks {LIST_PAGE_SIZE + 1}–{LIST_PAGE_SIZE + 2}:" in message
+    callbacks = [button.callback_data for row in query.edit_message_text.call_args[1]['reply_markup'].inline_keyboard for button in row]
+    assert f"tasks_page:prev:1:{ids[LIST_PAGE_SIZE]}" in callbacks
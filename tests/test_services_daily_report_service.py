@@ -0,0 +1,137 @@
+import pytest
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from larrybot.models import Base
+from larrybot.services import daily_report_service
+from larrybot.services.daily_report_service import DailyReportService
+from larrybot.storage.async_db import DatabaseExecutor
+from larrybot.storage.habit_repository import HabitRepository
+from larrybot.storage.task_repository import TaskRepository
+from larrybot.utils.datetime_utils import get_current_datetime
+
+
+@pytest.fixture
+def report_db(tmp_path):
+    """File-backed database the report service reads on its DB executor."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'report.db'}",
+                           connect_args={'check_same_thread': False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    session = SessionLocal()
+    yield engine, SessionLocal, session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def test_session(report_db):
+    """Session on the report database, for arranging test data."""
+    return report_db[2]
+
+
+@pytest.fixture
+def report_session(report_db):
+    """Serve report sessions from a DB executor and count their uses."""
+    _, SessionLocal, _ = report_db
+    uses = []
+
+    @contextmanager
+    def session_factory():
+        uses.append(1)
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+    executor = DatabaseExecutor(max_workers=1, session_factory=session_factory)
+    with patch.object(daily_report_service, 'get_db_executor', lambda : executor):
+        yield uses
+    executor.shutdown()
+
+
+@pytest.fixture
+def calendar_events():
+    """Stand-in for the Google Calendar fetch."""
+    with patch('larrybot.services.calendar_service.CalendarService.get_todays_events',
+        new_callable=AsyncMock, return_value=[]) as fetch:
+        yield fetch
+
+
+class TestDailyReportService:
+    """Test cases for the precomputed daily report snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_when_unchanged(self, test_session, report_session, calendar_events):
+        """An unchanged snapshot is served without queries or calendar fetches."""
+        service = DailyReportService()
+        HabitRepository(test_session).add_habit('Stretch')
+        built = await service.build_snapshot()
+        uses = len(report_session)
+
+        snapshot = await service.get_snapshot()
+
+        assert snapshot is built
+        assert len(report_session) == uses
+        assert calendar_events.await_count == 1
+        assert [habit['name'] for habit in snapshot.habits_due] == ['Stretch']
+
+    @pytest.mark.asyncio
+    async def test_delta_refresh_after_mutation(self, test_session, report_session, calendar_events):
+        """Invalidated sections are rebuilt; the calendar is kept."""
+        service = DailyReportService()
+        await service.build_snapshot()
+
+        TaskRepository(test_session).add_task_with_metadata('File taxes',
+            due_date=get_current_datetime() - timedelta(days=2))
+        snapshot = await service.get_snapshot()
+
+        assert [task['description'] for task in snapshot.overdue_tasks] == ['File taxes']
+        assert calendar_events.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_without_calendar(self, report_session, calendar_events):
+        """The end-of-day reminder does not fetch the calendar."""
+        service = DailyReportService()
+
+        snapshot = await service.get_snapshot(include_calendar=False)
+
+        assert snapshot.events == []
+        assert calendar_events.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_new_day_rebuilds_snapshot(self, report_session, calendar_events):
+        """A snapshot from a previous day is never served."""
+        service = DailyReportService()
+        stale = await service.build_snapshot()
+        stale.day -= timedelta(days=1)
+
+        snapshot = await service.get_snapshot()
+
+        assert snapshot is not stale
+        assert snapshot.day == HabitRepository.today()
+        assert calendar_events.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sections_read_off_the_event_loop(self, report_session, calendar_events):
+        """Task and habit sections are queried on database executor threads."""
+        import threading
+        threads = []
+        stats = HabitRepository.get_habit_stats
+        overdue = TaskRepository.get_overdue_tasks
+
+        def record_stats(repo, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return stats(repo, *args, **kwargs)
+
+        def record_overdue(repo, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return overdue(repo, *args, **kwargs)
+        with patch.object(HabitRepository, 'get_habit_stats', record_stats), \
+                patch.object(TaskRepository, 'get_overdue_tasks', record_overdue):
+            await DailyReportService().build_snapshot()
+
+        assert threads and all(name.startswith('db') for name in threads)
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from contextlib import contextmanager
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from larrybot.models import Base
+from larrybot.models.task import Task
+from larrybot.services.task_service import TaskService
+from larrybot.storage.async_db import AsyncTaskRepository, DatabaseExecutor, configure_async_storage, is_async_storage_enabled
+
+
+@pytest.fixture
+def db_executor(tmp_path):
+    """Database executor bound to a file-backed test database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'async.db'}",
+                           connect_args={'check_same_thread': False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+    @contextmanager
+    def session_factory():
+        session = SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    executor = DatabaseExecutor(max_workers=2, session_factory=session_factory)
+    yield executor
+    executor.shutdown()
+    engine.dispose()
+
+
+class TestAsyncRepositories:
+    """Test cases for the awaitable repository facades."""
+
+    @pytest.mark.asyncio
+    async def test_task_round_trip(self, db_executor):
+        """Tasks written through the facade can be read back."""
+        repo = AsyncTaskRepository(db_executor)
+        task = await repo.add_task("Async task")
+        assert task.id is not None
+
+        fetched = await repo.get_task_by_id(task.id)
+        assert fetched.description == "Async task"
+        assert [t.id for t in await repo.list_incomplete_tasks()] == [task.id]
+
+    def test_unknown_method_raises(self, db_executor):
+        """Only real repository methods are exposed."""
+        repo = AsyncTaskRepository(db_executor)
+        with pytest.raises(AttributeError):
+            repo.not_a_method
+        with pytest.raises(AttributeError):
+            repo._compute_task_statistics
+
+    @pytest.mark.asyncio
+    async def test_task_service_awaits_async_repository(self, db_executor):
+        """TaskService works unchanged on top of the async repository."""
+        service = TaskService(AsyncTaskRepository(db_executor))
+        result = await service.create_task_with_metadata("Write report",
+                                                         priority='High')
+        assert result['success'] is True
+
+        listed = await service.get_tasks_with_filters(done=False)
+        assert listed['success'] is True
+        assert listed['data'][0]['description'] == "Write report"
+        assert listed['data'][0]['priority'] == 'High'
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_counted(self, db_executor):
+        """Exceptions raised on the DB thread reach the awaiting caller."""
+        def fail(session):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await db_executor.run_in_session(fail)
+        stats = db_executor.get_stats()
+        assert stats['failed'] == 1
+        assert stats['completed'] == 0
+        assert stats['in_flight'] == 0
+
+
+class TestEventLoopResponsiveness:
+    """The loop keeps serving other work while a heavy query runs."""
+
+    @pytest.mark.asyncio
+    async def test_loop_latency_flat_during_heavy_query(self, db_executor):
+        """Loop tick lateness stays low while a slow DB call is in flight."""
+        repo = AsyncTaskRepository(db_executor)
+        await repo.add_task("Seed")
+
+        def heavy_query(session):
+            time.sleep(0.5)
+            return session.query(Task).count()
+
+        heavy = asyncio.ensure_future(db_executor.run_in_session(heavy_query))
+        lateness = []
+        for _ in range(20):
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lateness.append(time.perf_counter() - start - 0.01)
+        quick_start = time.perf_counter()
+        assert await repo.get_task_by_id(1) is not None
+        quick_latency = time.perf_counter() - quick_start
+        assert await heavy == 1
+
+        p99 = sorted(lateness)[int(len(lateness) * 0.99) - 1]
+        assert p99 < 0.1
+        assert quick_latency < 0.4
+
+
+class TestAsyncStorageMode:
+    """Test cases for the async storage mode switch."""
+
+    def test_configure_async_storage(self):
+        """The mode can be toggled at runtime."""
+        original = is_async_storage_enabled()
+        try:
+            configure_async_storage(True)
+            assert is_async_storage_enabled() is True
+            configure_async_storage(False)
+            assert is_async_storage_enabled() is False
+        finally:
+            configure_async_storage(original)
@@ -64,4 +64,47 @@ def test_get_client_tasks(test_session, db_client_factory, db_task_factory):
     task_repo.assign_task_to_client(task.id, "BetaLLC")
     tasks = client_repo.get_client_tasks("BetaLLC")
     assert len(tasks) == 1
-    assert tasks[0].description == "Beta Task" 
\ No newline at end of file
+    assert tasks[0].description == "Beta Task" 
+def test_client_analytics_aggregate(test_session, db_client_factory, db_task_factory):
+    """Per-client counts, overdue tasks and hours come from one query."""
+    from datetime import timedelta
+    from sqlalchemy import event
+    from larrybot.utils.datetime_utils import get_utc_now
+    client_repo = ClientRepository(test_session)
+    acme = db_client_factory(name="AcmeCorp")
+    db_client_factory(name="BetaLLC")
+    db_task_factory(description="Done", client_id=acme.id, done=True,
+        priority="High", estimated_hours=2.0, actual_hours=3.0)
+    db_task_factory(description="Late", client_id=acme.id, priority="Low",
+        due_date=get_utc_now() - timedelta(days=2))
+    statements = []
+    engine = test_session.get_bind()
+
+    def count(*args):
+        statements.append(args[2])
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        analytics = client_repo.get_client_analytics()
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+    assert len(statements) == 1
+    acme_stats, beta_stats = analytics
+    assert (acme_stats['total'], acme_stats['completed'], acme_stats['overdue']) == (2, 1, 1)
+    assert acme_stats['actual_hours'] == 3.0 and acme_stats['avg_priority'] == 2.0
+    assert acme_stats['completion_rate'] == 50.0
+    assert beta_stats['total'] == 0 and beta_stats['completion_rate'] == 0
+
+def test_client_analytics_invalidated_by_task_changes(test_session, db_client_factory, db_task_factory):
+    """Cached client analytics follow task assignment and completion."""
+    client_repo = ClientRepository(test_session)
+    task_repo = TaskRepository(test_session)
+    client = db_client_factory(name="AcmeCorp")
+    task = db_task_factory(description="Test Task")
+    client_id, task_id = client.id, task.id
+    assert client_repo.get_client_analytics(client_id)[0]['total'] == 0
+    task_repo.assign_task_to_client(task_id, "AcmeCorp")
+    assert client_repo.get_client_analytics(client_id)[0]['total'] == 1
+    task_repo.mark_task_done(task_id)
+    assert client_repo.get_client_analytics(client_id)[0]['completed'] == 1
+    client_repo.add_client("Zeta")
+    assert [c['name'] for c in client_repo.get_client_analytics()] == ["AcmeCorp", "Zeta"]
@@ -0,0 +1,131 @@
+import asyncio
+import operator
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from larrybot.models.background_job import BackgroundJobRecord
+from larrybot.storage.job_store import JobStore, callable_path, decode_value, encode_value
+from larrybot.utils.background_processing import BackgroundJob, BackgroundJobQueue
+
+
+def module_level_job(value):
+    return value
+
+
+@pytest.fixture
+def job_db(tmp_path):
+    """File-backed database and session factory for the job store."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def session_factory():
+        session = factory()
+        try:
+            yield session
+        finally:
+            session.close()
+    store = JobStore(session_factory)
+    store.ensure_table()
+    yield store, session_factory
+    engine.dispose()
+
+
+async def wait_for(queue, job_id, timeout=2.0):
+    """Wait until a job has finished."""
+    for _ in range(int(timeout / 0.01)):
+        if queue.get_job_status(job_id)['status'] in ('completed', 'failed'):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('job did not finish in time')
+
+
+class TestJobStore:
+    """Test cases for the durable background job store."""
+
+    def test_only_importable_functions_are_durable(self):
+        """Lambdas and bound methods cannot be resumed after a restart."""
+        assert callable_path(operator.add) == '_operator:add'
+        assert callable_path(module_level_job
+            ) == 'tests.test_storage_job_store:module_level_job'
+        assert callable_path(lambda: None) is None
+        assert callable_path(JobStore().ensure_table) is None
+
+    def test_values_round_trip(self):
+        """Datetimes survive JSON encoding."""
+        moment = datetime(2025, 7, 1, 9, 30, tzinfo=timezone.utc)
+        assert decode_value(encode_value([moment, {'n': 1}])) == [moment, {
+            'n': 1}]
+
+    @pytest.mark.asyncio
+    async def test_pending_jobs_resume_after_restart(self, job_db):
+        """Pending and interrupted jobs from the last run run again."""
+        store, session_factory = job_db
+        moment = datetime(2025, 7, 1, tzinfo=timezone.utc)
+        store.add(store.encode(BackgroundJob(id='pending', func=
+            module_level_job, args=(moment,), kwargs={}, idempotency_key=
+            'report')))
+        store.add(store.encode(BackgroundJob(id='interrupted', func=
+            operator.add, args=(2, 3), kwargs={})))
+        store.mark_running('interrupted', time.time())
+        assert store.encode(BackgroundJob(id='lambda', func=lambda : None,
+            args=(), kwargs={})) is None
+
+        queue = BackgroundJobQueue(max_workers=1, job_store=store)
+        await queue.start()
+        try:
+            assert await queue.resume_jobs() == 2
+            await wait_for(queue, 'pending')
+            await wait_for(queue, 'interrupted')
+            assert queue.get_job_result('pending') == moment
+            assert queue.get_job_result('interrupted') == 5
+            assert queue.submit_job(module_level_job, moment,
+                idempotency_key='report') == 'pending'
+        finally:
+            await queue.stop()
+        with session_factory() as session:
+            record = session.get(BackgroundJobRecord, 'pending')
+            assert record.status == 'completed'
+            assert decode_value(record.result) == moment
+            assert record.expires_at is not None
+
+    @pytest.mark.asyncio
+    async def test_completed_results_survive_restart(self, job_db):
+        """Unexpired results are served after a restart without rerunning."""
+        store, session_factory = job_db
+        first = BackgroundJobQueue(max_workers=1, job_store=store,
+            result_ttl=60.0)
+        await first.start()
+        job_id = first.submit_job(operator.add, 2, 3, idempotency_key='sum')
+        await wait_for(first, job_id)
+        await first.stop()
+
+        second = BackgroundJobQueue(max_workers=1, job_store=store)
+        await second.start()
+        try:
+            assert await second.resume_jobs() == 0
+            assert second.submit_job(operator.add, 2, 3, idempotency_key='sum'
+                ) == job_id
+            assert second.get_job_result(job_id) == 5
+        finally:
+            await second.stop()
+
+    def test_purge_expired(self, job_db):
+        """Finished jobs are deleted once their result expires."""
+        store, session_factory = job_db
+        now = datetime.now(timezone.utc)
+        with session_factory() as session:
+            session.add(BackgroundJobRecord(id='old', func_path=
+                'operator:add', args='[]', kwargs='{}', status='completed',
+                created_at=now, expires_at=now))
+            session.add(BackgroundJobRecord(id='queued', func_path=
+                'operator:add', args='[]', kwargs='{}', status='pending',
+                created_at=now))
+            session.commit()
+        assert store.purge_expired(now.timestamp() + 1) == 1
+        with session_factory() as session:
+            assert [record.id for record in session.query(
+                BackgroundJobRecord)] == ['queued']
@@ -5,6 +5,7 @@ from larrybot.storage.habit_repository import HabitRepository
 from larrybot.storage.reminder_repository import ReminderRepository
 from larrybot.models.task import Task
 from larrybot.models.habit import Habit
+from larrybot.models.habit_completion import HabitCompletion
 from larrybot.models.reminder import Reminder
 
 
@@ -251,6 +252,64 @@ class TestHabitRepository:
         
         assert result is None
 
+    def test_mark_habit_done_records_completion(self, test_session, db_habit_factory):
+        """Test that each completed day is logged once."""
+        repo = HabitRepository(test_session)
+        habit = db_habit_factory()
+        
+        repo.mark_habit_done(habit.name)
+        repo.mark_habit_done_by_id(habit.id)
+        
+        completions = test_session.query(HabitCompletion).filter_by(habit_id=habit.id).all()
+        assert [c.completed_on for c in completions] == [repo.today()]
+
+    def test_habit_stats_from_completions(self, test_session, db_habit_factory):
+        """Test streaks and completion rates derived from the completion log."""
+        repo = HabitRepository(test_session)
+        habit = db_habit_factory(created_at=datetime(2020, 1, 1))
+        today = repo.today()
+        for days_ago in (1, 2, 5, 6, 7, 8, 9, 40):
+            test_session.add(HabitCompletion(habit_id=habit.id, completed_on=today - timedelta(days=days_ago)))
+        test_session.commit()
+        
+        stats = repo.get_habit_stats(habit.id)[0]
+        
+        assert stats['current_streak'] == 2
+        assert stats['best_streak'] == 5
+        assert stats['last_completed'] == today - timedelta(days=1)
+        assert stats['completed_today'] is False
+        assert stats['total_completions'] == 8
+        assert stats['last_7_days'] == 4
+        assert stats['last_30_days'] == 7
+        assert stats['rate_7_days'] == 57.1
+        assert stats['rate_30_days'] == 23.3
+
+    def test_habit_stats_refresh_after_completion(self, test_session, db_habit_factory):
+        """Test that cached stats are invalidated when a habit is marked done."""
+        repo = HabitRepository(test_session)
+        habit = db_habit_factory()
+        
+        assert repo.get_habit_stats(habit.id)[0]['current_streak'] == 0
+        repo.mark_habit_done(habit.name)
+        
+        stats = repo.get_habit_stats(habit.id)[0]
+        assert stats['current_streak'] == 1
+        assert stats['completed_today'] is True
+        assert stats['rate_7_days'] == 100.0
+
+    def test_habit_calendar(self, test_session, db_habit_factory):
+        """Test the per-day calendar of recent completions."""
+        repo = HabitRepository(test_session)
+        habit = db_habit_factory()
+        today = repo.today()
+        test_session.add(HabitCompletion(habit_id=habit.id, completed_on=today - timedelta(days=2)))
+        test_session.commit()
+        
+        calendar = repo.get_habit_calendar(habit.id, days=3)
+        
+        assert [day['day'] for day in calendar] == [today - timedelta(days=offset) for offset in (2, 1, 0)]
+        assert [day['done'] for day in calendar] == [True, False, False]
+
 
 class TestReminderRepository:
     """Test cases for ReminderRepository."""
@@ -0,0 +1,135 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy.orm import sessionmaker
+from larrybot.models.task import Task
+from larrybot.models.task_time_entry import TaskTimeEntry
+from larrybot.storage.task_repository import TaskRepository
+from larrybot.storage.task_snapshot import ClientRef, TaskSnapshot
+from larrybot.utils.ux_helpers import MessageFormatter
+
+
+class TestTaskSnapshots:
+    """Test cases for cached read-only task snapshots."""
+
+    def test_cached_reads_return_snapshots(self, test_session,
+                                           db_task_factory):
+        """Cached list and lookup methods return snapshots, not ORM rows."""
+        repo = TaskRepository(test_session)
+        task = db_task_factory(description="Snapshot me", priority="High")
+
+        listed = repo.list_incomplete_tasks()
+        fetched = repo.get_task_by_id(task.id)
+
+        assert isinstance(listed[0], TaskSnapshot)
+        assert isinstance(fetched, TaskSnapshot)
+        assert fetched.description == "Snapshot me"
+        assert fetched.priority == "High"
+        assert repo.get_task_by_id(task.id) is fetched
+
+    def test_snapshot_is_immutable(self, test_session, db_task_factory):
+        """Snapshots cannot be modified by cache consumers."""
+        repo = TaskRepository(test_session)
+        task = db_task_factory()
+        snapshot = repo.get_task_by_id(task.id)
+        with pytest.raises(AttributeError):
+            snapshot.description = "changed"
+
+    def test_snapshot_survives_session_close(self, test_session,
+                                             db_task_factory):
+        """Snapshots stay readable after their session is closed."""
+        repo = TaskRepository(test_session)
+        task = db_task_factory(description="Detached")
+        snapshot = repo.get_task_by_id(task.id)
+        test_session.close()
+        assert snapshot.description == "Detached"
+        assert snapshot.client is None
+
+    def test_cached_reads_shared_across_sessions(self, test_db_engine,
+                                                 test_session):
+        """A cache hit from another session's repository stays readable."""
+        repo = TaskRepository(test_session)
+        repo.add_task_with_metadata("Late", priority="High", category="Work",
+            due_date=datetime.utcnow() - timedelta(days=3))
+        reads = [
+            lambda r: r.get_overdue_tasks(),
+            lambda r: r.get_tasks_by_priority("High"),
+            lambda r: r.get_tasks_by_category("Work"),
+            lambda r: r.get_tasks_by_status("Todo"),
+            lambda r: r.get_tasks_due_between(datetime(2000, 1, 1),
+                datetime(2100, 1, 1)),
+        ]
+        first = [read(repo) for read in reads]
+        test_session.commit()
+        test_session.close()
+
+        other = sessionmaker(bind=test_db_engine)()
+        try:
+            for read, cached in zip(reads, first):
+                tasks = read(TaskRepository(other))
+                assert tasks is cached
+                assert [task.description for task in tasks] == ["Late"]
+        finally:
+            other.close()
+
+    def test_client_and_time_spent(self, test_session, db_task_factory,
+                                   db_client_factory):
+        """Client names and time entry totals come from the same row."""
+        repo = TaskRepository(test_session)
+        client = db_client_factory(name="Acme")
+        task = db_task_factory(description="Billable")
+        repo.assign_task_to_client(task.id, "Acme")
+        start = datetime(2025, 1, 1, 9, 0)
+        test_session.add(TaskTimeEntry(task_id=task.id, started_at=start,
+            ended_at=start + timedelta(minutes=90), duration_minutes=90))
+        test_session.commit()
+
+        snapshot = repo.get_tasks_by_client("Acme")[0]
+        assert snapshot.client == ClientRef(client.id, "Acme")
+        assert snapshot.client_name == "Acme"
+        assert snapshot.time_spent_hours == 1.5
+
+    def test_to_dict_matches_model(self, test_session, db_task_factory):
+        """Snapshot dictionaries match the ORM representation."""
+        repo = TaskRepository(test_session)
+        task = db_task_factory(description="Dict", category="Work",
+                               tags='["a", "b"]')
+        snapshot = repo.get_task_by_id(task.id)
+        expected = test_session.get(Task, task.id).to_dict()
+        actual = snapshot.to_dict()
+        for volatile in ('sla_hours_remaining', 'priority_score'):
+            expected.pop(volatile)
+            actual.pop(volatile)
+        assert actual == expected
+        assert snapshot.get_tags_list() == ["a", "b"]
+
+    def test_format_task_list_accepts_snapshots(self, test_session,
+                                                db_task_factory,
+                                                db_client_factory):
+        """The task list formatter renders snapshots, including clients."""
+        repo = TaskRepository(test_session)
+        db_client_factory(name="Globex")
+        task = db_task_factory(description="Ship it", category="Work")
+        repo.assign_task_to_client(task.id, "Globex")
+
+        message = MessageFormatter.format_task_list(
+            repo.list_incomplete_tasks())
+        assert "Ship it" in message
+        assert "Globex" in message
+
+    def test_keyset_pages_follow_list_order(self, test_session):
+        """Keyset pages walk /list order forwards and back without overlap."""
+        repo = TaskRepository(test_session)
+        due = datetime.utcnow() + timedelta(days=1)
+        for number in range(7):
+            repo.add_task_with_metadata(f"Task {number}", priority=["Low", "High"][number % 2],
+                                        due_date=due if number < 4 else None)
+        expected = [task.id for task in repo.list_incomplete_tasks()]
+
+        first, more = repo.list_incomplete_tasks_page(3)
+        second, _ = repo.list_incomplete_tasks_page(3, after_id=first[-1].id)
+        third, last_more = repo.list_incomplete_tasks_page(3, after_id=second[-1].id)
+        back, back_more = repo.list_incomplete_tasks_page(3, before_id=second[0].id)
+
+        assert more and not last_more and not back_more
+        assert [t.id for t in first + second + third] == expected
+        assert [t.id for t in back] == [t.id for t in first]
@@ -1,5 +1,6 @@
 import pytest
 import json
+from larrybot.models.tag import Tag, TaskTag
 from larrybot.storage.task_repository import TaskRepository
 
 class TestTagsAndComments:
@@ -52,4 +53,79 @@ class TestTagsAndComments:
         assert len(comments) == 2
         assert any(c.comment == "This is a test comment" for c in comments)
         assert any(c.comment == "Another comment" for c in comments)
-        assert comments[0].created_at <= comments[1].created_at 
\ No newline at end of file
+        assert comments[0].created_at <= comments[1].created_at 
+
+    def test_tags_are_normalized(self, test_session):
+        repo = TaskRepository(test_session)
+        first = repo.add_task_with_metadata("First", tags=["Work", "urgent"])
+        second = repo.add_task_with_metadata("Second", tags=["work"])
+        repo.add_tags(second.id, ["home", "URGENT"])
+
+        # Tag names are shared and matched case-insensitively, but each task
+        # keeps the casing it was given
+        assert test_session.query(Tag).count() == 3
+        assert test_session.query(TaskTag).count() == 5
+        assert json.loads(second.tags) == ["home", "URGENT", "work"]
+        assert sorted(json.loads(first.tags)) == ["Work", "urgent"]
+        assert [t.id for t in repo.get_tasks_by_tag("WORK")] == [second.id, first.id]
+
+        repo.remove_tags(second.id, ["Urgent"])
+        assert json.loads(second.tags) == ["home", "work"]
+        assert [t.id for t in repo.get_tasks_by_tag("urgent")] == [first.id]
+
+    def test_direct_link_edits_keep_task_casing(self, test_session):
+        repo = TaskRepository(test_session)
+        repo.add_task_with_metadata("First", tags=["Travel"])
+        task = repo.add_task_with_metadata("Second", tags=["work"])
+        travel = test_session.query(Tag).filter_by(name="travel").one()
+        work = test_session.query(Tag).filter_by(name="Work").one()
+
+        test_session.add(TaskTag(task_id=task.id, tag_id=travel.id))
+        test_session.commit()
+        test_session.refresh(task)
+        assert json.loads(task.tags) == ["work", "Travel"]
+
+        test_session.query(TaskTag).filter_by(task_id=task.id, tag_id=work.id).delete()
+        test_session.commit()
+        test_session.refresh(task)
+        assert json.loads(task.tags) == ["Travel"]
+
+    def test_multiple_tags_any_and_all(self, test_session):
+        repo = TaskRepository(test_session)
+        first = repo.add_task_with_metadata("First", tags=["work", "urgent"])
+        second = repo.add_task_with_metadata("Second", tags=["work"])
+        repo.add_task_with_metadata("Third", tags=["home"])
+
+        any_ids = [t.id for t in repo.get_tasks_by_multiple_tags(["urgent", "work"])]
+        all_ids = [t.id for t in repo.get_tasks_by_multiple_tags(["urgent", "work"], match_all=True)]
+        filtered = repo.get_tasks_with_advanced_filters(tags=["urgent", "missing"])
+
+        assert any_ids == [second.id, first.id]
+        assert all_ids == [first.id]
+        assert [t.id for t in filtered] == [first.id]
+
+    def test_tag_links_follow_removal_and_deletes(self, test_session):
+        repo = TaskRepository(test_session)
+        task = repo.add_task_with_metadata("Tagged", tags=["work"])
+        assert repo.remove_tags(task.id, ["work"]).tags is None
+        assert repo.get_tasks_by_tag("work") == []
+
+        repo.add_tags(task.id, ["travel"])
+        assert repo.search_tasks_by_text("travel")[0].id == task.id
+        test_session.delete(task)
+        test_session.commit()
+        assert test_session.query(TaskTag).count() == 0
+
+    def test_model_tag_edits_resync_links(self, test_session):
+        repo = TaskRepository(test_session)
+        task = repo.add_task_with_metadata("Tagged", tags=["work"])
+        task.add_tag("urgent")
+        test_session.commit()
+        assert [t.id for t in repo.get_tasks_by_tag("urgent")] == [task.id]
+
+        task.remove_tag("work")
+        test_session.commit()
+        assert repo.get_tasks_by_tag("work") == []
+        task.set_tags_list([])
+        test_session.commit()
+        assert test_session.query(TaskTag).count() == 0
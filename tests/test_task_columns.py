@@ -0,0 +1,60 @@
+from datetime import timedelta
+import pytest
+from larrybot.models.task import Task
+from larrybot.storage import task_columns
+from larrybot.storage.task_columns import load_task_columns, time_analysis
+from larrybot.storage.task_repository import TaskRepository
+from larrybot.utils.datetime_utils import get_utc_now
+
+
+@pytest.fixture
+def task_rows(test_session):
+    """Tasks with a spread of completion times, estimates and due dates."""
+    now = get_utc_now()
+    for i in range(12):
+        created = now - timedelta(days=5, hours=i)
+        done = i % 3 != 0
+        test_session.add(Task(description=f'Task {i}', priority=['Low',
+            'High', 'Urgent', '2'][i % 4], done=done, created_at=created,
+            updated_at=created + timedelta(hours=2 * i + 1), completed_at=
+            created + timedelta(hours=i + 1) if done and i % 2 else None,
+            due_date=created + timedelta(hours=6) if i % 4 else None,
+            estimated_hours=i % 5 or None, actual_hours=i * 0.75 or None))
+    test_session.commit()
+    return test_session
+
+
+class TestTaskColumns:
+    """Test cases for columnar task analytics."""
+
+    def test_numpy_and_python_paths_agree(self, task_rows):
+        """The vectorized and plain Python analyses give the same figures."""
+        columns = load_task_columns(task_rows)
+        assert len(columns) == 12
+        result = time_analysis(columns, use_numpy=False)
+        assert result['completed'] == 8
+        assert result['by_priority']['Medium']['tasks'] == 3
+        if task_columns.NUMPY_AVAILABLE:
+            assert time_analysis(columns, use_numpy=True) == result
+
+    def test_percentiles_interpolate(self):
+        """Percentiles match NumPy's linear interpolation."""
+        columns = task_columns.TaskColumns(created=(0.0, 0.0, 0.0, 0.0),
+            completed=(1.0, 2.0, 3.0, 10.0), due=(None,) * 4,
+            estimated_hours=(None,) * 4, actual_hours=(None,) * 4,
+            priority=(2,) * 4, done=(True,) * 4)
+        completion = time_analysis(columns, use_numpy=False)['completion_hours']
+        assert completion == {'mean': 4.0, 'p50': 2.5, 'p90': 7.9}
+
+    def test_report_without_numpy(self, task_rows, monkeypatch):
+        """The productivity report falls back to Python when NumPy is absent."""
+        repo = TaskRepository(task_rows)
+        end = get_utc_now()
+        start = end - timedelta(days=7)
+        report = repo._compute_productivity_report(start, end,
+            include_time_analysis=True)
+        monkeypatch.setattr(task_columns, 'NUMPY_AVAILABLE', False)
+        assert repo._compute_productivity_report(start, end,
+            include_time_analysis=True) == report
+        assert report['total_tasks'] == 12
+        assert report['time_analysis']['on_time_rate'] > 0
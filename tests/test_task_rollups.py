@@ -0,0 +1,121 @@
+from datetime import timedelta
+from unittest.mock import patch
+import pytest
+from sqlalchemy import text
+from larrybot.models.task import Task
+from larrybot.models.task_daily_stats import TaskDailyStats
+from larrybot.storage.task_repository import TaskRepository
+from larrybot.storage.task_rollups import backfill_daily_stats, day_bounds, local_day, rollups_in_sync, summarize_by_priority
+from larrybot.utils.datetime_utils import get_utc_now
+
+
+@pytest.fixture
+def seeded_session(test_session):
+    """Tasks spread over the last ten days, added without the rollup."""
+    now = get_utc_now()
+    for i in range(10):
+        created = now - timedelta(days=i, hours=3)
+        test_session.add(Task(description=f'Task {i}', priority='High' if
+            i % 2 else 'Low', category='Work' if i % 3 else None, done=i %
+            4 == 0, estimated_hours=1.5, actual_hours=i * 0.5, created_at=
+            created, updated_at=created + timedelta(hours=i + 1)))
+    test_session.commit()
+    return test_session
+
+
+class TestTaskDailyStats:
+    """Test cases for the task_daily_stats rollup."""
+
+    def test_backfill_matches_tasks(self, seeded_session):
+        """Analytics read from the rollup equal those read from tasks."""
+        repo = TaskRepository(seeded_session)
+        now = get_utc_now()
+        start = now - timedelta(days=6, hours=5)
+        assert not rollups_in_sync(seeded_session)
+        report = repo._compute_productivity_report(start, now)
+        analytics = repo._compute_advanced_analytics(7)
+        backfill_daily_stats(seeded_session)
+        assert rollups_in_sync(seeded_session)
+        assert repo._compute_productivity_report(start, now) == report
+        assert repo._compute_advanced_analytics(7) == analytics
+
+    def test_report_skips_task_columns(self, seeded_session):
+        """A report over synced rollups loads no task columns unless asked to."""
+        from larrybot.storage import task_repository
+        backfill_daily_stats(seeded_session)
+        repo = TaskRepository(seeded_session)
+        now = get_utc_now()
+        start = now - timedelta(days=6, hours=5)
+        with patch.object(task_repository, 'load_task_columns', wraps=
+            task_repository.load_task_columns) as load:
+            report = repo._compute_productivity_report(start, now)
+            load.assert_not_called()
+            detailed = repo._compute_productivity_report(start, now,
+                include_time_analysis=True)
+            load.assert_called_once()
+        assert 'time_analysis' not in report
+        assert detailed['time_analysis']['tasks'] == report['total_tasks']
+
+    def test_range_edges_read_tasks(self, seeded_session):
+        """Partial days at the edges of a range are not counted whole."""
+        backfill_daily_stats(seeded_session)
+        day = local_day(get_utc_now() - timedelta(days=3))
+        start, end = day_bounds(day)
+        whole = summarize_by_priority(seeded_session, start, end)
+        assert sum(stats['tasks_created'] for stats in whole.values()) == 1
+        later = summarize_by_priority(seeded_session, end - timedelta(
+            seconds=1), end)
+        assert sum(stats['tasks_created'] for stats in later.values()) == 0
+
+    def test_mutations_refresh_their_days(self, test_session):
+        """Repository mutations keep the rollup in sync."""
+        repo = TaskRepository(test_session)
+        first = repo.add_task_with_metadata('Write report', priority='High',
+            category='Work', estimated_hours=2.0)
+        second = repo.add_task('Call client')
+        first_id, second_id = first.id, second.id
+        repo.mark_task_done(first_id)
+        repo.update_priority(second_id, 'Low')
+        assert rollups_in_sync(test_session)
+        totals = summarize_by_priority(test_session)
+        assert totals[3]['tasks_completed'] == 1
+        assert totals[3]['estimated_hours'] == 2.0
+        assert totals[1]['tasks_created'] == 1
+        repo.remove_task(first_id)
+        repo.bulk_delete_tasks([second_id])
+        assert rollups_in_sync(test_session)
+        assert test_session.query(TaskDailyStats).count() == 0
+
+    def test_rollup_priority_is_integer(self, seeded_session):
+        """Refreshed rollup rows store the integer priority code."""
+        backfill_daily_stats(seeded_session)
+        priorities = {priority for priority, in seeded_session.query(
+            TaskDailyStats.priority)}
+        assert priorities == {1, 3}
+        assert set(summarize_by_priority(seeded_session)) == {1, 3}
+        assert seeded_session.execute(text(
+            'SELECT DISTINCT typeof(priority) FROM task_daily_stats')
+            ).scalars().all() == ['integer']
+
+    def test_sync_state_is_not_recomputed(self, seeded_session):
+        """Only the first check compares the rollup with the tasks table."""
+        backfill_daily_stats(seeded_session)
+        with patch('larrybot.storage.task_rollups.rollups_match_tasks'
+            ) as match:
+            repo = TaskRepository(seeded_session)
+            repo.add_task('Another task')
+            assert rollups_in_sync(seeded_session)
+            repo._compute_advanced_analytics(7)
+        match.assert_not_called()
+
+    def test_failed_refresh_clears_sync_state(self, test_session):
+        """A failed refresh sends analytics back to the tasks table."""
+        repo = TaskRepository(test_session)
+        repo.add_task('Call client')
+        assert rollups_in_sync(test_session)
+        with patch('larrybot.storage.task_rollups.refresh_daily_stats',
+            side_effect=RuntimeError('disk full')):
+            repo.add_task('Write report')
+        assert not rollups_in_sync(test_session)
+        backfill_daily_stats(test_session)
+        assert rollups_in_sync(test_session)
@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import text
+from larrybot.storage.task_repository import TaskRepository
+from larrybot.storage.task_search import HIGHLIGHT_END, HIGHLIGHT_START, fts_query, search_index_available
+
+
+@pytest.fixture
+def repo(test_session):
+    """A repository over a few tasks with tags and comments."""
+    repo = TaskRepository(test_session)
+    repo.add_task_with_metadata('Quarterly invoice review', category='Finance')
+    repo.add_task_with_metadata('Plan team offsite', category='Work', tags=['travel'])
+    task = repo.add_task_with_metadata('Call the accountant', category='Finance')
+    repo.add_comment(task.id, 'Ask about the overdue invoice from March')
+    return repo
+
+
+class TestTaskSearch:
+    """Test cases for FTS5 task search."""
+
+    def test_fts_query_prefixes_words(self):
+        """Every word becomes a quoted prefix term; punctuation is dropped."""
+        assert fts_query('invoice, "march"') == '"invoice"* "march"*'
+        assert fts_query('  !! ') is None
+
+    def test_ranked_prefix_matches(self, repo):
+        """Description matches outrank comment matches; prefixes match."""
+        assert search_index_available(repo.session)
+        results = repo.search_tasks_by_text('invo')
+        assert [task.description for task in results] == [
+            'Quarterly invoice review', 'Call the accountant']
+        snippet = results[1].search_snippet
+        assert f'{HIGHLIGHT_START}invoice{HIGHLIGHT_END}' in snippet
+
+    def test_tags_and_all_words_required(self, repo):
+        """Tags are indexed and every query word must match."""
+        assert [task.description for task in repo.search_tasks_by_text(
+            'travel')] == ['Plan team offsite']
+        assert repo.search_tasks_by_text('invoice travel') == []
+
+    def test_index_follows_updates_and_deletes(self, repo):
+        """Triggers keep the index in step with tasks and comments."""
+        task = repo.search_tasks_by_text('offsite')[0]
+        repo.edit_task(task.id, 'Plan team retreat')
+        assert repo.search_tasks_by_text('offsite') == []
+        assert repo.search_tasks_by_text('retreat')[0].id == task.id
+        accountant = repo.search_tasks_by_text('accountant')[0]
+        repo.session.delete(accountant)
+        repo.session.commit()
+        assert repo.search_tasks_by_text('march') == []
+
+    def test_falls_back_without_index(self, repo):
+        """Without tasks_fts the LIKE search is used."""
+        repo.session.execute(text('DROP TABLE tasks_fts'))
+        results = repo.search_tasks_by_text('invoice')
+        assert [task.description for task in results] == [
+            'Quarterly invoice review']
+        assert getattr(results[0], 'search_snippet', None) is None
+
+    def test_case_sensitive_uses_like(self, repo):
+        """Case-sensitive searches keep substring semantics."""
+        assert [task.description for task in repo.search_tasks_by_text(
+            'Plan', case_sensitive=True)] == ['Plan team offsite']
@@ -1,5 +1,6 @@
 import pytest
 from larrybot.storage.task_repository import TaskRepository
+from larrybot.storage.task_rollups import backfill_daily_stats, rollups_in_sync
 
 class TestTaskStatisticsAndAnalytics:
     def test_task_statistics(self, test_session, db_task_factory):
@@ -31,4 +32,64 @@ class TestTaskStatisticsAndAnalytics:
         assert stats['priority_distribution']['Low'] == 1
         assert stats['status_distribution']['Todo'] == 1
         assert stats['status_distribution']['In Progress'] == 1
-        assert stats['status_distribution']['Done'] == 2 
\ No newline at end of file
+        assert stats['status_distribution']['Done'] == 2 
+
+    def test_advanced_analytics_daily_breakdown(self, test_session):
+        """Per-day histograms and priority breakdown come from aggregates."""
+        from datetime import timedelta
+        from larrybot.models.task import Task
+        from larrybot.utils.datetime_utils import get_utc_now
+        now = get_utc_now()
+        two_days_ago = (now - timedelta(days=2)).replace(hour=8)
+        test_session.add_all([
+            Task(description="Old", priority="High", created_at=now -
+                timedelta(days=40), updated_at=now - timedelta(days=40)),
+            Task(description="Recent", priority="High", done=True,
+                created_at=two_days_ago, updated_at=two_days_ago +
+                timedelta(hours=6)),
+            Task(description="Other", priority="Low", created_at=
+                two_days_ago, updated_at=two_days_ago),
+        ])
+        test_session.commit()
+        analytics = TaskRepository(test_session)._compute_advanced_analytics(7)
+        day = two_days_ago.strftime('%Y-%m-%d')
+        assert len(analytics['daily_breakdown']) == 7
+        assert analytics['daily_breakdown'][day]['created'] == 2
+        assert analytics['daily_breakdown'][day]['completed'] == 1
+        assert analytics['priority_analysis'] == {'High': {'total': 2,
+            'completed': 1}, 'Low': {'total': 1, 'completed': 0}}
+        assert analytics['overall_stats']['total_tasks'] == 3
+        assert analytics['tasks_created'] == 2
+        assert analytics['tasks_completed'] == 1
+        assert analytics['avg_completion_time_hours'] == 6.0
+
+    def test_advanced_analytics_query_count_is_constant(self, test_session,
+        db_task_factory):
+        """The number of queries does not grow with the window size."""
+        from sqlalchemy import event
+        for i in range(5):
+            db_task_factory(description=f"Task {i}")
+        repo = TaskRepository(test_session)
+        rollups_in_sync(test_session)
+        engine = test_session.get_bind()
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        def query_counts():
+            counts = {}
+            for days in (7, 30, 365):
+                statements.clear()
+                repo._compute_advanced_analytics(days)
+                counts[days] = len(statements)
+            return counts
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            from_tasks = query_counts()
+            backfill_daily_stats(test_session)
+            from_rollups = query_counts()
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+        assert from_tasks[7] == from_tasks[30] == from_tasks[365] <= 4
+        assert from_rollups[7] == from_rollups[30] == from_rollups[365] <= 5
@@ -0,0 +1,269 @@
+import asyncio
+import threading
+import time
+import pytest
+from larrybot.utils.background_processing import BackgroundJobQueue, JobStatus
+
+
+async def wait_for_jobs(queue, job_ids, timeout=2.0):
+    """Wait until every job has finished."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        statuses = [queue.get_job_status(job_id)['status'] for job_id in
+            job_ids]
+        if all(status in ('completed', 'failed', 'cancelled') for status in
+            statuses):
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError('jobs did not finish in time')
+
+
+class TestPriorityScheduling:
+    """Test cases for priority-aware job scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order_with_fifo_ties(self):
+        """Higher priorities run first; equal priorities keep FIFO order."""
+        queue = BackgroundJobQueue(max_workers=1, concurrency_limits={})
+        gate = threading.Event()
+        order = []
+        await queue.start()
+        try:
+            blocker = queue.submit_job(gate.wait, 2)
+            await asyncio.sleep(0.05)
+            job_ids = [queue.submit_job(order.append, name, priority=
+                priority) for name, priority in (('bulk', 9), ('stats-1', 3
+                ), ('report', 5), ('stats-2', 3), ('urgent', 1))]
+            gate.set()
+            await wait_for_jobs(queue, [blocker, *job_ids])
+        finally:
+            await queue.stop()
+        assert order == ['urgent', 'stats-1', 'stats-2', 'report', 'bulk']
+
+    @pytest.mark.asyncio
+    async def test_aging_prevents_starvation(self):
+        """A long-waiting low-priority job overtakes newer urgent jobs."""
+        queue = BackgroundJobQueue(max_workers=1, aging_interval=0.01,
+            concurrency_limits={})
+        gate = threading.Event()
+        order = []
+        await queue.start()
+        try:
+            blocker = queue.submit_job(gate.wait, 2)
+            await asyncio.sleep(0.02)
+            old = queue.submit_job(order.append, 'old-bulk', priority=10)
+            await asyncio.sleep(0.15)
+            new = queue.submit_job(order.append, 'new-urgent', priority=1)
+            gate.set()
+            await wait_for_jobs(queue, [blocker, old, new])
+        finally:
+            await queue.stop()
+        assert order == ['old-bulk', 'new-urgent']
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_per_priority(self):
+        """Capped priorities never exceed their limit; others use free workers."""
+        queue = BackgroundJobQueue(max_workers=3, concurrency_limits={9: 1})
+        lock = threading.Lock()
+        active = {'bulk': 0, 'peak': 0}
+
+        def bulk_job():
+            with lock:
+                active['bulk'] += 1
+                active['peak'] = max(active['peak'], active['bulk'])
+            time.sleep(0.1)
+            with lock:
+                active['bulk'] -= 1
+
+        await queue.start()
+        try:
+            bulk_ids = [queue.submit_job(bulk_job, priority=9) for _ in
+                range(3)]
+            await asyncio.sleep(0.01)
+            fast_start = time.perf_counter()
+            fast = queue.submit_job(lambda: 'done', priority=3)
+            await wait_for_jobs(queue, [fast])
+            fast_latency = time.perf_counter() - fast_start
+            await wait_for_jobs(queue, bulk_ids)
+        finally:
+            await queue.stop()
+        assert active['peak'] == 1
+        assert fast_latency < 0.08
+
+    @pytest.mark.asyncio
+    async def test_per_priority_stats(self):
+        """Wait and run times are reported per priority."""
+        queue = BackgroundJobQueue(max_workers=2)
+        await queue.start()
+        try:
+            ok = queue.submit_job(time.sleep, 0.01, priority=3)
+
+            async def failing():
+                raise ValueError('boom')
+            failed = queue.submit_job(failing, priority=4)
+            await wait_for_jobs(queue, [ok, failed])
+            stats = queue.get_queue_stats()
+        finally:
+            await queue.stop()
+        assert stats['priorities'][3]['completed'] == 1
+        assert stats['priorities'][3]['avg_run'] >= 0.01
+        assert stats['priorities'][3]['avg_wait'] >= 0
+        assert stats['priorities'][4]['failed'] == 1
+        assert queue.get_job_status(failed)['error'] == 'ValueError: boom'
+
+    @pytest.mark.asyncio
+    async def test_submit_from_worker_thread(self):
+        """Jobs submitted from another thread wake the workers."""
+        queue = BackgroundJobQueue(max_workers=1)
+        await queue.start()
+        try:
+            job_ids = []
+            thread = threading.Thread(target=lambda: job_ids.append(queue.
+                submit_job(lambda: 42)))
+            thread.start()
+            thread.join()
+            await wait_for_jobs(queue, job_ids, timeout=0.5)
+            assert queue.get_job_result(job_ids[0]) == 42
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_job(self, job_queue):
+        """Cancelled jobs leave the queue and never run."""
+        gate = threading.Event()
+        ran = []
+        blockers = [job_queue.submit_job(gate.wait, 2) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        job_id = job_queue.submit_job(ran.append, 'x')
+        assert job_queue.cancel_job(job_id) is True
+        assert job_queue.get_queue_stats()['queue_size'] == 0
+        gate.set()
+        await wait_for_jobs(job_queue, blockers)
+        assert ran == []
+        assert job_queue.get_job_status(job_id)['status'
+            ] == JobStatus.CANCELLED.value
+
+    def test_submit_requires_started_queue(self, sync_job_queue):
+        """Submitting before start() fails loudly."""
+        with pytest.raises(RuntimeError):
+            sync_job_queue.submit_job(lambda: None)
+        assert sync_job_queue.get_queue_stats()['total_jobs'] == 0
+
+
+class TestProcessLane:
+    """Test cases for the process-pool execution lane."""
+
+    @pytest.mark.asyncio
+    async def test_process_jobs_run_in_another_process(self):
+        """Jobs submitted with executor='process' leave the bot process."""
+        import os
+        queue = BackgroundJobQueue(max_workers=1, process_workers=1)
+        await queue.start()
+        try:
+            job_id = queue.submit_job(os.getpid, executor='process')
+            await wait_for_jobs(queue, [job_id], timeout=30.0)
+            status = queue.get_job_status(job_id)
+        finally:
+            await queue.stop()
+        assert status['status'] == 'completed'
+        assert status['executor'] == 'process'
+        assert status['result'] != os.getpid()
+
+    def test_invalid_lane_rejected(self, sync_job_queue):
+        """Unknown lanes and coroutines in the process lane are refused."""
+
+        async def coroutine_job():
+            return None
+        with pytest.raises(ValueError):
+            sync_job_queue.submit_job(len, executor='gpu')
+        with pytest.raises(ValueError):
+            sync_job_queue.submit_job(coroutine_job, executor='process')
+
+    @pytest.mark.asyncio
+    async def test_analytics_computed_from_database_path(self, tmp_path):
+        """Process-lane analytics match the in-session computation."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from larrybot.models import Base
+        from larrybot.storage.analytics_worker import compute_advanced_analytics, get_database_path
+        from larrybot.storage.task_repository import TaskRepository
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'analytics.db'}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        repo = TaskRepository(session)
+        repo.add_task_with_metadata("Report", priority='High')
+        done = repo.add_task_with_metadata("Invoice", priority='Low')
+        repo.mark_task_done(done.id)
+        db_path = get_database_path(session)
+        expected = repo._compute_advanced_analytics(7)
+        session.close()
+
+        queue = BackgroundJobQueue(max_workers=1, process_workers=1)
+        await queue.start()
+        try:
+            job_id = queue.submit_job(compute_advanced_analytics, db_path, 7,
+                executor='process')
+            await wait_for_jobs(queue, [job_id], timeout=30.0)
+            result = queue.get_job_result(job_id)
+        finally:
+            await queue.stop()
+            engine.dispose()
+        assert result['overall_stats'] == expected['overall_stats']
+        assert result['priority_analysis'] == {'High': {'total': 1,
+            'completed': 0}, 'Low': {'total': 1, 'completed': 1}}
+
+    def test_in_memory_database_has_no_path(self, test_session):
+        """In-memory databases cannot be handed to a worker process."""
+        from larrybot.storage.analytics_worker import get_database_path
+        assert get_database_path(test_session) is None
+
+
+class TestIdempotency:
+    """Test cases for idempotent job submission."""
+
+    @pytest.mark.asyncio
+    async def test_identical_submissions_share_one_job(self):
+        """Submissions with the same key reuse the pending job and its result."""
+        queue = BackgroundJobQueue(max_workers=1, result_ttl=60.0)
+        gate = threading.Event()
+        calls = []
+
+        def compute():
+            gate.wait(2)
+            calls.append(1)
+            return len(calls)
+        await queue.start()
+        try:
+            first = queue.submit_job(compute, idempotency_key='stats')
+            second = queue.submit_job(compute, idempotency_key='stats')
+            gate.set()
+            await wait_for_jobs(queue, [first])
+            third = queue.submit_job(compute, idempotency_key='stats')
+            stats = queue.get_queue_stats()
+        finally:
+            await queue.stop()
+        assert first == second == third
+        assert calls == [1]
+        assert stats['coalesced_jobs'] == 2
+        assert stats['total_jobs'] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_or_failed_results_run_again(self):
+        """Expired results and failures do not satisfy new submissions."""
+        queue = BackgroundJobQueue(max_workers=1)
+        await queue.start()
+        try:
+            first = queue.submit_job(time.time, idempotency_key='now',
+                result_ttl=0.0)
+            await wait_for_jobs(queue, [first])
+            second = queue.submit_job(time.time, idempotency_key='now')
+            failed = queue.submit_job(int, 'x', idempotency_key='parse')
+            await wait_for_jobs(queue, [second, failed])
+            retried = queue.submit_job(int, '7', idempotency_key='parse')
+            await wait_for_jobs(queue, [retried])
+            assert queue.get_job_result(retried) == 7
+        finally:
+            await queue.stop()
+        assert first != second
+        assert failed != retried
@@ -0,0 +1,301 @@
+import time
+import pytest
+from larrybot.utils.caching import QueryCache
+from larrybot.utils.cache_automation import AutomatedCacheManager, OperationType
+
+
+@pytest.fixture
+def cache():
+    """Fresh query cache for each test."""
+    return QueryCache(max_entries=10, default_ttl=60.0)
+
+
+class TestQueryCache:
+    """Test cases for the QueryCache engine."""
+
+    def test_get_and_set(self, cache):
+        """Stored values are returned and counted as hits."""
+        cache.set('k1', 'value', func_name='list_incomplete_tasks')
+        assert cache.get('k1') == 'value'
+        assert cache.get('missing') is None
+        stats = cache.get_stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+
+    def test_expired_entry_is_removed(self, cache):
+        """Expired entries miss and drop out of the indexes."""
+        cache.set('k1', 'value', ttl=0.01, func_name='get_task_by_id',
+                  tags=['task'])
+        time.sleep(0.02)
+        assert cache.get('k1') is None
+        stats = cache.get_stats()
+        assert stats['expirations'] == 1
+        assert stats['indexed_functions'] == 0
+        assert stats['indexed_tags'] == 0
+
+    def test_lru_eviction_keeps_recently_used(self, cache):
+        """The least recently used entry is evicted first."""
+        for i in range(10):
+            cache.set(f'k{i}', i)
+        cache.get('k0')
+        cache.set('k10', 10)
+        assert cache.get('k0') == 0
+        assert cache.get('k1') is None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_overwrite_does_not_evict(self, cache):
+        """Re-setting an existing key never triggers eviction."""
+        for i in range(10):
+            cache.set(f'k{i}', i)
+        cache.set('k5', 'new')
+        assert cache.get_stats()['entries'] == 10
+        assert cache.get_stats()['evictions'] == 0
+        assert cache.get('k5') == 'new'
+
+    def test_invalidate_pattern_matches_function_names(self, cache):
+        """Patterns match the producing function, not the hashed key."""
+        cache.set(cache._generate_key('list_incomplete_tasks', (), {}), [1],
+                  func_name='list_incomplete_tasks')
+        cache.set(cache._generate_key('get_task_statistics', (), {}), {},
+                  func_name='get_task_statistics')
+        cache.set(cache._generate_key('get_all_clients', (), {}), [],
+                  func_name='get_all_clients')
+
+        assert cache.invalidate_pattern('list_incomplete_tasks') == 1
+        assert cache.invalidate_pattern('task_statistics') == 1
+        assert cache.invalidate_pattern('list_incomplete_tasks') == 0
+        assert cache.get_stats()['entries'] == 1
+
+    def test_invalidate_tag(self, cache):
+        """Tag invalidation removes every entry carrying the tag."""
+        cache.set('a', 1, func_name='get_task_by_id', tags=['task'])
+        cache.set('b', 2, func_name='get_tasks_by_client',
+                  tags=['task', 'client'])
+        cache.set('c', 3, func_name='get_all_clients', tags=['client'])
+
+        assert cache.invalidate_tag('task') == 2
+        assert cache.get('c') == 3
+        assert cache.invalidate_tag('client') == 1
+        assert cache.get_stats()['indexed_tags'] == 0
+
+    def test_clear(self, cache):
+        """Clearing drops entries and indexes."""
+        cache.set('a', 1, func_name='f', tags=['t'])
+        cache.clear()
+        stats = cache.get_stats()
+        assert stats['entries'] == 0
+        assert stats['indexed_functions'] == 0
+        assert cache.invalidate_tag('t') == 0
+
+
+class TestAutomatedInvalidation:
+    """Operation-based invalidation now reaches the hashed cache keys."""
+
+    def test_task_create_invalidates_task_lists(self, test_session,
+                                                db_task_factory):
+        """Creating a task drops the cached incomplete-task list."""
+        from larrybot.storage.task_repository import TaskRepository
+        repo = TaskRepository(test_session)
+        db_task_factory(description="Existing")
+        assert len(repo.list_incomplete_tasks()) == 1
+
+        repo.add_task("New task")
+        assert len(repo.list_incomplete_tasks()) == 2
+
+    def test_bulk_operation_invalidates_task_tag(self, monkeypatch):
+        """Bulk operations clear every task-tagged entry."""
+        import larrybot.utils.caching as caching
+        cache = QueryCache(max_entries=10)
+        monkeypatch.setattr(caching, '_global_cache', cache)
+        cache.set('a', 1, func_name='get_task_by_id', tags=['task'])
+        cache.set('b', 2, func_name='get_overdue_tasks', tags=['task'])
+
+        manager = AutomatedCacheManager()
+        assert manager.invalidate_for_operation(
+            OperationType.BULK_OPERATION) == 2
+        assert cache.get_stats()['entries'] == 0
+
+
+@pytest.fixture
+def global_cache(monkeypatch):
+    """Fresh cache installed as the decorator's global cache."""
+    import larrybot.utils.caching as caching
+    cache = QueryCache(max_entries=10)
+    monkeypatch.setattr(caching, '_global_cache', cache)
+    return cache
+
+
+class TestCachedDecorator:
+    """Single-flight and stale-while-revalidate behaviour of @cached."""
+
+    def test_concurrent_sync_misses_are_coalesced(self, global_cache):
+        """Only one thread computes a missing value; the rest wait for it."""
+        import threading
+        from larrybot.utils.caching import cached
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        @cached(ttl=60.0)
+        def slow_stats():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return {'total': 3}
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            slow_stats())) for _ in range(5)]
+        threads[0].start()
+        started.wait(2)
+        for thread in threads[1:]:
+            thread.start()
+        while global_cache.get_stats()['coalesced'] < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert len(calls) == 1
+        assert results == [{'total': 3}] * 5
+        assert global_cache.get_stats()['coalesced'] == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_async_misses_are_coalesced(self, global_cache):
+        """Async callers await the leader's computation."""
+        import asyncio
+        from larrybot.utils.caching import cached
+        calls = []
+
+        @cached(ttl=60.0)
+        async def slow_analytics(days):
+            calls.append(days)
+            await asyncio.sleep(0.02)
+            return {'days': days}
+
+        results = await asyncio.gather(*(slow_analytics(30) for _ in
+            range(5)))
+        assert calls == [30]
+        assert results == [{'days': 30}] * 5
+        assert await slow_analytics(30) == {'days': 30}
+        stats = global_cache.get_stats()
+        assert stats['coalesced'] == 4
+        assert stats['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_errors_reach_waiters_and_are_not_cached(self,
+        global_cache):
+        """A failing leader fails every waiter and leaves no entry."""
+        import asyncio
+        from larrybot.utils.caching import cached
+
+        @cached(ttl=60.0)
+        async def broken():
+            await asyncio.sleep(0.01)
+            raise ValueError('boom')
+
+        results = await asyncio.gather(broken(), broken(),
+            return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert global_cache.get_stats()['entries'] == 0
+
+    def test_methods_share_entries_across_instances(self, global_cache):
+        """The instance is not part of the key for methods."""
+        from larrybot.utils.caching import cached
+        calls = []
+
+        class Repo:
+
+            def __init__(self, session):
+                self.session = session
+
+            @cached(ttl=60.0)
+            def get_count(self, flag):
+                calls.append(flag)
+                return 1
+
+        Repo('a').get_count(True)
+        Repo('b').get_count(True)
+        assert calls == [True]
+
+    def test_invalidation_during_computation_drops_result(self,
+        global_cache):
+        """A value computed across an invalidation is not stored."""
+        from larrybot.utils.caching import cached
+
+        @cached(ttl=60.0, tags=['task'])
+        def racing():
+            global_cache.invalidate_tag('task')
+            return 'old'
+
+        assert racing() == 'old'
+        assert global_cache.get_stats()['entries'] == 0
+
+    def test_stale_value_served_while_refreshing(self, global_cache,
+        monkeypatch):
+        """Stale entries are returned at once and refreshed in the background."""
+        import larrybot.utils.background_processing as bg
+        from larrybot.utils.caching import cached
+        jobs = []
+        monkeypatch.setattr(bg, 'submit_background_job', lambda func, *a,
+            **kw: jobs.append(func) or 'job')
+        values = iter(['first', 'second'])
+
+        @cached(ttl=0.01, stale_while_revalidate=60.0)
+        def stats():
+            return next(values)
+
+        assert stats() == 'first'
+        time.sleep(0.02)
+        assert stats() == 'first'
+        assert stats() == 'first'
+        assert len(jobs) == 1
+
+        jobs[0]()
+        assert stats() == 'second'
+        cache_stats = global_cache.get_stats()
+        assert cache_stats['stale_hits'] == 2
+        assert cache_stats['refreshes'] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_stale_refresh_through_job_queue(self, global_cache):
+        """Async functions are refreshed by the background job queue."""
+        import asyncio
+        import larrybot.utils.background_processing as bg
+        from larrybot.utils.caching import cached
+        queue = bg.BackgroundJobQueue(max_workers=1)
+        original_queue, bg._global_queue = bg._global_queue, queue
+        await queue.start()
+        try:
+            counter = {'n': 0}
+
+            @cached(ttl=0.01, stale_while_revalidate=60.0)
+            async def analytics():
+                counter['n'] += 1
+                return counter['n']
+
+            assert await analytics() == 1
+            await asyncio.sleep(0.02)
+            assert await analytics() == 1
+            for _ in range(100):
+                if global_cache.get_stats()['refreshes']:
+                    break
+                await asyncio.sleep(0.01)
+            assert await analytics() == 2
+        finally:
+            await queue.stop()
+            bg._global_queue = original_queue
+
+    def test_refresh_without_job_queue_keeps_serving_stale(self,
+        global_cache):
+        """Without a running job queue the stale value is still served."""
+        from larrybot.utils.caching import cached
+
+        @cached(ttl=0.01, stale_while_revalidate=60.0)
+        def stats():
+            return 'value'
+
+        stats()
+        time.sleep(0.02)
+        assert stats() == 'value'
+        assert global_cache.get_stats()['refresh_failures'] == 1
@@ -0,0 +1,91 @@
+import asyncio
+import time
+import pytest
+from telegram.error import RetryAfter
+from larrybot.utils.telegram_dispatcher import OutboundDispatcher, TokenBucket
+
+
+class FakeBotApi:
+    """Records requests and optionally fails the first ones."""
+
+    def __init__(self, failures=()):
+        self.calls = []
+        self.failures = list(failures)
+
+    async def request(self, endpoint, data):
+        if self.failures:
+            raise self.failures.pop(0)
+        self.calls.append((endpoint, data, time.monotonic()))
+        return {'ok': endpoint}
+
+
+def submit(dispatcher, api, endpoint, **data):
+    """Send one request through the dispatcher."""
+    return dispatcher.process_request(api.request, (endpoint, data), {},
+        endpoint, data, None)
+
+
+class TestOutboundDispatcher:
+    """Test cases for the outbound Telegram dispatcher."""
+
+    def test_token_bucket_queues_reservations(self):
+        """Reservations beyond the burst wait in arrival order."""
+        bucket = TokenBucket(rate=10.0, capacity=2)
+        now = time.monotonic()
+        assert [round(bucket.reserve(now), 2) for _ in range(4)] == [0.0,
+            0.0, 0.1, 0.2]
+
+    @pytest.mark.asyncio
+    async def test_per_chat_rate_limit(self):
+        """A burst to one chat is spaced out; other chats are not delayed."""
+        dispatcher = OutboundDispatcher(chat_rate=20.0, chat_burst=1)
+        api = FakeBotApi()
+        start = time.monotonic()
+        await asyncio.gather(*(submit(dispatcher, api, 'sendMessage',
+            chat_id=1, text=str(i)) for i in range(4)), submit(dispatcher,
+            api, 'sendMessage', chat_id=2, text='other'))
+        sent_at = {data['text']: at - start for _, data, at in api.calls}
+        assert sent_at['3'] >= 0.14
+        assert sent_at['other'] < 0.05
+        stats = dispatcher.get_stats()
+        assert stats['sent'] == 5
+        assert stats['max_queue_depth'] == 5
+        assert stats['queue_depth'] == 0
+
+    @pytest.mark.asyncio
+    async def test_queued_edits_collapse_to_latest(self):
+        """Only the newest pending edit of a message is sent."""
+        dispatcher = OutboundDispatcher(chat_rate=10.0, chat_burst=1)
+        api = FakeBotApi()
+        results = await asyncio.gather(submit(dispatcher, api,
+            'sendMessage', chat_id=1, text='menu'), *(submit(dispatcher,
+            api, 'editMessageText', chat_id=1, message_id=7, text=f'v{i}') for
+            i in range(3)), submit(dispatcher, api, 'editMessageText',
+            chat_id=1, message_id=8, text='other'))
+        assert [data['text'] for _, data, _ in api.calls] == ['menu', 'v2',
+            'other']
+        assert results[1:3] == [True, True]
+        assert dispatcher.get_stats()['coalesced'] == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_and_retries(self):
+        """RetryAfter delays the request and every request behind it."""
+        dispatcher = OutboundDispatcher(max_retries=2)
+        api = FakeBotApi(failures=[RetryAfter(1)])
+        start = time.monotonic()
+        result = await submit(dispatcher, api, 'sendMessage', chat_id=1,
+            text='hi')
+        assert result == {'ok': 'sendMessage'}
+        assert time.monotonic() - start >= 0.9
+        stats = dispatcher.get_stats()
+        assert stats['retries'] == 1
+        assert stats['flood_wait_seconds'] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_retry_after_gives_up(self):
+        """The error is raised once max_retries is exhausted."""
+        dispatcher = OutboundDispatcher(max_retries=0)
+        api = FakeBotApi(failures=[RetryAfter(5)])
+        with pytest.raises(RetryAfter):
+            await submit(dispatcher, api, 'sendMessage', chat_id=1, text='hi')
+        assert dispatcher.get_stats()['failed'] == 1